@@ -23,7 +23,7 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from typing import List
+from typing import List, Tuple
 
 from django.http import HttpResponse
 from django.utils import timezone
@@ -72,6 +72,17 @@ BORDER_LEFT = Border(
 
 @set_download_cookie
 def export_xls(exam_enrollments: List[ExamEnrollment], is_program_manager: bool):
+    filename, content = build_xls(exam_enrollments, is_program_manager)
+    response = HttpResponse(content,
+                            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+    response['Content-Disposition'] = 'attachment; filename=%s' % filename
+    return response
+
+
+def build_xls(exam_enrollments: List[ExamEnrollment], is_program_manager: bool) -> Tuple[str, bytes]:
+    """
+    :return: The filename and the content of the score sheet of the exam enrollments (of one learning unit)
+    """
     workbook = Workbook()
     worksheet = workbook.active
     _add_header_and_legend_to_file(exam_enrollments, worksheet, is_program_manager)
@@ -80,7 +91,7 @@ def export_xls(exam_enrollments: List[ExamEnrollment], is_program_manager: bool)
     for exam_enroll in exam_enrollments:
         student = exam_enroll.learning_unit_enrollment.student
         offer = exam_enroll.learning_unit_enrollment.offer_enrollment.education_group_year
-        person = mdl.person.find_by_id(student.person.id)
+        person = student.person
         end_date = __get_session_exam_deadline(exam_enroll)
 
         score = None
@@ -133,10 +144,7 @@ def export_xls(exam_enrollments: List[ExamEnrollment], is_program_manager: bool)
     academic_year = lst_exam_enrollments[0].learning_unit_enrollment.learning_unit_year.academic_year
 
     filename = "session_%s_%s_%s.xlsx" % (str(academic_year.year), str(number_session), learn_unit_acronym)
-    response = HttpResponse(save_virtual_workbook(workbook),
-                            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    response['Content-Disposition'] = 'attachment; filename=%s' % filename
-    return response
+    return filename, save_virtual_workbook(workbook)
 
 
 def _add_header_and_legend_to_file(exam_enrollments, worksheet, is_program_manager: bool):
@@ -30,6 +30,7 @@ from decimal import Decimal, Context, Inexact
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
+from assessments.models import score_encoding_progress_summary
 from base.models import exam_enrollment, learning_unit_year, education_group_year
 from base.auth.roles import program_manager, tutor
 from base.models.academic_year import AcademicYear
@@ -131,10 +132,11 @@ def find_related_learning_unit_years(scores_encoding_list):
 def update_enrollments(scores_encoding_list, user):
     is_program_manager = program_manager.is_program_manager(user)
     updated_enrollments = []
-    for enrollment in scores_encoding_list.enrollments:
-        enrollment_updated = update_enrollment(enrollment, user, is_program_manager)
-        if enrollment_updated:
-            updated_enrollments.append(enrollment_updated)
+    with score_encoding_progress_summary.deferred_refresh():
+        for enrollment in scores_encoding_list.enrollments:
+            enrollment_updated = update_enrollment(enrollment, user, is_program_manager)
+            if enrollment_updated:
+                updated_enrollments.append(enrollment_updated)
     return updated_enrollments
 
 
@@ -171,6 +173,14 @@ def update_enrollment(enrollment, user, is_program_manager=None):
 
 
 def clean_score_and_justification(enrollment):
+    cleaned_score, cleaned_justification = get_cleaned_score_and_justification(enrollment)
+    enrollment_cleaned = copy.deepcopy(enrollment)
+    enrollment_cleaned.score_encoded = cleaned_score
+    enrollment_cleaned.justification_encoded = cleaned_justification
+    return enrollment_cleaned
+
+
+def get_cleaned_score_and_justification(enrollment):
     is_decimal_scores_authorized = enrollment.learning_unit_enrollment.learning_unit_year.decimal_scores
 
     cleaned_score = None
@@ -180,11 +190,7 @@ def clean_score_and_justification(enrollment):
     cleaned_justification = None if not enrollment.justification_encoded else enrollment.justification_encoded
     if enrollment.justification_encoded == exam_enrollment_justification_type.SCORE_MISSING:
         cleaned_justification = cleaned_score = None
-
-    enrollment_cleaned = copy.deepcopy(enrollment)
-    enrollment_cleaned.score_encoded = cleaned_score
-    enrollment_cleaned.justification_encoded = cleaned_justification
-    return enrollment_cleaned
+    return cleaned_score, cleaned_justification
 
 
 def _convert_to_decimal(score, decimal_scores_authorized):
@@ -242,6 +248,16 @@ def is_deadline_reached(enrollment, is_program_manager=True):
 
 
 def set_score_and_justification(enrollment, is_program_manager):
+    assign_score_and_justification(enrollment, is_program_manager)
+
+    #Validation
+    enrollment.full_clean()
+    enrollment.save()
+
+    return enrollment
+
+
+def assign_score_and_justification(enrollment, is_program_manager):
     enrollment.score_reencoded = None
     enrollment.justification_reencoded = None
     enrollment.score_draft = enrollment.score_encoded
@@ -249,11 +265,6 @@ def set_score_and_justification(enrollment, is_program_manager):
     if is_program_manager:
         enrollment.score_final = enrollment.score_encoded
         enrollment.justification_final = enrollment.justification_encoded
-
-    #Validation
-    enrollment.full_clean()
-    enrollment.save()
-
     return enrollment
 
 
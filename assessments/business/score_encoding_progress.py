@@ -25,11 +25,13 @@
 ##############################################################################
 from typing import List
 
+from django.db.models import F
+
+from assessments.models.score_encoding_progress_summary import ScoreEncodingProgressSummary
 from attribution.models import attribution
 from base.models import exam_enrollment, education_group_year
-from base.auth.roles import tutor
+from base.auth.roles import program_manager, tutor
 from base.models.education_group_year import EducationGroupYear
-from base.models.session_exam_deadline import compute_deadline_tutor
 
 
 def get_scores_encoding_progress(
@@ -39,13 +41,29 @@ def get_scores_encoding_progress(
         academic_year,
         learning_unit_year_ids=None
 ):
-    queryset = exam_enrollment.get_progress_by_learning_unit_years_and_offer_years(
-        user=user,
-        education_group_year_id=education_group_year_id,
-        session_exam_number=number_session,
-        academic_year=academic_year,
-        learning_unit_year_ids=learning_unit_year_ids,
-        only_enrolled=True
+    queryset = ScoreEncodingProgressSummary.objects.filter(
+        number_session=number_session,
+        learning_unit_year__academic_year=academic_year,
+    )
+
+    if education_group_year_id:
+        education_group_year_ids = [education_group_year_id]
+    else:
+        education_group_year_ids = list(education_group_year.find_by_user(user).values_list('id', flat=True))
+    if education_group_year_ids:
+        queryset = queryset.filter(education_group_year__in=education_group_year_ids)
+
+    if learning_unit_year_ids is not None:
+        queryset = queryset.filter(learning_unit_year_id__in=learning_unit_year_ids)
+    elif not program_manager.is_program_manager(user):
+        tutor_user = tutor.find_by_user(user)
+        if tutor_user:
+            queryset = queryset.filter(learning_unit_year__in=attribution.find_by_tutor(tutor_user))
+
+    queryset = queryset.annotate(
+        learning_unit_year_acronym=F('learning_unit_year__acronym'),
+        learning_unit_year_specific_title=F('learning_unit_year__specific_title'),
+        learning_container_year_common_title=F('learning_unit_year__learning_container_year__common_title'),
     )
 
     return _sort_by_acronym([ScoreEncodingProgress(obj) for obj in queryset])
@@ -159,25 +177,23 @@ def _sort_by_acronym(score_encoding_progress_list):
 
 
 class ScoreEncodingProgress:
-    def __init__(self, exam_enrol: exam_enrollment.ExamEnrollment):
-        self.learning_unit_year_id = exam_enrol.learning_unit_year_id
-        self.learning_unit_year_acronym = exam_enrol.learning_unit_year_acronym
+    def __init__(self, progress_summary: ScoreEncodingProgressSummary):
+        self.learning_unit_year_id = progress_summary.learning_unit_year_id
+        self.learning_unit_year_acronym = progress_summary.learning_unit_year_acronym
         self.learning_unit_year_title = ' - '.join(
             filter(None,
-                   [exam_enrol.learning_container_year_common_title,
-                    exam_enrol.learning_unit_year_specific_title]
+                   [progress_summary.learning_container_year_common_title,
+                    progress_summary.learning_unit_year_specific_title]
                    )
         )
 
-        self.education_group_year_id = exam_enrol.education_group_year_id
-        self.exam_enrollments_encoded = exam_enrol.exam_enrollments_encoded
-        self.draft_scores = exam_enrol.draft_scores
-        self.scores_not_yet_submitted = exam_enrol.scores_not_yet_submitted
-        self.total_exam_enrollments = exam_enrol.total_exam_enrollments
-        self.remaining_scores_by_deadline = {
-            compute_deadline_tutor(exam_enrol.deadline, exam_enrol.deadline_tutor): self.scores_not_yet_submitted
-        }
-        self.has_student_specific_profile = exam_enrol.has_student_specific_profile
+        self.education_group_year_id = progress_summary.education_group_year_id
+        self.exam_enrollments_encoded = progress_summary.exam_enrollments_encoded
+        self.draft_scores = progress_summary.draft_scores
+        self.scores_not_yet_submitted = progress_summary.scores_not_yet_submitted
+        self.total_exam_enrollments = progress_summary.total_exam_enrollments
+        self.remaining_scores_by_deadline = {progress_summary.deadline: self.scores_not_yet_submitted}
+        self.has_student_specific_profile = progress_summary.has_student_specific_profile
 
     @property
     def progress_int(self):
@@ -131,6 +131,13 @@ def scores_sheet_data(exam_enrollments, tutor=None):
     enrollments_by_learn_unit = _group_by_learning_unit_year_id(
         exam_enrollments)  # {<learning_unit_year_id> : [<ExamEnrollment>]}
 
+    # Scores responsibles, their addresses and the programs data are fetched once for all learning units
+    scores_responsibles = _get_scores_responsibles_by_learning_unit_year(enrollments_by_learn_unit.keys())
+    professional_addresses = _get_professional_addresses_by_person(
+        [scores_responsible.person_id for scores_responsible in scores_responsibles.values()]
+    )
+    programs_data = {}  # {(<education_group_year_id>, <number_session>) : (<deliberation_date>, <address>)}
+
     learning_unit_years = []
     for exam_enrollments in enrollments_by_learn_unit.values():
         # exam_enrollments contains all ExamEnrollment for a learningUnitYear
@@ -138,13 +145,12 @@ def scores_sheet_data(exam_enrollments, tutor=None):
         # We can take the first element of the list 'exam_enrollments' to get the learning_unit_yr
         # because all exam_enrollments have the same learningUnitYear
         learning_unit_yr = exam_enrollments[0].session_exam.learning_unit_year
-        scores_responsible = attribution.find_responsible(learning_unit_yr.id)
+        scores_responsible = scores_responsibles.get(learning_unit_yr.id)
         scores_responsible_address = None
         person = None
         if scores_responsible:
             person = scores_responsible.person
-            scores_responsible_address = person_address.get_by_label(scores_responsible.person,
-                                                                     PersonAddressType.PROFESSIONAL.name)
+            scores_responsible_address = professional_addresses.get(person.id)
 
         learn_unit_year_dict['academic_year'] = str(learning_unit_yr.academic_year)
 
@@ -178,15 +184,17 @@ def scores_sheet_data(exam_enrollments, tutor=None):
             exam_enrollment = list_enrollments[0]
             educ_group_year = exam_enrollment.learning_unit_enrollment.offer_enrollment.education_group_year
             number_session = exam_enrollment.session_exam.number_session
-            deliberation_date = session_exam_calendar.find_deliberation_date(number_session, educ_group_year)
-            if deliberation_date:
-                deliberation_date = deliberation_date.strftime(date_format)
-            else:
-                deliberation_date = _('Not passed')
+            program_key = (educ_group_year.id, number_session)
+            if program_key not in programs_data:
+                programs_data[program_key] = (
+                    _get_formatted_deliberation_date(date_format, number_session, educ_group_year),
+                    _get_serialized_address(educ_group_year)
+                )
+            deliberation_date, address = programs_data[program_key]
 
             program = {'acronym': educ_group_year.acronym,
                        'deliberation_date': deliberation_date,
-                       'address': _get_serialized_address(educ_group_year)}
+                       'address': dict(address)}
             enrollments = []
             for exam_enrol in list_enrollments:
                 student = exam_enrol.learning_unit_enrollment.student
@@ -211,6 +219,29 @@ def scores_sheet_data(exam_enrollments, tutor=None):
     return data
 
 
+def _get_scores_responsibles_by_learning_unit_year(learning_unit_year_ids) -> Dict[int, 'Tutor']:
+    attributions = attribution.Attribution.objects.filter(
+        learning_unit_year_id__in=list(learning_unit_year_ids),
+        score_responsible=True
+    ).order_by('learning_unit_year_id', 'tutor_id').distinct('learning_unit_year_id').select_related('tutor__person')
+    return {attrib.learning_unit_year_id: attrib.tutor for attrib in attributions}
+
+
+def _get_professional_addresses_by_person(person_ids) -> Dict[int, 'PersonAddress']:
+    addresses = person_address.PersonAddress.objects.filter(
+        person_id__in=person_ids,
+        label=PersonAddressType.PROFESSIONAL.name
+    ).order_by('person_id', 'pk').distinct('person_id')
+    return {address.person_id: address for address in addresses}
+
+
+def _get_formatted_deliberation_date(date_format, number_session, educ_group_year: 'EducationGroupYear'):
+    deliberation_date = session_exam_calendar.find_deliberation_date(number_session, educ_group_year)
+    if deliberation_date:
+        return deliberation_date.strftime(date_format)
+    return _('Not passed')
+
+
 def _get_serialized_address(educ_group_year: 'EducationGroupYear'):
     address = get_score_sheet_address(educ_group_year)['address']
     country = address.get('country')
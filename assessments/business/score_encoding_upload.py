@@ -0,0 +1,203 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+from decimal import Decimal
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from assessments.business import score_encoding_list
+from assessments.models import score_encoding_progress_summary
+from base.models import person, session_exam_deadline
+from base.models.enums.exam_enrollment_justification_type import JUSTIFICATION_TYPES
+from base.models.exam_enrollment import ExamEnrollment, ExamEnrollmentHistory
+from base.utils.cache import OsisCache
+
+PREVIEW_CACHE_TIMEOUT = 60 * 60
+
+UPDATED_FIELDS = [
+    'score_draft', 'justification_draft', 'score_final', 'justification_final', 'score_reencoded',
+    'justification_reencoded', 'changed',
+]
+
+
+class ScoreChange(NamedTuple):
+    """
+    Score or justification of an exam enrollment read in an uploaded file, validated but not saved yet.
+    """
+    enrollment_id: int
+    row_number: int
+    registration_id: str
+    last_name: str
+    first_name: str
+    previous_score: Optional[Decimal]
+    previous_justification: Optional[str]
+    score: Optional[Decimal]
+    justification: Optional[str]
+    # Last modification of the enrollment when the file was uploaded, to detect concurrent encodings
+    enrollment_changed: Optional[datetime.datetime]
+
+    @property
+    def previous_justification_display(self):
+        return dict(JUSTIFICATION_TYPES).get(self.previous_justification)
+
+    @property
+    def justification_display(self):
+        return dict(JUSTIFICATION_TYPES).get(self.justification)
+
+
+class ScoresUploadPreview(NamedTuple):
+    number_session: int
+    is_program_manager: bool
+    score_changes: List[ScoreChange]
+
+
+class ScoresUploadPreviewCache(OsisCache):
+    """
+    Changes read in the last file uploaded by the user for a learning unit year, waiting for the user confirmation.
+    """
+    PREFIX_KEY = 'scores_upload_preview'
+
+    def __init__(self, user, learning_unit_year_id: int):
+        self.user = user
+        self.learning_unit_year_id = learning_unit_year_id
+
+    @property
+    def key(self):
+        return "_".join([self.PREFIX_KEY, str(self.user.id), str(self.learning_unit_year_id)])
+
+    def set_cached_data(self, data, timeout=PREVIEW_CACHE_TIMEOUT):
+        super().set_cached_data(data, timeout=timeout)
+
+
+def build_score_change(enrollment: ExamEnrollment, row_number: int, is_program_manager: bool) -> Optional[ScoreChange]:
+    """
+    Validate the score_encoded/justification_encoded of the enrollment as update_enrollment() would, without saving.
+    :return: None if the enrollment cannot be modified or is not modified
+    """
+    previous_score, previous_justification = _get_current_score_and_justification(enrollment, is_program_manager)
+    enrollment_changed = enrollment.changed
+    enrollment.score_encoded, enrollment.justification_encoded = \
+        score_encoding_list.get_cleaned_score_and_justification(enrollment)
+
+    if not score_encoding_list.can_modify_exam_enrollment(enrollment, is_program_manager) or \
+            not score_encoding_list.is_enrollment_changed(enrollment, is_program_manager):
+        return None
+
+    score_encoding_list.assign_score_and_justification(enrollment, is_program_manager)
+    enrollment.full_clean(validate_unique=False)
+
+    student = enrollment.learning_unit_enrollment.offer_enrollment.student
+    return ScoreChange(
+        enrollment_id=enrollment.pk,
+        row_number=row_number,
+        registration_id=student.registration_id,
+        last_name=student.person.last_name,
+        first_name=student.person.first_name,
+        previous_score=previous_score,
+        previous_justification=previous_justification,
+        score=enrollment.score_encoded,
+        justification=enrollment.justification_encoded,
+        enrollment_changed=enrollment_changed,
+    )
+
+
+def apply_score_changes(
+        user,
+        learning_unit_year_id: int,
+        preview: ScoresUploadPreview
+) -> Tuple[List[ExamEnrollment], List[ScoreChange]]:
+    """
+    Save all the changes confirmed by the user at once. Changes of enrollments modified since the upload, or which
+    cannot be modified anymore (deadline reached in the meantime), are not applied.
+    :return: The updated enrollments and the changes not applied
+    """
+    now = timezone.now()
+    updated_enrollments = []
+    outdated_changes = []
+    with transaction.atomic():
+        # Locked until the changes are saved, so an encoding made meanwhile cannot be overwritten
+        enrollments = _get_enrollments_in_bulk(
+            learning_unit_year_id,
+            preview.number_session,
+            [score_change.enrollment_id for score_change in preview.score_changes]
+        )
+        for score_change in preview.score_changes:
+            enrollment = enrollments.get(score_change.enrollment_id)
+            if not enrollment or enrollment.changed != score_change.enrollment_changed:
+                outdated_changes.append(score_change)
+                continue
+            enrollment.score_encoded = score_change.score
+            enrollment.justification_encoded = score_change.justification
+            if not score_encoding_list.can_modify_exam_enrollment(enrollment, preview.is_program_manager):
+                outdated_changes.append(score_change)
+                continue
+            score_encoding_list.assign_score_and_justification(enrollment, preview.is_program_manager)
+            enrollment.changed = now
+            updated_enrollments.append(enrollment)
+
+        if updated_enrollments:
+            ExamEnrollment.objects.bulk_update(updated_enrollments, UPDATED_FIELDS)
+            if preview.is_program_manager:
+                _create_exam_enrollments_historic(user, updated_enrollments)
+            # bulk_update does not send post_save, the progress counters are refreshed here
+            score_encoding_progress_summary.refresh([(learning_unit_year_id, preview.number_session)])
+    return updated_enrollments, outdated_changes
+
+
+def _get_current_score_and_justification(enrollment: ExamEnrollment, is_program_manager: bool):
+    if is_program_manager:
+        return enrollment.score_final, enrollment.justification_final
+    return enrollment.score_draft, enrollment.justification_draft
+
+
+def _get_enrollments_in_bulk(learning_unit_year_id: int, number_session: int, enrollment_ids: Iterable[int]):
+    return ExamEnrollment.objects.filter(
+        pk__in=enrollment_ids,
+        learning_unit_enrollment__learning_unit_year_id=learning_unit_year_id,
+        session_exam__number_session=number_session,
+    ).select_related(
+        'session_exam',
+        'learning_unit_enrollment__offer_enrollment',
+    ).prefetch_related(
+        Prefetch('learning_unit_enrollment__offer_enrollment__sessionexamdeadline_set',
+                 queryset=session_exam_deadline.filter_by_nb_session(number_session),
+                 to_attr="session_exam_deadlines")
+    ).select_for_update(of=('self',)).in_bulk()
+
+
+def _create_exam_enrollments_historic(user, enrollments: List[ExamEnrollment]):
+    author = person.find_by_user(user)
+    ExamEnrollmentHistory.objects.bulk_create(
+        ExamEnrollmentHistory(
+            exam_enrollment=enrollment,
+            score_final=enrollment.score_final,
+            justification_final=enrollment.justification_final,
+            person=author,
+        ) for enrollment in enrollments
+    )
@@ -0,0 +1,157 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import io
+import zipfile
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from assessments.business import score_encoding_export, score_encoding_sheet
+from assessments.business.score_encoding_list import sort_encodings
+from base.models import exam_enrollment
+from base.models.academic_year import AcademicYear
+from base.models.education_group_year import EducationGroupYear
+from base.models.exam_enrollment import ExamEnrollment
+from base.utils.cache import OsisCache
+from osis_common.document import paper_sheet
+
+ARCHIVE_CACHE_TIMEOUT = 60 * 60 * 24
+
+LearningUnitYearId = int
+
+
+class ScoreSheetsArchiveCache(OsisCache):
+    """
+    State of a score sheets archive job: the requesting user and, once generated by the worker, the archive itself.
+    """
+    PREFIX_KEY = 'score_sheets_archive'
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+
+    @property
+    def key(self):
+        return "_".join([self.PREFIX_KEY, self.job_id])
+
+    def set_cached_data(self, data, timeout=ARCHIVE_CACHE_TIMEOUT):
+        super().set_cached_data(data, timeout=timeout)
+
+    def is_owned_by(self, user) -> bool:
+        cached_data = self.cached_data
+        return bool(cached_data) and cached_data['user_id'] == user.pk
+
+    def is_ready(self) -> bool:
+        cached_data = self.cached_data
+        return bool(cached_data) and 'content' in cached_data
+
+    def save_archive(self, filename: str, content: bytes):
+        self.set_cached_data({**(self.cached_data or {}), 'filename': filename, 'content': content})
+
+
+def get_enrollments_by_learning_unit_year(
+        education_group_year: EducationGroupYear,
+        number_session: int,
+        academic_year: AcademicYear
+) -> Dict[LearningUnitYearId, List[ExamEnrollment]]:
+    """
+    Exam enrollments of all learning units of the program, fetched at once and sorted as on the score sheets.
+    """
+    enrollments = exam_enrollment.find_for_score_encodings(
+        session_exam_number=number_session,
+        education_group_years=[education_group_year.pk],
+        academic_year=academic_year,
+    ).select_related(
+        'session_exam__learning_unit_year__academic_year',
+        'learning_unit_enrollment__learning_unit_year__academic_year',
+        'learning_unit_enrollment__offer_enrollment__student__studentspecificprofile',
+    )
+    enrollments_by_learning_unit_year = OrderedDict()
+    for enrollment in sort_encodings(list(enrollments)):
+        enrollments_by_learning_unit_year.setdefault(enrollment.session_exam.learning_unit_year_id, []).append(
+            enrollment
+        )
+    return enrollments_by_learning_unit_year
+
+
+def generate_score_sheets_archive(
+        education_group_year: EducationGroupYear,
+        number_session: int,
+        academic_year: AcademicYear,
+        on_progress: Optional[Callable[[int, int], None]] = None
+) -> Tuple[str, bytes]:
+    """
+    Zip archive containing the PDF score sheet and the XLS encoding file of each learning unit of the program.
+    :return: The filename and the content of the archive
+    """
+    enrollments_by_learning_unit_year = get_enrollments_by_learning_unit_year(
+        education_group_year,
+        number_session,
+        academic_year
+    )
+    sheet_data_by_acronym = _get_sheet_data_by_acronym(enrollments_by_learning_unit_year)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for index, enrollments in enumerate(enrollments_by_learning_unit_year.values(), 1):
+            acronym = enrollments[0].session_exam.learning_unit_year.acronym
+            sheet_data = sheet_data_by_acronym[acronym]
+            archive.writestr("{}.pdf".format(acronym), paper_sheet.print_notes(sheet_data).content)
+
+            # As for the download of a single file, enrollments whose deadline is reached cannot be encoded anymore
+            enrollments_to_encode = [
+                enrollment for enrollment in enrollments if not exam_enrollment.is_deadline_reached(enrollment)
+            ]
+            if enrollments_to_encode:
+                xls_filename, xls_content = score_encoding_export.build_xls(
+                    enrollments_to_encode,
+                    is_program_manager=True
+                )
+                archive.writestr(xls_filename, xls_content)
+
+            if on_progress:
+                on_progress(index, len(enrollments_by_learning_unit_year))
+
+    filename = "score_sheets_{}_{}_session_{}.zip".format(
+        education_group_year.acronym,
+        academic_year.year,
+        number_session
+    )
+    return filename, buffer.getvalue()
+
+
+def _get_sheet_data_by_acronym(
+        enrollments_by_learning_unit_year: Dict[LearningUnitYearId, List[ExamEnrollment]]
+) -> Dict[str, Dict]:
+    """
+    Score sheet data of each learning unit, computed at once for all the enrollments of the program.
+    """
+    if not enrollments_by_learning_unit_year:
+        return {}
+    sheets_data = score_encoding_sheet.scores_sheet_data(
+        [enrollment for enrollments in enrollments_by_learning_unit_year.values() for enrollment in enrollments]
+    )
+    return {
+        learning_unit_year_data['acronym']: {**sheets_data, 'learning_unit_years': [learning_unit_year_data]}
+        for learning_unit_year_data in sheets_data['learning_unit_years']
+    }
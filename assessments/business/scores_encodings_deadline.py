@@ -28,6 +28,7 @@ import logging
 
 from django.conf import settings
 
+from assessments.models import score_encoding_progress_summary
 from base.models import session_exam_calendar, offer_year_calendar
 from base.models.enums.academic_calendar_type import AcademicCalendarTypes
 from base.models.session_exam_deadline import SessionExamDeadline
@@ -102,18 +103,23 @@ def _impact_scores_encodings_deadlines(oyc):
 
 
 def _save_new_deadlines(sessions_exam_deadlines, end_date_academic, end_date_educ_group_year, tutor_submission_date):
-    for sess_exam_deadline in sessions_exam_deadlines:
-        end_date_student = _one_day_before(sess_exam_deadline.deliberation_date)
-
-        new_deadline = min(filter(None, (_get_date_instance(end_date_academic),
-                                         _get_date_instance(end_date_educ_group_year),
-                                         _get_date_instance(end_date_student))))
-        new_deadline_tutor = _compute_delta_deadline_tutor(new_deadline, tutor_submission_date)
-
-        if _is_deadline_changed(sess_exam_deadline, new_deadline, new_deadline_tutor):
-            sess_exam_deadline.deadline = new_deadline
-            sess_exam_deadline.deadline_tutor = new_deadline_tutor
-            sess_exam_deadline.save()
+    with score_encoding_progress_summary.deferred_refresh():
+        for sess_exam_deadline in sessions_exam_deadlines:
+            _save_new_deadline(sess_exam_deadline, end_date_academic, end_date_educ_group_year, tutor_submission_date)
+
+
+def _save_new_deadline(sess_exam_deadline, end_date_academic, end_date_educ_group_year, tutor_submission_date):
+    end_date_student = _one_day_before(sess_exam_deadline.deliberation_date)
+
+    new_deadline = min(filter(None, (_get_date_instance(end_date_academic),
+                                     _get_date_instance(end_date_educ_group_year),
+                                     _get_date_instance(end_date_student))))
+    new_deadline_tutor = _compute_delta_deadline_tutor(new_deadline, tutor_submission_date)
+
+    if _is_deadline_changed(sess_exam_deadline, new_deadline, new_deadline_tutor):
+        sess_exam_deadline.deadline = new_deadline
+        sess_exam_deadline.deadline_tutor = new_deadline_tutor
+        sess_exam_deadline.save()
 
 
 def _is_deadline_changed(sess_exam_deadline, new_deadline, new_deadline_tutor):
@@ -0,0 +1,35 @@
+# Generated by Django 2.2.13 on 2021-02-15 10:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0587_search_title'),
+        ('assessments', '0003_remove_scoresheetaddress_offer_year'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoreEncodingProgressSummary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('changed', models.DateTimeField(auto_now=True, null=True)),
+                ('number_session', models.IntegerField()),
+                ('deadline', models.DateField(blank=True, null=True)),
+                ('total_exam_enrollments', models.PositiveIntegerField(default=0)),
+                ('exam_enrollments_encoded', models.PositiveIntegerField(default=0)),
+                ('draft_scores', models.PositiveIntegerField(default=0)),
+                ('scores_not_yet_submitted', models.PositiveIntegerField(default=0)),
+                ('student_specific_profiles', models.PositiveIntegerField(default=0)),
+                ('education_group_year', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='base.EducationGroupYear')),
+                ('learning_unit_year', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='base.LearningUnitYear')),
+            ],
+            options={
+                'unique_together': {('learning_unit_year', 'education_group_year', 'number_session', 'deadline')},
+                'index_together': {('learning_unit_year', 'number_session')},
+            },
+        ),
+    ]
@@ -0,0 +1,281 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import contextlib
+import threading
+from typing import Iterable, Tuple
+
+from django.db import models, transaction
+from django.db.models import Case, Count, Exists, F, IntegerField, OuterRef, Q, Subquery, Sum, When
+from django.utils import timezone
+
+from base.models.enums import exam_enrollment_state as enrollment_states
+from base.models.exam_enrollment import ExamEnrollment
+from base.models.learning_unit_year import LearningUnitYear
+from base.models.session_exam_deadline import SessionExamDeadline, compute_deadline_tutor
+from base.models.student_specific_profile import StudentSpecificProfile
+from osis_common.models.osis_model_admin import OsisModelAdmin
+
+# (learning_unit_year_id, number_session)
+ProgressKey = Tuple[int, int]
+
+COUNTER_FIELDS = [
+    'total_exam_enrollments',
+    'exam_enrollments_encoded',
+    'draft_scores',
+    'scores_not_yet_submitted',
+    'student_specific_profiles',
+]
+
+_local = threading.local()
+
+
+class ScoreEncodingProgressSummaryAdmin(OsisModelAdmin):
+    list_display = ('learning_unit_year', 'education_group_year', 'number_session', 'deadline',
+                    'exam_enrollments_encoded', 'total_exam_enrollments', 'changed')
+    list_filter = ('number_session', 'learning_unit_year__academic_year')
+    raw_id_fields = ('learning_unit_year', 'education_group_year')
+    search_fields = ['learning_unit_year__acronym', 'education_group_year__acronym']
+
+
+class ScoreEncodingProgressSummary(models.Model):
+    """
+    Counters of the exam enrollments (state ENROLLED) of a learning unit year inside an education group year for a
+    session, one row by tutor deadline. Maintained by refresh() when an enrollment changes and rebuilt by the
+    rebuild_score_encoding_progress command.
+    """
+    changed = models.DateTimeField(null=True, auto_now=True)
+    learning_unit_year = models.ForeignKey('base.LearningUnitYear', on_delete=models.CASCADE)
+    education_group_year = models.ForeignKey('base.EducationGroupYear', on_delete=models.CASCADE)
+    number_session = models.IntegerField()
+    deadline = models.DateField(blank=True, null=True)  # Tutor deadline (see compute_deadline_tutor)
+    total_exam_enrollments = models.PositiveIntegerField(default=0)
+    exam_enrollments_encoded = models.PositiveIntegerField(default=0)
+    draft_scores = models.PositiveIntegerField(default=0)
+    scores_not_yet_submitted = models.PositiveIntegerField(default=0)
+    student_specific_profiles = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('learning_unit_year', 'education_group_year', 'number_session', 'deadline')
+        index_together = ('learning_unit_year', 'number_session')
+
+    def __str__(self):
+        return u"%s - %s - %s" % (self.learning_unit_year, self.education_group_year, self.number_session)
+
+    @property
+    def has_student_specific_profile(self):
+        return self.student_specific_profiles > 0
+
+
+def refresh(keys: Iterable[ProgressKey]) -> None:
+    """
+    Recompute the counters of the given (learning_unit_year_id, number_session). Inside deferred_refresh(), the
+    keys are only collected and refreshed once when leaving the scope.
+    """
+    keys = set(keys)
+    if not keys:
+        return
+    pending_keys = getattr(_local, 'pending_keys', None)
+    if pending_keys is not None:
+        pending_keys.update(keys)
+        return
+
+    with transaction.atomic():
+        # Serialize the refreshes of a same learning unit year
+        list(
+            LearningUnitYear.objects.select_for_update().filter(
+                pk__in={learning_unit_year_id for learning_unit_year_id, _ in keys}
+            ).order_by('pk').values_list('pk', flat=True)
+        )
+        keys_filter = Q()
+        enrollments_filter = Q()
+        for learning_unit_year_id, number_session in keys:
+            keys_filter |= Q(learning_unit_year_id=learning_unit_year_id, number_session=number_session)
+            enrollments_filter |= Q(
+                learning_unit_enrollment__learning_unit_year_id=learning_unit_year_id,
+                session_exam__number_session=number_session,
+            )
+        _update_summaries_in_place(
+            ScoreEncodingProgressSummary.objects.filter(keys_filter),
+            _compute_summaries(ExamEnrollment.objects.filter(enrollments_filter))
+        )
+
+
+def rebuild(academic_year=None, number_session=None) -> int:
+    summaries = ScoreEncodingProgressSummary.objects.all()
+    exam_enrollments = ExamEnrollment.objects.all()
+    if academic_year:
+        summaries = summaries.filter(learning_unit_year__academic_year=academic_year)
+        exam_enrollments = exam_enrollments.filter(
+            learning_unit_enrollment__learning_unit_year__academic_year=academic_year
+        )
+    if number_session:
+        summaries = summaries.filter(number_session=number_session)
+        exam_enrollments = exam_enrollments.filter(session_exam__number_session=number_session)
+
+    with transaction.atomic():
+        summaries.delete()
+        created = ScoreEncodingProgressSummary.objects.bulk_create(
+            _compute_summaries(exam_enrollments),
+            batch_size=1000
+        )
+    return len(created)
+
+
+@contextlib.contextmanager
+def deferred_refresh():
+    """
+    Collect the keys to refresh and refresh them all at once when leaving the scope, in order to avoid recomputing
+    the same learning unit year for each saved exam enrollment. Nested scopes share the outermost one.
+    """
+    if getattr(_local, 'pending_keys', None) is not None:
+        yield
+        return
+    _local.pending_keys = set()
+    try:
+        yield
+    finally:
+        pending_keys, _local.pending_keys = _local.pending_keys, None
+        if not transaction.get_connection().needs_rollback:
+            refresh(pending_keys)
+
+
+def get_progress(learning_unit_year_id: int, education_group_year_id: int, number_session: int) -> float:
+    counters = ScoreEncodingProgressSummary.objects.filter(
+        learning_unit_year_id=learning_unit_year_id,
+        education_group_year_id=education_group_year_id,
+        number_session=number_session,
+    ).aggregate(encoded=Sum('exam_enrollments_encoded'), total=Sum('total_exam_enrollments'))
+    if not counters['total']:
+        return 0
+    return counters['encoded'] / counters['total'] * 100
+
+
+def _compute_summaries(exam_enrollments) -> Iterable[ScoreEncodingProgressSummary]:
+    rows = exam_enrollments.filter(
+        enrollment_state=enrollment_states.ENROLLED
+    ).annotate(
+        session_deadline=Subquery(
+            SessionExamDeadline.objects.filter(
+                offer_enrollment_id=OuterRef('learning_unit_enrollment__offer_enrollment_id'),
+                number_session=OuterRef('session_exam__number_session'),
+            ).distinct().values('deadline')[:1]
+        ),
+        session_deadline_tutor=Subquery(
+            SessionExamDeadline.objects.filter(
+                offer_enrollment_id=OuterRef('learning_unit_enrollment__offer_enrollment_id'),
+                number_session=OuterRef('session_exam__number_session'),
+            ).distinct().values('deadline_tutor')[:1]
+        ),
+        has_student_specific_profile=Exists(
+            StudentSpecificProfile.objects.filter(
+                student_id=OuterRef('learning_unit_enrollment__offer_enrollment__student_id')
+            )
+        ),
+    ).values(
+        'session_deadline',
+        'session_deadline_tutor',
+        summary_learning_unit_year_id=F('learning_unit_enrollment__learning_unit_year_id'),
+        summary_education_group_year_id=F('learning_unit_enrollment__offer_enrollment__education_group_year_id'),
+        summary_number_session=F('session_exam__number_session'),
+    ).annotate(
+        total_exam_enrollments=Count('id'),
+        exam_enrollments_encoded=_count_when(Q(score_final__isnull=False) | Q(justification_final__isnull=False)),
+        draft_scores=_count_when(
+            (Q(score_draft__isnull=False) | Q(justification_draft__isnull=False))
+            & Q(score_final__isnull=True) & Q(justification_final__isnull=True)
+        ),
+        scores_not_yet_submitted=_count_when(Q(score_final__isnull=True) & Q(justification_final__isnull=True)),
+        student_specific_profiles=_count_when(Q(has_student_specific_profile=True)),
+    ).order_by()
+
+    # Several session deadlines can give the same tutor deadline
+    summaries = {}
+    for row in rows:
+        key = (
+            row['summary_learning_unit_year_id'],
+            row['summary_education_group_year_id'],
+            row['summary_number_session'],
+            compute_deadline_tutor(row['session_deadline'], row['session_deadline_tutor']),
+        )
+        summary = summaries.setdefault(key, ScoreEncodingProgressSummary(
+            learning_unit_year_id=key[0],
+            education_group_year_id=key[1],
+            number_session=key[2],
+            deadline=key[3],
+        ))
+        summary.total_exam_enrollments += row['total_exam_enrollments']
+        summary.exam_enrollments_encoded += row['exam_enrollments_encoded']
+        summary.draft_scores += row['draft_scores']
+        summary.scores_not_yet_submitted += row['scores_not_yet_submitted']
+        summary.student_specific_profiles += row['student_specific_profiles']
+    return list(summaries.values())
+
+
+def _update_summaries_in_place(
+        existing_summaries,
+        computed_summaries: Iterable[ScoreEncodingProgressSummary]
+) -> None:
+    """ Keep the existing rows (and their pk) and only update their counters """
+    existing_by_key = {_get_summary_key(summary): summary for summary in existing_summaries}
+    now = timezone.now()
+    to_update = []
+    to_create = []
+    for computed in computed_summaries:
+        existing = existing_by_key.pop(_get_summary_key(computed), None)
+        if existing is None:
+            to_create.append(computed)
+            continue
+        changed = False
+        for field_name in COUNTER_FIELDS:
+            if getattr(existing, field_name) != getattr(computed, field_name):
+                setattr(existing, field_name, getattr(computed, field_name))
+                changed = True
+        if changed:
+            existing.changed = now
+            to_update.append(existing)
+
+    if existing_by_key:
+        ScoreEncodingProgressSummary.objects.filter(
+            pk__in=[summary.pk for summary in existing_by_key.values()]
+        ).delete()
+    if to_update:
+        # bulk_update() does not set the auto_now fields
+        ScoreEncodingProgressSummary.objects.bulk_update(to_update, COUNTER_FIELDS + ['changed'])
+    if to_create:
+        ScoreEncodingProgressSummary.objects.bulk_create(to_create)
+
+
+def _get_summary_key(summary: ScoreEncodingProgressSummary) -> tuple:
+    return (
+        summary.learning_unit_year_id,
+        summary.education_group_year_id,
+        summary.number_session,
+        summary.deadline,
+    )
+
+
+def _count_when(condition: Q) -> Sum:
+    return Sum(Case(When(condition, then=1), default=0, output_field=IntegerField()))
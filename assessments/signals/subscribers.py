@@ -23,9 +23,16 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from assessments.business import scores_encodings_deadline
+from assessments.models import score_encoding_progress_summary
+from base.models.exam_enrollment import ExamEnrollment
+from base.models.learning_unit_enrollment import LearningUnitEnrollment
+from base.models.offer_enrollment import OfferEnrollment
+from base.models.session_exam_deadline import SessionExamDeadline
+from base.models.student_specific_profile import StudentSpecificProfile
 from base.signals import publisher
 
 
@@ -42,3 +49,47 @@ def compute_student_score_encoding_deadline(sender, **kwargs):
 @receiver(publisher.compute_all_scores_encodings_deadlines)
 def compute_all_scores_encodings_deadlines(sender, **kwargs):
     scores_encodings_deadline.recompute_all_deadlines(kwargs['academic_calendar'])
+
+
+@receiver(post_save, sender=ExamEnrollment)
+@receiver(post_delete, sender=ExamEnrollment)
+def refresh_score_encoding_progress_of_exam_enrollment(sender, instance, **kwargs):
+    score_encoding_progress_summary.refresh([
+        (instance.learning_unit_enrollment.learning_unit_year_id, instance.session_exam.number_session)
+    ])
+
+
+@receiver(post_save, sender=SessionExamDeadline)
+@receiver(post_delete, sender=SessionExamDeadline)
+def refresh_score_encoding_progress_of_session_exam_deadline(sender, instance, **kwargs):
+    _refresh_score_encoding_progress(
+        learning_unit_enrollment__offer_enrollment_id=instance.offer_enrollment_id,
+        session_exam__number_session=instance.number_session,
+    )
+
+
+@receiver(post_save, sender=OfferEnrollment)
+def refresh_score_encoding_progress_of_offer_enrollment(sender, instance, created, **kwargs):
+    if not created:
+        _refresh_score_encoding_progress(learning_unit_enrollment__offer_enrollment_id=instance.pk)
+
+
+@receiver(post_save, sender=LearningUnitEnrollment)
+def refresh_score_encoding_progress_of_learning_unit_enrollment(sender, instance, created, **kwargs):
+    if not created:
+        _refresh_score_encoding_progress(learning_unit_enrollment_id=instance.pk)
+
+
+@receiver(post_save, sender=StudentSpecificProfile)
+@receiver(post_delete, sender=StudentSpecificProfile)
+def refresh_score_encoding_progress_of_student_specific_profile(sender, instance, **kwargs):
+    _refresh_score_encoding_progress(learning_unit_enrollment__offer_enrollment__student_id=instance.student_id)
+
+
+def _refresh_score_encoding_progress(**exam_enrollment_filters):
+    score_encoding_progress_summary.refresh(
+        ExamEnrollment.objects.filter(**exam_enrollment_filters).values_list(
+            'learning_unit_enrollment__learning_unit_year_id',
+            'session_exam__number_session',
+        ).distinct()
+    )
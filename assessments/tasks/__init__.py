@@ -1,4 +1,5 @@
 from . import check_academic_calendar
+from . import generate_score_sheets_archive
 
 from celery.schedules import crontab
 from backoffice.celery import app as celery_app
@@ -0,0 +1,21 @@
+from assessments.business import score_sheets_batch
+from backoffice.celery import app as celery_app
+from base.models.academic_year import AcademicYear
+from base.models.education_group_year import EducationGroupYear
+from base.utils.read_replica import read_replica
+
+
+@celery_app.task(bind=True)
+def run(self, education_group_year_id: int, number_session: int, academic_year_id: int) -> dict:
+    def update_progress(done: int, total: int):
+        self.update_state(state='PROGRESS', meta={'done': done, 'total': total})
+
+    with read_replica():
+        filename, content = score_sheets_batch.generate_score_sheets_archive(
+            EducationGroupYear.objects.get(pk=education_group_year_id),
+            number_session,
+            AcademicYear.objects.get(pk=academic_year_id),
+            on_progress=update_progress
+        )
+    score_sheets_batch.ScoreSheetsArchiveCache(self.request.id).save_archive(filename, content)
+    return {'filename': filename}
@@ -0,0 +1,150 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from decimal import Decimal
+
+from django.contrib.auth.models import Group
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from assessments.business import score_encoding_upload
+from assessments.tests.views.test_upload_xls_utils import generate_exam_enrollments
+from base.models.enums import number_session
+from base.models.enums.exam_enrollment_justification_type import ABSENCE_UNJUSTIFIED
+from base.models.exam_enrollment import ExamEnrollment
+from base.tests.factories.user import UserFactory
+
+
+class TestBuildScoreChange(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Group.objects.get_or_create(name="tutors")
+        cls.exam_enrollment = generate_exam_enrollments(2017)["exam_enrollments"][0]
+
+    def setUp(self):
+        self.exam_enrollment.refresh_from_db()
+
+    def test_should_return_change_without_saving_it(self):
+        self.exam_enrollment.score_encoded = 15
+
+        score_change = score_encoding_upload.build_score_change(self.exam_enrollment, 12, is_program_manager=False)
+
+        self.assertEqual(score_change.enrollment_id, self.exam_enrollment.pk)
+        self.assertEqual(score_change.row_number, 12)
+        self.assertIsNone(score_change.previous_score)
+        self.assertEqual(score_change.score, Decimal(15))
+        self.assertIsNone(ExamEnrollment.objects.get(pk=self.exam_enrollment.pk).score_draft)
+
+    def test_should_return_none_when_score_unchanged(self):
+        ExamEnrollment.objects.filter(pk=self.exam_enrollment.pk).update(score_draft=15)
+        self.exam_enrollment.refresh_from_db()
+        self.exam_enrollment.score_encoded = 15
+
+        self.assertIsNone(
+            score_encoding_upload.build_score_change(self.exam_enrollment, 12, is_program_manager=False)
+        )
+
+    def test_should_raise_validation_error_when_score_out_of_range(self):
+        self.exam_enrollment.score_encoded = 21
+
+        with self.assertRaises(ValidationError):
+            score_encoding_upload.build_score_change(self.exam_enrollment, 12, is_program_manager=False)
+
+
+class TestApplyScoreChanges(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Group.objects.get_or_create(name="tutors")
+        data = generate_exam_enrollments(2017)
+        cls.exam_enrollments = data["exam_enrollments"]
+        cls.learning_unit_year = data["learning_unit_year"]
+        cls.user = UserFactory()
+
+    def _build_preview(self, encoded_values):
+        score_changes = []
+        for row_number, (enrollment, (score, justification)) in enumerate(
+                zip(self.exam_enrollments, encoded_values), start=12
+        ):
+            enrollment.refresh_from_db()
+            enrollment.score_encoded, enrollment.justification_encoded = score, justification
+            score_changes.append(score_encoding_upload.build_score_change(enrollment, row_number, False))
+        return score_encoding_upload.ScoresUploadPreview(
+            number_session=number_session.ONE,
+            is_program_manager=False,
+            score_changes=score_changes
+        )
+
+    def test_should_save_all_changes(self):
+        preview = self._build_preview([(12, None), (None, ABSENCE_UNJUSTIFIED)])
+
+        updated_enrollments, outdated_changes = score_encoding_upload.apply_score_changes(
+            self.user,
+            self.learning_unit_year.id,
+            preview
+        )
+
+        self.assertEqual(len(updated_enrollments), 2)
+        self.assertEqual(outdated_changes, [])
+        self.assertEqual(ExamEnrollment.objects.get(pk=self.exam_enrollments[0].pk).score_draft, 12)
+        self.assertEqual(
+            ExamEnrollment.objects.get(pk=self.exam_enrollments[1].pk).justification_draft,
+            ABSENCE_UNJUSTIFIED
+        )
+
+    def test_should_not_apply_change_of_enrollment_modified_since_preview(self):
+        preview = self._build_preview([(12, None), (14, None)])
+        ExamEnrollment.objects.filter(pk=self.exam_enrollments[0].pk).update(score_draft=8, changed=timezone.now())
+
+        updated_enrollments, outdated_changes = score_encoding_upload.apply_score_changes(
+            self.user,
+            self.learning_unit_year.id,
+            preview
+        )
+
+        self.assertEqual([enrollment.pk for enrollment in updated_enrollments], [self.exam_enrollments[1].pk])
+        self.assertEqual(outdated_changes, preview.score_changes[:1])
+        self.assertEqual(ExamEnrollment.objects.get(pk=self.exam_enrollments[0].pk).score_draft, 8)
+
+    def test_should_save_with_same_number_of_queries_whatever_the_number_of_changes(self):
+        one_change_preview = self._build_preview([(12, None)])
+        with CaptureQueriesContext(connection) as one_change_context:
+            score_encoding_upload.apply_score_changes(self.user, self.learning_unit_year.id, one_change_preview)
+
+        two_changes_preview = self._build_preview([(13, None), (14, None)])
+        with CaptureQueriesContext(connection) as two_changes_context:
+            score_encoding_upload.apply_score_changes(self.user, self.learning_unit_year.id, two_changes_preview)
+
+        self.assertEqual(len(one_change_context.captured_queries), len(two_changes_context.captured_queries))
+
+    def test_should_lock_enrollments_while_checking_and_saving_changes(self):
+        preview = self._build_preview([(12, None)])
+
+        with CaptureQueriesContext(connection) as context:
+            score_encoding_upload.apply_score_changes(self.user, self.learning_unit_year.id, preview)
+
+        self.assertTrue(any('FOR UPDATE' in query['sql'] for query in context.captured_queries))
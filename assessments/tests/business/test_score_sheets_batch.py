@@ -0,0 +1,108 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import io
+import zipfile
+from unittest import mock
+
+from django.contrib.auth.models import Group
+from django.http import HttpResponse
+from django.test import TestCase
+
+from assessments.business import score_encoding_sheet, score_sheets_batch
+from assessments.tests.views.test_upload_xls_utils import generate_exam_enrollments, LEARNING_UNIT_ACRONYM
+from base.models.enums import number_session
+
+
+@mock.patch("osis_common.document.paper_sheet.print_notes", return_value=HttpResponse(b"%PDF"))
+class TestGenerateScoreSheetsArchive(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Group.objects.get_or_create(name="tutors")
+        data = generate_exam_enrollments(2017)
+        cls.academic_year = data["academic_year"]
+        cls.education_group_year = data["education_group_years"][0]
+        cls.exam_enrollments = data["exam_enrollments"]
+
+    def test_should_group_enrollments_by_learning_unit_year(self, mock_print_notes):
+        enrollments_by_learning_unit_year = score_sheets_batch.get_enrollments_by_learning_unit_year(
+            self.education_group_year,
+            number_session.ONE,
+            self.academic_year
+        )
+        learning_unit_year_id = self.exam_enrollments[0].session_exam.learning_unit_year_id
+        self.assertCountEqual(enrollments_by_learning_unit_year.keys(), [learning_unit_year_id])
+        self.assertCountEqual(enrollments_by_learning_unit_year[learning_unit_year_id], self.exam_enrollments)
+
+    def test_should_zip_pdf_and_xls_of_each_learning_unit(self, mock_print_notes):
+        on_progress = mock.Mock()
+        filename, content = score_sheets_batch.generate_score_sheets_archive(
+            self.education_group_year,
+            number_session.ONE,
+            self.academic_year,
+            on_progress=on_progress
+        )
+
+        self.assertEqual(
+            filename,
+            "score_sheets_{}_2017_session_{}.zip".format(self.education_group_year.acronym, number_session.ONE)
+        )
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            self.assertCountEqual(
+                archive.namelist(),
+                [
+                    "{}.pdf".format(LEARNING_UNIT_ACRONYM),
+                    "session_2017_{}_{}.xlsx".format(number_session.ONE, LEARNING_UNIT_ACRONYM)
+                ]
+            )
+        on_progress.assert_called_once_with(1, 1)
+
+    def test_should_compute_score_sheet_data_once_for_all_learning_units(self, mock_print_notes):
+        with mock.patch(
+            "assessments.business.score_encoding_sheet.scores_sheet_data",
+            wraps=score_encoding_sheet.scores_sheet_data
+        ) as mock_scores_sheet_data:
+            score_sheets_batch.generate_score_sheets_archive(
+                self.education_group_year,
+                number_session.ONE,
+                self.academic_year
+            )
+
+        mock_scores_sheet_data.assert_called_once()
+        sheet_data = mock_print_notes.call_args[0][0]
+        self.assertEqual(
+            [learning_unit_year['acronym'] for learning_unit_year in sheet_data['learning_unit_years']],
+            [LEARNING_UNIT_ACRONYM]
+        )
+
+    def test_should_generate_empty_archive_when_no_enrollment(self, mock_print_notes):
+        _, content = score_sheets_batch.generate_score_sheets_archive(
+            self.education_group_year,
+            number_session.TWO,
+            self.academic_year
+        )
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            self.assertEqual(archive.namelist(), [])
+        self.assertFalse(mock_print_notes.called)
@@ -0,0 +1,141 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+
+from django.test import TestCase
+
+from assessments.models import score_encoding_progress_summary
+from assessments.models.score_encoding_progress_summary import ScoreEncodingProgressSummary
+from base.models.enums import exam_enrollment_justification_type as justification_types
+from base.models.enums import exam_enrollment_state, number_session
+from base.tests.factories.exam_enrollment import ExamEnrollmentFactory
+from base.tests.factories.learning_unit_enrollment import LearningUnitEnrollmentFactory
+from base.tests.factories.learning_unit_year import LearningUnitYearFactory
+from base.tests.factories.offer_enrollment import OfferEnrollmentFactory
+from base.tests.factories.session_exam_deadline import SessionExamDeadlineFactory
+from base.tests.factories.session_examen import SessionExamFactory
+from base.tests.factories.student_specific_profile import StudentSpecificProfileFactory
+
+
+class TestScoreEncodingProgressSummary(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.learning_unit_year = LearningUnitYearFactory()
+        cls.session_exam = SessionExamFactory(
+            number_session=number_session.ONE,
+            learning_unit_year=cls.learning_unit_year
+        )
+        cls.offer_enrollment = OfferEnrollmentFactory()
+        cls.session_exam_deadline = SessionExamDeadlineFactory(
+            offer_enrollment=cls.offer_enrollment,
+            number_session=number_session.ONE,
+            deadline=datetime.date(2021, 1, 20),
+            deadline_tutor=5,
+        )
+        cls.exam_enrollments = [
+            ExamEnrollmentFactory(
+                session_exam=cls.session_exam,
+                learning_unit_enrollment=LearningUnitEnrollmentFactory(
+                    learning_unit_year=cls.learning_unit_year,
+                    offer_enrollment=cls.offer_enrollment,
+                )
+            ) for _ in range(4)
+        ]
+
+    def test_counters_updated_when_scores_change(self):
+        self.exam_enrollments[0].score_final = 12
+        self.exam_enrollments[0].save()
+        self.exam_enrollments[1].score_draft = 8
+        self.exam_enrollments[1].save()
+
+        summary = ScoreEncodingProgressSummary.objects.get(learning_unit_year=self.learning_unit_year)
+        self.assertEqual(summary.education_group_year_id, self.offer_enrollment.education_group_year_id)
+        self.assertEqual(summary.number_session, number_session.ONE)
+        self.assertEqual(summary.deadline, datetime.date(2021, 1, 15))
+        self.assertEqual(summary.total_exam_enrollments, 4)
+        self.assertEqual(summary.exam_enrollments_encoded, 1)
+        self.assertEqual(summary.draft_scores, 1)
+        self.assertEqual(summary.scores_not_yet_submitted, 3)
+        self.assertFalse(summary.has_student_specific_profile)
+
+    def test_counters_ignore_not_enrolled_exam_enrollments(self):
+        self.exam_enrollments[0].enrollment_state = exam_enrollment_state.NOT_ENROLLED
+        self.exam_enrollments[0].save()
+
+        summary = ScoreEncodingProgressSummary.objects.get(learning_unit_year=self.learning_unit_year)
+        self.assertEqual(summary.total_exam_enrollments, 3)
+
+    def test_counters_updated_when_student_specific_profile_created(self):
+        StudentSpecificProfileFactory(student=self.offer_enrollment.student)
+
+        summary = ScoreEncodingProgressSummary.objects.get(learning_unit_year=self.learning_unit_year)
+        self.assertTrue(summary.has_student_specific_profile)
+
+    def test_deadline_updated_when_session_exam_deadline_changes(self):
+        self.session_exam_deadline.deadline_tutor = None
+        self.session_exam_deadline.save()
+
+        summary = ScoreEncodingProgressSummary.objects.get(learning_unit_year=self.learning_unit_year)
+        self.assertIsNone(summary.deadline)
+
+    def test_deferred_refresh_when_leaving_scope(self):
+        with score_encoding_progress_summary.deferred_refresh():
+            for exam_enrollment in self.exam_enrollments:
+                exam_enrollment.justification_final = justification_types.ABSENCE_UNJUSTIFIED
+                exam_enrollment.save()
+            summary = ScoreEncodingProgressSummary.objects.get(learning_unit_year=self.learning_unit_year)
+            self.assertEqual(summary.exam_enrollments_encoded, 0)
+
+        summary.refresh_from_db()
+        self.assertEqual(summary.exam_enrollments_encoded, 4)
+
+    def test_rebuild(self):
+        ScoreEncodingProgressSummary.objects.all().delete()
+
+        created = score_encoding_progress_summary.rebuild(academic_year=self.learning_unit_year.academic_year)
+
+        self.assertEqual(created, 1)
+        summary = ScoreEncodingProgressSummary.objects.get(learning_unit_year=self.learning_unit_year)
+        self.assertEqual(summary.total_exam_enrollments, 4)
+
+    def test_get_progress(self):
+        self.exam_enrollments[0].score_final = 12
+        self.exam_enrollments[0].save()
+
+        progress = score_encoding_progress_summary.get_progress(
+            self.learning_unit_year.id,
+            self.offer_enrollment.education_group_year_id,
+            number_session.ONE
+        )
+        self.assertEqual(progress, 25)
+
+    def test_get_progress_without_exam_enrollment(self):
+        progress = score_encoding_progress_summary.get_progress(
+            self.learning_unit_year.id,
+            self.offer_enrollment.education_group_year_id,
+            number_session.TWO
+        )
+        self.assertEqual(progress, 0)
@@ -0,0 +1,114 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.contrib.auth.models import Group
+from django.http import HttpResponseNotFound
+from django.test import TestCase
+from django.urls import reverse
+
+from assessments.business.score_sheets_batch import ScoreSheetsArchiveCache
+from assessments.tests.views.test_score_encoding import add_permission
+from assessments.tests.views.test_upload_xls_utils import generate_exam_enrollments
+from base.tests.factories.person import PersonFactory
+from base.tests.factories.program_manager import ProgramManagerFactory
+from base.tests.mixin.session_exam_calendar import SessionExamCalendarMockMixin
+
+
+class TestScoreSheetsArchive(SessionExamCalendarMockMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Group.objects.get_or_create(name="program_managers")
+        data = generate_exam_enrollments(2017)
+        cls.session_exam_calendar = data["session_exam_calendar"]
+        cls.education_group_year = data["education_group_years"][0]
+        cls.program_manager = ProgramManagerFactory(education_group=cls.education_group_year.education_group)
+        add_permission(cls.program_manager.person.user, "can_access_scoreencoding")
+        cls.request_url = reverse('score_sheets_archive_request', args=[cls.education_group_year.pk])
+
+    def setUp(self):
+        self.mock_session_exam_calendar(current_session_exam=self.session_exam_calendar)
+        self.client.force_login(self.program_manager.person.user)
+        self.job_id = "5ba4a8e6-4b9d-4c9a-9c55-1a2a0ee8c6a1"
+        self.archive_cache = ScoreSheetsArchiveCache(self.job_id)
+        self.archive_cache.set_cached_data({'user_id': self.program_manager.person.user.pk, 'acronym': 'DROI1BA'})
+        self.addCleanup(self.archive_cache.clear)
+
+    @mock.patch("assessments.tasks.generate_score_sheets_archive.run.apply_async")
+    def test_should_start_generation_and_redirect_to_status(self, mock_apply_async):
+        response = self.client.post(self.request_url)
+
+        job_id = mock_apply_async.call_args[1]['task_id']
+        self.assertRedirects(
+            response,
+            reverse('score_sheets_archive_status', args=[job_id]),
+            fetch_redirect_response=False
+        )
+        self.assertEqual(
+            mock_apply_async.call_args[1]['kwargs']['education_group_year_id'],
+            self.education_group_year.pk
+        )
+        self.assertTrue(ScoreSheetsArchiveCache(job_id).is_owned_by(self.program_manager.person.user))
+
+    @mock.patch("assessments.tasks.generate_score_sheets_archive.run.apply_async")
+    def test_should_not_start_generation_for_a_program_not_managed(self, mock_apply_async):
+        other_user = PersonFactory().user
+        add_permission(other_user, "can_access_scoreencoding")
+        self.client.force_login(other_user)
+
+        response = self.client.post(self.request_url)
+
+        self.assertEqual(response.status_code, HttpResponseNotFound.status_code)
+        self.assertFalse(mock_apply_async.called)
+
+    @mock.patch("assessments.views.score_sheets_archive.AsyncResult")
+    def test_should_display_progress_while_generating(self, mock_async_result):
+        mock_async_result.return_value = mock.Mock(state='PROGRESS', info={'done': 3, 'total': 10})
+
+        response = self.client.get(reverse('score_sheets_archive_status', args=[self.job_id]))
+
+        self.assertTemplateUsed(response, "score_sheets_archive.html")
+        self.assertFalse(response.context['is_ready'])
+        self.assertEqual(response.context['done'], 3)
+        self.assertEqual(response.context['total'], 10)
+
+    def test_should_not_display_status_of_a_job_of_another_user(self):
+        other_user = PersonFactory().user
+        add_permission(other_user, "can_access_scoreencoding")
+        self.client.force_login(other_user)
+
+        response = self.client.get(reverse('score_sheets_archive_status', args=[self.job_id]))
+
+        self.assertEqual(response.status_code, HttpResponseNotFound.status_code)
+
+    def test_should_download_archive_when_ready(self):
+        self.archive_cache.save_archive("score_sheets.zip", b"archive")
+
+        response = self.client.get(reverse('score_sheets_archive_download', args=[self.job_id]))
+
+        self.assertEqual(response['Content-Type'], 'application/zip')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename=score_sheets.zip')
+        self.assertEqual(response.content, b"archive")
@@ -24,15 +24,22 @@
 #
 ##############################################################################
 import datetime
+import io
 from unittest import mock
 
 from django.contrib.auth.models import Group
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.http import Http404
 from django.test import TestCase, TransactionTestCase
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from openpyxl import load_workbook
+from openpyxl.writer.excel import save_virtual_workbook
 
-from assessments.views.upload_xls_utils import _get_score_list_filtered_by_enrolled_state
+from assessments.business import score_encoding_export
+from assessments.views.upload_xls_utils import _get_score_list_filtered_by_enrolled_state, col_score, \
+    col_justification
 from attribution.tests.factories.attribution import AttributionFactory
 from base.models.enums import exam_enrollment_state
 from base.models.enums import number_session, exam_enrollment_justification_type
@@ -58,10 +65,28 @@ EMAIL_1 = "adam.smith@test.be"
 EMAIL_2 = "john.doe@test.be"
 
 
+# First line of the enrollments in the file built by score_encoding_export
+FIRST_ENROLLMENT_ROW = 12
+
+
 def _get_list_tag_and_content(messages):
     return [(m.tags, m.message) for m in messages]
 
 
+def _generate_score_sheet(exam_enrollments, scores):
+    """
+    Build the excel file of the exam enrollments as downloaded by the tutor, and encode the given scores (or
+    justifications) on the lines of the enrollments.
+    """
+    filename, content = score_encoding_export.build_xls(exam_enrollments, is_program_manager=False)
+    workbook = load_workbook(io.BytesIO(content))
+    worksheet = workbook.active
+    for index, score in enumerate(scores):
+        column = col_justification if isinstance(score, str) else col_score
+        worksheet.cell(row=FIRST_ENROLLMENT_ROW + index, column=column + 1).value = score
+    return SimpleUploadedFile(filename, save_virtual_workbook(workbook))
+
+
 def generate_exam_enrollments(year, with_different_offer=False):
     number_enrollments = 2
     academic_year = AcademicYearFactory(year=year)
@@ -131,11 +156,18 @@ class MixinTestUploadScoresFile(TestCase):
             student.person.save()
 
         cls.url = reverse('upload_encoding', kwargs={'learning_unit_year_id': cls.learning_unit_year.id})
+        cls.confirm_url = reverse('upload_encoding_confirm', kwargs={'learning_unit_year_id': cls.learning_unit_year.id})
 
     def setUp(self):
         self.a_user = self.attribution.tutor.person.user
         self.client.force_login(user=self.a_user)
 
+    def upload_and_confirm(self, score_sheet_path):
+        with open(score_sheet_path, 'rb') as score_sheet:
+            upload_response = self.client.post(self.url, {'file': score_sheet}, follow=True)
+        confirm_response = self.client.post(self.confirm_url, follow=True)
+        return upload_response, confirm_response
+
     def assert_enrollments_equal(self, exam_enrollments, attribute_value_list):
         [enrollment.refresh_from_db() for enrollment in exam_enrollments]
         data = zip(exam_enrollments, attribute_value_list)
@@ -145,17 +177,16 @@ class MixinTestUploadScoresFile(TestCase):
 
 
 class TestTransactionNonAtomicUploadXls(MixinTestUploadScoresFile, TransactionTestCase):
-    @mock.patch("assessments.views.upload_xls_utils._show_error_messages", side_effect=Http404)
+    @mock.patch("assessments.views.upload_xls_utils._show_saved_scores_message", side_effect=Http404)
     def test_when_exception_occured_after_saving_scores(self, mock_method_that_raise_exception):
         SCORE_1 = 16
         SCORE_2 = exam_enrollment_justification_type.ABSENCE_UNJUSTIFIED
-        with open("assessments/tests/resources/correct_score_sheet.xlsx", 'rb') as score_sheet:
-            self.client.post(self.url, {'file': score_sheet}, follow=True)
-            self.assertTrue(mock_method_that_raise_exception.called)
-            self.assert_enrollments_equal(
-                self.exam_enrollments,
-                [("score_draft", SCORE_1), ("justification_draft", SCORE_2)]
-            )
+        self.upload_and_confirm("assessments/tests/resources/correct_score_sheet.xlsx")
+        self.assertTrue(mock_method_that_raise_exception.called)
+        self.assert_enrollments_equal(
+            self.exam_enrollments,
+            [("score_draft", SCORE_1), ("justification_draft", SCORE_2)]
+        )
 
 
 class TestUploadXls(MixinTestUploadScoresFile, TestCase):
@@ -209,51 +240,50 @@ class TestUploadXls(MixinTestUploadScoresFile, TestCase):
         NUMBER_CORRECT_SCORES = "2"
         SCORE_1 = 16
         SCORE_2 = exam_enrollment_justification_type.ABSENCE_UNJUSTIFIED
-        with open("assessments/tests/resources/correct_score_sheet.xlsx", 'rb') as score_sheet:
-            response = self.client.post(self.url, {'file': score_sheet}, follow=True)
-            messages = list(response.context['messages'])
+        _, response = self.upload_and_confirm("assessments/tests/resources/correct_score_sheet.xlsx")
+        messages = list(response.context['messages'])
 
-            messages_tag_and_content = _get_list_tag_and_content(messages)
-            self.assertIn(('success', '%s %s' % (NUMBER_CORRECT_SCORES, _('Score(s) saved'))),
-                          messages_tag_and_content)
+        messages_tag_and_content = _get_list_tag_and_content(messages)
+        self.assertIn(('success', '%s %s' % (NUMBER_CORRECT_SCORES, _('Score(s) saved'))),
+                      messages_tag_and_content)
 
-            self.assert_enrollments_equal(
-                self.exam_enrollments,
-                [("score_draft", SCORE_1), ("justification_draft", SCORE_2)]
-            )
+        self.assert_enrollments_equal(
+            self.exam_enrollments,
+            [("score_draft", SCORE_1), ("justification_draft", SCORE_2)]
+        )
 
     def test_with_formula(self):
         NUMBER_SCORES = "2"
-        with open("assessments/tests/resources/score_sheet_with_formula.xlsx", 'rb') as score_sheet:
-            response = self.client.post(self.url, {'file': score_sheet}, follow=True)
-            messages = list(response.context['messages'])
+        _, response = self.upload_and_confirm("assessments/tests/resources/score_sheet_with_formula.xlsx")
+        messages = list(response.context['messages'])
 
-            messages_tag_and_content = _get_list_tag_and_content(messages)
-            self.assertIn(('success', '%s %s' % (NUMBER_SCORES, _('Score(s) saved'))),
-                          messages_tag_and_content)
+        messages_tag_and_content = _get_list_tag_and_content(messages)
+        self.assertIn(('success', '%s %s' % (NUMBER_SCORES, _('Score(s) saved'))),
+                      messages_tag_and_content)
 
-            self.assert_enrollments_equal(
-                self.exam_enrollments,
-                [("score_draft", 15), ("score_draft", 17)]
-            )
+        self.assert_enrollments_equal(
+            self.exam_enrollments,
+            [("score_draft", 15), ("score_draft", 17)]
+        )
 
     def test_with_incorrect_formula(self):
         NUMBER_CORRECT_SCORES = "1"
         INCORRECT_LINE = "13"
-        with open("assessments/tests/resources/incorrect_formula.xlsx", 'rb') as score_sheet:
-            response = self.client.post(self.url, {'file': score_sheet}, follow=True)
-            messages = list(response.context['messages'])
-
-            messages_tag_and_content = _get_list_tag_and_content(messages)
-            self.assertIn(('error', "%s : %s %s" % (_("Scores must be between 0 and 20"), _('Row'), INCORRECT_LINE)),
-                          messages_tag_and_content)
-            self.assertIn(('success', '%s %s' % (NUMBER_CORRECT_SCORES, _('Score(s) saved'))),
-                          messages_tag_and_content)
-
-            self.assert_enrollments_equal(
-                self.exam_enrollments[:1],
-                [("score_draft", 15)]
-            )
+        upload_response, confirm_response = self.upload_and_confirm(
+            "assessments/tests/resources/incorrect_formula.xlsx"
+        )
+
+        upload_messages = _get_list_tag_and_content(list(upload_response.context['messages']))
+        self.assertIn(('error', "%s : %s %s" % (_("Scores must be between 0 and 20"), _('Row'), INCORRECT_LINE)),
+                      upload_messages)
+        confirm_messages = _get_list_tag_and_content(list(confirm_response.context['messages']))
+        self.assertIn(('success', '%s %s' % (NUMBER_CORRECT_SCORES, _('Score(s) saved'))),
+                      confirm_messages)
+
+        self.assert_enrollments_equal(
+            self.exam_enrollments[:1],
+            [("score_draft", 15)]
+        )
 
     def test_with_registration_id_not_matching_email(self):
         INCORRECT_LINES = '12, 13'
@@ -269,35 +299,76 @@ class TestUploadXls(MixinTestUploadScoresFile, TestCase):
 
     def test_with_correct_score_sheet_white_spaces_around_emails(self):
         NUMBER_CORRECT_SCORES = "2"
-        with open("assessments/tests/resources/correct_score_sheet_spaces_around_emails.xlsx", 'rb') as score_sheet:
-            response = self.client.post(self.url, {'file': score_sheet}, follow=True)
-            messages = list(response.context['messages'])
+        _, response = self.upload_and_confirm(
+            "assessments/tests/resources/correct_score_sheet_spaces_around_emails.xlsx"
+        )
+        messages = list(response.context['messages'])
 
-            messages_tag_and_content = _get_list_tag_and_content(messages)
-            self.assertIn(('success', '%s %s' % (NUMBER_CORRECT_SCORES, _('Score(s) saved'))),
-                          messages_tag_and_content)
+        messages_tag_and_content = _get_list_tag_and_content(messages)
+        self.assertIn(('success', '%s %s' % (NUMBER_CORRECT_SCORES, _('Score(s) saved'))),
+                      messages_tag_and_content)
 
-            self.assert_enrollments_equal(
-                self.exam_enrollments,
-                [("score_draft", 16), ("justification_draft", exam_enrollment_justification_type.ABSENCE_UNJUSTIFIED)]
-            )
+        self.assert_enrollments_equal(
+            self.exam_enrollments,
+            [("score_draft", 16), ("justification_draft", exam_enrollment_justification_type.ABSENCE_UNJUSTIFIED)]
+        )
 
     def test_with_correct_score_sheet_white_one_empty_email(self):
         self.students[0].person.email = ""
         self.students[0].person.save()
         NUMBER_CORRECT_SCORES = "2"
-        with open("assessments/tests/resources/correct_score_sheet_one_empty_email.xlsx", 'rb') as score_sheet:
-            response = self.client.post(self.url, {'file': score_sheet}, follow=True)
-            messages = list(response.context['messages'])
-
-            messages_tag_and_content = _get_list_tag_and_content(messages)
-            self.assertIn(('success', '%s %s' % (NUMBER_CORRECT_SCORES, _('Score(s) saved'))),
-                          messages_tag_and_content)
+        _, response = self.upload_and_confirm("assessments/tests/resources/correct_score_sheet_one_empty_email.xlsx")
+        messages = list(response.context['messages'])
 
-            self.assert_enrollments_equal(
-                self.exam_enrollments,
-                [("score_draft", 16), ("justification_draft", exam_enrollment_justification_type.ABSENCE_UNJUSTIFIED)]
-            )
+        messages_tag_and_content = _get_list_tag_and_content(messages)
+        self.assertIn(('success', '%s %s' % (NUMBER_CORRECT_SCORES, _('Score(s) saved'))),
+                      messages_tag_and_content)
+
+        self.assert_enrollments_equal(
+            self.exam_enrollments,
+            [("score_draft", 16), ("justification_draft", exam_enrollment_justification_type.ABSENCE_UNJUSTIFIED)]
+        )
+
+    def test_should_not_save_scores_before_confirmation(self):
+        score_sheet = _generate_score_sheet(self.exam_enrollments, [12, 'A'])
+
+        response = self.client.post(self.url, {'file': score_sheet}, follow=True)
+
+        self.assertTemplateUsed(response, "upload_scores_preview.html")
+        self.assertEqual(
+            [(score_change.score, score_change.justification) for score_change in response.context['score_changes']],
+            [(12, None), (None, exam_enrollment_justification_type.ABSENCE_UNJUSTIFIED)]
+        )
+        self.assert_enrollments_equal(self.exam_enrollments, [("score_draft", None), ("justification_draft", None)])
+
+    def test_should_save_generated_score_sheet_once_confirmed(self):
+        score_sheet = _generate_score_sheet(self.exam_enrollments, [12, 'A'])
+        self.client.post(self.url, {'file': score_sheet})
+
+        response = self.client.post(self.confirm_url, follow=True)
+
+        self.assertIn(('success', '%s %s' % ("2", _('Score(s) saved'))),
+                      _get_list_tag_and_content(list(response.context['messages'])))
+        self.assert_enrollments_equal(
+            self.exam_enrollments,
+            [("score_draft", 12), ("justification_draft", exam_enrollment_justification_type.ABSENCE_UNJUSTIFIED)]
+        )
+
+    def test_should_not_save_score_modified_since_upload(self):
+        score_sheet = _generate_score_sheet(self.exam_enrollments, [12, 14])
+        self.client.post(self.url, {'file': score_sheet})
+        ExamEnrollment.objects.filter(pk=self.exam_enrollments[0].pk).update(
+            score_draft=8,
+            changed=timezone.now()
+        )
+
+        response = self.client.post(self.confirm_url, follow=True)
+
+        self.assertIn(('warning', "%s : %s %s" % (_("The score has been modified since the upload of the file"),
+                                                  _('Line'),
+                                                  FIRST_ENROLLMENT_ROW)),
+                      _get_list_tag_and_content(list(response.context['messages'])))
+        self.assert_enrollments_equal(self.exam_enrollments, [("score_draft", 8), ("score_draft", 14)])
 
     def test_get_score_list_filtered_by_enrolled_state(self):
         enrolled_exam_enrollment = ExamEnrollment.objects.all()
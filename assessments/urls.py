@@ -25,7 +25,8 @@
 ##############################################################################
 from django.conf.urls import url, include
 
-from assessments.views import score_encoding, upload_xls_utils, pgm_manager_administration, score_sheet
+from assessments.views import score_encoding, upload_xls_utils, pgm_manager_administration, score_sheet, \
+    score_sheets_archive
 from assessments.views import scores_responsible
 from assessments.views.pgm_manager_administration import ProgramManagerListView, ProgramManagerDeleteView, \
     ProgramManagerCreateView, PersonAutocomplete, MainProgramManagerUpdateView, MainProgramManagerPersonUpdateView, \
@@ -57,10 +58,22 @@ urlpatterns = [
             score_encoding.notes_printing_all, name='notes_printing_all'),
         url(r'^notes_printing/(?P<learning_unit_year_id>[0-9]+)(?:/(?P<tutor_id>[0-9]+))?/$',
             score_encoding.notes_printing, name='notes_printing'),
+        url(r'^score_sheets_archive/', include([
+            url(r'^(?P<education_group_year_id>[0-9]+)/$',
+                score_sheets_archive.request_score_sheets_archive, name='score_sheets_archive_request'),
+            url(r'^job/(?P<job_id>[0-9a-f-]+)/$',
+                score_sheets_archive.score_sheets_archive_status, name='score_sheets_archive_status'),
+            url(r'^job/(?P<job_id>[0-9a-f-]+)/download/$',
+                score_sheets_archive.download_score_sheets_archive, name='score_sheets_archive_download'),
+        ])),
         url(r'^xlsdownload/([0-9]+)/$',
             score_encoding.export_xls, name='scores_encoding_download'),
         url(r'^upload/(?P<learning_unit_year_id>[0-9]+)/$',
             upload_xls_utils.upload_scores_file, name='upload_encoding'),
+        url(r'^upload/(?P<learning_unit_year_id>[0-9]+)/preview/$',
+            upload_xls_utils.upload_scores_preview, name='upload_encoding_preview'),
+        url(r'^upload/(?P<learning_unit_year_id>[0-9]+)/confirm/$',
+            upload_xls_utils.confirm_scores_upload, name='upload_encoding_confirm'),
     ])),
 
     url(r'^offers/', include([
@@ -45,6 +45,7 @@ import base
 from assessments.business import score_encoding_progress, score_encoding_list, score_encoding_export
 from assessments.business import score_encoding_sheet
 from assessments.business.score_encoding_list import ScoresEncodingList
+from assessments.models import score_encoding_progress_summary
 from assessments.models import score_sheet_address as score_sheet_address_mdl
 from attribution import models as mdl_attr
 from base import models as mdl
@@ -279,20 +280,21 @@ def online_encoding_submission(request, learning_unit_year_id):
         ex for ex in scores_list.enrollments
         if not ex.is_final and ex.enrollment_state == exam_enrollment_state.ENROLLED
     ])
-    for exam_enroll in draft_scores_not_sumitted_yet:
-        if (exam_enroll.score_draft is not None and exam_enroll.score_final is None) \
-                or (exam_enroll.justification_draft and not exam_enroll.justification_final):
-            submitted_enrollments.append(exam_enroll)
-            not_submitted_enrollments.remove(exam_enroll)
-        if exam_enroll.is_draft:
-            if exam_enroll.score_draft is not None:
-                exam_enroll.score_final = exam_enroll.score_draft
-            if exam_enroll.justification_draft:
-                exam_enroll.justification_final = exam_enroll.justification_draft
-            exam_enroll.full_clean()
-            with transaction.atomic():
-                exam_enroll.save()
-                mdl.exam_enrollment.create_exam_enrollment_historic(request.user, exam_enroll)
+    with score_encoding_progress_summary.deferred_refresh():
+        for exam_enroll in draft_scores_not_sumitted_yet:
+            if (exam_enroll.score_draft is not None and exam_enroll.score_final is None) \
+                    or (exam_enroll.justification_draft and not exam_enroll.justification_final):
+                submitted_enrollments.append(exam_enroll)
+                not_submitted_enrollments.remove(exam_enroll)
+            if exam_enroll.is_draft:
+                if exam_enroll.score_draft is not None:
+                    exam_enroll.score_final = exam_enroll.score_draft
+                if exam_enroll.justification_draft:
+                    exam_enroll.justification_final = exam_enroll.justification_draft
+                exam_enroll.full_clean()
+                with transaction.atomic():
+                    exam_enroll.save()
+                    mdl.exam_enrollment.create_exam_enrollment_historic(request.user, exam_enroll)
 
     # Send mail to all the teachers of the submitted learning unit on any submission
     all_encoded = len(not_submitted_enrollments) == 0
@@ -508,7 +510,11 @@ def __send_message_for_education_group_year(
         updated_enrollments=None,
 ):
     enrollments = filter_enrollments_by_education_group_year(all_enrollments, education_group_year)
-    progress = mdl.exam_enrollment.calculate_exam_enrollment_progress(enrollments)
+    progress = score_encoding_progress_summary.get_progress(
+        learning_unit_year.id,
+        education_group_year.id,
+        enrollments[0].session_exam.number_session if enrollments else None
+    )
     offer_acronym = education_group_year.acronym
     sent_error_message = None
     if progress == 100:
@@ -573,10 +579,6 @@ def bulk_send_messages_to_notify_encoding_progress(logged_user, updated_enrollme
         mail_already_sent_by_learning_unit = set()
         for enrollment in updated_enrollments:
             learning_unit_year = enrollment.learning_unit_enrollment.learning_unit_year
-            scores_list_before_update = score_encoding_list.get_scores_encoding_list(
-                user=logged_user,
-                learning_unit_year_id=learning_unit_year.id
-            )
             if learning_unit_year in mail_already_sent_by_learning_unit:
                 continue
             scores_list = score_encoding_list.get_scores_encoding_list(
@@ -589,7 +591,7 @@ def bulk_send_messages_to_notify_encoding_progress(logged_user, updated_enrollme
                 is_program_manager=is_program_manager,
                 updated_enrollments=updated_enrollments,
                 pgm_manager=pgm_manager,
-                encoding_already_completed_before_update=_is_encoding_completed_before_update(scores_list_before_update)
+                encoding_already_completed_before_update=_is_encoding_completed_before_update(scores_list)
             )
             mail_already_sent_by_learning_unit.add(learning_unit_year)
 
@@ -0,0 +1,100 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import uuid
+
+from celery.result import AsyncResult
+from django.contrib.auth.decorators import login_required, permission_required, user_passes_test
+from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.shortcuts import get_object_or_404, render
+from django.urls import reverse, reverse_lazy
+from django.views.decorators.http import require_http_methods
+
+from assessments.business.score_sheets_batch import ScoreSheetsArchiveCache
+from assessments.tasks import generate_score_sheets_archive
+from assessments.views.score_encoding import _is_inside_scores_encodings_period
+from base.models import education_group_year, session_exam_calendar
+
+
+@login_required
+@permission_required('assessments.can_access_scoreencoding', raise_exception=True)
+@user_passes_test(_is_inside_scores_encodings_period, login_url=reverse_lazy('outside_scores_encodings_period'))
+@require_http_methods(["POST"])
+def request_score_sheets_archive(request, education_group_year_id):
+    academic_year = session_exam_calendar.current_opened_academic_year()
+    educ_group_year = get_object_or_404(
+        education_group_year.find_by_user(request.user, academic_yr=academic_year),
+        pk=education_group_year_id
+    )
+    job_id = str(uuid.uuid4())
+    # The owner is stored before the job starts so that the status page is available right away
+    ScoreSheetsArchiveCache(job_id).set_cached_data({'user_id': request.user.pk, 'acronym': educ_group_year.acronym})
+    generate_score_sheets_archive.run.apply_async(
+        kwargs={
+            'education_group_year_id': educ_group_year.pk,
+            'number_session': session_exam_calendar.find_session_exam_number(),
+            'academic_year_id': academic_year.pk,
+        },
+        task_id=job_id
+    )
+    return HttpResponseRedirect(reverse('score_sheets_archive_status', args=[job_id]))
+
+
+@login_required
+@permission_required('assessments.can_access_scoreencoding', raise_exception=True)
+@require_http_methods(["GET"])
+def score_sheets_archive_status(request, job_id):
+    archive_cache = _get_archive_cache_of_user(request.user, job_id)
+    job = AsyncResult(job_id)
+    progress = job.info if job.state == 'PROGRESS' else {}
+    context = {
+        'job_id': job_id,
+        'acronym': archive_cache.cached_data['acronym'],
+        'is_ready': archive_cache.is_ready(),
+        'has_failed': job.state == 'FAILURE',
+        'done': progress.get('done', 0),
+        'total': progress.get('total'),
+    }
+    return render(request, "score_sheets_archive.html", context)
+
+
+@login_required
+@permission_required('assessments.can_access_scoreencoding', raise_exception=True)
+@require_http_methods(["GET"])
+def download_score_sheets_archive(request, job_id):
+    archive_cache = _get_archive_cache_of_user(request.user, job_id)
+    if not archive_cache.is_ready():
+        return HttpResponseRedirect(reverse('score_sheets_archive_status', args=[job_id]))
+    archive = archive_cache.cached_data
+    response = HttpResponse(archive['content'], content_type='application/zip')
+    response['Content-Disposition'] = 'attachment; filename=%s' % archive['filename']
+    return response
+
+
+def _get_archive_cache_of_user(user, job_id: str) -> ScoreSheetsArchiveCache:
+    archive_cache = ScoreSheetsArchiveCache(job_id)
+    if not archive_cache.is_owned_by(user):
+        raise Http404
+    return archive_cache
@@ -30,14 +30,16 @@ from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.http import HttpResponseRedirect
+from django.shortcuts import render
 from django.urls import reverse
 from django.utils.translation import gettext as _
 from django.utils.translation import pgettext_lazy
 from django.views.decorators.http import require_http_methods
 from openpyxl import load_workbook
 
-from assessments.business import score_encoding_list
+from assessments.business import score_encoding_list, score_encoding_upload
 from assessments.business.score_encoding_export import HEADER
+from assessments.business.score_encoding_upload import ScoresUploadPreviewCache, ScoresUploadPreview
 from assessments.forms.score_file import ScoreFileForm
 from attribution import models as mdl_attr
 from base import models as mdl
@@ -69,7 +71,6 @@ INFORMATIVE_JUSTIFICATION_ALIASES = {
 
 @login_required
 @require_http_methods(["POST"])
-@transaction.non_atomic_requests
 def upload_scores_file(request, learning_unit_year_id=None):
     form = ScoreFileForm(request.POST, request.FILES)
     if form.is_valid():
@@ -77,7 +78,8 @@ def upload_scores_file(request, learning_unit_year_id=None):
         if file_name is not None:
             learning_unit_year = mdl.learning_unit_year.get_by_id(learning_unit_year_id)
             try:
-                __save_xls_scores(request, file_name, learning_unit_year.id)
+                if __prepare_xls_scores_preview(request, file_name, learning_unit_year):
+                    return HttpResponseRedirect(reverse('upload_encoding_preview', args=[learning_unit_year_id]))
             except IndexError:
                 messages.add_message(request, messages.ERROR,
                                      _("Your excel file isn't well structured. "
@@ -89,9 +91,61 @@ def upload_scores_file(request, learning_unit_year_id=None):
     return HttpResponseRedirect(reverse('online_encoding', args=[learning_unit_year_id, ]))
 
 
-def _get_all_data(worksheet):
+@login_required
+@require_http_methods(["GET"])
+def upload_scores_preview(request, learning_unit_year_id):
+    preview = ScoresUploadPreviewCache(request.user, learning_unit_year_id).cached_data
+    if not preview:
+        return HttpResponseRedirect(reverse('online_encoding', args=[learning_unit_year_id, ]))
+    return render(request, "upload_scores_preview.html", {
+        'learning_unit_year': mdl.learning_unit_year.get_by_id(learning_unit_year_id),
+        'number_session': preview.number_session,
+        'is_program_manager': preview.is_program_manager,
+        'score_changes': sorted(preview.score_changes, key=lambda score_change: score_change.row_number),
+    })
+
+
+@login_required
+@require_http_methods(["POST"])
+@transaction.non_atomic_requests
+def confirm_scores_upload(request, learning_unit_year_id):
+    preview_cache = ScoresUploadPreviewCache(request.user, learning_unit_year_id)
+    preview = preview_cache.cached_data
+    if not preview:
+        messages.add_message(request, messages.ERROR, '%s' % _("No scores injected"))
+        return HttpResponseRedirect(reverse('online_encoding', args=[learning_unit_year_id, ]))
+
+    updated_enrollments, outdated_changes = score_encoding_upload.apply_score_changes(
+        request.user,
+        learning_unit_year_id,
+        preview
+    )
+    preview_cache.clear()
+    _show_error_messages(request, {
+        score_change.row_number: UploadValueError(
+            "%s" % _("The score has been modified since the upload of the file"), messages.WARNING
+        ) for score_change in outdated_changes
+    })
+    _show_saved_scores_message(
+        request,
+        len(updated_enrollments),
+        mdl.learning_unit_year.get_by_id(learning_unit_year_id),
+        preview.is_program_manager
+    )
+    return HttpResponseRedirect(reverse('online_encoding', args=[learning_unit_year_id, ]))
+
+
+def _read_rows(worksheet):
     """
-    :param worksheet: The excel worksheet (containing examEnrollments/scores)
+    Read the worksheet once.
+    :return: The number and the values of each line of the worksheet
+    """
+    return [(row_number, tuple(cell.value for cell in row)) for row_number, row in enumerate(worksheet.rows, 1)]
+
+
+def _get_all_data(rows):
+    """
+    :param rows: The lines of the excel worksheet (containing examEnrollments/scores)
     :return: All learn_unit_acronyms, offer_acronyms, registration_ids, session and academic_years
              in all lines of the worksheet.
     """
@@ -101,35 +155,35 @@ def _get_all_data(worksheet):
     sessions = []
     academic_years = []
 
-    for count, row in enumerate(worksheet.rows):
+    for _row_number, row in rows:
         if not _is_valid_registration_id(row):
             # In case of blank line or line that is not a examEnrollment
             continue
-        session = row[col_session].value
+        session = row[col_session]
         session = int(session) if isinstance(session, str) and session.isdigit() else session
         if session and session not in sessions:
             sessions.append(session)
 
         try:
             academic_year = None
-            if type(row[col_academic_year].value) is int:
-                academic_year = int(row[col_academic_year].value)
-            elif type(row[col_academic_year].value) is str:
-                academic_year = int(row[col_academic_year].value[:4])
+            if type(row[col_academic_year]) is int:
+                academic_year = int(row[col_academic_year])
+            elif type(row[col_academic_year]) is str:
+                academic_year = int(row[col_academic_year][:4])
             if academic_year and academic_year not in academic_years:
                 academic_years.append(academic_year)
         except (ValueError, TypeError):
             pass
 
-        learn_unit_acronym = row[col_learning_unit].value
+        learn_unit_acronym = row[col_learning_unit]
         if learn_unit_acronym and learn_unit_acronym not in learn_unit_acronyms:
             learn_unit_acronyms.append(learn_unit_acronym)
 
-        offer_acronym = row[col_offer].value
+        offer_acronym = row[col_offer]
         if offer_acronym and offer_acronym not in offer_acronyms:
             offer_acronyms.append(offer_acronym)
 
-        registration_id = row[col_registration_id].value
+        registration_id = row[col_registration_id]
         if registration_id and registration_id not in registration_ids:
             registration_ids.append(registration_id)
 
@@ -140,18 +194,21 @@ def _get_all_data(worksheet):
             'academic_years': academic_years}
 
 
-def __save_xls_scores(request, file_name, learning_unit_year_id):
+def __prepare_xls_scores_preview(request, file_name, learning_unit_year):
+    """
+    Read and validate the whole file, without saving anything: the valid changes are kept until the user
+    confirms them (see confirm_scores_upload).
+    :return: True if there is at least one change to confirm
+    """
     try:
         workbook = load_workbook(file_name, read_only=True, data_only=True)
     except KeyError:
         messages.add_message(request, messages.ERROR, _("The file must be a valid 'XLSX' excel file"))
         return False
-    worksheet = workbook.active
-    new_scores_number = 0
-    learning_unit_year = mdl.learning_unit_year.get_by_id(learning_unit_year_id)
+    rows = _read_rows(workbook.active)
     is_program_manager = program_manager.is_program_manager(request.user)
 
-    data_xls = _get_all_data(worksheet)
+    data_xls = _get_all_data(rows)
 
     try:
         data_xls['session'] = _extract_session_number(data_xls)
@@ -166,45 +223,57 @@ def __save_xls_scores(request, file_name, learning_unit_year_id):
                              '%s (%s).' % (_("No data for this academic year"), data_xls['academic_year']))
         return False
 
-    score_list = _get_score_list_filtered_by_enrolled_state(learning_unit_year_id, request.user)
+    # All the enrollments (with their deadlines) that can be referenced by the file are loaded at once
+    score_list = _get_score_list_filtered_by_enrolled_state(learning_unit_year.id, request.user)
 
     offer_acronyms_managed_by_user = {educ_group_year.acronym for educ_group_year
                                       in score_encoding_list.find_related_education_group_years(score_list)}
     learn_unit_acronyms_managed_by_user = {learning_unit_year.acronym for learning_unit_year
                                             in score_encoding_list.find_related_learning_unit_years(score_list)}
     registration_ids_managed_by_user = score_encoding_list.find_related_registration_ids(score_list)
+    emails_by_registration_id = _get_emails_by_registration_id(score_list.enrollments)
 
     enrollments_grouped = _group_exam_enrollments_by_registration_id_and_learning_unit_year(score_list.enrollments)
+    score_changes_by_enrollment = {}
     errors_list = {}
-    # Iterates over the lines of the spreadsheet.
-    for count, row in enumerate(worksheet.rows):
+    for row_number, row in rows:
         if _row_can_be_ignored(row):
             continue
 
-        row_number = count + 1
         try:
             _check_intergity_data(row,
                                   offer_acronyms_managed=offer_acronyms_managed_by_user,
                                   learn_unit_acronyms_managed=learn_unit_acronyms_managed_by_user,
                                   registration_ids_managed=registration_ids_managed_by_user,
                                   learning_unit_year=learning_unit_year)
-            _check_consistency_data(row)
-            updated_row = _update_row(request.user, row, enrollments_grouped, is_program_manager)
-            if updated_row:
-                new_scores_number+=1
+            _check_consistency_data(row, emails_by_registration_id)
+            score_change = _get_score_change(row, row_number, enrollments_grouped, is_program_manager)
+            if score_change:
+                score_changes_by_enrollment[score_change.enrollment_id] = score_change
         except Exception as e:
             errors_list[row_number] = e
 
     _show_error_messages(request, errors_list)
 
+    if score_changes_by_enrollment:
+        ScoresUploadPreviewCache(request.user, learning_unit_year.id).set_cached_data(ScoresUploadPreview(
+            number_session=score_list.number_session,
+            is_program_manager=is_program_manager,
+            score_changes=list(score_changes_by_enrollment.values()),
+        ))
+        return True
+    else:
+        messages.add_message(request, messages.ERROR, '%s' % _("No scores injected"))
+        return False
+
+
+def _show_saved_scores_message(request, new_scores_number, learning_unit_year, is_program_manager):
     if new_scores_number:
         messages.add_message(request, messages.SUCCESS, '%s %s' % (str(new_scores_number), _('Score(s) saved')))
         if not is_program_manager:
             __warn_that_score_responsibles_must_submit_scores(request, learning_unit_year)
-        return True
     else:
         messages.add_message(request, messages.ERROR, '%s' % _("No scores injected"))
-        return False
 
 
 def _extract_session_number(data_xls):
@@ -232,13 +301,13 @@ def _extract_academic_year(data_xls):
 
 def _extract_registration_id(row):
     if _is_valid_registration_id(row):
-        xls_registration_id = str(row[col_registration_id].value)
+        xls_registration_id = str(row[col_registration_id])
         return xls_registration_id.zfill(REGISTRATION_ID_LENGTH)
     return None
 
 
 def _extract_email(row):
-    return str(row[col_email].value)
+    return str(row[col_email])
 
 
 def _group_exam_enrollments_by_registration_id_and_learning_unit_year(enrollments):
@@ -250,23 +319,31 @@ def _group_exam_enrollments_by_registration_id_and_learning_unit_year(enrollment
     return exam_enrollments_by_registration_id
 
 
+def _get_emails_by_registration_id(enrollments):
+    return {
+        enrollment.learning_unit_enrollment.student.registration_id:
+            enrollment.learning_unit_enrollment.student.person.email
+        for enrollment in enrollments
+    }
+
+
 def _row_can_be_ignored(row):
     return not _is_valid_registration_id(row) or _is_empty_row(row)
 
 
 def _is_valid_registration_id(row):
-    registration_id_value = row[col_registration_id].value
+    registration_id_value = row[col_registration_id]
     return registration_id_value and str(registration_id_value).isdigit()
 
 
 def _is_empty_row(row):
-    return (row[col_score].value is None or row[col_score].value == '') and not row[col_justification].value
+    return (row[col_score] is None or row[col_score] == '') and not row[col_justification]
 
 
 def _check_intergity_data(row, **kwargs):
     xls_registration_id = _extract_registration_id(row)
-    xls_offer_year_acronym = row[col_offer].value
-    xls_learning_unit_acronym = row[col_learning_unit].value
+    xls_offer_year_acronym = row[col_offer]
+    xls_learning_unit_acronym = row[col_learning_unit]
     registration_ids_managed = kwargs.get('registration_ids_managed')
     learn_unit_acronyms_managed = kwargs.get('learn_unit_acronyms_managed')
     offer_acronyms_managed = kwargs.get('offer_acronyms_managed')
@@ -297,25 +374,24 @@ def _check_intergity_data(row, **kwargs):
             raise UploadValueError("%s" % _("Student not registered for exam"), messages.ERROR)
 
 
-def _check_consistency_data(row):
+def _check_consistency_data(row, emails_by_registration_id):
     xls_registration_id = _extract_registration_id(row)
     xls_email = _extract_email(row)
-    if not _registration_id_matches_email(xls_registration_id, xls_email):
+    if not _registration_id_matches_email(emails_by_registration_id.get(xls_registration_id), xls_email):
         raise UploadValueError("%s" % _("Registration ID does not match email"), messages.ERROR)
 
 
-def _registration_id_matches_email(registration_id, email):
-    student_by_registration_id = mdl.student.find_by_registration_id(registration_id)
+def _registration_id_matches_email(student_email, email):
     if email == 'None':
         email = ""
-    return str(student_by_registration_id.person.email).strip() == email.strip()
+    return str(student_email).strip() == email.strip()
 
 
-def _update_row(user, row, enrollments_managed_grouped, is_program_manager):
+def _get_score_change(row, row_number, enrollments_managed_grouped, is_program_manager):
     xls_registration_id = _extract_registration_id(row)
-    xls_learning_unit_acronym = row[col_learning_unit].value
-    xls_score = _clean_value(row[col_score].value)
-    xls_justification = _clean_value(row[col_justification].value)
+    xls_learning_unit_acronym = row[col_learning_unit]
+    xls_score = _clean_value(row[col_score])
+    xls_justification = _clean_value(row[col_justification])
 
     key = "{}_{}".format(xls_registration_id, xls_learning_unit_acronym)
     enrollments = enrollments_managed_grouped.get(key, [])
@@ -337,16 +413,13 @@ def _update_row(user, row, enrollments_managed_grouped, is_program_manager):
         raise UploadValueError("%s" % _("You can't encode a 'score' and a 'justification' together"), messages.ERROR)
 
     if xls_justification and _is_informative_justification(enrollment, xls_justification, is_program_manager):
-       return False
+        return None
 
     enrollment.score_encoded = xls_score
     enrollment.justification_encoded = None
     if xls_justification:
         enrollment.justification_encoded = _get_justification_from_aliases(enrollment, xls_justification)
-    return score_encoding_list.update_enrollment(
-        enrollment=enrollment,
-        user=user
-    )
+    return score_encoding_upload.build_score_change(enrollment, row_number, is_program_manager)
 
 
 def _clean_value(value):
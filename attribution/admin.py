@@ -38,3 +38,6 @@ admin.site.register(attribution_charge_new.AttributionChargeNew,
 
 admin.site.register(tutor_application.TutorApplication,
                     tutor_application.TutorApplicationAdmin)
+
+admin.site.register(tutor_attribution_charges.TutorAttributionCharges,
+                    tutor_attribution_charges.TutorAttributionChargesAdmin)
@@ -23,11 +23,6 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-import logging
-import traceback
-
-import requests
-from django.conf import settings
 from django.db.models import F, Case, When, Q, Value, CharField
 from django.db.models.functions import Concat, Replace
 from django.utils.functional import cached_property
@@ -35,11 +30,12 @@ from rest_framework import generics
 from rest_framework.response import Response
 
 from attribution.api.serializers.attribution import AttributionSerializer
+from attribution.business import epc_attribution_charges
 from attribution.calendar.access_schedule_calendar import AccessScheduleCalendar
 from attribution.models.attribution_charge_new import AttributionChargeNew
 from base.models.person import Person
 
-logger = logging.getLogger(settings.DEFAULT_LOGGER)
+ATTRIBUTION_CHARGES_SYNCED_AT_HEADER = 'X-Attribution-Charges-Synced-At'
 
 
 class AttributionListView(generics.ListAPIView):
@@ -106,7 +102,10 @@ class AttributionListView(generics.ListAPIView):
             function=F('attribution__function')
         )
         serializer = AttributionSerializer(qs, many=True, context=self.get_serializer_context())
-        return Response(serializer.data)
+        response = Response(serializer.data)
+        if self.attribution_charges.synced_at:
+            response[ATTRIBUTION_CHARGES_SYNCED_AT_HEADER] = self.attribution_charges.synced_at.isoformat()
+        return response
 
     @cached_property
     def person(self) -> Person:
@@ -119,39 +118,12 @@ class AttributionListView(generics.ListAPIView):
             'attribution_charges': self.get_attribution_charges()
         }
 
-    # TODO: Remove after find synchronization solution because make a remote call to EPC to get right value
-    def get_attribution_charges(self):
-        attribution_charges = []
-        if not all([
-            settings.EPC_API_URL, settings.EPC_API_USER, settings.EPC_API_PASSWORD,
-            settings.EPC_ATTRIBUTIONS_TUTOR_ENDPOINT
-        ]):
-            logger.error("[Attribution API] Missing at least one env. settings (EPC_API_URL, EPC_API_USER, "
-                         "EPC_API_PASSWORD, EPC_ATTRIBUTIONS_TUTOR_ENDPOINT)  ) ")
-            return attribution_charges
+    @cached_property
+    def attribution_charges(self) -> epc_attribution_charges.AttributionCharges:
+        return epc_attribution_charges.get_attribution_charges(self.person.global_id, self.kwargs['year'])
 
-        try:
-            url = "{base_url}{endpoint}".format(
-                base_url=settings.EPC_API_URL,
-                endpoint=settings.EPC_ATTRIBUTIONS_TUTOR_ENDPOINT.format(
-                    global_id=self.person.global_id,
-                    year=self.kwargs['year']
-                )
-            )
-            response = requests.get(url, auth=(settings.EPC_API_USER, settings.EPC_API_PASSWORD,), timeout=100)
-            response.raise_for_status()
-            response_data = response.json() or {}
-            attribution_charges = response_data.get("tutorAllocations", [])
-            # Fix when the webservice return a dictionnary in place of a list.
-            # Occur when the tutor has a single attribution.
-            if type(attribution_charges) is dict:
-                attribution_charges = [attribution_charges]
-            return attribution_charges
-        except Exception:
-            log_trace = traceback.format_exc()
-            logger.warning('Error when returning attributions charge duration: \n {}'.format(log_trace))
-        finally:
-            return attribution_charges
+    def get_attribution_charges(self):
+        return self.attribution_charges.charges
 
 
 class MyAttributionListView(AttributionListView):
@@ -0,0 +1,155 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+import logging
+from typing import Iterable, List, NamedTuple, Optional
+
+import requests
+from django.conf import settings
+from django.utils import timezone
+
+from attribution.models.attribution_charge_new import AttributionChargeNew
+from attribution.models.tutor_attribution_charges import TutorAttributionCharges
+from base.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+
+class FetchAttributionChargesException(Exception):
+    pass
+
+
+def _is_epc_unavailable(exception: Exception) -> bool:
+    """ Only connection errors, timeouts and server errors open the circuit, not the errors of a single tutor """
+    cause = exception.__cause__
+    if isinstance(cause, (requests.ConnectionError, requests.Timeout)):
+        return True
+    return isinstance(cause, requests.HTTPError) and cause.response is not None and cause.response.status_code >= 500
+
+
+EPC_CIRCUIT_BREAKER = CircuitBreaker(
+    'epc_attribution_charges',
+    failure_threshold=settings.EPC_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    recovery_timeout=settings.EPC_CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+    is_failure=_is_epc_unavailable,
+)
+
+
+class AttributionCharges(NamedTuple):
+    charges: List[dict]
+    synced_at: Optional[datetime.datetime]
+
+
+def get_attribution_charges(global_id: str, year: int) -> AttributionCharges:
+    """
+    Return the local copy of the attribution charges when it is fresh enough. Otherwise, the charges are fetched from
+    EPC (bounded timeout, guarded by the circuit breaker) and the stale copy is returned if EPC cannot answer.
+    """
+    local_copy = TutorAttributionCharges.objects.filter(global_id=global_id, year=year).first()
+    if local_copy and _is_fresh(local_copy):
+        return AttributionCharges(local_copy.charges, local_copy.synced_at)
+
+    if not _is_epc_configured():
+        logger.error("[Attribution charges] Missing at least one env. settings (EPC_API_URL, EPC_API_USER, "
+                     "EPC_API_PASSWORD, EPC_ATTRIBUTIONS_TUTOR_ENDPOINT)")
+    else:
+        try:
+            local_copy = synchronize(global_id, year, timeout=settings.EPC_API_TIMEOUT)
+        except (FetchAttributionChargesException, CircuitOpenError):
+            logger.warning(
+                "[Attribution charges] Unable to fetch charges of {} for {} from EPC".format(global_id, year)
+            )
+
+    if local_copy:
+        return AttributionCharges(local_copy.charges, local_copy.synced_at)
+    return AttributionCharges([], None)
+
+
+def synchronize(global_id: str, year: int, timeout: int) -> TutorAttributionCharges:
+    charges = EPC_CIRCUIT_BREAKER.call(_fetch_from_epc, global_id, year, timeout)
+    local_copy, _ = TutorAttributionCharges.objects.update_or_create(
+        global_id=global_id,
+        year=year,
+        defaults={'charges': charges, 'synced_at': timezone.now()}
+    )
+    return local_copy
+
+
+def synchronize_all(years: Iterable[int]) -> dict:
+    if not _is_epc_configured():
+        return {'Attribution charges synchronized': 'EPC is not configured'}
+
+    tutors_by_year = AttributionChargeNew.objects.filter(
+        learning_component_year__learning_unit_year__academic_year__year__in=list(years),
+        attribution__decision_making='',
+        attribution__tutor__person__global_id__isnull=False,
+    ).values_list(
+        'attribution__tutor__person__global_id',
+        'learning_component_year__learning_unit_year__academic_year__year',
+    ).distinct()
+
+    synchronized = errors = 0
+    for global_id, year in tutors_by_year:
+        try:
+            synchronize(global_id, year, timeout=settings.REQUESTS_TIMEOUT or 20)
+            synchronized += 1
+        except FetchAttributionChargesException:
+            errors += 1
+        except CircuitOpenError:
+            logger.warning("[Attribution charges] Synchronization interrupted: EPC does not answer")
+            break
+    return {'Attribution charges synchronized': synchronized, 'Errors': errors}
+
+
+def _fetch_from_epc(global_id: str, year: int, timeout: int) -> List[dict]:
+    url = "{base_url}{endpoint}".format(
+        base_url=settings.EPC_API_URL,
+        endpoint=settings.EPC_ATTRIBUTIONS_TUTOR_ENDPOINT.format(global_id=global_id, year=year)
+    )
+    try:
+        response = requests.get(url, auth=(settings.EPC_API_USER, settings.EPC_API_PASSWORD,), timeout=timeout)
+        response.raise_for_status()
+        response_data = response.json() or {}
+    except (requests.RequestException, ValueError) as e:
+        raise FetchAttributionChargesException(str(e)) from e
+
+    attribution_charges = response_data.get("tutorAllocations", [])
+    # Fix when the webservice return a dictionnary in place of a list.
+    # Occur when the tutor has a single attribution.
+    if type(attribution_charges) is dict:
+        attribution_charges = [attribution_charges]
+    return attribution_charges
+
+
+def _is_fresh(local_copy: TutorAttributionCharges) -> bool:
+    return (timezone.now() - local_copy.synced_at).total_seconds() < settings.EPC_ATTRIBUTION_CHARGES_MAX_AGE
+
+
+def _is_epc_configured() -> bool:
+    return all([
+        settings.EPC_API_URL, settings.EPC_API_USER, settings.EPC_API_PASSWORD,
+        settings.EPC_ATTRIBUTIONS_TUTOR_ENDPOINT
+    ])
@@ -0,0 +1,29 @@
+# Generated by Django 2.2.13 on 2021-03-25 10:41
+
+import django.contrib.postgres.fields.jsonb
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attribution', '0045_auto_20210318_0949'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TutorAttributionCharges',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('global_id', models.CharField(db_index=True, max_length=10)),
+                ('year', models.IntegerField()),
+                ('charges', django.contrib.postgres.fields.jsonb.JSONField(default=list, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('synced_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name_plural': 'tutor attribution charges',
+                'unique_together': {('global_id', 'year')},
+            },
+        ),
+    ]
@@ -3,3 +3,4 @@ from attribution.models import attribution_charge_new
 from attribution.models import attribution_new
 from attribution.models import tutor_application
 
+from attribution.models import tutor_attribution_charges
@@ -0,0 +1,54 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib import admin
+from django.contrib.postgres.fields import JSONField
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class TutorAttributionChargesAdmin(admin.ModelAdmin):
+    list_display = ('global_id', 'year', 'synced_at')
+    search_fields = ['global_id']
+    list_filter = ('year',)
+    readonly_fields = ('synced_at',)
+
+
+class TutorAttributionCharges(models.Model):
+    """
+    Local copy of the attribution charges of a tutor for a year, as returned by the EPC service
+    ('tutorAllocations'). Synchronized in background and used by the attribution API.
+    """
+    global_id = models.CharField(max_length=10, db_index=True)
+    year = models.IntegerField()
+    charges = JSONField(default=list, encoder=DjangoJSONEncoder)
+    synced_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ('global_id', 'year')
+        verbose_name_plural = 'tutor attribution charges'
+
+    def __str__(self):
+        return u"%s - %s" % (self.global_id, self.year)
@@ -0,0 +1,12 @@
+from attribution.business import epc_attribution_charges
+from backoffice.celery import app as celery_app
+from base.models import academic_year
+
+
+@celery_app.task
+def run() -> dict:
+    current_academic_year = academic_year.starting_academic_year()
+    if not current_academic_year:
+        return {}
+    years = [current_academic_year.year, current_academic_year.year + 1]
+    return epc_attribution_charges.synchronize_all(years)
@@ -23,11 +23,14 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from attribution.api.views.attribution import AttributionListView, MyAttributionListView
+from attribution.api.views.attribution import AttributionListView, MyAttributionListView, \
+    ATTRIBUTION_CHARGES_SYNCED_AT_HEADER
+from attribution.tests.epc_stub_server import EPCStubServer
 from attribution.tests.factories.attribution_charge_new import AttributionChargeNewFactory
 from base.tests.factories.tutor import TutorFactory
 
@@ -74,6 +77,23 @@ class AttributionListViewTestCase(APITestCase):
             ]
         )
 
+    def test_get_results_with_attribution_charges_from_epc(self):
+        cache.clear()
+        self.attribution_charge.attribution.external_id = 'osis.attribution_8080'
+        self.attribution_charge.attribution.save()
+        year = self.attribution_charge.learning_component_year.learning_unit_year.academic_year.year
+        epc_path = '/resources/AllocationCharges/tutors/{}/{}'.format(self.tutor.person.global_id, year)
+        allocations = [{'allocationId': '8080', 'allocationChargeLecturing': '15.0', 'learningUnitCharge': '30.0'}]
+
+        with EPCStubServer(allocations={epc_path: allocations}):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(ATTRIBUTION_CHARGES_SYNCED_AT_HEADER, response)
+        results = response.json()
+        self.assertEqual(results[0]['lecturing_charge'], '15.0')
+        self.assertEqual(results[0]['total_learning_unit_charge'], '30.0')
+
 
 class MyAttributionListViewTestCase(APITestCase):
     @classmethod
@@ -0,0 +1,121 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from attribution.business import epc_attribution_charges
+from attribution.models.tutor_attribution_charges import TutorAttributionCharges
+from attribution.tests.epc_stub_server import EPCStubServer
+from attribution.tests.factories.attribution_charge_new import AttributionChargeNewFactory
+
+GLOBAL_ID = '12345678'
+YEAR = 2020
+EPC_PATH = '/resources/AllocationCharges/tutors/{}/{}'.format(GLOBAL_ID, YEAR)
+ALLOCATIONS = [{'allocationId': '1', 'allocationChargeLecturing': '15.0', 'allocationChargePractical': '7.5'}]
+
+
+class TestGetAttributionCharges(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_should_fetch_from_epc_and_keep_local_copy_when_no_local_copy(self):
+        with EPCStubServer(allocations={EPC_PATH: ALLOCATIONS}):
+            result = epc_attribution_charges.get_attribution_charges(GLOBAL_ID, YEAR)
+
+        self.assertEqual(result.charges, ALLOCATIONS)
+        self.assertIsNotNone(result.synced_at)
+        self.assertEqual(TutorAttributionCharges.objects.get(global_id=GLOBAL_ID, year=YEAR).charges, ALLOCATIONS)
+
+    def test_should_serve_fresh_local_copy_without_calling_epc(self):
+        TutorAttributionCharges.objects.create(global_id=GLOBAL_ID, year=YEAR, charges=ALLOCATIONS,
+                                               synced_at=timezone.now())
+
+        with EPCStubServer() as epc_server:
+            result = epc_attribution_charges.get_attribution_charges(GLOBAL_ID, YEAR)
+
+        self.assertEqual(result.charges, ALLOCATIONS)
+        self.assertEqual(epc_server.requested_paths, [])
+
+    @override_settings(EPC_ATTRIBUTION_CHARGES_MAX_AGE=60)
+    def test_should_serve_stale_local_copy_when_epc_fails(self):
+        synced_at = timezone.now() - datetime.timedelta(hours=1)
+        TutorAttributionCharges.objects.create(global_id=GLOBAL_ID, year=YEAR, charges=ALLOCATIONS,
+                                               synced_at=synced_at)
+
+        with EPCStubServer(status=500) as epc_server:
+            result = epc_attribution_charges.get_attribution_charges(GLOBAL_ID, YEAR)
+
+        self.assertEqual(epc_server.requested_paths, [EPC_PATH])
+        self.assertEqual(result, epc_attribution_charges.AttributionCharges(ALLOCATIONS, synced_at))
+
+    def test_should_return_empty_charges_when_epc_fails_without_local_copy(self):
+        with EPCStubServer(status=503):
+            result = epc_attribution_charges.get_attribution_charges(GLOBAL_ID, YEAR)
+
+        self.assertEqual(result, epc_attribution_charges.AttributionCharges([], None))
+
+    def test_should_not_call_epc_when_circuit_is_open(self):
+        with EPCStubServer(status=500) as epc_server:
+            for _ in range(epc_attribution_charges.EPC_CIRCUIT_BREAKER.failure_threshold + 2):
+                epc_attribution_charges.get_attribution_charges(GLOBAL_ID, YEAR)
+
+        self.assertEqual(len(epc_server.requested_paths), epc_attribution_charges.EPC_CIRCUIT_BREAKER.failure_threshold)
+
+    def test_should_not_open_circuit_on_client_errors(self):
+        with EPCStubServer(status=404) as epc_server:
+            for _ in range(epc_attribution_charges.EPC_CIRCUIT_BREAKER.failure_threshold + 2):
+                epc_attribution_charges.get_attribution_charges(GLOBAL_ID, YEAR)
+
+        self.assertFalse(epc_attribution_charges.EPC_CIRCUIT_BREAKER.is_open)
+        self.assertEqual(
+            len(epc_server.requested_paths),
+            epc_attribution_charges.EPC_CIRCUIT_BREAKER.failure_threshold + 2
+        )
+
+    def test_should_wrap_single_allocation_in_list(self):
+        with EPCStubServer(allocations={EPC_PATH: ALLOCATIONS[0]}):
+            result = epc_attribution_charges.get_attribution_charges(GLOBAL_ID, YEAR)
+
+        self.assertEqual(result.charges, ALLOCATIONS)
+
+
+class TestSynchronizeAll(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_should_synchronize_tutors_having_attributions_in_years(self):
+        attribution_charge = AttributionChargeNewFactory(attribution__tutor__person__global_id=GLOBAL_ID)
+        year = attribution_charge.learning_component_year.learning_unit_year.academic_year.year
+        path = '/resources/AllocationCharges/tutors/{}/{}'.format(GLOBAL_ID, year)
+
+        with EPCStubServer(allocations={path: ALLOCATIONS}):
+            result = epc_attribution_charges.synchronize_all([year])
+
+        self.assertEqual(result, {'Attribution charges synchronized': 1, 'Errors': 0})
+        self.assertEqual(TutorAttributionCharges.objects.get(global_id=GLOBAL_ID, year=year).charges, ALLOCATIONS)
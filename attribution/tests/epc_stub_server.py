@@ -0,0 +1,84 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+from django.test import override_settings
+
+
+class EPCStubServer:
+    """
+    Local HTTP server answering like the EPC attribution charges service. 'allocations' maps the requested path
+    (ex: '/resources/AllocationCharges/tutors/12345678/2020') to the 'tutorAllocations' returned ; 'status' forces
+    the HTTP status of every response.
+
+    Usage:
+        with EPCStubServer(allocations={...}) as epc_server:
+            ...
+    """
+
+    def __init__(self, allocations: Dict[str, list] = None, status: int = 200):
+        self.allocations = allocations or {}
+        self.status = status
+        self.requested_paths = []
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._build_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._settings = override_settings(
+            EPC_API_URL="http://127.0.0.1:{}/".format(self._server.server_port),
+            EPC_API_USER="user",
+            EPC_API_PASSWORD="password",
+            EPC_ATTRIBUTIONS_TUTOR_ENDPOINT="resources/AllocationCharges/tutors/{global_id}/{year}",
+        )
+
+    def __enter__(self):
+        self._thread.start()
+        self._settings.enable()
+        return self
+
+    def __exit__(self, *args):
+        self._settings.disable()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _build_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requested_paths.append(self.path)
+                body = json.dumps({'tutorAllocations': stub.allocations.get(self.path, [])}).encode()
+                self.send_response(stub.status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
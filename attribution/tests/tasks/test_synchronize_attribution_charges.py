@@ -0,0 +1,41 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.test import TestCase
+
+from attribution.tasks import synchronize_attribution_charges
+from base.tests.factories.academic_year import create_current_academic_year
+
+
+class TestSynchronizeAttributionCharges(TestCase):
+    @mock.patch("attribution.tasks.synchronize_attribution_charges.epc_attribution_charges.synchronize_all")
+    def test_should_synchronize_current_and_next_academic_years(self, mock_synchronize_all):
+        current_academic_year = create_current_academic_year()
+
+        synchronize_attribution_charges.run()
+
+        mock_synchronize_all.assert_called_once_with([current_academic_year.year, current_academic_year.year + 1])
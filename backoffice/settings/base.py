@@ -112,6 +112,7 @@ MIDDLEWARE = (
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'base.middlewares.read_replica_middleware.ReadReplicaMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'django.middleware.security.SecurityMiddleware',
@@ -182,6 +183,26 @@ DATABASES = {
     },
 }
 
+# Read-only views (see base.utils.read_replica.read_only_view) and background exports read from this replica.
+# In tests, the replica mirrors the default database unless DATABASE_REPLICA_TEST_MIRROR is False:
+# a second local database is then created for it.
+if os.environ.get("DATABASE_REPLICA_HOST"):
+    DATABASES['replica'] = {
+        'ENGINE': 'django.contrib.gis.db.backends.postgis',
+        'NAME': os.environ.get("DATABASE_REPLICA_NAME", DATABASES['default']['NAME']),
+        'USER': os.environ.get("DATABASE_REPLICA_USER", DATABASES['default']['USER']),
+        'PASSWORD': os.environ.get("DATABASE_REPLICA_PASSWORD", DATABASES['default']['PASSWORD']),
+        'HOST': os.environ.get("DATABASE_REPLICA_HOST"),
+        'PORT': os.environ.get("DATABASE_REPLICA_PORT", DATABASES['default']['PORT']),
+        'ATOMIC_REQUESTS': False,
+        'TEST': {'MIRROR': 'default'} if os.environ.get(
+            'DATABASE_REPLICA_TEST_MIRROR', 'True'
+        ).lower() == 'true' else {},
+    }
+DATABASE_REPLICA_ALIAS = 'replica' if 'replica' in DATABASES else None
+DATABASE_ROUTERS = ['base.utils.read_replica.ReadReplicaRouter']
+REPLICA_READ_YOUR_WRITES_DELAY = int(os.environ.get("REPLICA_READ_YOUR_WRITES_DELAY", 10))
+
 AUTHENTICATION_BACKENDS = os.environ.get('AUTHENTICATION_BACKENDS', 'django.contrib.auth.backends.ModelBackend').split()
 PERMISSION_CACHE_ENABLED = os.environ.get('PERMISSION_CACHE_ENABLED', 'True').lower() == 'true'
 
@@ -228,7 +249,10 @@ SERVER_EMAIL = os.environ.get('SERVER_EMAIL', DEFAULT_FROM_EMAIL)
 LOGO_EMAIL_SIGNATURE_URL = os.environ.get('LOGO_EMAIL_SIGNATURE_URL', '')
 EMAIL_PRODUCTION_SENDING = os.environ.get('EMAIL_PRODUCTION_SENDING', 'False').lower() == 'true'
 COMMON_EMAIL_RECEIVER = os.environ.get('COMMON_EMAIL_RECEIVER', 'osis@localhost.org')
-EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.filebased.EmailBackend')
+# The emails are sent by EMAIL_DELIVERY_BACKEND, through a backend which can share one connection between several
+# emails (see base.utils.mail_connection)
+EMAIL_DELIVERY_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.filebased.EmailBackend')
+EMAIL_BACKEND = 'base.utils.mail_connection.SharedConnectionEmailBackend'
 EMAIL_FILE_PATH = os.environ.get('EMAIL_FILE_PATH', os.path.join(BASE_DIR, "base/tests/sent_mails"))
 EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
 EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 25))
@@ -431,6 +455,11 @@ EPC_API_PASSWORD = os.environ.get('EPC_API_PASSWORD')
 EPC_ATTRIBUTIONS_TUTOR_ENDPOINT = os.environ.get(
     'EPC_ATTRIBUTIONS_TUTOR_ENDPOINT', "resources/AllocationCharges/tutors/{global_id}/{year}"
 )
+EPC_API_TIMEOUT = int(os.environ.get('EPC_API_TIMEOUT', 5))
+# Age (in seconds) after which the local copy of the attribution charges is refreshed from EPC by the API
+EPC_ATTRIBUTION_CHARGES_MAX_AGE = int(os.environ.get('EPC_ATTRIBUTION_CHARGES_MAX_AGE', 6 * 60 * 60))
+EPC_CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.environ.get('EPC_CIRCUIT_BREAKER_FAILURE_THRESHOLD', 5))
+EPC_CIRCUIT_BREAKER_RECOVERY_TIMEOUT = int(os.environ.get('EPC_CIRCUIT_BREAKER_RECOVERY_TIMEOUT', 60))
 
 RELEASE_TAG = os.environ.get('RELEASE_TAG')
 
@@ -506,6 +535,9 @@ STAFF_FUNDING_URL = os.environ.get('STAFF_FUNDING_URL', '')
 VIRTUAL_DESKTOP_URL = os.environ.get('VIRTUAL_DESKTOP_URL', '')
 LEARNING_UNIT_PORTAL_URL = os.environ.get('LEARNING_UNIT_PORTAL_URL', 'https://uclouvain.be/cours-{year}-{code}')
 
+# Host used to build absolute urls of documents rendered by workers (ex: PDF of program trees)
+PDF_RENDERING_HOST = os.environ.get('PDF_RENDERING_HOST', ALLOWED_HOSTS[0] if ALLOWED_HOSTS else 'localhost')
+
 # SITE_ID for Django "sites framework"
 SITE_ID = os.environ.get('SITE_ID', 1)
 
@@ -50,6 +50,11 @@ if os.environ.get("ENABLE_DEBUG_TOOLBAR", "False").lower() == "true":
         'JQUERY_URL': os.path.join(STATIC_URL, "js/jquery-2.1.4.min.js"),
     }
 
+if os.environ.get("ENABLE_QUERY_PROFILING", "False").lower() == "true":
+    OPTIONAL_MIDDLEWARES += ('base.middlewares.query_profiling_middleware.QueryProfilingMiddleware',)
+    QUERY_PROFILING_REPORT_FILE = os.environ.get("QUERY_PROFILING_REPORT_FILE", "query_profiling.jsonl")
+    QUERY_PROFILING_STRICT = TESTING
+
 INSTALLED_APPS += OPTIONAL_APPS
 APPS_TO_TEST += OPTIONAL_APPS
 MIDDLEWARE += OPTIONAL_MIDDLEWARES
@@ -23,8 +23,15 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.pagination import LimitOffsetPagination, CursorPagination
 
 
 class LimitOffsetPaginationWithUpperBound(LimitOffsetPagination):
     max_limit = 100
+
+
+class IdCursorPagination(CursorPagination):
+    """ Stable pagination of append-only collections, to be followed by incremental consumers """
+    ordering = 'id'
+    page_size_query_param = 'limit'
+    max_page_size = 1000
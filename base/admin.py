@@ -44,6 +44,9 @@ admin.site.register(admission_condition.AdmissionConditionLine,
 admin.site.register(campus.Campus,
                     campus.CampusAdmin)
 
+admin.site.register(change_log_entry.ChangeLogEntry,
+                    change_log_entry.ChangeLogEntryAdmin)
+
 admin.site.register(certificate_aim.CertificateAim,
                     certificate_aim.CertificateAimAdmin)
 
@@ -134,6 +137,9 @@ admin.site.register(offer_year_calendar.OfferYearCalendar,
 admin.site.register(organization.Organization,
                     organization.OrganizationAdmin)
 
+admin.site.register(outbox_message.OutboxMessage,
+                    outbox_message.OutboxMessageAdmin)
+
 admin.site.register(person.Person,
                     person.PersonAdmin)
 
@@ -152,6 +158,9 @@ admin.site.register(program_manager.ProgramManager,
 admin.site.register(proposal_learning_unit.ProposalLearningUnit,
                     proposal_learning_unit.ProposalLearningUnitAdmin)
 
+admin.site.register(revision_aggregate.RevisionAggregate,
+                    revision_aggregate.RevisionAggregateAdmin)
+
 admin.site.register(session_exam.SessionExam,
                     session_exam.SessionExamAdmin)
 
@@ -25,9 +25,11 @@
 ##############################################################################
 from django.conf.urls import url
 
+from base.api.views.change_log import ChangeLogList
 from base.api.views.person import PersonRoles
 
 app_name = "base"
 urlpatterns = [
     url(r'^person/(?P<global_id>[0-9]+)/roles$', PersonRoles.as_view(), name=PersonRoles.name),
+    url(r'^changes$', ChangeLogList.as_view(), name=ChangeLogList.name),
 ]
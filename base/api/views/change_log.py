@@ -0,0 +1,60 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import django_filters
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import generics
+
+from backoffice.settings.rest_framework.pagination import IdCursorPagination
+from base.api.serializers.change_log import ChangeLogEntrySerializer
+from base.models.change_log_entry import ChangeLogEntry
+from base.models.enums.change_log_types import ChangeLogObjectTypes
+
+
+class ChangeLogFilter(django_filters.FilterSet):
+    object_type = django_filters.MultipleChoiceFilter(choices=ChangeLogObjectTypes.choices())
+    since = django_filters.NumberFilter(field_name='sequence', lookup_expr='gt')
+
+    class Meta:
+        model = ChangeLogEntry
+        fields = ['object_type', 'since']
+
+
+class ChangeLogPagination(IdCursorPagination):
+    ordering = 'sequence'
+
+
+class ChangeLogList(generics.ListAPIView):
+    """
+       Return the changes of the catalogue objects, in the order of their sequence. Consumers follow the 'next'
+       cursor, or filter on the last sequence they have read with 'since'. Only the sequenced entries are returned
+       (see ChangeLogEntry), so that an entry committed late is never skipped.
+    """
+    name = 'change-log'
+    queryset = ChangeLogEntry.objects.filter(sequence__isnull=False)
+    serializer_class = ChangeLogEntrySerializer
+    pagination_class = ChangeLogPagination
+    filter_backends = (DjangoFilterBackend,)
+    filterset_class = ChangeLogFilter
@@ -31,7 +31,10 @@ class BaseConfig(AppConfig):
 
     def ready(self):
         from base.models.models_signals import update_person
+        from base.business.revision_history import tag_revision_with_aggregate_roots
         from base.models.utils.lookups import ArrayContainsAny
         from assessments.views.score_encoding import get_json_data_scores_sheets
+        from base.business import change_log
+        change_log.connect_signals()
         # if django.core.exceptions.AppRegistryNotReady: Apps aren't loaded yet.
         # ===> This exception says that there is an error in the implementation of method ready(self) !!
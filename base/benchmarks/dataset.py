@@ -0,0 +1,242 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import functools
+import logging
+import random
+import time
+
+import factory.random
+from django.conf import settings
+from django.db import transaction
+
+from assessments.models import score_encoding_progress_summary
+from base.models.academic_year import LEARNING_UNIT_CREATION_SPAN_YEARS
+from base.models.enums import education_group_categories, number_session
+from base.models.enums.academic_calendar_type import AcademicCalendarTypes
+from base.models.enums.education_group_types import TrainingType, GroupType
+from base.models.enums.entity_type import FACULTY
+from base.models.exam_enrollment import ExamEnrollment
+from base.models.learning_unit_enrollment import LearningUnitEnrollment
+from base.models.offer_enrollment import OfferEnrollment
+from base.tests.factories.academic_calendar import AcademicCalendarFactory
+from base.tests.factories.academic_year import AcademicYearFactory, get_current_year
+from base.tests.factories.education_group_type import EducationGroupTypeFactory
+from base.tests.factories.entity_version import EntityVersionFactory
+from base.tests.factories.exam_enrollment import ExamEnrollmentFactory
+from base.tests.factories.group_element_year import GroupElementYearFactory
+from base.tests.factories.learning_unit import LearningUnitFactoryWithAnnualizedData
+from base.tests.factories.learning_unit_enrollment import LearningUnitEnrollmentFactory
+from base.tests.factories.offer_enrollment import OfferEnrollmentFactory
+from base.tests.factories.person import PersonFactory
+from base.tests.factories.program_manager import ProgramManagerFactory
+from base.tests.factories.session_exam_calendar import SessionExamCalendarFactory
+from base.tests.factories.session_examen import SessionExamFactory
+from base.tests.factories.student import StudentFactory
+from education_group.tests.factories.group_year import GroupYearFactory
+from program_management.tests.factories.education_group_version import StandardEducationGroupVersionFactory
+from program_management.tests.factories.element import ElementGroupYearFactory, ElementLearningUnitYearFactory
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+BENCHMARK_USERNAME = "benchmark_program_manager"
+
+
+def _log_step(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        result = method(self, *args, **kwargs)
+        logger.info("Benchmark dataset: %s done in %.1fs", method.__name__, time.perf_counter() - start)
+        return result
+    return wrapper
+
+
+class BenchmarkDatasetGenerator:
+    """
+    Generate a production-scale dataset. The same seed always generates the same dataset
+    (for a same current academic year), so benchmark results can be compared between runs.
+    """
+    def __init__(
+            self,
+            seed: int = 0,
+            number_past_years: int = 3,
+            number_future_years: int = 3,
+            learning_units: int = 5800,
+            trainings: int = 20,
+            groups_per_training: int = 30,
+            links_per_training: int = 1500,
+            students_per_training: int = 100,
+            exam_enrollments_per_student: int = 25,
+    ):
+        self.seed = seed
+        self.number_past_years = number_past_years
+        self.number_future_years = number_future_years
+        self.number_learning_units = learning_units
+        self.number_trainings = trainings
+        self.groups_per_training = groups_per_training
+        self.links_per_training = links_per_training
+        self.students_per_training = students_per_training
+        self.exam_enrollments_per_student = exam_enrollments_per_student
+
+    @transaction.atomic
+    def generate(self):
+        random.seed(self.seed)
+        factory.random.reseed_random(self.seed)
+
+        self._generate_academic_years()
+        self._generate_entities()
+        self._generate_learning_units()
+        self._generate_trainings()
+        self._generate_exam_enrollments()
+
+    @_log_step
+    def _generate_academic_years(self):
+        self.current_year = get_current_year()
+        # Academic years until N+6 are needed by the automatic postponement
+        academic_years = AcademicYearFactory.produce(
+            base_year=self.current_year,
+            number_past=self.number_past_years,
+            number_future=max(self.number_future_years, LEARNING_UNIT_CREATION_SPAN_YEARS),
+        )
+        self.academic_years = [
+            academic_year for academic_year in academic_years
+            if academic_year.year <= self.current_year + self.number_future_years
+        ]
+        self.current_academic_year = next(ay for ay in academic_years if ay.year == self.current_year)
+
+    @_log_step
+    def _generate_entities(self):
+        self.faculties = [
+            entity_version.entity
+            for entity_version in EntityVersionFactory.create_batch(20, entity_type=FACULTY, parent=None)
+        ]
+
+    @_log_step
+    def _generate_learning_units(self):
+        learning_units = LearningUnitFactoryWithAnnualizedData.create_batch(
+            self.number_learning_units,
+            start_year=self.academic_years[0],
+            learningunityears__academic_years=self.academic_years,
+            learningunityears__learning_container_year__requirement_entity=factory.Iterator(self.faculties),
+        )
+        self.current_learning_unit_years = [
+            learning_unit.learningunityear_set.get(academic_year=self.current_academic_year)
+            for learning_unit in learning_units
+        ]
+
+    @_log_step
+    def _generate_trainings(self):
+        training_type = EducationGroupTypeFactory(
+            name=TrainingType.PGRM_MASTER_120.name,
+            category=education_group_categories.TRAINING,
+        )
+        group_type = EducationGroupTypeFactory(
+            name=GroupType.SUB_GROUP.name,
+            category=education_group_categories.GROUP,
+        )
+        self.trainings = []
+        for _ in range(self.number_trainings):
+            version = StandardEducationGroupVersionFactory(
+                root_group__academic_year=self.current_academic_year,
+                root_group__education_group_type=training_type,
+                root_group__management_entity=random.choice(self.faculties),
+            )
+            self._generate_training_content(version.root_group, group_type)
+            self.trainings.append(version.offer)
+
+    def _generate_training_content(self, root_group, group_type):
+        root_element = ElementGroupYearFactory(group_year=root_group)
+        group_elements = [
+            ElementGroupYearFactory(
+                group_year=GroupYearFactory(
+                    academic_year=self.current_academic_year,
+                    education_group_type=group_type,
+                    management_entity=root_group.management_entity,
+                )
+            ) for _ in range(self.groups_per_training)
+        ]
+        for order, group_element in enumerate(group_elements):
+            GroupElementYearFactory(parent_element=root_element, child_element=group_element, order=order)
+
+        learning_unit_years = random.sample(
+            self.current_learning_unit_years,
+            min(self.links_per_training, len(self.current_learning_unit_years))
+        )
+        for order, learning_unit_year in enumerate(learning_unit_years):
+            GroupElementYearFactory(
+                parent_element=group_elements[order % len(group_elements)],
+                child_element=ElementLearningUnitYearFactory(learning_unit_year=learning_unit_year),
+                order=order,
+            )
+
+    @_log_step
+    def _generate_exam_enrollments(self):
+        academic_calendar = AcademicCalendarFactory(
+            data_year=self.current_academic_year,
+            reference=AcademicCalendarTypes.SCORES_EXAM_SUBMISSION.name,
+            start_date=self.current_academic_year.start_date,
+            end_date=self.current_academic_year.end_date,
+        )
+        SessionExamCalendarFactory(
+            academic_calendar=academic_calendar,
+            number_session=number_session.ONE,
+        )
+
+        program_manager = PersonFactory(user__username=BENCHMARK_USERNAME)
+        for training in self.trainings:
+            ProgramManagerFactory(person=program_manager, education_group=training.education_group)
+            learning_unit_years = random.sample(
+                self.current_learning_unit_years,
+                min(self.exam_enrollments_per_student, len(self.current_learning_unit_years))
+            )
+            session_exams = [
+                SessionExamFactory(
+                    learning_unit_year=learning_unit_year,
+                    education_group_year=training,
+                    number_session=number_session.ONE,
+                ) for learning_unit_year in learning_unit_years
+            ]
+            # Built then inserted in bulk : these are the most numerous rows of the dataset
+            offer_enrollments = OfferEnrollment.objects.bulk_create(
+                OfferEnrollmentFactory.build(student=student, education_group_year=training)
+                for student in StudentFactory.create_batch(self.students_per_training)
+            )
+            learning_unit_enrollments = LearningUnitEnrollment.objects.bulk_create(
+                LearningUnitEnrollmentFactory.build(
+                    learning_unit_year=session_exam.learning_unit_year,
+                    offer_enrollment=offer_enrollment,
+                )
+                for offer_enrollment in offer_enrollments for session_exam in session_exams
+            )
+            ExamEnrollment.objects.bulk_create(
+                ExamEnrollmentFactory.build(
+                    session_exam=session_exams[index % len(session_exams)],
+                    learning_unit_enrollment=learning_unit_enrollment,
+                )
+                for index, learning_unit_enrollment in enumerate(learning_unit_enrollments)
+            )
+        # Inserted in bulk : the progress counters are not maintained by the signals
+        score_encoding_progress_summary.rebuild(academic_year=self.current_academic_year)
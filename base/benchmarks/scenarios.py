@@ -0,0 +1,165 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import contextlib
+import random
+import statistics
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Callable, Dict, List
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from assessments.business import score_encoding_list
+from base.benchmarks.dataset import BENCHMARK_USERNAME
+from base.business import learning_unit_xls
+from base.business.learning_units.automatic_postponement import LearningUnitAutomaticPostponementToN6
+from base.forms.learning_unit.search.simple import LearningUnitFilter
+from base.models.academic_year import AcademicYear
+from base.models.enums import education_group_categories
+from base.models.learning_unit_year import LearningUnitYear
+from base.utils import query_profiling
+from education_group.api.views.training import TrainingList
+from program_management.ddd.repositories import load_tree, find_roots
+from program_management.models.element import Element
+
+SAMPLE_SIZE = 500
+
+
+class _Rollback(Exception):
+    pass
+
+
+@contextlib.contextmanager
+def _rolled_back_transaction():
+    """ Scenarios writing into the database must leave the dataset unchanged for the next runs """
+    with contextlib.suppress(_Rollback), transaction.atomic():
+        yield
+        raise _Rollback()
+
+
+def _training_root_element_ids(academic_year: AcademicYear) -> List[int]:
+    return list(Element.objects.filter(
+        group_year__academic_year=academic_year,
+        group_year__education_group_type__category=education_group_categories.TRAINING,
+    ).values_list('pk', flat=True))
+
+
+def benchmark_load_trees(academic_year: AcademicYear) -> Callable:
+    root_ids = _training_root_element_ids(academic_year)
+    return lambda: load_tree.load_trees(root_ids)
+
+
+def benchmark_find_roots(academic_year: AcademicYear) -> Callable:
+    elements = list(Element.objects.filter(
+        learning_unit_year__academic_year=academic_year,
+        learning_unit_year__isnull=False,
+    ).order_by('pk')[:SAMPLE_SIZE])
+    return lambda: find_roots.find_roots(elements)
+
+
+def benchmark_learning_unit_filter(academic_year: AcademicYear) -> Callable:
+    data = {'academic_year': academic_year.pk, 'acronym': 'A'}
+    return lambda: list(LearningUnitFilter(data=data).qs)
+
+
+def benchmark_training_list_api(academic_year: AcademicYear) -> Callable:
+    user = User.objects.get(username=BENCHMARK_USERNAME)
+
+    def run():
+        request = APIRequestFactory().get('/', data={'from_year': academic_year.year, 'to_year': academic_year.year})
+        force_authenticate(request, user=user)
+        return TrainingList.as_view()(request).render()
+    return run
+
+
+def benchmark_prepare_xls_content(academic_year: AcademicYear) -> Callable:
+    ids = list(
+        LearningUnitYear.objects.filter(academic_year=academic_year).order_by('pk').values_list('pk', flat=True)
+    )[:SAMPLE_SIZE]
+    return lambda: learning_unit_xls.prepare_xls_content(
+        LearningUnitYear.objects.filter(pk__in=ids),
+        is_external_ue_list=False,
+        with_grp=True,
+        with_attributions=True,
+    )
+
+
+def benchmark_update_enrollments(academic_year: AcademicYear) -> Callable:
+    user = User.objects.get(username=BENCHMARK_USERNAME)
+
+    def run():
+        with _rolled_back_transaction():
+            scores_encoding = score_encoding_list.get_scores_encoding_list(user)
+            for enrollment in scores_encoding.enrollments:
+                enrollment.score_encoded = Decimal(random.randint(0, 20))
+            score_encoding_list.update_enrollments(scores_encoding, user)
+    return run
+
+
+def benchmark_automatic_postponement(academic_year: AcademicYear) -> Callable:
+    def run():
+        with _rolled_back_transaction():
+            postponement = LearningUnitAutomaticPostponementToN6()
+            for chunk in postponement.get_chunks():
+                postponement.extend_chunk(chunk)
+    return run
+
+
+SCENARIOS = OrderedDict([
+    ('load_trees', benchmark_load_trees),
+    ('find_roots', benchmark_find_roots),
+    ('learning_unit_filter', benchmark_learning_unit_filter),
+    ('training_list_api', benchmark_training_list_api),
+    ('prepare_xls_content', benchmark_prepare_xls_content),
+    ('update_enrollments', benchmark_update_enrollments),
+    ('automatic_postponement', benchmark_automatic_postponement),
+])  # type: Dict[str, Callable[[AcademicYear], Callable]]
+
+
+def run_scenarios(names: List[str], repeat: int, seed: int = 0) -> Dict[str, Dict]:
+    random.seed(seed)
+    academic_year = AcademicYear.objects.current()
+    results = OrderedDict()
+    for name in names:
+        scenario = SCENARIOS[name](academic_year)
+        durations = []
+        for _ in range(repeat):
+            with query_profiling.profile() as report:
+                start = time.perf_counter()
+                scenario()
+                durations.append((time.perf_counter() - start) * 1000)
+        results[name] = {
+            'min_ms': round(min(durations), 1),
+            'median_ms': round(statistics.median(durations), 1),
+            'max_ms': round(max(durations), 1),
+            'query_count': report.query_count,
+            'duplicate_count': report.duplicate_count,
+            'db_ms': round(report.db_time * 1000, 1),
+        }
+    return results
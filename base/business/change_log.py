@@ -0,0 +1,213 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+"""
+Change feed of the catalogue objects : every creation, update and deletion is appended to ChangeLogEntry in the
+transaction of the change, so that downstream systems sync incrementally (through the API or the queue)
+instead of receiving whole datasets.
+"""
+import logging
+from typing import Callable, Dict, Iterable, List, NamedTuple
+
+import pika
+import pika.exceptions
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection, models, transaction
+from django.db.models import Max
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from base.api.serializers.change_log import ChangeLogEntrySerializer
+from base.models.change_log_entry import ChangeLogEntry
+from base.models.enums.change_log_types import ChangeLogObjectTypes, ChangeLogActions
+from osis_common.queue import queue_sender
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+PUBLICATION_BATCH_SIZE = 500
+# Key of the advisory lock serializing the runs of sequence_committed_entries()
+SEQUENCE_LOCK_ID = 480001
+
+
+class TrackedModel(NamedTuple):
+    object_type: ChangeLogObjectTypes
+    # Object logged for an instance of the model (e.g. the attribution of a charge)
+    get_object: Callable[[models.Model], models.Model]
+    get_data: Callable[[models.Model], dict]
+
+
+def _itself(instance: models.Model) -> models.Model:
+    return instance
+
+
+def _learning_unit_year_data(obj: 'LearningUnitYear') -> dict:
+    return {'acronym': obj.acronym, 'year': obj.academic_year.year}
+
+
+def _group_year_data(obj: 'GroupYear') -> dict:
+    return {'code': obj.partial_acronym, 'year': obj.academic_year.year}
+
+
+def _link_data(obj: 'GroupElementYear') -> dict:
+    return {'parent_element_id': obj.parent_element_id, 'child_element_id': obj.child_element_id}
+
+
+def _prerequisite_data(obj: 'Prerequisite') -> dict:
+    return {
+        'learning_unit_year_id': obj.learning_unit_year_id,
+        'education_group_version_id': obj.education_group_version_id,
+    }
+
+
+def _attribution_data(obj: 'AttributionNew') -> dict:
+    return {'tutor_id': obj.tutor_id, 'learning_container_year_id': obj.learning_container_year_id}
+
+
+def _translated_text_data(obj: 'TranslatedText') -> dict:
+    return {
+        'entity': obj.entity,
+        'reference': obj.reference,
+        'text_label_id': obj.text_label_id,
+        'language': obj.language,
+    }
+
+
+# Models (app_label.model_name) whose save/delete are logged. The items of a prerequisite are not tracked on their
+# own : they are only written by the program tree repository, which logs their prerequisite.
+TRACKED_MODELS: Dict[str, TrackedModel] = {
+    'base.learningunityear': TrackedModel(ChangeLogObjectTypes.LEARNING_UNIT_YEAR, _itself, _learning_unit_year_data),
+    'education_group.groupyear': TrackedModel(ChangeLogObjectTypes.GROUP_YEAR, _itself, _group_year_data),
+    'base.groupelementyear': TrackedModel(ChangeLogObjectTypes.LINK, _itself, _link_data),
+    'base.prerequisite': TrackedModel(ChangeLogObjectTypes.PREREQUISITE, _itself, _prerequisite_data),
+    'attribution.attributionnew': TrackedModel(ChangeLogObjectTypes.ATTRIBUTION, _itself, _attribution_data),
+    'attribution.attributionchargenew': TrackedModel(
+        ChangeLogObjectTypes.ATTRIBUTION,
+        lambda charge: charge.attribution,
+        _attribution_data
+    ),
+    'cms.translatedtext': TrackedModel(ChangeLogObjectTypes.TRANSLATED_TEXT, _itself, _translated_text_data),
+}
+
+
+def build_entry(instance: models.Model, action: ChangeLogActions) -> ChangeLogEntry:
+    tracked_model = TRACKED_MODELS[instance._meta.label_lower]
+    obj = tracked_model.get_object(instance)
+    if obj is not instance:
+        # A change of a part of the object (e.g. a charge of an attribution) is an update of the object
+        action = ChangeLogActions.UPDATE
+    return ChangeLogEntry(
+        object_type=tracked_model.object_type.name,
+        object_id=obj.pk,
+        action=action.name,
+        data=tracked_model.get_data(obj),
+    )
+
+
+def record(instance: models.Model, action: ChangeLogActions) -> ChangeLogEntry:
+    entry = build_entry(instance, action)
+    entry.save()
+    return entry
+
+
+def record_many(instances: Iterable[models.Model], action: ChangeLogActions) -> List[ChangeLogEntry]:
+    """ To be called after the bulk operations, which do not send the post_save signal """
+    return ChangeLogEntry.objects.bulk_create([build_entry(instance, action) for instance in instances])
+
+
+def _on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    record(instance, ChangeLogActions.CREATE if created else ChangeLogActions.UPDATE)
+
+
+def _on_delete(sender, instance, **kwargs):
+    try:
+        record(instance, ChangeLogActions.DELETE)
+    except ObjectDoesNotExist:
+        # Part of an object already deleted in the same cascade : the deletion of the object itself is logged
+        pass
+
+
+def connect_signals():
+    for label in TRACKED_MODELS:
+        post_save.connect(_on_save, sender=label, dispatch_uid="change_log_save_{}".format(label))
+        post_delete.connect(_on_delete, sender=label, dispatch_uid="change_log_delete_{}".format(label))
+
+
+def sequence_committed_entries(batch_size: int = PUBLICATION_BATCH_SIZE) -> int:
+    """
+    Give a sequence to the committed entries which have none yet, in the order of their id. Entries still in an
+    uncommitted transaction are not visible : they get a greater sequence once committed. Runs are serialized
+    by an advisory lock, so that the sequence always grows.
+    :return: The number of entries sequenced
+    """
+    sequenced = 0
+    while True:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_xact_lock(%s)", [SEQUENCE_LOCK_ID])
+            entries = list(
+                ChangeLogEntry.objects.filter(sequence__isnull=True).order_by('id').only('id')[:batch_size]
+            )
+            if not entries:
+                return sequenced
+            last_sequence = ChangeLogEntry.objects.aggregate(last_sequence=Max('sequence'))['last_sequence'] or 0
+            for index, entry in enumerate(entries, start=1):
+                entry.sequence = last_sequence + index
+            ChangeLogEntry.objects.bulk_update(entries, ['sequence'])
+            sequenced += len(entries)
+
+
+def publish_pending_entries(batch_size: int = PUBLICATION_BATCH_SIZE) -> int:
+    """
+    Send the sequenced entries not published yet on the CHANGE_LOG queue, in order, one message per batch.
+    Delivery is at least once : consumers ignore the sequences they have already processed.
+    :return: The number of entries published
+    """
+    queue_name = settings.QUEUES.get('QUEUES_NAME', {}).get('CHANGE_LOG')
+    if not queue_name:
+        logger.warning('Could not publish the change log because no queue name CHANGE_LOG')
+        return 0
+
+    published = 0
+    while True:
+        with transaction.atomic():
+            entries = list(
+                ChangeLogEntry.objects.select_for_update(skip_locked=True).filter(
+                    sequence__isnull=False,
+                    published_at__isnull=True
+                ).order_by('sequence')[:batch_size]
+            )
+            if not entries:
+                return published
+            try:
+                queue_sender.send_message(queue_name, ChangeLogEntrySerializer(entries, many=True).data)
+            except (RuntimeError, pika.exceptions.ConnectionClosed, pika.exceptions.ChannelClosed,
+                    pika.exceptions.AMQPError):
+                logger.exception('Could not publish the change log on the queue')
+                return published
+            ChangeLogEntry.objects.filter(id__in=[entry.id for entry in entries]).update(published_at=timezone.now())
+            published += len(entries)
@@ -25,11 +25,12 @@
 ##############################################################################
 import functools
 from decimal import Decimal
-from typing import List, Dict, Callable, Any, Tuple
+from typing import List, Dict, Callable, Any, Tuple, Optional
 
 from django.contrib.messages import ERROR, SUCCESS
 from django.contrib.messages import INFO
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
+from django.db.models import QuerySet
 from django.forms import model_to_dict
 from django.utils.translation import gettext_lazy as _
 
@@ -61,6 +62,9 @@ FOREIGN_KEY_NAME = (
     'language', 'campus', 'requirement_entity', 'allocation_entity', 'additional_entity_1', 'additional_entity_2',
 )
 
+# Above this number of proposals, consolidation is delegated to the workers and the report is sent by e-mail
+ASYNC_CONSOLIDATION_THRESHOLD = 20
+
 END_FOREIGN_KEY_NAME = "_id"
 NO_PREVIOUS_VALUE = '-'
 # TODO : VALUES_WHICH_NEED_TRANSLATION ?
@@ -313,20 +317,73 @@ def _apply_action_on_proposals(
         proposals: List[proposal_learning_unit.ProposalLearningUnit],
         action_method: Callable,
         author: person.Person,
-        permission_check: Callable[[proposal_learning_unit.ProposalLearningUnit, person.Person, bool], bool]
+        permission_check: Callable[[proposal_learning_unit.ProposalLearningUnit, person.Person, bool], bool],
+        on_progress: Optional[Callable[[int, int], None]] = None
 ) -> List[Tuple[proposal_learning_unit.ProposalLearningUnit, Dict]]:
+    proposals_with_permission = _check_permission_on_proposals(proposals, author, permission_check)
+
     proposals_with_results = []
-    for proposal in proposals:
-        perm, perm_result = permission_check(proposal, author, True)
+    for index, (proposal, perm, perm_result) in enumerate(proposals_with_permission, 1):
         if perm_result:
-            proposal_with_result = (proposal, action_method(proposal))
+            with transaction.atomic():
+                proposal_with_result = (proposal, action_method(proposal))
         else:
             perm_denied_msg = get_permission_error(author.user, perm)
             proposal_with_result = (proposal, {ERROR: _(str(perm_denied_msg))})
         proposals_with_results.append(proposal_with_result)
+        if on_progress:
+            on_progress(index, len(proposals_with_permission))
     return proposals_with_results
 
 
+def _check_permission_on_proposals(
+        proposals: List[proposal_learning_unit.ProposalLearningUnit],
+        author: person.Person,
+        permission_check: Callable[[proposal_learning_unit.ProposalLearningUnit, person.Person, bool], bool]
+) -> List[Tuple[proposal_learning_unit.ProposalLearningUnit, str, bool]]:
+    """
+    Permissions are evaluated for all proposals before any action is applied, on the same user object
+    in order to share the predicates cache, with the data used by the predicates fetched at once.
+    """
+    if isinstance(proposals, QuerySet):
+        proposals = proposals.select_related(
+            'learning_unit_year__academic_year',
+            'learning_unit_year__learning_unit',
+            'learning_unit_year__learning_container_year__requirement_entity',
+            'entity',
+        )
+    return [(proposal, *permission_check(proposal, author, True)) for proposal in proposals]
+
+
+def consolidate_proposals_async(
+        proposals: List[proposal_learning_unit.ProposalLearningUnit],
+        author: person.Person,
+        research_criteria: Dict) -> Dict[str, List[str]]:
+    from base.tasks import apply_action_on_proposals
+    # The worker must not read the proposals before the commit of the request
+    transaction.on_commit(functools.partial(
+        apply_action_on_proposals.run.delay,
+        proposal_ids=[proposal.pk for proposal in proposals],
+        author_id=author.pk,
+        operation=send_mail_util.CONSOLIDATION_OPERATION,
+        research_criteria=[(str(key), str(value)) for key, value in research_criteria or []],
+    ))
+    return {
+        INFO: [
+            _("The consolidation of %(number)s proposals has been started. A report will be sent by e-mail.") % {
+                "number": len(proposals)
+            }
+        ]
+    }
+
+
+def get_action_on_proposals(operation: str) -> Tuple[Callable, Callable]:
+    return {
+        send_mail_util.CONSOLIDATION_OPERATION: (consolidate_proposal, can_consolidate_learningunit_proposal),
+        send_mail_util.CANCELLATION_OPERATION: (cancel_proposal, can_cancel_proposal),
+    }[operation]
+
+
 def cancel_proposal(proposal):
     results = {}
     if proposal.type == ProposalType.CREATION.name:
@@ -67,6 +67,11 @@ class LearningUnitAutomaticPostponementToN6(AutomaticPostponementToN6):
             is_a_creation_proposal=False,
         )
 
+    def get_chunk_key(self, obj):
+        # A full learning unit and its partims create the same learning container years:
+        # postponed in parallel by different chunks, they would try to create them twice
+        return obj.learning_container_id
+
     def get_object_to_copy(self, object_to_duplicate):
         return getattr(
             object_to_duplicate,
@@ -32,7 +32,7 @@ from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 from base import models as mdl_base
-from base.business import learning_unit_year_with_context
+from base.business import change_log, learning_unit_year_with_context
 from base.business.learning_unit import CMS_LABEL_SUMMARY, CMS_LABEL_PEDAGOGY_FR_AND_EN, \
     CMS_LABEL_PEDAGOGY_FR_ONLY, CMS_LABEL_SPECIFICATIONS
 from base.business.learning_unit import get_academic_year_postponement_range
@@ -48,6 +48,7 @@ from base.models import academic_year
 from base.models.academic_year import AcademicYear, compute_max_academic_year_adjournment
 from base.models.entity import Entity
 from base.models.enums import learning_unit_year_subtypes, learning_component_year_type
+from base.models.enums.change_log_types import ChangeLogActions
 from base.models.enums.component_type import COMPONENT_TYPES
 from base.models.enums.entity_container_year_link_type import ENTITY_TYPE_LIST
 from base.models.enums.proposal_type import ProposalType
@@ -252,29 +253,44 @@ def _raise_if_entity_version_does_not_exist(new_lcy, new_academic_year):
 
 def _duplicate_learning_component_year(new_learn_unit_year, old_learn_unit_year):
     old_components = old_learn_unit_year.learningcomponentyear_set.all()
-    for old_component in old_components:
-        new_component = update_related_object(old_component, 'learning_unit_year', new_learn_unit_year)
-        _duplicate_learning_class_year(new_component)
+    new_components = [
+        update_related_object(old_component, 'learning_unit_year', new_learn_unit_year)
+        for old_component in old_components
+    ]
+    _duplicate_learning_class_year(new_components)
 
 
-def _duplicate_learning_class_year(new_component):
+def _duplicate_learning_class_year(new_components):
+    new_component_by_old_id = {new_component.copied_from.id: new_component for new_component in new_components}
     learning_class_years = LearningClassYear.objects.filter(
-        learning_component_year=new_component.copied_from
-    ).order_by("acronym")
-    for old_learning_class in learning_class_years:
-        update_related_object(old_learning_class, 'learning_component_year', new_component)
+        learning_component_year__in=new_component_by_old_id.keys()
+    ).order_by("learning_component_year", "acronym")
+    LearningClassYear.objects.bulk_create(
+        update_related_object(
+            old_learning_class,
+            'learning_component_year',
+            new_component_by_old_id[old_learning_class.learning_component_year_id],
+            commit_save=False
+        )
+        for old_learning_class in learning_class_years
+    )
 
 
 def _duplicate_teaching_material(duplicated_luy):
     previous_teaching_material = mdl_base.teaching_material.find_by_learning_unit_year(duplicated_luy.copied_from)
-    for material in previous_teaching_material:
-        update_related_object(material, 'learning_unit_year', duplicated_luy)
+    mdl_base.teaching_material.TeachingMaterial.objects.bulk_create(
+        update_related_object(material, 'learning_unit_year', duplicated_luy, commit_save=False)
+        for material in previous_teaching_material
+    )
 
 
 def _duplicate_cms_data(duplicated_luy):
     previous_cms_data = TranslatedText.objects.filter(reference=duplicated_luy.copied_from.id)
-    for item in previous_cms_data:
-        update_related_object(item, 'reference', duplicated_luy.id)
+    duplicated_cms_data = TranslatedText.objects.bulk_create(
+        update_related_object(item, 'reference', duplicated_luy.id, commit_save=False)
+        for item in previous_cms_data
+    )
+    change_log.record_many(duplicated_cms_data, ChangeLogActions.CREATE)
 
 
 def _check_shorten_partims(learning_unit_to_edit, new_academic_year):
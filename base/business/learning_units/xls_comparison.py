@@ -24,9 +24,8 @@
 #
 ##############################################################################
 from decimal import Decimal
-from typing import List
+from typing import Dict, Iterable, List, NamedTuple
 
-from django.db.models import Case, When
 from django.db.models.query import QuerySet
 from django.utils.translation import gettext_lazy as _
 from openpyxl.utils import get_column_letter
@@ -44,18 +43,18 @@ from base.business.xls import get_name_or_username
 from base.enums.component_detail import VOLUME_TOTAL, VOLUME_Q1, VOLUME_Q2, PLANNED_CLASSES, \
     VOLUME_REQUIREMENT_ENTITY, VOLUME_ADDITIONAL_REQUIREMENT_ENTITY_1, VOLUME_ADDITIONAL_REQUIREMENT_ENTITY_2, \
     VOLUME_TOTAL_REQUIREMENT_ENTITIES, REAL_CLASSES, VOLUME_GLOBAL
-from base.models.academic_year import find_academic_year_by_id
-from base.models.campus import find_by_id as find_campus_by_id
-from base.models.entity import find_by_id
+from base.models.academic_year import AcademicYear
+from base.models.campus import Campus
+from base.models.entity import Entity
 from base.models.enums import entity_container_year_link_type as entity_types, vacant_declaration_type, \
     attribution_procedure
-from base.models.enums import learning_component_year_type
+from base.models.enums import learning_component_year_type, learning_unit_year_subtypes
 from base.models.enums.learning_component_year_type import LECTURING, PRACTICAL_EXERCISES
 from base.models.enums.learning_container_year_types import LearningContainerYearType
 from base.models.enums.learning_unit_year_periodicity import PERIODICITY_TYPES
-from base.models.learning_unit_year import LearningUnitYear, get_by_id
+from base.models.learning_unit_year import LearningUnitYear
 from osis_common.document import xls_build
-from reference.models.language import find_by_id as find_language_by_id
+from reference.models.language import Language
 
 EMPTY_VALUE = ''
 DATE_FORMAT = '%d-%m-%Y'
@@ -70,6 +69,7 @@ ACADEMIC_COL_NUMBER = 1
 CELLS_MODIFIED_NO_BORDER = 'modifications'
 CELLS_TOP_BORDER = 'border_not_modified'
 DATA = 'data'
+INITIAL_DATA_ENTITY_KEYS = ['requirement_entity', 'allocation_entity', 'additional_entity_1', 'additional_entity_2']
 
 
 def learning_unit_titles():
@@ -107,33 +107,67 @@ def create_xls_comparison(user, learning_unit_years: QuerySet, filters, academic
 
 def _get_learning_unit_yrs_on_2_different_years(academic_yr_comparison: int,
                                                 learning_unit_years: QuerySet) -> List[LearningUnitYear]:
-    l_units_order_to_preserve = [learning_unit_yr.learning_unit for learning_unit_yr in learning_unit_years]
-    preserved = Case(*[When(learning_unit__pk=pk.id, then=pos) for pos, pk in enumerate(l_units_order_to_preserve)])
+    position_by_learning_unit = {}
+    for learning_unit_yr in learning_unit_years:
+        position_by_learning_unit.setdefault(learning_unit_yr.learning_unit_id, len(position_by_learning_unit))
 
     learning_unit_years = LearningUnitYear.objects.filter(
-        learning_unit__in=(_get_learning_units(learning_unit_years)),
+        learning_unit_id__in=position_by_learning_unit.keys(),
         academic_year__year__in=(
             learning_unit_years[0].academic_year.year,
             academic_yr_comparison)
     ).select_related(
         'academic_year',
+        'learning_unit',
+        'language',
+        'campus__organization',
         'learning_container_year',
         'learning_container_year__academic_year'
     ).prefetch_related(
         get_learning_component_prefetch()
     ).prefetch_related(
+        *_get_entity_container_prefetches()
+    )
+    # Keep the order of the selected learning units, both years of a learning unit being on consecutive lines
+    learning_unit_years = sorted(
+        learning_unit_years,
+        key=lambda luy: (position_by_learning_unit[luy.learning_unit_id], luy.academic_year.year)
+    )
+    [append_latest_entities(learning_unit) for learning_unit in learning_unit_years]
+    [append_components(learning_unit) for learning_unit in learning_unit_years]
+    _append_partims(learning_unit_years)
+    return learning_unit_years
+
+
+def _get_entity_container_prefetches():
+    return [
         build_entity_container_prefetch(entity_types.ALLOCATION_ENTITY),
         build_entity_container_prefetch(entity_types.REQUIREMENT_ENTITY),
         build_entity_container_prefetch(entity_types.ADDITIONAL_REQUIREMENT_ENTITY_1),
         build_entity_container_prefetch(entity_types.ADDITIONAL_REQUIREMENT_ENTITY_2),
-    ).order_by(preserved, 'academic_year__year')
-    [append_latest_entities(learning_unit) for learning_unit in learning_unit_years]
-    [append_components(learning_unit) for learning_unit in learning_unit_years]
-    return learning_unit_years
+    ]
+
+
+def _append_partims(learning_unit_years: List[LearningUnitYear]) -> None:
+    full_container_year_ids = {luy.learning_container_year_id for luy in learning_unit_years if luy.is_full()}
+    partims_by_container_year = {}
+    partims = LearningUnitYear.objects.filter(
+        learning_container_year_id__in=full_container_year_ids,
+        subtype=learning_unit_year_subtypes.PARTIM,
+    ).order_by('acronym') if full_container_year_ids else []
+    for partim in partims:
+        partims_by_container_year.setdefault(partim.learning_container_year_id, []).append(partim)
+
+    for luy in learning_unit_years:
+        luy.partims_related = partims_by_container_year.get(luy.learning_container_year_id, []) \
+            if luy.is_full() else []
 
 
-def _get_learning_units(learning_unit_years):
-    return list(set([l.learning_unit for l in learning_unit_years]))
+def _get_partims(learning_unit_yr: LearningUnitYear):
+    # Partims are attached in bulk by _append_partims when the comparison is loaded
+    if hasattr(learning_unit_yr, 'partims_related'):
+        return learning_unit_yr.partims_related
+    return learning_unit_yr.get_partims_related()
 
 
 def prepare_xls_content(learning_unit_yrs):
@@ -228,7 +262,7 @@ def _get_data(learning_unit_yr, new_line, first_data, partims=True, proposal_com
         organization.name if organization else BLANK_VALUE,
         learning_unit_yr.campus or BLANK_VALUE]
     if partims:
-        data.append(get_partims_as_str(learning_unit_yr.get_partims_related()))
+        data.append(get_partims_as_str(_get_partims(learning_unit_yr)))
     data.extend(
         [
             get_representing_string(learning_unit_yr.faculty_remark),
@@ -318,20 +352,26 @@ def _get_component_data_by_type(component):
 
 
 def prepare_xls_content_for_comparison(luy_with_proposals):
+    luy_with_proposals = _get_learning_unit_yrs_with_proposal(luy_with_proposals)
+    luys_with_components = _get_learning_unit_yrs_with_components(luy_with_proposals)
+    initial_data_references = _load_initial_data_references(
+        luy.proposallearningunit.initial_data for luy in luy_with_proposals
+    )
+
     line_index = 1
     data = []
     top_border = []
     modified_cells_no_border = []
     for luy_with_proposal in luy_with_proposals:
         top_border.extend(get_border_columns(line_index))
-        data_proposal = _get_proposal_data(luy_with_proposal)
+        data_proposal = _get_proposal_data(luy_with_proposal, luys_with_components.get(luy_with_proposal.id))
         data.append(data_proposal)
 
         proposal = luy_with_proposal.proposallearningunit
         initial_luy_data = proposal.initial_data
 
         if initial_luy_data and initial_luy_data.get('learning_unit'):
-            initial_data = _get_data_from_initial_data(luy_with_proposal.proposallearningunit.initial_data, True)
+            initial_data = _get_data_from_initial_data(initial_luy_data, True, initial_data_references)
             data.append(initial_data)
             modified_cells_no_border.extend(
                 _check_changes(initial_data,
@@ -348,30 +388,88 @@ def prepare_xls_content_for_comparison(luy_with_proposals):
     }
 
 
-def _get_data_from_initial_data(initial_data, proposal_comparison=False):
+def _get_learning_unit_yrs_with_proposal(learning_unit_years) -> List[LearningUnitYear]:
+    ids = [luy.pk for luy in learning_unit_years]
+    learning_unit_years_by_id = LearningUnitYear.objects.select_related(
+        'academic_year',
+        'learning_unit__end_year',
+        'language',
+        'campus__organization',
+        'learning_container_year',
+        'proposallearningunit',
+    ).prefetch_related(
+        *_get_entity_container_prefetches()
+    ).in_bulk(ids)
+    return [append_latest_entities(learning_unit_years_by_id[luy_id]) for luy_id in ids]
+
+
+def _get_learning_unit_yrs_with_components(learning_unit_years) -> Dict[int, LearningUnitYear]:
+    container_year_ids = list({luy.learning_container_year_id for luy in learning_unit_years})
+    if not container_year_ids:
+        return {}
+    return {
+        luy.id: luy
+        for luy in learning_unit_year_with_context.get_with_context(learning_container_year_id=container_year_ids)
+    }
+
+
+class InitialDataReferences(NamedTuple):
+    learning_unit_years: Dict[int, LearningUnitYear]
+    entities: Dict[int, Entity]
+    campuses: Dict[int, Campus]
+    languages: Dict[int, Language]
+    academic_years: Dict[int, AcademicYear]
+
+
+def _load_initial_data_references(initial_datas: Iterable[dict]) -> InitialDataReferences:
+    """ Fetch at once the rows referenced by the initial data of all the proposals """
+    luy_ids, entity_ids, campus_ids, language_ids, academic_year_ids = set(), set(), set(), set(), set()
+    for initial_data in filter(None, initial_datas):
+        luy_initial = initial_data.get('learning_unit_year', {})
+        lcy_initial = initial_data.get('learning_container_year', {})
+        lu_initial = initial_data.get('learning_unit', {})
+        luy_ids.add(luy_initial.get('id'))
+        entity_ids.update(lcy_initial.get(key) for key in INITIAL_DATA_ENTITY_KEYS)
+        campus_ids.add(luy_initial.get('campus'))
+        language_ids.add(luy_initial.get('language'))
+        academic_year_ids.add(lu_initial.get('end_year'))
+    for ids in (luy_ids, entity_ids, campus_ids, language_ids, academic_year_ids):
+        ids.discard(None)
+
+    return InitialDataReferences(
+        learning_unit_years=LearningUnitYear.objects.select_related(
+            'academic_year', 'campus__organization'
+        ).in_bulk(luy_ids),
+        entities=Entity.objects.prefetch_related('entityversion_set').in_bulk(entity_ids),
+        campuses=Campus.objects.select_related('organization').in_bulk(campus_ids),
+        languages=Language.objects.in_bulk(language_ids),
+        academic_years=AcademicYear.objects.in_bulk(academic_year_ids),
+    )
+
+
+def _get_data_from_initial_data(initial_data, proposal_comparison=False, references: InitialDataReferences = None):
+    if references is None:
+        references = _load_initial_data_references([initial_data])
     luy_initial = initial_data.get('learning_unit_year', {})
     lcy_initial = initial_data.get('learning_container_year', {})
     lu_initial = initial_data.get('learning_unit', {})
 
-    if luy_initial.get('id'):
-        learning_unit_yr = get_by_id(luy_initial.get('id'))
-    else:
-        learning_unit_yr = None
+    learning_unit_yr = references.learning_unit_years.get(luy_initial.get('id'))
 
-    requirement_entity = find_by_id(lcy_initial.get('requirement_entity'))
-    allocation_entity = find_by_id(lcy_initial.get('allocation_entity'))
-    add1_requirement_entity = find_by_id(lcy_initial.get('additional_entity_1'))
-    add2_requirement_entity = find_by_id(lcy_initial.get('additional_entity_2'))
-    campus = find_campus_by_id(luy_initial.get('campus'))
+    requirement_entity = references.entities.get(lcy_initial.get('requirement_entity'))
+    allocation_entity = references.entities.get(lcy_initial.get('allocation_entity'))
+    add1_requirement_entity = references.entities.get(lcy_initial.get('additional_entity_1'))
+    add2_requirement_entity = references.entities.get(lcy_initial.get('additional_entity_2'))
+    campus = references.campuses.get(luy_initial.get('campus'))
 
     organization = None
     if learning_unit_yr:
         organization = get_organization_from_learning_unit_year(learning_unit_yr)
-    language = find_language_by_id(luy_initial.get('language'))
+    language = references.languages.get(luy_initial.get('language'))
 
     if proposal_comparison:
         academic_year = _format_academic_year(learning_unit_yr.academic_year.name,
-                                              find_academic_year_by_id(lu_initial.get('end_year'))
+                                              references.academic_years.get(lu_initial.get('end_year'))
                                               if lu_initial.get('end_year') else None)
     else:
         academic_year = learning_unit_yr.academic_year.name
@@ -452,7 +550,6 @@ def create_xls_proposal_comparison(user, learning_units_with_proposal, filters):
 
 
 def _get_basic_components(learning_unit_yr):
-    learning_unit_yr = find_learning_unit_yr_with_components_data(learning_unit_yr)
     components = []
     components_values = []
     for key, value in learning_unit_yr.components.items():
@@ -483,9 +580,11 @@ def _get_components_data(learning_unit_yr):
         _get_component_data_by_type(components_data_dict.get(PRACTICAL_EXERCISES))
 
 
-def _get_proposal_data(learning_unit_yr):
+def _get_proposal_data(learning_unit_yr, learning_unit_yr_with_components=None):
     data_proposal = [_('Proposal')] + _get_data(learning_unit_yr, False, None, False, True)
-    data_proposal.extend(_get_components_data(learning_unit_yr))
+    data_proposal.extend(_get_components_data(
+        learning_unit_yr_with_components or find_learning_unit_yr_with_components_data(learning_unit_yr)
+    ))
     return data_proposal
 
 
@@ -23,10 +23,12 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import itertools
+from typing import Dict, List
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Prefetch, Case, When, Value, IntegerField, CharField, Q
+from django.db.models import Value, CharField, Q
 from django.db.models.expressions import F
 from django.db.models.functions import Concat, Upper
 from django.utils.translation import gettext_lazy as _
@@ -40,11 +42,10 @@ from base.business.learning_unit import CMS_LABEL_PEDAGOGY_FR_ONLY, \
 from base.business.learning_unit import CMS_LABEL_SPECIFICATIONS, get_achievements_group_by_language
 from base.business.learning_unit_xls import annotate_qs
 from base.business.xls import get_name_or_username
-from base.models.person import get_user_interface_language
 from base.models.teaching_material import TeachingMaterial
 from base.utils.excel import get_html_to_text
-from base.views.learning_unit import get_specifications_context
 from cms.enums.entity_name import LEARNING_UNIT_YEAR
+from cms.models import translated_text
 from cms.models.text_label import TextLabel
 from cms.models.translated_text import TranslatedText
 from cms.models.translated_text_label import TranslatedTextLabel
@@ -114,28 +115,22 @@ def _add_cms_title_fr_en(cms_labels, with_en=True):
 
 
 def prepare_xls_educational_information_and_specifications(learning_unit_years, request):
-    qs = annotate_qs(learning_unit_years)
-    user_language = get_user_interface_language(request.user)
+    learning_unit_years = list(annotate_qs(learning_unit_years))
+    cms_texts = translated_text.bulk_search((LEARNING_UNIT_YEAR, luy.id) for luy in learning_unit_years)
+    teaching_materials_by_luy = _get_teaching_materials_by_learning_unit_year(learning_unit_years)
 
     result = []
 
-    for learning_unit_yr in qs:
-        translated_labels_with_text = _get_translated_labels_with_text(
-            learning_unit_yr.id,
-            user_language,
-            CMS_LABEL_PEDAGOGY
-        )
-        teaching_materials = TeachingMaterial.objects.filter(learning_unit_year=learning_unit_yr).order_by('order')
-
+    for learning_unit_yr in learning_unit_years:
         line = [
             learning_unit_yr.acronym,
             learning_unit_yr.complete_title,
             learning_unit_yr.entity_requirement,
         ]
 
-        for label_key in CMS_LABEL_PEDAGOGY_FR_AND_EN:
-            _add_pedagogies_translated_labels_with_text(label_key, line, translated_labels_with_text)
+        _add_cms_texts_fr_en(cms_texts, learning_unit_yr, CMS_LABEL_PEDAGOGY_FR_AND_EN, line)
 
+        teaching_materials = teaching_materials_by_luy.get(learning_unit_yr.id)
         if teaching_materials:
             line.append("\n".join(
                 [get_html_to_text(teaching_material.title) for teaching_material in
@@ -143,29 +138,13 @@ def prepare_xls_educational_information_and_specifications(learning_unit_years,
         else:
             line.append('')
 
-        for label_key in CMS_LABEL_PEDAGOGY_FR_ONLY:
-            translated_label = translated_labels_with_text.filter(text_label__label=label_key).first()
-            if translated_label:
-                line.append(
-                    get_html_to_text(translated_label.text_label.text_fr[0].text)
-                    if translated_label.text_label.text_fr and translated_label.text_label.text_fr[0].text else ''
-                )
-
-            else:
-                line.append('')
-
+        _add_cms_texts_fr_en(cms_texts, learning_unit_yr, CMS_LABEL_PEDAGOGY_FR_ONLY, line, with_en=False)
         _add_revision_informations(learning_unit_yr, line)
 
-        translated_labels_force_majeure_with_text = _get_translated_labels_with_text(
-            learning_unit_yr.id,
-            user_language,
-            CMS_LABEL_PEDAGOGY_FORCE_MAJEURE
-        )
-        for label_key in CMS_LABEL_PEDAGOGY_FORCE_MAJEURE:
-            _add_pedagogies_translated_labels_with_text(label_key, line, translated_labels_force_majeure_with_text)
-
+        _add_cms_texts_fr_en(cms_texts, learning_unit_yr, CMS_LABEL_PEDAGOGY_FORCE_MAJEURE, line)
         _add_revision_informations(learning_unit_yr, line, is_force_majeure=True)
-        _add_specifications(learning_unit_yr, line, request)
+
+        _add_cms_texts_fr_en(cms_texts, learning_unit_yr, CMS_LABEL_SPECIFICATIONS, line)
 
         line.extend(_add_achievements(learning_unit_yr))
 
@@ -174,6 +153,24 @@ def prepare_xls_educational_information_and_specifications(learning_unit_years,
     return result
 
 
+def _get_teaching_materials_by_learning_unit_year(learning_unit_years) -> Dict[int, List[TeachingMaterial]]:
+    teaching_materials = TeachingMaterial.objects.filter(
+        learning_unit_year__in=[luy.id for luy in learning_unit_years]
+    ).order_by('learning_unit_year', 'order')
+    return {
+        luy_id: list(materials)
+        for luy_id, materials in itertools.groupby(teaching_materials, key=lambda tm: tm.learning_unit_year_id)
+    }
+
+
+def _add_cms_texts_fr_en(cms_texts, learning_unit_yr, cms_labels, line, with_en=True):
+    languages = [settings.LANGUAGE_CODE_FR, settings.LANGUAGE_CODE_EN] if with_en else [settings.LANGUAGE_CODE_FR]
+    for label_key in cms_labels:
+        for language in languages:
+            text = cms_texts.get_text(LEARNING_UNIT_YEAR, learning_unit_yr.id, label_key, language)
+            line.append(get_html_to_text(text) if text else '')
+
+
 def _add_revision_informations(learning_unit_yr, line, is_force_majeure=False):
     translated_texts = TranslatedText.objects.filter(
         reference=learning_unit_yr.id,
@@ -211,21 +208,6 @@ def _add_revision_informations(learning_unit_yr, line, is_force_majeure=False):
         line.append('')
 
 
-def _add_pedagogies_translated_labels_with_text(label_key, line, translated_labels_with_text):
-    translated_label = translated_labels_with_text.filter(text_label__label=label_key).first()
-    if translated_label:
-        line.append(
-            get_html_to_text(translated_label.text_label.text_fr[0].text)
-            if translated_label.text_label.text_fr and translated_label.text_label.text_fr[0].text else ''
-        )
-        line.append(
-            get_html_to_text(translated_label.text_label.text_en[0].text)
-            if translated_label.text_label.text_en and translated_label.text_label.text_en[0].text else '')
-    else:
-        line.append('')
-        line.append('')
-
-
 def _add_achievements(learning_unit_yr):
     achievements = get_achievements_group_by_language(learning_unit_yr)
     achievements_fr = (achievements.get('achievements_FR', None))
@@ -237,52 +219,6 @@ def _add_achievements(learning_unit_yr):
             ]
 
 
-def _add_specifications(learning_unit_yr, line, request):
-    specifications = get_specifications_context(learning_unit_yr, request)
-    obj_fr = specifications.get('form_french')
-    obj_en = specifications.get('form_english')
-    for label_key in CMS_LABEL_SPECIFICATIONS:
-        line.append(get_html_to_text(getattr(obj_fr, label_key, '')))
-        line.append(get_html_to_text(getattr(obj_en, label_key, '')))
-
-
-def _get_translated_labels_with_text(learning_unit_year_id, user_language, cms_labels):
-    translated_labels_with_text = TranslatedTextLabel.objects.filter(
-        language=user_language,
-        text_label__label__in=cms_labels
-    ).prefetch_related(
-        Prefetch(
-            "text_label__translatedtext_set",
-            queryset=TranslatedText.objects.filter(
-                language=settings.LANGUAGE_CODE_FR,
-                entity=LEARNING_UNIT_YEAR,
-                reference=learning_unit_year_id
-            ),
-            to_attr="text_fr"
-        ),
-        Prefetch(
-            "text_label__translatedtext_set",
-            queryset=TranslatedText.objects.filter(
-                language=settings.LANGUAGE_CODE_EN,
-                entity=LEARNING_UNIT_YEAR,
-                reference=learning_unit_year_id
-            ),
-            to_attr="text_en"
-        )
-    ).annotate(
-        label_ordering=Case(
-            *[When(text_label__label=label, then=Value(i)) for i, label in enumerate(cms_labels)],
-            default=Value(len(cms_labels)),
-            output_field=IntegerField()
-        )
-    ).select_related(
-        "text_label"
-    ).order_by(
-        "label_ordering"
-    )
-    return translated_labels_with_text
-
-
 def _get_wrapped_cells_educational_information_and_specifications(learning_units, nb_col):
     dict_wrapped_styled_cells = []
 
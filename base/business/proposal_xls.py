@@ -28,7 +28,7 @@ from django.utils.translation import gettext_lazy as _
 
 from base.business.xls import get_name_or_username
 from base.models.enums.learning_unit_year_periodicity import PERIODICITY_TYPES
-from base.models.proposal_learning_unit import find_by_learning_unit_year
+from base.models.proposal_learning_unit import find_by_learning_unit_year, ProposalLearningUnit
 from osis_common.document import xls_build
 
 WORKSHEET_TITLE = _('Proposals')
@@ -120,11 +120,20 @@ COMPARISON_PROPOSAL_TITLES = \
 
 
 def prepare_xls_content(proposals):
-    return [extract_xls_data_from_proposal(proposal) for proposal in proposals]
+    proposal_by_learning_unit_year = {
+        proposal.learning_unit_year_id: proposal
+        for proposal in ProposalLearningUnit.objects.filter(
+            learning_unit_year__in=[luy.pk for luy in proposals]
+        ).select_related('entity')
+    }
+    return [
+        extract_xls_data_from_proposal(luy, proposal_by_learning_unit_year.get(luy.pk))
+        for luy in proposals
+    ]
 
 
-def extract_xls_data_from_proposal(luy):
-    proposal = find_by_learning_unit_year(luy)
+def extract_xls_data_from_proposal(luy, proposal=None):
+    proposal = proposal or find_by_learning_unit_year(luy)
     return [luy.entity_requirement,
             luy.acronym,
             luy.complete_title,
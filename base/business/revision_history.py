@@ -0,0 +1,160 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q, QuerySet
+from django.dispatch import receiver
+from reversion.models import Revision, Version
+from reversion.signals import post_revision_commit
+
+from base.models.education_group_achievement import EducationGroupAchievement
+from base.models.enums.revision_aggregate_types import RevisionAggregateTypes
+from base.models.learning_unit_year import LearningUnitYear
+from base.models.revision_aggregate import RevisionAggregate
+from program_management.models.education_group_version import EducationGroupVersion
+
+AggregateRoot = Tuple[str, int]
+
+LEARNING_UNIT_YEAR = RevisionAggregateTypes.LEARNING_UNIT_YEAR.name
+EDUCATION_GROUP_YEAR = RevisionAggregateTypes.EDUCATION_GROUP_YEAR.name
+GROUP_YEAR = RevisionAggregateTypes.GROUP_YEAR.name
+
+
+def _learning_unit_years_of_container_year(object_id: int, fields: dict) -> List[AggregateRoot]:
+    luy_ids = LearningUnitYear.objects.filter(learning_container_year_id=object_id).values_list('pk', flat=True)
+    return [(LEARNING_UNIT_YEAR, luy_id) for luy_id in luy_ids]
+
+
+def _learning_unit_years_of_learning_unit(object_id: int, fields: dict) -> List[AggregateRoot]:
+    luy_ids = LearningUnitYear.objects.filter(learning_unit_id=object_id).values_list('pk', flat=True)
+    return [(LEARNING_UNIT_YEAR, luy_id) for luy_id in luy_ids]
+
+
+def _education_group_year_of_detailed_achievement(object_id: int, fields: dict) -> List[AggregateRoot]:
+    egy_ids = EducationGroupAchievement.objects.filter(
+        pk=fields['education_group_achievement_id']
+    ).values_list('education_group_year_id', flat=True)
+    return [(EDUCATION_GROUP_YEAR, egy_id) for egy_id in egy_ids]
+
+
+def _aggregates_of_education_group_version(object_id: int, fields: dict) -> List[AggregateRoot]:
+    return [(EDUCATION_GROUP_YEAR, fields['offer_id']), (GROUP_YEAR, fields['root_group_id'])]
+
+
+def _aggregates_of_group_year(object_id: int, fields: dict) -> List[AggregateRoot]:
+    egy_ids = EducationGroupVersion.objects.filter(root_group_id=object_id).values_list('offer_id', flat=True)
+    return [(GROUP_YEAR, object_id)] + [(EDUCATION_GROUP_YEAR, egy_id) for egy_id in egy_ids]
+
+
+def _by_field(aggregate_type: str, field_name: str) -> Callable[[int, dict], List[AggregateRoot]]:
+    return lambda object_id, fields: [(aggregate_type, fields[field_name])] if fields.get(field_name) else []
+
+
+def _by_pk(aggregate_type: str) -> Callable[[int, dict], List[AggregateRoot]]:
+    return lambda object_id, fields: [(aggregate_type, object_id)]
+
+
+# For each versioned model (app_label.model_name), the aggregate roots whose history is affected by a change
+AGGREGATE_ROOT_RESOLVERS: Dict[str, Callable[[int, dict], Iterable[AggregateRoot]]] = {
+    'base.learningunityear': _by_pk(LEARNING_UNIT_YEAR),
+    'base.learningcontaineryear': _learning_unit_years_of_container_year,
+    'base.learningunit': _learning_unit_years_of_learning_unit,
+    'base.externallearningunityear': _by_field(LEARNING_UNIT_YEAR, 'learning_unit_year_id'),
+    'base.learningcomponentyear': _by_field(LEARNING_UNIT_YEAR, 'learning_unit_year_id'),
+    'base.educationgroupyear': _by_pk(EDUCATION_GROUP_YEAR),
+    'base.educationgrouporganization': _by_field(EDUCATION_GROUP_YEAR, 'education_group_year_id'),
+    'base.educationgroupachievement': _by_field(EDUCATION_GROUP_YEAR, 'education_group_year_id'),
+    'base.educationgroupdetailedachievement': _education_group_year_of_detailed_achievement,
+    'base.educationgroupyeardomain': _by_field(EDUCATION_GROUP_YEAR, 'education_group_year_id'),
+    'base.educationgroupcertificateaim': _by_field(EDUCATION_GROUP_YEAR, 'education_group_year_id'),
+    'program_management.educationgroupversion': _aggregates_of_education_group_version,
+    'education_group.groupyear': _aggregates_of_group_year,
+}
+
+
+def get_aggregate_roots(version: Version) -> List[AggregateRoot]:
+    content_type = ContentType.objects.get_for_id(version.content_type_id)
+    resolver = AGGREGATE_ROOT_RESOLVERS.get("{}.{}".format(content_type.app_label, content_type.model))
+    if resolver is None:
+        return []
+    try:
+        return list(resolver(int(version.object_id), version.field_dict))
+    except Exception:
+        # The version can not be deserialized anymore (e.g. field removed since) : it belongs to no aggregate
+        return []
+
+
+def build_revision_aggregates(revision: Revision, versions: Iterable[Version]) -> List[RevisionAggregate]:
+    aggregate_roots = set()
+    for version in versions:
+        aggregate_roots.update(get_aggregate_roots(version))
+    return [
+        RevisionAggregate(
+            revision_id=revision.pk,
+            aggregate_type=aggregate_type,
+            aggregate_id=aggregate_id,
+            date_created=revision.date_created,
+        )
+        for aggregate_type, aggregate_id in aggregate_roots
+    ]
+
+
+def tag_revision(revision: Revision, versions: Iterable[Version]) -> None:
+    RevisionAggregate.objects.bulk_create(build_revision_aggregates(revision, versions), ignore_conflicts=True)
+
+
+def tag_existing_revisions(batch_size: int = 2000) -> int:
+    """ Tag the revisions recorded before the aggregate roots were tracked ; return the number of tags processed """
+    content_type_filter = Q()
+    for label in AGGREGATE_ROOT_RESOLVERS:
+        app_label, model = label.split('.')
+        content_type_filter |= Q(app_label=app_label, model=model)
+    versions = Version.objects.filter(
+        content_type__in=ContentType.objects.filter(content_type_filter)
+    ).select_related('revision').order_by('pk')
+
+    created = 0
+    batch = []
+    for version in versions.iterator(chunk_size=batch_size):
+        batch.extend(build_revision_aggregates(version.revision, [version]))
+        if len(batch) >= batch_size:
+            created += len(RevisionAggregate.objects.bulk_create(batch, ignore_conflicts=True))
+            batch = []
+    created += len(RevisionAggregate.objects.bulk_create(batch, ignore_conflicts=True))
+    return created
+
+
+@receiver(post_revision_commit)
+def tag_revision_with_aggregate_roots(sender, revision, versions, **kwargs):
+    tag_revision(revision, versions)
+
+
+def get_history(aggregate_type: str, aggregate_id: int) -> QuerySet:
+    return RevisionAggregate.objects.filter(
+        aggregate_type=aggregate_type,
+        aggregate_id=aggregate_id,
+    ).select_related('revision__user__person').order_by('-date_created')
@@ -23,8 +23,13 @@
 #    see http://www.gnu.org/licenses/.
 #
 ############################################################################
+import logging
+import time
 from abc import ABC
+from collections import OrderedDict
+from typing import List, Dict, Iterator
 
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned
 from django.db import transaction, Error
 from django.db.models import Max, Q
@@ -33,6 +38,8 @@ from django.utils.translation import gettext as _
 from base.business.education_groups.postponement import ConsistencyError
 from base.models.academic_year import AcademicYear
 
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
 
 class AutomaticPostponement(ABC):
     # The model must have annualized data with a FK to AcademicYear
@@ -102,12 +109,21 @@ class AutomaticPostponementToN6(AutomaticPostponement):
     send_before = None
     send_after = None
 
+    # Number of objects postponed in the same transaction
+    chunk_size = 100
+
     def __init__(self, queryset=None):
         # Fetch the N and N+6 academic_years
         self.last_academic_year = AcademicYear.objects.max_adjournment()
 
         super().__init__(queryset)
 
+        self.academic_years_by_year = {
+            academic_year.year: academic_year
+            for academic_year in AcademicYear.objects.filter(year__lte=self.last_academic_year.year)
+        }
+        self.metrics = {'chunks': 0, 'duration': 0.0}
+
     def postpone(self):
         # send statistics to the managers
         statistics_context = self.get_statistics_context()
@@ -121,25 +137,123 @@ class AutomaticPostponementToN6(AutomaticPostponement):
         return self.result, self.errors
 
     def _extend_objects(self):
+        for chunk in self.get_chunks():
+            self.extend_chunk(chunk)
+
+    def get_chunk_key(self, obj):
+        """ Objects with the same key share data and are never split across chunks (None: no constraint) """
+        return None
+
+    def get_chunks(self) -> Iterator[List]:
+        groups = OrderedDict()
         for obj in self.to_duplicate:
-            try:
-                with transaction.atomic():
-                    last_year = obj.end_year.year if obj.end_year else self.last_academic_year.year
-                    obj_to_copy = self.get_object_to_copy(obj)
-                    copied_objs = []
-                    last_object_copied = None
-                    for year in range(obj.last_year + 1, last_year + 1):
-                        new_obj = self.extend_obj(obj_to_copy, AcademicYear.objects.get(year=year))
-                        copied_objs.append(new_obj)
-                        last_object_copied = new_obj
-
-                    self.post_extend(obj_to_copy, copied_objs)
-                    if last_object_copied:
-                        self.result.append(last_object_copied)
-
-            # General catch to be sure to not stop the rest of the duplication
-            except (Error, ObjectDoesNotExist, MultipleObjectsReturned, ConsistencyError) as err:
-                self.errors.append(obj)
+            key = self.get_chunk_key(obj)
+            groups.setdefault(('object', obj.pk) if key is None else key, []).append(obj)
+
+        chunk = []
+        for group in groups.values():
+            if chunk and len(chunk) + len(group) > self.chunk_size:
+                yield chunk
+                chunk = []
+            chunk.extend(group)
+        if chunk:
+            yield chunk
+
+    def extend_chunk(self, objects_to_duplicate: List):
+        """ Postpone a chunk of objects in its own transaction. An error on an object does not stop the chunk. """
+        start = time.perf_counter()
+        with transaction.atomic():
+            for obj in objects_to_duplicate:
+                self._extend_object(obj)
+
+        self.metrics['chunks'] += 1
+        self.metrics['duration'] += time.perf_counter() - start
+        logger.info(
+            "Automatic postponement of %s: chunk %s done (%s objects, %s extended, %s errors, %.2fs)",
+            self.model.__name__, self.metrics['chunks'], len(objects_to_duplicate), len(self.result),
+            len(self.errors), self.metrics['duration'],
+        )
+
+    def _extend_object(self, obj):
+        try:
+            with transaction.atomic():
+                last_year = obj.end_year.year if obj.end_year else self.last_academic_year.year
+                obj_to_copy = self.get_object_to_copy(obj)
+                copied_objs = []
+                last_object_copied = None
+                for year in range(obj.last_year + 1, last_year + 1):
+                    new_obj = self.extend_obj(obj_to_copy, self._get_academic_year(year))
+                    copied_objs.append(new_obj)
+                    last_object_copied = new_obj
+
+                self.post_extend(obj_to_copy, copied_objs)
+                if last_object_copied:
+                    self.result.append(last_object_copied)
+
+        # General catch to be sure to not stop the rest of the duplication
+        except (Error, ObjectDoesNotExist, MultipleObjectsReturned, ConsistencyError) as err:
+            self.errors.append(obj)
+
+    def _get_academic_year(self, year: int) -> AcademicYear:
+        try:
+            return self.academic_years_by_year[year]
+        except KeyError:
+            raise AcademicYear.DoesNotExist
+
+    def serialize_chunk_results(self) -> Dict:
+        """ Results of a chunk processed by a worker, to be merged by send_statistics_from_chunk_results() """
+        return {
+            "result": [obj.pk for obj in self.result],
+            "errors": [obj.pk for obj in self.errors],
+            "metrics": self.metrics,
+        }
+
+    def serialize_statistics_context(self, statistics_context: Dict) -> Dict:
+        return {
+            'max_academic_year_to_postpone': statistics_context['max_academic_year_to_postpone'].pk,
+            'to_duplicate': [obj.pk for obj in statistics_context['to_duplicate']],
+            'already_duplicated': list(statistics_context['already_duplicated'].values_list('pk', flat=True)),
+            'to_ignore': list(statistics_context['to_ignore'].values_list('pk', flat=True)),
+            'ending_on_max_academic_year': list(
+                statistics_context['ending_on_max_academic_year'].values_list('pk', flat=True)
+            ),
+        }
+
+    @classmethod
+    def deserialize_statistics_context(cls, serialized_statistics_context: Dict) -> Dict:
+        return {
+            'max_academic_year_to_postpone': AcademicYear.objects.get(
+                pk=serialized_statistics_context['max_academic_year_to_postpone']
+            ),
+            'to_duplicate': cls.model.objects.filter(pk__in=serialized_statistics_context['to_duplicate']),
+            'already_duplicated': cls.model.objects.filter(
+                pk__in=serialized_statistics_context['already_duplicated']
+            ),
+            'to_ignore': cls.model.objects.filter(pk__in=serialized_statistics_context['to_ignore']),
+            'ending_on_max_academic_year': cls.model.objects.filter(
+                pk__in=serialized_statistics_context['ending_on_max_academic_year']
+            ),
+        }
+
+    @classmethod
+    def send_statistics_from_chunk_results(cls, serialized_statistics_context: Dict, chunk_results: List[Dict]):
+        """ Merge the results of chunks processed in parallel and send statistics to the managers """
+        annualized_model = cls.model._meta.get_field(cls.annualized_set).related_model
+        result = list(annualized_model.objects.filter(
+            pk__in=[pk for chunk_result in chunk_results for pk in chunk_result['result']]
+        ))
+        errors = list(cls.model.objects.filter(
+            pk__in=[pk for chunk_result in chunk_results for pk in chunk_result['errors']]
+        ))
+        cls.send_after(cls.deserialize_statistics_context(serialized_statistics_context), result, errors)
+        return {
+            "msg": cls.msg_result % {'number_extended': len(result), 'number_error': len(errors)},
+            "errors": [str(obj) for obj in errors],
+            "metrics": {
+                "chunks": sum(chunk_result['metrics']['chunks'] for chunk_result in chunk_results),
+                "duration": sum(chunk_result['metrics']['duration'] for chunk_result in chunk_results),
+            }
+        }
 
     def get_object_to_copy(self, object_to_duplicate):
         return getattr(object_to_duplicate, self.annualized_set + "_set").latest('academic_year__year')
@@ -127,11 +127,20 @@ class MultipleBusinessExceptions(Exception):
 
 
 class MultipleExceptionBusinessListValidator(BusinessListValidator):
+    # When True, validation stops at the first validator raising an exception
+    fail_fast = False
+
     def validate(self):
-        _catch_exceptions_from_validators_and_raise_multiple_business_exceptions(self.validators)
+        _catch_exceptions_from_validators_and_raise_multiple_business_exceptions(
+            self.validators,
+            fail_fast=self.fail_fast
+        )
 
 
-def _catch_exceptions_from_validators_and_raise_multiple_business_exceptions(validators: List['BusinessValidator']):
+def _catch_exceptions_from_validators_and_raise_multiple_business_exceptions(
+        validators: List['BusinessValidator'],
+        fail_fast: bool = False
+):
     exceptions = set()
     for validator in validators:
         try:
@@ -140,6 +149,8 @@ def _catch_exceptions_from_validators_and_raise_multiple_business_exceptions(val
             exceptions |= e.exceptions
         except BusinessException as e:
             exceptions.add(e)
+        if exceptions and fail_fast:
+            break
 
     if exceptions:
         raise MultipleBusinessExceptions(exceptions=exceptions)
@@ -30,7 +30,7 @@ from django.utils.translation import gettext_lazy as _, pgettext_lazy
 from django_filters import OrderingFilter, filters, FilterSet
 
 from base.business.entity import get_entities_ids
-from base.forms.utils.filter_field import filter_field_by_regex
+from base.forms.utils.filter_field import filter_field_by_regex, filter_field_by_search_text
 from base.models import entity_version
 from base.models.academic_year import AcademicYear, starting_academic_year
 from base.models.education_group_type import EducationGroupType
@@ -81,7 +81,7 @@ class EducationGroupFilter(FilterSet):
     )
     title = filters.CharFilter(
         field_name="title",
-        method='filter_education_group_year_field',
+        method=filter_field_by_search_text,
         max_length=255,
         required=False,
         label=_('Title')
@@ -23,21 +23,107 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from collections import defaultdict
-from typing import Dict, List
-
 from django import forms
+from django.db.models.expressions import RawSQL
 from django.utils.translation import gettext_lazy as _
 from django_filters import filters
 
-from base.business.entity_version import load_main_entity_structure, MainEntityStructure
 from base.forms.learning_unit.search.simple import LearningUnitFilter
 from base.models.academic_year import AcademicYear
-from base.models.entity_version import EntityVersion
+from base.models.entity_version import EntityVersion, PEDAGOGICAL_ENTITY_ADDED_EXCEPTIONS
+from base.models.enums import entity_type
+from base.models.enums.organization_type import MAIN
 from base.models.learning_unit_year import LearningUnitYear, LearningUnitYearQuerySet
 from base.views.learning_units.search.common import SearchTypes
-from program_management.ddd.repositories.find_roots import find_roots_for_element_ids
-from program_management.models.element import Element
+from program_management.ddd.repositories.find_roots import DEFAULT_ROOT_CATEGORIES
+
+BORROWED_LEARNING_UNIT_YEARS_QUERY = """
+    WITH RECURSIVE
+        main_entity AS (
+            SELECT
+                ev.entity_id,
+                ev.parent_id,
+                COALESCE(ev.entity_type = %s OR ev.acronym IN %s, false) AS is_faculty
+            FROM base_entityversion ev
+            INNER JOIN base_entity e ON e.id = ev.entity_id
+            INNER JOIN base_organization o ON o.id = e.organization_id
+            WHERE o.type = %s AND ev.start_date <= %s AND (ev.end_date IS NULL OR ev.end_date >= %s)
+        ),
+        entity_ancestor AS (
+            SELECT entity_id, entity_id AS ancestor_id, parent_id, is_faculty, 0 AS depth
+            FROM main_entity
+
+            UNION ALL
+
+            SELECT child.entity_id, parent.entity_id, parent.parent_id, parent.is_faculty, child.depth + 1
+            FROM entity_ancestor child
+            INNER JOIN main_entity parent ON parent.entity_id = child.parent_id
+            WHERE NOT child.is_faculty
+        ),
+        containing_faculty AS (
+            SELECT
+                entity_id,
+                COALESCE(
+                    (ARRAY_AGG(ancestor_id ORDER BY depth) FILTER (WHERE is_faculty))[1],
+                    entity_id
+                ) AS faculty_id
+            FROM entity_ancestor
+            GROUP BY entity_id
+        ),
+        borrowing_entity AS (
+            SELECT entity_id
+            FROM main_entity
+            WHERE entity_id = %s
+
+            UNION ALL
+
+            SELECT child.entity_id
+            FROM main_entity child
+            INNER JOIN borrowing_entity parent ON child.parent_id = parent.entity_id
+        ),
+        learning_unit_root AS (
+            SELECT
+                gey.child_element_id AS learning_unit_element_id,
+                gey.parent_element_id,
+                gy.academic_year_id,
+                gy.management_entity_id,
+                egt.name IN %s AS is_root
+            FROM base_groupelementyear gey
+            INNER JOIN program_management_element child_element ON child_element.id = gey.child_element_id
+            INNER JOIN base_learningunityear luy ON luy.id = child_element.learning_unit_year_id
+            INNER JOIN program_management_element parent_element ON parent_element.id = gey.parent_element_id
+            INNER JOIN education_group_groupyear gy ON gy.id = parent_element.group_year_id
+            INNER JOIN base_educationgrouptype egt ON egt.id = gy.education_group_type_id
+            WHERE luy.academic_year_id = %s
+
+            UNION ALL
+
+            SELECT
+                child.learning_unit_element_id,
+                gey.parent_element_id,
+                gy.academic_year_id,
+                gy.management_entity_id,
+                egt.name IN %s
+            FROM base_groupelementyear gey
+            INNER JOIN learning_unit_root child ON gey.child_element_id = child.parent_element_id AND NOT child.is_root
+            INNER JOIN program_management_element parent_element ON parent_element.id = gey.parent_element_id
+            INNER JOIN education_group_groupyear gy ON gy.id = parent_element.group_year_id
+            INNER JOIN base_educationgrouptype egt ON egt.id = gy.education_group_type_id
+        )
+
+    SELECT DISTINCT element.learning_unit_year_id
+    FROM learning_unit_root root
+    INNER JOIN program_management_element element ON element.id = root.learning_unit_element_id
+    INNER JOIN base_learningunityear luy ON luy.id = element.learning_unit_year_id
+    INNER JOIN base_learningcontaineryear lcy ON lcy.id = luy.learning_container_year_id
+    LEFT JOIN containing_faculty requirement_faculty ON requirement_faculty.entity_id = lcy.requirement_entity_id
+    LEFT JOIN containing_faculty root_faculty ON root_faculty.entity_id = root.management_entity_id
+    WHERE root.is_root
+        AND root.academic_year_id = %s
+        AND root.management_entity_id IS NOT NULL
+        AND requirement_faculty.faculty_id IS DISTINCT FROM root_faculty.faculty_id
+        AND (%s IS NULL OR root.management_entity_id IN (SELECT entity_id FROM borrowing_entity))
+"""
 
 
 class BorrowedLearningUnitSearch(LearningUnitFilter):
@@ -65,7 +151,7 @@ class BorrowedLearningUnitSearch(LearningUnitFilter):
         self.form.fields["academic_year"].required = True
 
     def filter_queryset(self, queryset: 'LearningUnitYearQuerySet'):
-        qs = super().filter_queryset(queryset).select_related("element").exclude(element__isnull=True)
+        qs = super().filter_queryset(queryset)
 
         faculty_borrowing_id = None
         faculty_borrowing_acronym = self.form.cleaned_data.get('faculty_borrowing_acronym')
@@ -78,64 +164,34 @@ class BorrowedLearningUnitSearch(LearningUnitFilter):
             except EntityVersion.DoesNotExist:
                 return LearningUnitYear.objects.none()
 
-        ids = filter_borrowed_learning_units(
+        return filter_borrowed_learning_units(
             qs,
             academic_year,
             faculty_borrowing_id=faculty_borrowing_id
         )
-        return qs.filter(id__in=ids)
 
 
 def filter_borrowed_learning_units(
         learning_unit_year_qs: LearningUnitYearQuerySet,
         academic_year: AcademicYear,
         faculty_borrowing_id: int = None
-):
-    entity_structure = load_main_entity_structure(academic_year.start_date)
-    entities_borrowing_restriction = _get_faculty_entities(entity_structure, faculty_borrowing_id) \
-        if faculty_borrowing_id else []
-
-    map_element_entities = _get_management_entity_of_roots_by_elements(
-        [luy.element.id for luy in learning_unit_year_qs],
-        entities_borrowing_restriction,
-    )
-
-    return [luy.id for luy in learning_unit_year_qs
-            if _is_borrowed_course(luy, map_element_entities.get(luy.element.id, []), entity_structure)]
-
-
-def _get_faculty_entities(entity_structure: 'MainEntityStructure', faculty_borrowing_id: int) -> List[int]:
-    faculty_entities = entity_structure.get_node(faculty_borrowing_id).get_all_children()
-    faculty_entities += [entity_structure.get_node(faculty_borrowing_id)]
-    return [node.entity_version.entity.id for node in faculty_entities]
-
-
-def _get_management_entity_of_roots_by_elements(
-        element_ids: List[int],
-        entities_restricted: List[int]
-) -> Dict[int, List[int]]:
-    root_child_lists = find_roots_for_element_ids(element_ids)
-    root_element_ids = [list_element["root_id"] for list_element in root_child_lists]
-
-    root_element_qs = Element.objects.filter(id__in=root_element_ids)
-    if entities_restricted:
-        root_element_qs = root_element_qs.filter(group_year__management_entity_id__in=entities_restricted)
-    dict_entity_of_element_id = dict(root_element_qs.values_list("id", "group_year__management_entity"))
-
-    dict_group_year_entities_for_learning_unit_year = defaultdict(list)
-    for list_element in root_child_lists:
-        if dict_entity_of_element_id.get(list_element["root_id"]):
-            dict_group_year_entities_for_learning_unit_year[list_element["child_id"]].append(
-                dict_entity_of_element_id.get(list_element["root_id"])
-            )
-    return dict_group_year_entities_for_learning_unit_year
-
-
-def _is_borrowed_course(
-        luy: 'LearningUnitYearQuerySet',
-        entities_using_luy: List[int],
-        entity_structure: 'MainEntityStructure') -> bool:
-    for entity in entities_using_luy:
-        if not entity_structure.in_same_faculty(luy.learning_container_year.requirement_entity_id, entity):
-            return True
-    return False
+) -> LearningUnitYearQuerySet:
+    """
+    Keep the learning units used by a training managed outside of the faculty of their requirement entity.
+    When a borrowing faculty is given, only the trainings managed by this faculty (or its children) are considered.
+    """
+    root_categories_names = tuple(root_type.name for root_type in DEFAULT_ROOT_CATEGORIES)
+    params = [
+        entity_type.FACULTY,
+        tuple(PEDAGOGICAL_ENTITY_ADDED_EXCEPTIONS),
+        MAIN,
+        academic_year.start_date,
+        academic_year.start_date,
+        faculty_borrowing_id,
+        root_categories_names,
+        academic_year.id,
+        root_categories_names,
+        academic_year.id,
+        faculty_borrowing_id,
+    ]
+    return learning_unit_year_qs.filter(id__in=RawSQL(BORROWED_LEARNING_UNIT_YEARS_QUERY, params))
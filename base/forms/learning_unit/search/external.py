@@ -28,7 +28,7 @@ from django.db.models import BLANK_CHOICE_DASH, OuterRef, Exists
 from django.utils.translation import gettext_lazy as _, pgettext_lazy
 from django_filters import FilterSet, filters, OrderingFilter
 
-from base.forms.utils.filter_field import filter_field_by_regex
+from base.forms.utils.filter_field import filter_field_by_regex, filter_field_by_search_text
 from base.models.academic_year import AcademicYear, current_academic_year
 from base.models.campus import Campus
 from base.models.entity_version_address import EntityVersionAddress
@@ -56,7 +56,7 @@ class ExternalLearningUnitFilter(FilterSet):
     )
     title = filters.CharFilter(
         field_name="full_title",
-        method="filter_learning_unit_year_field",
+        method=filter_field_by_search_text,
         max_length=40,
         label=_('Title'),
     )
@@ -25,6 +25,7 @@ from django import forms
 from django.utils.translation import gettext_lazy as _, pgettext_lazy
 from django_filters import FilterSet, filters, OrderingFilter
 
+from base.forms.utils.filter_field import filter_field_by_search_text
 from base.models.academic_year import AcademicYear
 from base.models.learning_unit_year import LearningUnitYear, LearningUnitYearQuerySet
 
@@ -46,7 +47,7 @@ class QuickLearningUnitYearFilter(FilterSet):
     )
     title = filters.CharFilter(
         field_name="full_title",
-        lookup_expr="icontains",
+        method=filter_field_by_search_text,
         max_length=40,
         label=_('Title'),
     )
@@ -29,7 +29,8 @@ from django.utils.translation import gettext_lazy as _, pgettext_lazy
 from django_filters import FilterSet, filters, OrderingFilter
 
 from base.business.entity import get_entities_ids
-from base.forms.utils.filter_field import filter_field_by_regex, espace_special_characters
+from base.forms.utils.filter_field import filter_field_by_regex, espace_special_characters, \
+    filter_field_by_search_text
 from base.models.academic_year import AcademicYear, current_academic_year
 from base.models.enums import quadrimesters, learning_unit_year_subtypes, active_status, learning_container_year_types
 from base.models.enums.learning_container_year_types import LearningContainerYearType
@@ -116,7 +117,7 @@ class LearningUnitFilter(FilterSet):
     )
     title = filters.CharFilter(
         field_name="full_title",
-        method="filter_learning_unit_year_field",
+        method=filter_field_by_search_text,
         max_length=40,
         label=_('Title'),
     )
@@ -27,9 +27,9 @@ from ckeditor.widgets import CKEditorWidget
 from django import forms
 from django.conf import settings
 from django.db.models import OuterRef, Min, Subquery
+from django.utils.safestring import mark_safe
 
 from base.business.learning_unit import get_academic_year_postponement_range
-from base.forms.common import set_trans_txt
 from base.models.learning_unit_year import LearningUnitYear
 from base.models.proposal_learning_unit import ProposalLearningUnit
 from cms.enums import entity_name
@@ -48,12 +48,12 @@ class LearningUnitSpecificationsForm(forms.Form):
 
     def refresh_data(self):
         language_iso = self.language[0]
-        texts_list = translated_text.search(
-            entity=entity_name.LEARNING_UNIT_YEAR,
-            reference=self.learning_unit_year.id,
-            language=language_iso
-        ).exclude(text__isnull=True)
-        set_trans_txt(self, texts_list)
+        texts = translated_text.bulk_search([(entity_name.LEARNING_UNIT_YEAR, self.learning_unit_year.id)])
+        for text_label_name, text in texts.get_texts(
+                entity_name.LEARNING_UNIT_YEAR, self.learning_unit_year.id, language_iso
+        ).items():
+            if text is not None:
+                setattr(self, text_label_name, mark_safe(text))
 
 
 class LearningUnitSpecificationsEditForm(forms.Form):
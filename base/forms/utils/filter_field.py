@@ -23,6 +23,10 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models.functions import Greatest
+
+from base.utils import search_text
 
 CHARACTER_TO_ESCAPE = [
     '[',
@@ -44,3 +48,26 @@ def espace_special_characters(value):
     for character in CHARACTER_TO_ESCAPE:
         value = value.replace(character, "\\{}".format(character))
     return r"({})".format(value)
+
+
+def filter_field_by_search_text(queryset, name, value):
+    """
+    Filter on the normalized search column of the model: each word of the value must be contained in it.
+    Results are ranked by similarity, an explicit ordering of the search still prevails.
+    """
+    normalized_value = search_text.normalize(value)
+    if not normalized_value.strip():
+        return queryset
+    queryset = search_text.filter_queryset(queryset, normalized_value)
+    return order_by_similarity(queryset, normalized_value, search_text.SEARCH_TEXT_FIELD)
+
+
+def order_by_similarity(queryset, value, *field_names):
+    """
+    Rank the results by their best similarity with the value on the fields, the former ordering of the queryset
+    only separates the ties.
+    """
+    similarities = [TrigramSimilarity(field_name, value) for field_name in field_names]
+    return queryset.annotate(
+        search_rank=Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+    ).order_by('-search_rank', *queryset.query.order_by)
@@ -0,0 +1,73 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from base.forms.utils.filter_field import filter_field_by_search_text
+from base.models.academic_year import current_academic_year
+from base.models.learning_unit_year import LearningUnitYear
+from education_group.models.group_year import GroupYear
+
+
+class Command(BaseCommand):
+    help = "Compare the legacy 'iregex' title search with the trigram indexed search column."
+
+    def add_arguments(self, parser):
+        parser.add_argument('terms', nargs='+', help="Titles searched by the benchmark")
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        academic_year = current_academic_year()
+        for term in options['terms']:
+            self._compare(
+                "LearningUnitYear",
+                lambda: LearningUnitYear.objects.filter(academic_year=academic_year).annotate_full_title().filter(
+                    full_title__iregex=term
+                ),
+                lambda: filter_field_by_search_text(
+                    LearningUnitYear.objects.filter(academic_year=academic_year), 'title', term
+                ),
+                options['repeat'],
+            )
+            self._compare(
+                "GroupYear",
+                lambda: GroupYear.objects.filter(academic_year=academic_year).filter(
+                    Q(title_fr__iregex=term) | Q(educationgroupversion__offer__title__iregex=term)
+                ),
+                lambda: filter_field_by_search_text(
+                    GroupYear.objects.filter(academic_year=academic_year), 'title', term
+                ),
+                options['repeat'],
+            )
+
+    def _compare(self, label, legacy_queryset, search_text_queryset, repeat):
+        for name, get_queryset in (("iregex", legacy_queryset), ("search_title", search_text_queryset)):
+            duration = timeit.timeit(lambda: list(get_queryset()[:100]), number=repeat) / repeat
+            self.stdout.write("{} [{}]: {} results, {:.1f} ms".format(
+                label, name, get_queryset().count(), duration * 1000
+            ))
@@ -0,0 +1,57 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.core.management.base import BaseCommand
+
+from base.benchmarks.dataset import BenchmarkDatasetGenerator
+
+
+class Command(BaseCommand):
+    help = "Generate a deterministic production-scale dataset in the local database (used by run_benchmarks)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--past-years', type=int, default=3)
+        parser.add_argument('--future-years', type=int, default=3)
+        parser.add_argument('--learning-units', type=int, default=5800)
+        parser.add_argument('--trainings', type=int, default=20)
+        parser.add_argument('--groups-per-training', type=int, default=30)
+        parser.add_argument('--links-per-training', type=int, default=1500)
+        parser.add_argument('--students-per-training', type=int, default=100)
+        parser.add_argument('--exam-enrollments-per-student', type=int, default=25)
+
+    def handle(self, *args, **options):
+        BenchmarkDatasetGenerator(
+            seed=options['seed'],
+            number_past_years=options['past_years'],
+            number_future_years=options['future_years'],
+            learning_units=options['learning_units'],
+            trainings=options['trainings'],
+            groups_per_training=options['groups_per_training'],
+            links_per_training=options['links_per_training'],
+            students_per_training=options['students_per_training'],
+            exam_enrollments_per_student=options['exam_enrollments_per_student'],
+        ).generate()
+        self.stdout.write(self.style.SUCCESS("Benchmark dataset generated"))
@@ -0,0 +1,79 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import collections
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from base.utils import query_profiling
+
+SORT_KEYS = ('query_count', 'duplicate_count', 'db_time', 'python_time')
+
+
+class Command(BaseCommand):
+    help = "Print the views executing the most SQL queries, recorded by the QueryProfilingMiddleware."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--file', default=getattr(settings, 'QUERY_PROFILING_REPORT_FILE', None))
+        parser.add_argument('--sort', choices=SORT_KEYS, default='query_count')
+        parser.add_argument('--top', type=int, default=20)
+
+    def handle(self, *args, **options):
+        if not options['file']:
+            raise CommandError("No report file: set QUERY_PROFILING_REPORT_FILE or use --file")
+        try:
+            reports = query_profiling.read_reports(options['file'])
+        except FileNotFoundError:
+            raise CommandError("Report file {} does not exist".format(options['file']))
+
+        reports_by_view = collections.defaultdict(list)
+        for report in reports:
+            reports_by_view[report['view']].append(report)
+
+        rows = [self._aggregate(view, view_reports) for view, view_reports in reports_by_view.items()]
+        rows.sort(key=lambda row: row[options['sort']], reverse=True)
+
+        self.stdout.write("{:<60} {:>6} {:>8} {:>10} {:>10} {:>10}".format(
+            "view", "calls", "queries", "duplicates", "db (ms)", "py (ms)"
+        ))
+        for row in rows[:options['top']]:
+            self.stdout.write("{view:<60} {calls:>6} {query_count:>8} {duplicate_count:>10} "
+                              "{db_time:>10.1f} {python_time:>10.1f}".format(**row))
+            for sql, count in row['duplicates'][:3]:
+                self.stdout.write("    {} x {}".format(count, sql[:150]))
+
+    @staticmethod
+    def _aggregate(view: str, reports: list) -> dict:
+        worst = max(reports, key=lambda report: report['query_count'])
+        return {
+            'view': view,
+            'calls': len(reports),
+            'query_count': worst['query_count'],
+            'duplicate_count': max(report['duplicate_count'] for report in reports),
+            'db_time': sum(report['db_time'] for report in reports) / len(reports),
+            'python_time': sum(report['python_time'] for report in reports) / len(reports),
+            'duplicates': worst['duplicates'],
+        }
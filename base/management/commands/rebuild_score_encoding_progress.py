@@ -0,0 +1,49 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.core.management.base import BaseCommand
+
+from assessments.models import score_encoding_progress_summary
+from base.models.academic_year import AcademicYear
+from base.models.enums.number_session import NUMBERS_SESSION
+
+
+class Command(BaseCommand):
+    help = "Rebuild the score encoding progress counters from the exam enrollments."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--academic-year', type=int, help="Year of the academic year to rebuild (all by default)")
+        parser.add_argument('--session', type=int, choices=[number for number, _ in NUMBERS_SESSION],
+                            help="Number of the session to rebuild (all by default)")
+
+    def handle(self, *args, **options):
+        academic_year = None
+        if options['academic_year']:
+            academic_year = AcademicYear.objects.get(year=options['academic_year'])
+        created = score_encoding_progress_summary.rebuild(
+            academic_year=academic_year,
+            number_session=options['session']
+        )
+        self.stdout.write(self.style.SUCCESS("{} score encoding progress counters rebuilt".format(created)))
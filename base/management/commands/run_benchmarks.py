@@ -0,0 +1,79 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from base.benchmarks import scenarios
+
+
+class Command(BaseCommand):
+    help = "Run the timed benchmark scenarios on the dataset generated by generate_benchmark_dataset " \
+           "and output the results as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('scenarios', nargs='*', help="Among: {}".format(", ".join(scenarios.SCENARIOS)))
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--output', help="Write the JSON results in this file")
+        parser.add_argument('--compare', help="JSON results of a previous run to compare with")
+
+    def handle(self, *args, **options):
+        names = options['scenarios'] or list(scenarios.SCENARIOS)
+        unknown_names = set(names) - set(scenarios.SCENARIOS)
+        if unknown_names:
+            raise CommandError("Unknown scenarios: {}".format(", ".join(sorted(unknown_names))))
+        results = {
+            'date': datetime.datetime.now().isoformat(),
+            'repeat': options['repeat'],
+            'scenarios': scenarios.run_scenarios(names, options['repeat']),
+        }
+        output = json.dumps(results, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                file.write(output)
+        self.stdout.write(output)
+
+        if options['compare']:
+            self._compare(results['scenarios'], options['compare'])
+
+    def _compare(self, results, baseline_file):
+        try:
+            with open(baseline_file) as file:
+                baseline = json.load(file)['scenarios']
+        except FileNotFoundError:
+            raise CommandError("Baseline file {} does not exist".format(baseline_file))
+        for name, result in results.items():
+            if name not in baseline:
+                continue
+            previous = baseline[name]
+            self.stdout.write("{:<25} median {:>10.1f} ms ({:+.1f}%)  queries {:>6} ({:+d})".format(
+                name,
+                result['median_ms'],
+                (result['median_ms'] - previous['median_ms']) * 100 / (previous['median_ms'] or 1),
+                result['query_count'],
+                result['query_count'] - previous['query_count'],
+            ))
@@ -0,0 +1,67 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import logging
+
+from django.conf import settings
+from django.urls import resolve, Resolver404
+
+from base.utils import query_profiling
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+
+class QueryProfilingMiddleware:
+    """
+    Record the SQL queries, the duplicated queries, the DB time and the Python time of each view.
+    Budgets declared with @query_budget raise QueryBudgetExceeded when QUERY_PROFILING_STRICT is set (tests),
+    and are logged otherwise.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with query_profiling.profile() as report:
+            response = self.get_response(request)
+        view_name, budget = self._get_view_info(request)
+        query_profiling.write_report(view_name, report)
+        response['X-Query-Count'] = report.query_count
+        response['X-DB-Time'] = round(report.db_time * 1000, 1)
+        if budget:
+            try:
+                budget.check(report, view_name)
+            except query_profiling.QueryBudgetExceeded as e:
+                if getattr(settings, 'QUERY_PROFILING_STRICT', False):
+                    raise
+                logger.warning(str(e))
+        return response
+
+    @staticmethod
+    def _get_view_info(request):
+        try:
+            resolver_match = getattr(request, 'resolver_match', None) or resolve(request.path_info)
+        except Resolver404:
+            return request.path_info, None
+        return resolver_match.view_name, query_profiling.get_view_query_budget(resolver_match.func)
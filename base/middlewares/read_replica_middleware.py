@@ -0,0 +1,64 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from rest_framework.permissions import SAFE_METHODS
+
+from base.utils import read_replica
+
+
+class ReadReplicaMiddleware:
+    """
+    Send the queries of the views marked with @read_only_view to the replica database, template rendering included.
+    After a successful write request of an authenticated user, pin the session to the primary database
+    during REPLICA_READ_YOUR_WRITES_DELAY seconds so that users always read their own writes.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.reads_from_replica = False
+        try:
+            response = self.get_response(request)
+        finally:
+            if request.reads_from_replica:
+                read_replica.leave_replica_scope()
+        if self._is_successful_write(request, response):
+            read_replica.pin_to_primary(request)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if read_replica.is_read_only_view(view_func) and not read_replica.is_pinned_to_primary(request):
+            read_replica.enter_replica_scope()
+            request.reads_from_replica = True
+
+    @staticmethod
+    def _is_successful_write(request, response) -> bool:
+        user = getattr(request, 'user', None)
+        session = getattr(request, 'session', None)
+        # Token authenticated API clients have no session: do not create one for each write
+        return request.method not in SAFE_METHODS and \
+            response.status_code < 400 and \
+            user is not None and user.is_authenticated and \
+            session is not None and not session.is_empty()
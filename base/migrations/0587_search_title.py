@@ -0,0 +1,82 @@
+# Generated by Django 2.2.13 on 2021-04-23 10:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+from base.utils import search_text
+
+BATCH_SIZE = 1000
+
+
+def fill_search_titles(apps, schema_editor):
+    LearningUnitYear = apps.get_model('base', 'LearningUnitYear')
+    EducationGroupYear = apps.get_model('base', 'EducationGroupYear')
+
+    learning_unit_years = []
+    qs = LearningUnitYear.objects.select_related('learning_container_year').only(
+        'specific_title', 'learning_container_year__common_title'
+    )
+    for luy in qs.iterator(chunk_size=BATCH_SIZE):
+        common_title = luy.learning_container_year.common_title if luy.learning_container_year else None
+        luy.search_title = search_text.normalize(" - ".join(filter(None, [common_title, luy.specific_title])))
+        learning_unit_years.append(luy)
+    LearningUnitYear.objects.bulk_update(learning_unit_years, ['search_title'], batch_size=BATCH_SIZE)
+
+    education_group_years = []
+    for egy in EducationGroupYear.objects.only('title').iterator(chunk_size=BATCH_SIZE):
+        egy.search_title = search_text.normalize(egy.title)
+        education_group_years.append(egy)
+    EducationGroupYear.objects.bulk_update(education_group_years, ['search_title'], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0586_outboxmessage'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='learningunityear',
+            name='search_title',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='educationgroupyear',
+            name='search_title',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(fill_search_titles, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='learningunityear',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['acronym'], name='learningunityear_acronym_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='learningunityear',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['search_title'], name='learningunityear_search_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='educationgroupyear',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['acronym'], name='educationgroupyear_acronym_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='educationgroupyear',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['partial_acronym'], name='educationgroupyear_code_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='educationgroupyear',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['search_title'], name='educationgroupyear_search_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+    ]
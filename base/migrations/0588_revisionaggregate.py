@@ -0,0 +1,32 @@
+# Generated by Django 2.2.13 on 2021-04-26 09:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reversion', '0001_squashed_0004_auto_20160611_1202'),
+        ('base', '0587_search_title'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevisionAggregate',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('aggregate_type', models.CharField(choices=[('LEARNING_UNIT_YEAR', 'Learning unit year'), ('EDUCATION_GROUP_YEAR', 'Education group year'), ('GROUP_YEAR', 'Group')], max_length=30)),
+                ('aggregate_id', models.PositiveIntegerField()),
+                ('date_created', models.DateTimeField()),
+                ('revision', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='reversion.Revision')),
+            ],
+            options={
+                'unique_together': {('revision', 'aggregate_type', 'aggregate_id')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='revisionaggregate',
+            index=models.Index(fields=['aggregate_type', 'aggregate_id', '-date_created'], name='revision_aggregate_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 2.2.13 on 2021-04-28 10:03
+
+import django.contrib.postgres.fields.jsonb
+import django.core.serializers.json
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0588_revisionaggregate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogEntry',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('object_type', models.CharField(choices=[('LEARNING_UNIT_YEAR', 'Learning unit year'), ('GROUP_YEAR', 'Group'), ('LINK', 'Link'), ('PREREQUISITE', 'Prerequisite'), ('ATTRIBUTION', 'Attribution'), ('TRANSLATED_TEXT', 'Text')], max_length=30)),
+                ('object_id', models.PositiveIntegerField()),
+                ('action', models.CharField(choices=[('CREATE', 'Creation'), ('UPDATE', 'Update'), ('DELETE', 'Suppression')], max_length=10)),
+                ('data', django.contrib.postgres.fields.jsonb.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('published_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ('id',),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='changelogentry',
+            index=models.Index(fields=['object_type', 'id'], name='change_log_object_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='changelogentry',
+            index=models.Index(fields=['published_at', 'id'], name='change_log_published_idx'),
+        ),
+    ]
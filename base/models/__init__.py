@@ -3,6 +3,7 @@ from base.models import academic_year
 from base.models import admission_condition
 from base.models import authorized_relationship
 from base.models import campus
+from base.models import change_log_entry
 from base.models import certificate_aim
 from base.models import education_group
 from base.models import education_group_certificate_aim
@@ -33,11 +34,13 @@ from base.models import mandate
 from base.models import offer_enrollment
 from base.models import offer_year_calendar
 from base.models import organization
+from base.models import outbox_message
 from base.models import person
 from base.models import person_address
 from base.models import prerequisite
 from base.models import prerequisite_item
 from base.models import proposal_learning_unit
+from base.models import revision_aggregate
 from base.models import session_exam
 from base.models import session_exam_calendar
 from base.models import session_exam_deadline
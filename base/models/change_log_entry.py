@@ -0,0 +1,72 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib.postgres.fields import JSONField
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+from base.models.enums.change_log_types import ChangeLogObjectTypes, ChangeLogActions
+from osis_common.models.osis_model_admin import OsisModelAdmin
+
+
+class ChangeLogEntryAdmin(OsisModelAdmin):
+    list_display = ('id', 'sequence', 'object_type', 'object_id', 'action', 'created_at', 'published_at')
+    list_filter = ('object_type', 'action')
+    search_fields = ['object_id']
+    readonly_fields = ('sequence', 'created_at', 'published_at')
+
+
+class ChangeLogEntry(models.Model):
+    """
+    Append-only log of the changes of the catalogue objects, written in the transaction of the change.
+    The sequence is the cursor of the downstream systems : entries are never updated (except their sequence and
+    publication date) nor deleted, so that a consumer can sync incrementally from the last sequence it has read.
+
+    The id is given at insert time, so an entry can commit after an entry with a greater id. The sequence is only
+    given after the commit, in increasing order, by change_log.sequence_committed_entries() : an entry is exposed
+    once it has a sequence (at most one run of the publish_change_log task after its commit) and a consumer following
+    the sequence never misses an entry.
+    """
+    id = models.BigAutoField(primary_key=True)
+    sequence = models.BigIntegerField(null=True, blank=True, unique=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    object_type = models.CharField(max_length=30, choices=ChangeLogObjectTypes.choices())
+    object_id = models.PositiveIntegerField()
+    action = models.CharField(max_length=10, choices=ChangeLogActions.choices())
+    # Natural identifiers of the object (e.g. acronym and year), still available after its deletion
+    data = JSONField(default=dict, encoder=DjangoJSONEncoder)
+    # Date of the publication of the entry on the queue
+    published_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ('id',)
+        indexes = [
+            models.Index(fields=['object_type', 'id'], name='change_log_object_type_idx'),
+            models.Index(fields=['published_at', 'id'], name='change_log_published_idx'),
+        ]
+
+    def __str__(self):
+        return "{} {} {} ({})".format(self.action, self.object_type, self.object_id, self.id)
@@ -49,6 +49,7 @@ from base.models.enums.funding_codes import FundingCodes
 from base.models.enums.offer_enrollment_state import SUBSCRIBED, PROVISORY
 from base.models.exceptions import ValidationWarning
 from base.models.validation_rule import ValidationRule
+from base.utils import search_text
 from osis_common.models.serializable_model import SerializableModel, SerializableModelManager, SerializableModelAdmin, \
     SerializableQuerySet
 
@@ -494,6 +495,8 @@ class EducationGroupYear(SerializableModel):
         verbose_name=_('Linked with EPC')
     )
 
+    search_title = models.TextField(blank=True, default='', editable=False)
+
     class Meta:
         ordering = ("academic_year",)
         verbose_name = _("Education group year")
@@ -506,6 +509,17 @@ class EducationGroupYear(SerializableModel):
             ("acronym", "academic_year"),
             ('partial_acronym', 'academic_year'),
         ]
+        indexes = [
+            search_text.trigram_index('acronym', name='educationgroupyear_acronym_trgm'),
+            search_text.trigram_index('partial_acronym', name='educationgroupyear_code_trgm'),
+            search_text.trigram_index('search_title', name='educationgroupyear_search_trgm'),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.search_title = search_text.normalize(self.title)
+        super().save(*args, **kwargs)
+        from education_group.models.group_year import GroupYear
+        GroupYear.update_search_titles(GroupYear.objects.filter(educationgroupversion__offer=self))
 
     def __str__(self):
         return "{} - {} - {}".format(
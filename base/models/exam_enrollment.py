@@ -27,20 +27,17 @@ from decimal import *
 
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.db.models import When, Case, Q, Sum, Count, IntegerField, F, OuterRef, Subquery, Exists
 from django.utils.translation import gettext as _
 
 from attribution.models import attribution
 from base.models import person, session_exam_deadline, \
-    academic_year as academic_yr, education_group_year
-from base.auth.roles import program_manager, tutor
+    academic_year as academic_yr
 from base.models.enums import exam_enrollment_justification_type as justification_types
 from base.models.enums import exam_enrollment_state as enrollment_states
 from base.models.enums.exam_enrollment_justification_type import JustificationTypes
 from base.models.exceptions import JustificationValueException
 from base.models.utils.admin_extentions import remove_delete_action
 from osis_common.models.osis_model_admin import OsisModelAdmin
-from base.models.student_specific_profile import StudentSpecificProfile
 
 JUSTIFICATION_ABSENT_FOR_TUTOR = _('Absent')
 SCORE_BETWEEN_0_AND_20 = _("Scores must be between 0 and 20")
@@ -249,99 +246,6 @@ def create_exam_enrollment_historic(user, enrollment):
     exam_enrollment_history.save()
 
 
-def get_progress_by_learning_unit_years_and_offer_years(user,
-                                                        session_exam_number,
-                                                        learning_unit_year_id=None,
-                                                        learning_unit_year_ids=None,
-                                                        education_group_year_id=None,
-                                                        academic_year=None,
-                                                        only_enrolled=False):
-    if education_group_year_id:
-        education_group_year_ids = [education_group_year_id]
-    else:
-        education_group_year_ids = education_group_year.find_by_user(user).values_list('id', flat=True)
-
-    tutor_user = None
-    if not program_manager.is_program_manager(user):
-        tutor_user = tutor.find_by_user(user)
-
-    queryset = find_for_score_encodings(session_exam_number=session_exam_number,
-                                        learning_unit_year_id=learning_unit_year_id,
-                                        learning_unit_year_ids=learning_unit_year_ids,
-                                        education_group_years=education_group_year_ids,
-                                        tutor=tutor_user,
-                                        academic_year=academic_year,
-                                        with_session_exam_deadline=False,
-                                        only_enrolled=only_enrolled)
-
-    queryset = queryset.annotate(
-        total_exam_enrollments=Count('id'),
-        learning_unit_year_id=F('learning_unit_enrollment__learning_unit_year_id'),
-        education_group_year_id=F('learning_unit_enrollment__offer_enrollment__education_group_year_id'),
-        learning_unit_year_acronym=F('learning_unit_enrollment__learning_unit_year__acronym'),
-        learning_unit_year_specific_title=F('learning_unit_enrollment__learning_unit_year__specific_title'),
-        learning_container_year_common_title=F(
-            'learning_unit_enrollment__learning_unit_year__learning_container_year__common_title'
-        ),
-        exam_enrollments_encoded=Sum(
-            Case(
-                When(
-                    Q(score_final__isnull=False) | Q(justification_final__isnull=False),
-                    then=1
-                ),
-                default=0,
-                output_field=IntegerField()
-            )
-        ),
-        draft_scores=Sum(
-            Case(
-                When(
-                    (
-                        Q(score_draft__isnull=False)
-                        & Q(score_final__isnull=True)
-                        & Q(justification_final__isnull=True)
-                    ) | (
-                        Q(justification_draft__isnull=False)
-                        & Q(score_final__isnull=True)
-                        & Q(justification_final__isnull=True)
-                    ),
-                    then=1
-                ),
-                default=0,
-                output_field=IntegerField())
-        ),
-        scores_not_yet_submitted=Sum(
-            Case(
-                When(
-                    Q(score_final__isnull=True) & Q(justification_final__isnull=True),
-                    then=1
-                ),
-                default=0,
-                output_field=IntegerField()
-            )
-        ),
-        deadline=Subquery(
-            session_exam_deadline.SessionExamDeadline.objects.filter(
-                offer_enrollment_id=OuterRef('learning_unit_enrollment__offer_enrollment_id'),
-                number_session=session_exam_number,
-            ).distinct().values('deadline')[:1]
-        ),
-        deadline_tutor=Subquery(
-            session_exam_deadline.SessionExamDeadline.objects.filter(
-                offer_enrollment_id=OuterRef('learning_unit_enrollment__offer_enrollment_id'),
-                number_session=session_exam_number,
-            ).distinct().values('deadline_tutor')[:1]
-        ),
-        has_student_specific_profile=Exists(
-            StudentSpecificProfile.objects.filter(
-                student_id=OuterRef('learning_unit_enrollment__offer_enrollment__student_id')
-            )
-        ),
-    )
-
-    return queryset
-
-
 def find_for_score_encodings(session_exam_number,
                              learning_unit_year_id=None,
                              learning_unit_year_ids=None,
@@ -112,6 +112,28 @@ class LearningContainerYear(SerializableModel):
             ("can_access_learningcontaineryear", "Can access learning container year"),
         )
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._update_learning_unit_years_search_title()
+
+    def _update_learning_unit_years_search_title(self):
+        from base.business import change_log
+        from base.models.enums.change_log_types import ChangeLogActions
+        learning_unit_years = list(
+            learning_unit_year.LearningUnitYear.objects.filter(learning_container_year=self).select_related(
+                'academic_year'
+            ).only('specific_title', 'search_title', 'acronym', 'academic_year__year')
+        )
+        updated_learning_unit_years = []
+        for luy in learning_unit_years:
+            luy.learning_container_year = self
+            search_title = luy.get_search_title()
+            if luy.search_title != search_title:
+                luy.search_title = search_title
+                updated_learning_unit_years.append(luy)
+        learning_unit_year.LearningUnitYear.objects.bulk_update(updated_learning_unit_years, ['search_title'])
+        change_log.record_many(updated_learning_unit_years, ChangeLogActions.UPDATE)
+
     @property
     def warnings(self):
         if self._warnings is None:
@@ -50,6 +50,7 @@ from base.models.enums.learning_unit_year_periodicity import PERIODICITY_TYPES,
 from base.models.learning_component_year import LearningComponentYear
 from base.models.learning_unit import LEARNING_UNIT_ACRONYM_REGEX_MODEL
 from base.models.prerequisite_item import PrerequisiteItem
+from base.utils import search_text
 from cms.enums.entity_name import LEARNING_UNIT_YEAR
 from cms.models.translated_text import TranslatedText
 from education_group import publisher
@@ -272,6 +273,7 @@ class LearningUnitYear(SerializableModel):
         verbose_name=_('Other remark in english (intended for publication)')
     )
     faculty_remark = models.TextField(blank=True, null=True, verbose_name=_('Faculty remark (unpublished)'))
+    search_title = models.TextField(blank=True, default='', editable=False)
 
     objects = BaseLearningUnitYearManager()
     objects_with_container = LearningUnitYearWithContainerManager()
@@ -282,6 +284,10 @@ class LearningUnitYear(SerializableModel):
         unique_together = (('learning_unit', 'academic_year'), ('acronym', 'academic_year'))
         ordering = ('academic_year', 'acronym')
         verbose_name = _("Learning unit year")
+        indexes = [
+            search_text.trigram_index('acronym', name='learningunityear_acronym_trgm'),
+            search_text.trigram_index('search_title', name='learningunityear_search_trgm'),
+        ]
         permissions = (
             ("can_receive_emails_about_automatic_postponement", "Can receive emails about automatic postponement"),
         )
@@ -290,6 +296,7 @@ class LearningUnitYear(SerializableModel):
         return u"%s - %s" % (self.academic_year, self.acronym)
 
     def save(self, *args, **kwargs):
+        self.search_title = self.get_search_title()
         super().save(*args, **kwargs)
         publisher.learning_unit_year_created.send(
             None,
@@ -357,6 +364,9 @@ class LearningUnitYear(SerializableModel):
             ]))
         return complete_title_english
 
+    def get_search_title(self) -> str:
+        return search_text.normalize(self.complete_title)
+
     @property
     def complete_title_i18n(self):
         complete_title = self.complete_title
@@ -609,8 +619,7 @@ def search(academic_year_id=None, acronym=None, learning_container_year_id=None,
         queryset = queryset.filter(learning_unit=learning_unit)
 
     if title:
-        queryset = queryset. \
-            filter(Q(specific_title__iregex=title) | Q(learning_container_year__common_title__iregex=title))
+        queryset = search_text.filter_queryset(queryset, title)
 
     if subtype:
         queryset = queryset.filter(subtype=subtype)
@@ -0,0 +1,72 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib.postgres.fields import JSONField
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+from base.models.enums.outbox_message_status import OutboxMessageStatus
+from osis_common.models.osis_model_admin import OsisModelAdmin
+
+
+class OutboxMessageAdmin(OsisModelAdmin):
+    list_display = ('sender', 'status', 'attempts', 'created_at', 'next_attempt_at', 'sent_at')
+    list_filter = ('status', 'sender')
+    readonly_fields = ('created_at', 'sent_at', 'last_error')
+    actions = ['retry']
+
+    def retry(self, request, queryset):
+        queryset.update(status=OutboxMessageStatus.PENDING.name, attempts=0, next_attempt_at=timezone.now())
+
+
+class OutboxMessage(models.Model):
+    """
+    Message written in the transaction of the request and delivered by a worker.
+    The sender is the dotted path of the function which builds and sends the message: it is called by the worker
+    with 'sender_kwargs', so that templates and attachments are generated out of the request.
+    """
+    created_at = models.DateTimeField(auto_now_add=True)
+    sender = models.CharField(max_length=255)
+    sender_kwargs = JSONField(default=dict, encoder=DjangoJSONEncoder)
+    status = models.CharField(
+        max_length=20,
+        choices=OutboxMessageStatus.choices(),
+        default=OutboxMessageStatus.PENDING.name,
+        db_index=True,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ('created_at',)
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return "{} ({})".format(self.sender, self.status)
@@ -0,0 +1,57 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.db import models
+
+from base.models.enums.revision_aggregate_types import RevisionAggregateTypes
+from osis_common.models.osis_model_admin import OsisModelAdmin
+
+
+class RevisionAggregateAdmin(OsisModelAdmin):
+    list_display = ('revision', 'aggregate_type', 'aggregate_id', 'date_created')
+    list_filter = ('aggregate_type',)
+    raw_id_fields = ('revision',)
+    search_fields = ['aggregate_id']
+
+
+class RevisionAggregate(models.Model):
+    """
+    Tag a revision with the aggregate root (learning unit year, education group year, group year) of the objects
+    it contains, so that the history of an aggregate is read with one indexed query.
+    """
+    revision = models.ForeignKey('reversion.Revision', on_delete=models.CASCADE)
+    aggregate_type = models.CharField(max_length=30, choices=RevisionAggregateTypes.choices())
+    aggregate_id = models.PositiveIntegerField()
+    # Copy of revision.date_created : the history is read in that order from the index
+    date_created = models.DateTimeField()
+
+    class Meta:
+        unique_together = ('revision', 'aggregate_type', 'aggregate_id')
+        indexes = [
+            models.Index(fields=['aggregate_type', 'aggregate_id', '-date_created'], name='revision_aggregate_idx'),
+        ]
+
+    def __str__(self):
+        return "{} {} - {}".format(self.aggregate_type, self.aggregate_id, self.revision_id)
@@ -1,8 +1,12 @@
 # Import .py file which contains tasks to be executed
+from . import apply_action_on_proposals
 from . import check_academic_calendar
 from . import extend_learning_units
 from . import synchronize_entities
 from . import calendar_reminder_notice
+from . import deliver_outbox_messages
+from . import invoke_commands
+from . import publish_change_log
 
 
 from celery.schedules import crontab
@@ -20,6 +24,14 @@ celery_app.conf.beat_schedule.update({
         'task': 'base.tasks.calendar_reminder_notice.run',
         'schedule': crontab(minute=0, hour=8)
     },
+    'Deliver outbox messages': {
+        'task': 'base.tasks.deliver_outbox_messages.run',
+        'schedule': crontab(minute='*')
+    },
+    'Publish change log': {
+        'task': 'base.tasks.publish_change_log.run',
+        'schedule': crontab(minute='*')
+    },
     'Synchronize entities': {
         'task': 'base.tasks.synchronize_entities.run',
         'schedule': crontab(minute=1)
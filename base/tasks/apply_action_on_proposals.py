@@ -0,0 +1,53 @@
+from celery import chord
+
+from backoffice.celery import app as celery_app
+from base.business import learning_unit_proposal as proposal_business
+from base.models.person import Person
+from base.models.proposal_learning_unit import ProposalLearningUnit
+from base.utils import send_mail as send_mail_util
+
+CHUNK_SIZE = 25
+
+
+@celery_app.task
+def run(proposal_ids: list, author_id: int, operation: str, research_criteria: list) -> dict:
+    chunks = [proposal_ids[index:index + CHUNK_SIZE] for index in range(0, len(proposal_ids), CHUNK_SIZE)]
+    # Chunks are processed in parallel by the workers, the report is sent once all of them are done
+    chord(apply_action_on_chunk.s(chunk, author_id, operation) for chunk in chunks)(
+        send_report.s(author_id=author_id, operation=operation, research_criteria=research_criteria)
+    )
+    return {"chunks": len(chunks)}
+
+
+@celery_app.task(bind=True)
+def apply_action_on_chunk(self, proposal_ids: list, author_id: int, operation: str) -> list:
+    action_method, permission_check = proposal_business.get_action_on_proposals(operation)
+    proposals = ProposalLearningUnit.objects.filter(pk__in=proposal_ids)
+
+    def update_progress(done: int, total: int):
+        self.update_state(state='PROGRESS', meta={'done': done, 'total': total})
+
+    proposals_with_results = proposal_business._apply_action_on_proposals(
+        proposals,
+        action_method,
+        Person.objects.select_related('user').get(pk=author_id),
+        permission_check,
+        on_progress=update_progress
+    )
+    # Rows are computed here as the proposals may have been deleted by the action
+    return [
+        [str(value) for value in row]
+        for row in send_mail_util._build_table_proposal_data(proposals_with_results)
+    ]
+
+
+@celery_app.task
+def send_report(rows_by_chunk: list, author_id: int, operation: str, research_criteria: list) -> dict:
+    report_rows = [row for rows in rows_by_chunk for row in rows]
+    send_mail_util.send_mail_proposals_report(
+        Person.objects.get(pk=author_id),
+        report_rows,
+        operation,
+        research_criteria
+    )
+    return {"proposals": len(report_rows)}
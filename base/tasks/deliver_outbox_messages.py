@@ -0,0 +1,7 @@
+from backoffice.celery import app as celery_app
+from base.utils import outbox
+
+
+@celery_app.task
+def run() -> dict:
+    return outbox.deliver_pending_messages()
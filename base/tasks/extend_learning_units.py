@@ -1,9 +1,38 @@
+from celery import chord
+
 from backoffice.celery import app as celery_app
 from base.business.learning_units.automatic_postponement import LearningUnitAutomaticPostponementToN6
+from base.models.learning_unit import LearningUnit
 
 
 @celery_app.task
 def run():
     process = LearningUnitAutomaticPostponementToN6()
-    process.postpone()
-    return process.serialize_postponement_results()
+    statistics_context = process.get_statistics_context()
+    process.send_before.__func__(statistics_context)
+
+    serialized_statistics_context = process.serialize_statistics_context(statistics_context)
+    chunks = [[learning_unit.pk for learning_unit in chunk] for chunk in process.get_chunks()]
+    if not chunks:
+        return send_statistics(chunk_results=[], serialized_statistics_context=serialized_statistics_context)
+
+    # Chunks are postponed in parallel by the workers, statistics are sent once all of them are done
+    chord(extend_chunk.s(learning_unit_ids) for learning_unit_ids in chunks)(
+        send_statistics.s(serialized_statistics_context=serialized_statistics_context)
+    )
+    return {"chunks": len(chunks)}
+
+
+@celery_app.task
+def extend_chunk(learning_unit_ids: list) -> dict:
+    process = LearningUnitAutomaticPostponementToN6(LearningUnit.objects.filter(pk__in=learning_unit_ids))
+    process.extend_chunk(list(process.to_duplicate))
+    return process.serialize_chunk_results()
+
+
+@celery_app.task
+def send_statistics(chunk_results: list, serialized_statistics_context: dict) -> dict:
+    return LearningUnitAutomaticPostponementToN6.send_statistics_from_chunk_results(
+        serialized_statistics_context,
+        chunk_results
+    )
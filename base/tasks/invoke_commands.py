@@ -0,0 +1,15 @@
+from typing import List
+
+from django.utils.module_loading import import_string
+
+from backoffice.celery import app as celery_app
+
+
+@celery_app.task
+def run(commands_data: List[dict]) -> int:
+    from infrastructure.messages_bus import message_bus_instance
+    commands = [
+        import_string(command_data['command'])(**command_data['attributes'])
+        for command_data in commands_data
+    ]
+    return len(message_bus_instance.invoke_batch(commands))
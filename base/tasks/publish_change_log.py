@@ -0,0 +1,8 @@
+from backoffice.celery import app as celery_app
+from base.business import change_log
+
+
+@celery_app.task
+def run() -> int:
+    change_log.sequence_committed_entries()
+    return change_log.publish_pending_entries()
@@ -37,7 +37,7 @@ from base.forms.learning_unit.search.service_course import ServiceCourseFilter
 from base.forms.learning_unit.search.simple import LearningUnitFilter
 from base.forms.proposal.learning_unit_proposal import ProposalLearningUnitFilter
 from base.models.learning_unit_year import LearningUnitYear
-from base.utils.cache import SearchParametersCache
+from base.utils.cache import SearchParametersCache, NavigationSnapshotCache
 from base.utils.db import convert_order_by_strings_to_expressions
 from base.views.learning_units.search.common import SearchTypes
 from education_group.models.group_year import GroupYear
@@ -66,6 +66,24 @@ def _navigation_base(filter_class_function, reverse_url_function, user, obj, url
     if not search_parameters:
         return context
 
+    neighbours = NavigationSnapshotCache(user, obj.__class__.__name__).get_neighbours(search_parameters, obj.id)
+    if neighbours is None:
+        neighbours = _get_neighbours_from_search(filter_class_function, search_parameters, obj, code_field_name, is_ue)
+
+    if neighbours:
+        if not is_ue:
+            url_name = 'element_identification'
+        previous_row, next_row = neighbours
+        context.update({
+            "next_element_title": _get_row_title(next_row),
+            "next_url": _get_row_url(next_row, reverse_url_function, url_name),
+            "previous_element_title": _get_row_title(previous_row),
+            "previous_url": _get_row_url(previous_row, reverse_url_function, url_name),
+        })
+    return context
+
+
+def _get_neighbours_from_search(filter_class_function, search_parameters, obj, code_field_name, is_ue):
     search_type = search_parameters.get("search_type")
     filter_form_class = filter_class_function(search_type)
 
@@ -131,23 +149,37 @@ def _navigation_base(filter_class_function, reverse_url_function, user, obj, url
         ).order_by(*order_by)
 
     current_row = _get_current_row(qs, obj)
+    if not current_row:
+        return None
+    previous_row = (
+        current_row.previous_id,
+        current_row.previous_code,
+        current_row.previous_year,
+        current_row.previous_title,
+        current_row.previous_version_label if not is_ue else None,
+    )
+    next_row = (
+        current_row.next_id,
+        current_row.next_code,
+        current_row.next_year,
+        current_row.next_title,
+        current_row.next_version_label if not is_ue else None,
+    )
+    return previous_row, next_row
 
-    if current_row:
-        if not is_ue:
-            url_name = 'element_identification'
-        context.update({
-            "next_element_title": _get_title(current_row.next_title,
-                                             current_row.next_version_label if not is_ue else None
-                                             ),
-            "next_url": reverse_url_function(current_row.next_code, current_row.next_year, url_name)
-            if current_row.next_id else None,
-            "previous_element_title": _get_title(current_row.previous_title,
-                                                 current_row.previous_version_label if not is_ue else None
-                                                 ),
-            "previous_url": reverse_url_function(current_row.previous_code, current_row.previous_year, url_name)
-            if current_row.previous_id else None
-        })
-    return context
+
+def _get_row_title(row):
+    if not row:
+        return None
+    _id, _code, _year, title, version_label = row
+    return _get_title(title, version_label)
+
+
+def _get_row_url(row, reverse_url_function, url_name):
+    if not row or not row[0]:
+        return None
+    _id, code, year, _title, _version_label = row
+    return reverse_url_function(code, year, url_name)
 
 
 def _get_group_filter_class(search_type):
@@ -0,0 +1,91 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from base.business import change_log
+from base.models.change_log_entry import ChangeLogEntry
+from base.models.enums.change_log_types import ChangeLogObjectTypes, ChangeLogActions
+from base.tests.factories.user import UserFactory
+
+
+class ChangeLogListTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.entries = [
+            ChangeLogEntry.objects.create(
+                object_type=object_type.name,
+                object_id=1,
+                action=ChangeLogActions.UPDATE.name,
+            ) for object_type in [
+                ChangeLogObjectTypes.LEARNING_UNIT_YEAR,
+                ChangeLogObjectTypes.LINK,
+                ChangeLogObjectTypes.LEARNING_UNIT_YEAR,
+            ]
+        ]
+        change_log.sequence_committed_entries()
+        for entry in cls.entries:
+            entry.refresh_from_db()
+        cls.user = UserFactory()
+        cls.url = reverse('base_api_v1:change-log')
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+    def test_get_not_authorized(self):
+        self.client.force_authenticate(user=None)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_should_follow_cursor_in_order_of_changes(self):
+        response = self.client.get(self.url, data={'limit': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry['id'] for entry in response.data['results']], [e.id for e in self.entries[:2]])
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual([entry['id'] for entry in response.data['results']], [self.entries[2].id])
+        self.assertIsNone(response.data['next'])
+
+    def test_should_filter_on_object_type_and_last_sequence_read(self):
+        response = self.client.get(
+            self.url,
+            data={'object_type': ChangeLogObjectTypes.LEARNING_UNIT_YEAR.name, 'since': self.entries[0].sequence}
+        )
+
+        self.assertEqual([entry['id'] for entry in response.data['results']], [self.entries[2].id])
+
+    def test_should_not_return_entries_not_sequenced_yet(self):
+        ChangeLogEntry.objects.create(
+            object_type=ChangeLogObjectTypes.LINK.name,
+            object_id=2,
+            action=ChangeLogActions.CREATE.name,
+        )
+
+        response = self.client.get(self.url, data={'since': self.entries[-1].sequence})
+
+        self.assertEqual(response.data['results'], [])
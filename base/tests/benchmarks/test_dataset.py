@@ -0,0 +1,62 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.test import TestCase
+
+from base.benchmarks import scenarios
+from base.benchmarks.dataset import BenchmarkDatasetGenerator
+from base.models.exam_enrollment import ExamEnrollment
+from base.models.group_element_year import GroupElementYear
+from base.models.learning_unit_year import LearningUnitYear
+
+
+class TestBenchmarkDatasetGenerator(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        BenchmarkDatasetGenerator(
+            number_past_years=1,
+            number_future_years=1,
+            learning_units=6,
+            trainings=2,
+            groups_per_training=2,
+            links_per_training=4,
+            students_per_training=3,
+            exam_enrollments_per_student=2,
+        ).generate()
+
+    def test_should_generate_learning_unit_years_for_each_academic_year(self):
+        self.assertEqual(LearningUnitYear.objects.count(), 6 * 3)
+
+    def test_should_generate_program_trees(self):
+        self.assertEqual(GroupElementYear.objects.count(), 2 * (2 + 4))
+
+    def test_should_generate_exam_enrollments(self):
+        self.assertEqual(ExamEnrollment.objects.count(), 2 * 3 * 2)
+
+    def test_should_run_tree_scenarios(self):
+        results = scenarios.run_scenarios(['load_trees', 'find_roots'], repeat=1)
+
+        self.assertCountEqual(results.keys(), ['load_trees', 'find_roots'])
+        self.assertGreater(results['load_trees']['query_count'], 0)
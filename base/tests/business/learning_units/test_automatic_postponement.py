@@ -103,6 +103,72 @@ class TestFetchLearningUnitToPostpone(TestCase):
         self.assertEqual(len(result), 0)
 
 
+    @mock.patch.object(LearningUnitAutomaticPostponementToN6, 'chunk_size', 1)
+    def test_postpone_by_chunks(self):
+        for learning_unit in [self.learning_unit, LearningUnitFactory(end_year=None)]:
+            LearningUnitYearFactory(
+                learning_unit=learning_unit,
+                academic_year=self.academic_years[-2],
+                learning_container_year__requirement_entity=None,
+                learning_container_year__allocation_entity=None
+            )
+
+        postponement = LearningUnitAutomaticPostponementToN6()
+        result, errors = postponement.postpone()
+
+        self.assertEqual(len(result), 2)
+        self.assertFalse(errors)
+        self.assertEqual(postponement.metrics['chunks'], 2)
+
+    @mock.patch.object(LearningUnitAutomaticPostponementToN6, 'chunk_size', 1)
+    def test_learning_units_of_same_container_never_split_across_chunks(self):
+        full = LearningUnitYearFactory(
+            learning_unit=self.learning_unit,
+            academic_year=self.academic_years[-2],
+            learning_container_year__requirement_entity=None,
+            learning_container_year__allocation_entity=None
+        )
+        partim = LearningUnitYearFactory(
+            learning_unit__learning_container=self.learning_unit.learning_container,
+            learning_unit__end_year=None,
+            academic_year=self.academic_years[-2],
+            learning_container_year=full.learning_container_year,
+        )
+        other = LearningUnitYearFactory(
+            learning_unit__end_year=None,
+            academic_year=self.academic_years[-2],
+            learning_container_year__requirement_entity=None,
+            learning_container_year__allocation_entity=None
+        )
+
+        chunks = list(LearningUnitAutomaticPostponementToN6().get_chunks())
+
+        self.assertCountEqual(
+            [set(chunk) for chunk in chunks],
+            [{full.learning_unit, partim.learning_unit}, {other.learning_unit}]
+        )
+
+    @mock.patch.object(LearningUnitAutomaticPostponementToN6, 'send_after')
+    def test_send_statistics_from_chunk_results(self, mock_send_after):
+        luy = LearningUnitYearFactory(
+            learning_unit=self.learning_unit,
+            academic_year=self.academic_years[-1],
+        )
+        postponement = LearningUnitAutomaticPostponementToN6()
+        serialized_statistics_context = postponement.serialize_statistics_context(
+            postponement.get_statistics_context()
+        )
+
+        result_dict = LearningUnitAutomaticPostponementToN6.send_statistics_from_chunk_results(
+            serialized_statistics_context,
+            [{"result": [luy.pk], "errors": [], "metrics": {"chunks": 1, "duration": 1.0}}]
+        )
+
+        self.assertTrue(mock_send_after.called)
+        self.assertEqual(result_dict['errors'], [])
+        self.assertEqual(result_dict['metrics'], {"chunks": 1, "duration": 1.0})
+
+
 class TestSerializePostponement(TestCase):
     @classmethod
     def setUpTestData(cls):
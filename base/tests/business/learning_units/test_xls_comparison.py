@@ -27,7 +27,9 @@ import copy
 import datetime
 from unittest import mock
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import gettext_lazy as _
 
 from base.business.learning_unit_proposal import copy_learning_unit_data
@@ -117,6 +119,28 @@ class TestComparisonXls(TestCase):
                          or BLANK_VALUE)
         self.assertEqual(data[0][29], learning_unit_yr.get_attribution_procedure_display() or BLANK_VALUE)
 
+    def test_number_of_queries_does_not_depend_on_number_of_learning_units(self):
+        with CaptureQueriesContext(connection) as one_learning_unit_context:
+            prepare_xls_content(
+                _get_learning_unit_yrs_on_2_different_years(
+                    self.previous_academic_year.year,
+                    [self.learning_unit_year_1]
+                )
+            )
+
+        other_learning_unit_year = GenerateContainer(
+            self.old_academic_year,
+            self.current_academic_year
+        ).generated_container_years[1].learning_unit_year_full
+        with self.assertNumQueries(len(one_learning_unit_context.captured_queries)):
+            data = prepare_xls_content(
+                _get_learning_unit_yrs_on_2_different_years(
+                    self.previous_academic_year.year,
+                    [self.learning_unit_year_1, other_learning_unit_year]
+                )
+            ).get(DATA)
+        self.assertEqual(len(data), 4)
+
     @mock.patch("osis_common.document.xls_build.generate_xls")
     def test_generate_xls_data_with_no_data(self, mock_generate_xls):
         create_xls_comparison(self.user, [], None, self.previous_academic_year.year)
@@ -0,0 +1,147 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+import pika.exceptions
+from django.test import TestCase, override_settings
+
+from attribution.tests.factories.attribution_charge_new import AttributionChargeNewFactory
+from base.business import change_log
+from base.models.change_log_entry import ChangeLogEntry
+from base.models.enums.change_log_types import ChangeLogObjectTypes, ChangeLogActions
+from base.tests.factories.learning_unit_year import LearningUnitYearFactory
+from cms.tests.factories.translated_text import TranslatedTextFactory
+
+
+class TestRecordChanges(TestCase):
+    def test_should_log_creation_update_and_deletion_of_learning_unit_year(self):
+        learning_unit_year = LearningUnitYearFactory(acronym="LDROI1001")
+        learning_unit_year_id = learning_unit_year.pk
+        learning_unit_year.credits = 5
+        learning_unit_year.save()
+        learning_unit_year.delete()
+
+        entries = ChangeLogEntry.objects.filter(
+            object_type=ChangeLogObjectTypes.LEARNING_UNIT_YEAR.name,
+            object_id=learning_unit_year_id
+        )
+        self.assertEqual(
+            [entry.action for entry in entries],
+            [ChangeLogActions.CREATE.name, ChangeLogActions.UPDATE.name, ChangeLogActions.DELETE.name]
+        )
+        self.assertEqual(
+            entries.last().data,
+            {'acronym': "LDROI1001", 'year': learning_unit_year.academic_year.year}
+        )
+
+    def test_should_log_change_of_charge_as_update_of_its_attribution(self):
+        charge = AttributionChargeNewFactory()
+
+        entry = ChangeLogEntry.objects.filter(object_type=ChangeLogObjectTypes.ATTRIBUTION.name).last()
+
+        self.assertEqual(entry.object_id, charge.attribution_id)
+        self.assertEqual(entry.action, ChangeLogActions.UPDATE.name)
+        self.assertEqual(entry.data['tutor_id'], charge.attribution.tutor_id)
+
+    def test_should_log_translated_texts(self):
+        translated_text = TranslatedTextFactory()
+
+        self.assertTrue(
+            ChangeLogEntry.objects.filter(
+                object_type=ChangeLogObjectTypes.TRANSLATED_TEXT.name,
+                object_id=translated_text.pk,
+                action=ChangeLogActions.CREATE.name,
+            ).exists()
+        )
+
+    def test_should_log_bulk_operations_with_one_query(self):
+        learning_unit_years = LearningUnitYearFactory.create_batch(3)
+
+        with self.assertNumQueries(1):
+            change_log.record_many(learning_unit_years, ChangeLogActions.UPDATE)
+
+
+class TestSequenceCommittedEntries(TestCase):
+    def test_should_sequence_entries_in_order_after_the_last_sequence(self):
+        LearningUnitYearFactory.create_batch(2)
+        change_log.sequence_committed_entries(batch_size=1)
+        first_sequences = list(ChangeLogEntry.objects.order_by('id').values_list('sequence', flat=True))
+
+        LearningUnitYearFactory()
+        sequenced = change_log.sequence_committed_entries()
+
+        self.assertEqual(sequenced, 1)
+        self.assertEqual(
+            list(ChangeLogEntry.objects.order_by('id').values_list('sequence', flat=True)),
+            first_sequences + [max(first_sequences) + 1]
+        )
+
+    def test_entry_committed_late_should_be_sequenced_after_the_last_sequence(self):
+        late_entry = change_log.record(LearningUnitYearFactory(), ChangeLogActions.UPDATE)
+        ChangeLogEntry.objects.filter(pk=late_entry.pk).delete()
+        LearningUnitYearFactory()
+        change_log.sequence_committed_entries()
+        last_sequence = ChangeLogEntry.objects.order_by('sequence').last().sequence
+        self.assertTrue(ChangeLogEntry.objects.filter(id__gt=late_entry.id).exists())
+
+        # Entry with a lower id made visible after the others have been sequenced
+        late_entry.save(force_insert=True)
+        change_log.sequence_committed_entries()
+
+        late_entry.refresh_from_db()
+        self.assertEqual(late_entry.sequence, last_sequence + 1)
+
+
+@mock.patch('osis_common.queue.queue_sender.send_message')
+class TestPublishPendingEntries(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        LearningUnitYearFactory.create_batch(2)
+        change_log.sequence_committed_entries()
+        cls.pending_entries = list(ChangeLogEntry.objects.order_by('sequence'))
+
+    @override_settings(QUEUES={'QUEUES_NAME': {'CHANGE_LOG': 'dummy'}})
+    def test_should_publish_pending_entries_by_batch(self, mock_send_message):
+        published = change_log.publish_pending_entries(batch_size=1)
+
+        self.assertEqual(published, len(self.pending_entries))
+        self.assertEqual(mock_send_message.call_count, len(self.pending_entries))
+        queue_name, message = mock_send_message.call_args_list[0][0]
+        self.assertEqual(queue_name, 'dummy')
+        self.assertEqual(message[0]['id'], self.pending_entries[0].id)
+        self.assertFalse(ChangeLogEntry.objects.filter(published_at__isnull=True).exists())
+
+    @override_settings(QUEUES={'QUEUES_NAME': {'CHANGE_LOG': 'dummy'}})
+    def test_should_keep_entries_pending_when_queue_unavailable(self, mock_send_message):
+        mock_send_message.side_effect = pika.exceptions.AMQPError
+
+        self.assertEqual(change_log.publish_pending_entries(), 0)
+        self.assertEqual(ChangeLogEntry.objects.filter(published_at__isnull=True).count(), len(self.pending_entries))
+
+    @override_settings(QUEUES={})
+    def test_should_not_publish_when_no_queue_configured(self, mock_send_message):
+        self.assertEqual(change_log.publish_pending_entries(), 0)
+        self.assertFalse(mock_send_message.called)
@@ -38,7 +38,9 @@ from base.models import academic_year
 from base.models import learning_unit_year as mdl_luy
 from base.models import teaching_material as mdl_teaching_material
 from base.models.academic_year import compute_max_academic_year_adjournment
+from base.models.change_log_entry import ChangeLogEntry
 from base.models.enums import learning_component_year_type
+from base.models.enums.change_log_types import ChangeLogObjectTypes, ChangeLogActions
 from base.models.enums import learning_unit_year_subtypes, learning_unit_year_periodicity, \
     learning_container_year_types, attribution_procedure, internship_subtypes, learning_unit_year_session, \
     quadrimesters, vacant_declaration_type, entity_container_year_link_type
@@ -737,6 +739,35 @@ class TestLearningUnitEdition(TestCase, LearningUnitsMixin):
         self.assertEqual(last_luy_teaching_material_count, new_luy_teaching_material_count)
         self.assertCountEqual(last_luy_educational_information, new_luy_educational_information)
 
+    def test_postpone_end_date_should_log_duplicated_cms_data(self):
+        start_year_full = AcademicYearFactory(year=self.starting_academic_year.year - 1)
+        end_year_full = AcademicYearFactory(year=self.starting_academic_year.year + 1)
+        expected_end_year_full = AcademicYearFactory(year=end_year_full.year + 2)
+        learning_unit_full_annual = self.setup_learning_unit(start_year=start_year_full, end_year=end_year_full)
+        luy_list = self.setup_list_of_learning_unit_years_full(
+            list_of_academic_years=self.list_of_academic_years,
+            learning_unit_full=learning_unit_full_annual,
+            periodicity=learning_unit_year_periodicity.ANNUAL
+        )
+        self.setup_educational_information(luy_list)
+
+        edit_learning_unit_end_date(
+            learning_unit_full_annual,
+            academic_year.find_academic_year_by_year(expected_end_year_full.year)
+        )
+
+        new_luy = mdl_luy.find_latest_by_learning_unit(learning_unit_full_annual)
+        new_translated_text_ids = TranslatedText.objects.filter(reference=new_luy.id).values_list('pk', flat=True)
+        self.assertTrue(new_translated_text_ids)
+        self.assertCountEqual(
+            ChangeLogEntry.objects.filter(
+                object_type=ChangeLogObjectTypes.TRANSLATED_TEXT.name,
+                action=ChangeLogActions.CREATE.name,
+                object_id__in=new_translated_text_ids,
+            ).values_list('object_id', flat=True),
+            new_translated_text_ids
+        )
+
     def test_postpone_end_date_with_external_learning_unit(self):
         start_year_full = AcademicYearFactory(year=self.starting_academic_year.year - 1)
         end_year_full = AcademicYearFactory(year=self.starting_academic_year.year + 1)
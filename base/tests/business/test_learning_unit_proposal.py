@@ -414,3 +414,17 @@ class TestModifyProposalState(TestCase):
 
         proposal.refresh_from_db()
         self.assertEqual(proposal.state, new_state)
+
+
+class TestConsolidateProposalsAsync(TestCase):
+    @mock.patch('base.tasks.apply_action_on_proposals.run.delay')
+    @mock.patch('base.business.learning_unit_proposal.transaction.on_commit')
+    def test_should_start_task_only_after_commit(self, mock_on_commit, mock_delay):
+        proposal = ProposalLearningUnitFactory()
+
+        lu_proposal_business.consolidate_proposals_async([proposal], proposal.author, {})
+
+        self.assertFalse(mock_delay.called)
+        on_commit_callback, = mock_on_commit.call_args[0]
+        on_commit_callback()
+        self.assertEqual(mock_delay.call_args[1]['proposal_ids'], [proposal.pk])
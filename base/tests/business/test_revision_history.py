@@ -0,0 +1,115 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import reversion
+from django.test import TestCase
+
+from base.business import revision_history
+from base.business.revision_history import EDUCATION_GROUP_YEAR, GROUP_YEAR, LEARNING_UNIT_YEAR
+from base.models.revision_aggregate import RevisionAggregate
+from base.tests.factories.learning_component_year import LearningComponentYearFactory
+from base.tests.factories.learning_unit_year import LearningUnitYearFullFactory, LearningUnitYearPartimFactory
+from program_management.tests.factories.education_group_version import EducationGroupVersionFactory
+
+
+class TestTagRevision(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.full = LearningUnitYearFullFactory()
+        cls.partim = LearningUnitYearPartimFactory(
+            academic_year=cls.full.academic_year,
+            learning_container_year=cls.full.learning_container_year,
+        )
+        cls.education_group_version = EducationGroupVersionFactory()
+
+    def _tags(self):
+        return set(RevisionAggregate.objects.values_list('aggregate_type', 'aggregate_id'))
+
+    def test_learning_container_year_change_tags_all_its_learning_unit_years(self):
+        with reversion.create_revision():
+            self.full.learning_container_year.save()
+
+        self.assertSetEqual(self._tags(), {(LEARNING_UNIT_YEAR, self.full.pk), (LEARNING_UNIT_YEAR, self.partim.pk)})
+
+    def test_component_change_tags_its_learning_unit_year_once_per_revision(self):
+        component = LearningComponentYearFactory(learning_unit_year=self.full)
+        with reversion.create_revision():
+            component.save()
+            self.full.save()
+
+        self.assertSetEqual(self._tags(), {(LEARNING_UNIT_YEAR, self.full.pk)})
+
+    def test_education_group_version_change_tags_training_and_group(self):
+        with reversion.create_revision():
+            self.education_group_version.save()
+
+        self.assertSetEqual(self._tags(), {
+            (EDUCATION_GROUP_YEAR, self.education_group_version.offer_id),
+            (GROUP_YEAR, self.education_group_version.root_group_id),
+        })
+
+    def test_group_year_change_tags_group_and_trainings_of_its_versions(self):
+        with reversion.create_revision():
+            self.education_group_version.root_group.save()
+
+        self.assertSetEqual(self._tags(), {
+            (EDUCATION_GROUP_YEAR, self.education_group_version.offer_id),
+            (GROUP_YEAR, self.education_group_version.root_group_id),
+        })
+
+    def test_tag_date_is_revision_date(self):
+        with reversion.create_revision():
+            self.full.save()
+
+        tag = RevisionAggregate.objects.get()
+        self.assertEqual(tag.date_created, tag.revision.date_created)
+
+
+class TestGetHistory(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.learning_unit_year = LearningUnitYearFullFactory()
+        cls.other_learning_unit_year = LearningUnitYearFullFactory()
+
+    def test_should_return_revisions_of_aggregate_most_recent_first(self):
+        for _ in range(2):
+            with reversion.create_revision():
+                self.learning_unit_year.save()
+        with reversion.create_revision():
+            self.other_learning_unit_year.save()
+
+        history = revision_history.get_history(LEARNING_UNIT_YEAR, self.learning_unit_year.pk)
+
+        self.assertEqual(len(history), 2)
+        self.assertGreater(history[0].date_created, history[1].date_created)
+
+    def test_tag_existing_revisions_should_tag_revisions_recorded_before(self):
+        with reversion.create_revision():
+            self.learning_unit_year.learning_unit.save()
+        RevisionAggregate.objects.all().delete()
+
+        revision_history.tag_existing_revisions(batch_size=1)
+
+        self.assertEqual(revision_history.get_history(LEARNING_UNIT_YEAR, self.learning_unit_year.pk).count(), 1)
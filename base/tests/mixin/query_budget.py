@@ -0,0 +1,44 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import contextlib
+from typing import Optional
+
+from base.utils import query_profiling
+
+
+class QueryBudgetMixin:
+    """
+        This mixin allow to fail a test when a block of code executes more SQL queries than expected
+        (or executes the same query several times, which is the sign of a N+1 query)
+    """
+    @contextlib.contextmanager
+    def assertQueryBudget(self, max_queries: int, max_duplicates: Optional[int] = None):
+        with query_profiling.profile() as report:
+            yield report
+        try:
+            query_profiling.QueryBudget(max_queries, max_duplicates).check(report, self.id())
+        except query_profiling.QueryBudgetExceeded as e:
+            self.fail(str(e))
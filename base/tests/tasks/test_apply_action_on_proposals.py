@@ -0,0 +1,118 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.contrib.messages import ERROR, SUCCESS
+from django.test import TestCase
+from django.utils.translation import gettext_lazy as _
+
+from base.models.enums.proposal_type import ProposalType
+from base.tasks import apply_action_on_proposals
+from base.tests.factories.person import PersonFactory
+from base.tests.factories.proposal_learning_unit import ProposalLearningUnitFactory
+from base.utils import send_mail as send_mail_util
+
+
+class TestRun(TestCase):
+    @mock.patch.object(apply_action_on_proposals, 'CHUNK_SIZE', 2)
+    @mock.patch('base.tasks.apply_action_on_proposals.chord')
+    def test_should_apply_action_by_chunks_then_send_report(self, mock_chord):
+        result = apply_action_on_proposals.run(
+            proposal_ids=[1, 2, 3, 4, 5],
+            author_id=10,
+            operation=send_mail_util.CONSOLIDATION_OPERATION,
+            research_criteria=[],
+        )
+
+        self.assertEqual(result, {"chunks": 3})
+        chunk_signatures = list(mock_chord.call_args[0][0])
+        self.assertEqual(
+            [signature.args for signature in chunk_signatures],
+            [
+                ([1, 2], 10, send_mail_util.CONSOLIDATION_OPERATION),
+                ([3, 4], 10, send_mail_util.CONSOLIDATION_OPERATION),
+                ([5], 10, send_mail_util.CONSOLIDATION_OPERATION),
+            ]
+        )
+        report_signature, = mock_chord.return_value.call_args[0]
+        self.assertEqual(report_signature.kwargs['author_id'], 10)
+
+
+class TestApplyActionOnChunk(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = PersonFactory()
+        cls.proposal_in_error = ProposalLearningUnitFactory(type=ProposalType.MODIFICATION.name)
+        cls.proposal_consolidated = ProposalLearningUnitFactory(type=ProposalType.MODIFICATION.name)
+
+    @mock.patch.object(apply_action_on_proposals.apply_action_on_chunk, 'update_state')
+    def test_should_report_result_and_progress_of_each_proposal(self, mock_update_state):
+        def action_method(proposal):
+            return {ERROR: ["Error on proposal"]} if proposal == self.proposal_in_error else {SUCCESS: []}
+
+        with mock.patch(
+            'base.business.learning_unit_proposal.get_action_on_proposals',
+            return_value=(action_method, mock.Mock(return_value=('can_consolidate', True)))
+        ):
+            rows = apply_action_on_proposals.apply_action_on_chunk(
+                [self.proposal_in_error.pk, self.proposal_consolidated.pk],
+                self.author.pk,
+                send_mail_util.CONSOLIDATION_OPERATION,
+            )
+
+        rows_by_acronym = {row[1]: row for row in rows}
+        self.assertEqual(mock_update_state.call_count, 2)
+        mock_update_state.assert_called_with(state='PROGRESS', meta={'done': 2, 'total': 2})
+        self.assertEqual(
+            rows_by_acronym[self.proposal_in_error.learning_unit_year.acronym][5:],
+            [str(_("Failure")), "Error on proposal"]
+        )
+        self.assertEqual(
+            rows_by_acronym[self.proposal_consolidated.learning_unit_year.acronym][5:],
+            [str(_("Success")), ""]
+        )
+
+
+class TestSendReport(TestCase):
+    @mock.patch('base.utils.send_mail.send_mail_proposals_report')
+    def test_should_send_one_report_with_rows_of_all_chunks(self, mock_send_report):
+        author = PersonFactory()
+        rows_by_chunk = [[["row 1"]], [["row 2"], ["row 3"]]]
+
+        result = apply_action_on_proposals.send_report(
+            rows_by_chunk,
+            author_id=author.pk,
+            operation=send_mail_util.CONSOLIDATION_OPERATION,
+            research_criteria=[],
+        )
+
+        self.assertEqual(result, {"proposals": 3})
+        mock_send_report.assert_called_once_with(
+            author,
+            [["row 1"], ["row 2"], ["row 3"]],
+            send_mail_util.CONSOLIDATION_OPERATION,
+            []
+        )
@@ -36,7 +36,7 @@ from base.templatetags import navigation
 from base.tests.factories.academic_year import AcademicYearFactory
 from base.tests.factories.learning_unit_year import LearningUnitYearFactory
 from base.tests.factories.user import UserFactory
-from base.utils.cache import SearchParametersCache
+from base.utils.cache import SearchParametersCache, NavigationSnapshotCache
 from base.views.learning_units.search.common import SearchTypes
 from education_group.models.group_year import GroupYear
 from education_group.tests.factories.group_year import GroupYearFactory
@@ -82,9 +82,11 @@ class TestNavigationMixin:
         ))
         self.cache = SearchParametersCache(self.user, self.search_type)
         self.cache.set_cached_data(parameters)
+        self.snapshot_cache = NavigationSnapshotCache(self.user, self.search_type)
 
     def tearDown(self):
         self.cache.clear()
+        self.snapshot_cache.clear()
 
     def assertNavigationContextEquals(self, expected_context, index, group=False):
         if group:
@@ -148,6 +150,35 @@ class TestNavigationLearningUnitYear(TestNavigationMixin, TestCase):
 
         self.filter_form_patcher.stop()
 
+    @mock.patch("base.templatetags.navigation._get_neighbours_from_search")
+    def test_navigation_should_use_snapshot_when_up_to_date(self, mock_get_neighbours_from_search):
+        elements_in_reverse_order = list(reversed(self.elements_sorted_by_acronym))
+        self.snapshot_cache.save_snapshot(
+            self.cache.cached_data,
+            [(obj.id, obj.acronym, obj.academic_year.year, obj.acronym, None) for obj in elements_in_reverse_order]
+        )
+
+        context = self.navigation_function(self.user, elements_in_reverse_order[1], self.url_name)
+
+        self.assertFalse(mock_get_neighbours_from_search.called)
+        self.assertEqual(context["previous_element_title"], elements_in_reverse_order[0].acronym)
+        self.assertEqual(context["next_element_title"], elements_in_reverse_order[2].acronym)
+
+    def test_navigation_should_search_again_when_snapshot_is_stale(self):
+        self.snapshot_cache.save_snapshot(
+            {"academic_year": self.academic_year.id, "ordering": "-acronym"},
+            [(obj.id, obj.acronym, obj.academic_year.year, obj.acronym, None) for obj in self.elements]
+        )
+        inner_element_index = 2
+        expected_context = {
+            "current_element": self.elements_sorted_by_acronym[inner_element_index],
+            "next_element_title": self.elements_sorted_by_acronym[inner_element_index + 1].acronym,
+            "next_url": self._get_element_url(self.query_parameters, inner_element_index + 1),
+            "previous_element_title": self.elements_sorted_by_acronym[inner_element_index - 1].acronym,
+            "previous_url": self._get_element_url(self.query_parameters, inner_element_index - 1),
+        }
+        self.assertNavigationContextEquals(expected_context, inner_element_index)
+
     def test_navigation_when_no_search_query(self):
         self.cache.clear()
 
@@ -25,11 +25,12 @@
 ##############################################################################
 from unittest import mock
 
+from django.http import QueryDict
 from django.test import TestCase, RequestFactory, SimpleTestCase
 from django.views.generic import TemplateView
 
 from base.tests.factories.user import UserFactory
-from base.utils.cache import cache, RequestCache, CacheFilterMixin, cached_result
+from base.utils.cache import cache, RequestCache, CacheFilterMixin, cached_result, NavigationSnapshotCache
 
 
 class TestRequestCache(TestCase):
@@ -137,3 +138,29 @@ class TestCachedResult(SimpleTestCase):
             3,
             "Function called 3 times, but should have been executed only the first time"
         )
+
+
+class TestNavigationSnapshotCache(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.search_parameters = QueryDict('academic_year=1&ordering=acronym&page=2')
+        cls.rows = [(10, "LDROI1001", 2020, "LDROI1001", None), (5, "LBIR1100", 2020, "LBIR1100", None)]
+
+    def setUp(self):
+        self.snapshot_cache = NavigationSnapshotCache(self.user, "LearningUnitYear")
+        self.snapshot_cache.save_snapshot(self.search_parameters, self.rows)
+        self.addCleanup(cache.clear)
+
+    def test_should_not_depend_on_page(self):
+        self.assertTrue(self.snapshot_cache.is_up_to_date({"academic_year": 1, "ordering": "acronym"}))
+
+    def test_get_neighbours(self):
+        self.assertEqual(self.snapshot_cache.get_neighbours(self.search_parameters, 10), (None, self.rows[1]))
+        self.assertEqual(self.snapshot_cache.get_neighbours(self.search_parameters, 5), (self.rows[0], None))
+
+    def test_get_neighbours_when_object_not_in_snapshot(self):
+        self.assertIsNone(self.snapshot_cache.get_neighbours(self.search_parameters, 99))
+
+    def test_get_neighbours_when_search_parameters_changed(self):
+        self.assertIsNone(self.snapshot_cache.get_neighbours(QueryDict('academic_year=2'), 10))
@@ -0,0 +1,78 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from base.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class TestCircuitBreaker(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.circuit_breaker = CircuitBreaker('test', failure_threshold=2, recovery_timeout=60)
+
+    def test_should_return_result_of_call(self):
+        self.assertEqual(self.circuit_breaker.call(lambda value: value * 2, 21), 42)
+
+    def test_should_open_after_consecutive_failures(self):
+        for _ in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                self.circuit_breaker.call(lambda: 1 / 0)
+
+        self.assertTrue(self.circuit_breaker.is_open)
+        with self.assertRaises(CircuitOpenError):
+            self.circuit_breaker.call(lambda: 42)
+
+    def test_should_reset_failures_on_success(self):
+        with self.assertRaises(ZeroDivisionError):
+            self.circuit_breaker.call(lambda: 1 / 0)
+        self.circuit_breaker.call(lambda: 42)
+        with self.assertRaises(ZeroDivisionError):
+            self.circuit_breaker.call(lambda: 1 / 0)
+
+        self.assertFalse(self.circuit_breaker.is_open)
+
+    def test_should_let_calls_through_after_recovery_timeout(self):
+        self.circuit_breaker.recovery_timeout = 0
+        for _ in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                self.circuit_breaker.call(lambda: 1 / 0)
+
+        self.assertEqual(self.circuit_breaker.call(lambda: 42), 42)
+        self.assertFalse(self.circuit_breaker.is_open)
+
+    def test_should_not_count_exceptions_which_are_not_failures(self):
+        circuit_breaker = CircuitBreaker(
+            'test', failure_threshold=1, is_failure=lambda exception: not isinstance(exception, KeyError)
+        )
+
+        with self.assertRaises(KeyError):
+            circuit_breaker.call(lambda: {}['key'])
+        self.assertFalse(circuit_breaker.is_open)
+
+        with self.assertRaises(ZeroDivisionError):
+            circuit_breaker.call(lambda: 1 / 0)
+        self.assertTrue(circuit_breaker.is_open)
@@ -0,0 +1,95 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from base.utils import identity_map
+
+
+class TestIdentityMap(SimpleTestCase):
+    def setUp(self):
+        self.repository = object()
+        self.loader = mock.Mock(side_effect=lambda entity_id: object())
+
+    def test_should_load_each_time_outside_of_a_scope(self):
+        first = identity_map.get_or_load(self.repository, 1, self.loader)
+        second = identity_map.get_or_load(self.repository, 1, self.loader)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_should_load_once_inside_a_scope(self):
+        with identity_map.scope():
+            first = identity_map.get_or_load(self.repository, 1, self.loader)
+            second = identity_map.get_or_load(self.repository, 1, self.loader)
+
+        self.assertIs(first, second)
+        self.loader.assert_called_once_with(1)
+
+    def test_nested_scopes_should_share_outermost_one(self):
+        with identity_map.scope():
+            first = identity_map.get_or_load(self.repository, 1, self.loader)
+            with identity_map.scope():
+                second = identity_map.get_or_load(self.repository, 1, self.loader)
+            third = identity_map.get_or_load(self.repository, 1, self.loader)
+
+        self.assertIs(first, second)
+        self.assertIs(first, third)
+
+    def test_should_reload_after_discard(self):
+        with identity_map.scope():
+            first = identity_map.get_or_load(self.repository, 1, self.loader)
+            identity_map.discard(self.repository, 1)
+            second = identity_map.get_or_load(self.repository, 1, self.loader)
+
+        self.assertIsNot(first, second)
+
+    def test_should_reload_after_clear(self):
+        with identity_map.scope():
+            first = identity_map.get_or_load(self.repository, 1, self.loader)
+            identity_map.clear()
+            second = identity_map.get_or_load(self.repository, 1, self.loader)
+
+        self.assertIsNot(first, second)
+
+    def test_should_clear_scope_when_block_fails(self):
+        with identity_map.scope():
+            first = identity_map.get_or_load(self.repository, 1, self.loader)
+            with self.assertRaises(ValueError), identity_map.discard_on_error():
+                raise ValueError
+            second = identity_map.get_or_load(self.repository, 1, self.loader)
+
+        self.assertIsNot(first, second)
+
+    def test_should_keep_scope_when_block_succeeds(self):
+        with identity_map.scope():
+            first = identity_map.get_or_load(self.repository, 1, self.loader)
+            with identity_map.discard_on_error():
+                pass
+            second = identity_map.get_or_load(self.repository, 1, self.loader)
+
+        self.assertIs(first, second)
@@ -0,0 +1,157 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+import attr
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test import TestCase
+
+from base.tasks import invoke_commands
+from base.utils import identity_map
+from infrastructure.messages_bus import MessageBus
+from infrastructure.messages_bus_middlewares import MessageBusMiddleware
+from osis_common.ddd.interface import CommandRequest
+
+
+@attr.s(frozen=True, slots=True)
+class BaseDummyCommand(CommandRequest):
+    year = attr.ib(type=int)
+    label = attr.ib(type=str, default='')
+    computed = attr.ib(type=str, init=False, default='not given to the constructor')
+
+
+@attr.s(frozen=True, slots=True)
+class DummyCommand(BaseDummyCommand):
+    code = attr.ib(type=str, default='')
+
+
+class RecordingMiddleware(MessageBusMiddleware):
+    def __init__(self, name: str, calls: list):
+        self.name = name
+        self.calls = calls
+
+    def __call__(self, command, next_handler):
+        self.calls.append(self.name)
+        return next_handler(command)
+
+
+class TestMessageBusMiddlewares(TestCase):
+    def setUp(self):
+        self.message_bus = MessageBus()
+
+    def _invoke(self, handler, command=None):
+        with mock.patch.dict(self.message_bus.command_handlers, {DummyCommand: handler}):
+            return self.message_bus.invoke(command or DummyCommand(year=2020))
+
+    def test_should_apply_middlewares_in_declared_order(self):
+        calls = []
+        self.message_bus.middlewares = [RecordingMiddleware('first', calls), RecordingMiddleware('second', calls)]
+
+        self._invoke(lambda cmd: calls.append('handler'))
+
+        self.assertEqual(calls, ['first', 'second', 'handler'])
+
+    def test_handler_should_run_in_transaction_and_identity_map_scope(self):
+        savepoints_outside = len(connection.savepoint_ids)
+
+        def handler(cmd):
+            self.assertEqual(len(connection.savepoint_ids), savepoints_outside + 1)
+            loader = mock.Mock(side_effect=lambda entity_id: object())
+            self.assertIs(
+                identity_map.get_or_load('repository', 1, loader),
+                identity_map.get_or_load('repository', 1, loader)
+            )
+            return 'result'
+
+        self.assertEqual(self._invoke(handler), 'result')
+
+    def test_should_log_duration_and_number_of_queries(self):
+        def handler(cmd):
+            list(Group.objects.all())
+
+        with self.assertLogs(settings.DEFAULT_LOGGER, level='INFO') as logs:
+            self._invoke(handler)
+
+        self.assertRegex(logs.output[0], r"Command DummyCommand handled in [\d.]+ ms with \d+ queries")
+
+    def test_should_rollback_when_command_fails(self):
+        def handler(cmd):
+            Group.objects.create(name="created by the command")
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            self._invoke(handler)
+
+        self.assertFalse(Group.objects.filter(name="created by the command").exists())
+
+    def test_should_discard_identity_map_when_command_fails(self):
+        loader = mock.Mock(side_effect=lambda entity_id: object())
+
+        def failing_handler(cmd):
+            identity_map.get_or_load('repository', 1, loader)
+            raise ValueError
+
+        with identity_map.scope():
+            first = identity_map.get_or_load('repository', 1, loader)
+            with self.assertRaises(ValueError):
+                self._invoke(failing_handler)
+            second = identity_map.get_or_load('repository', 1, loader)
+
+        self.assertIsNot(first, second)
+
+
+class TestInvokeBatch(TestCase):
+    def test_should_give_consecutive_commands_of_same_type_to_batch_handler(self):
+        message_bus = MessageBus()
+        batch_handler = mock.Mock(side_effect=lambda cmds: [cmd.year for cmd in cmds])
+        handler = mock.Mock(side_effect=lambda cmd: 'single')
+        commands = [DummyCommand(year=2020), DummyCommand(year=2021), BaseDummyCommand(year=2022)]
+
+        with mock.patch.dict(message_bus.batch_command_handlers, {DummyCommand: batch_handler}), \
+                mock.patch.dict(message_bus.command_handlers, {BaseDummyCommand: handler}):
+            results = message_bus.invoke_batch(commands)
+
+        self.assertEqual(results, [2020, 2021, 'single'])
+        batch_handler.assert_called_once_with(commands[:2])
+        handler.assert_called_once_with(commands[2])
+
+
+class TestInvokeAsync(TestCase):
+    @mock.patch('base.tasks.invoke_commands.run.delay')
+    def test_should_rebuild_commands_in_worker(self, mock_delay):
+        commands = [DummyCommand(year=2020, label='label', code='LDROI100B'), BaseDummyCommand(year=2021)]
+
+        MessageBus().invoke_async(commands)
+        commands_data, = mock_delay.call_args[0]
+
+        with mock.patch('infrastructure.messages_bus.message_bus_instance.invoke_batch') as mock_invoke_batch:
+            mock_invoke_batch.side_effect = lambda cmds: cmds
+            invoke_commands.run(commands_data)
+
+        self.assertEqual(mock_invoke_batch.call_args[0][0], commands)
+        self.assertNotIn('computed', commands_data[0]['attributes'])
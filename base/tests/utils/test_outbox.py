@@ -0,0 +1,126 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+from unittest import mock
+
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from base.models.enums.outbox_message_status import OutboxMessageStatus
+from base.models.outbox_message import OutboxMessage
+from base.utils import outbox, mail_connection
+
+
+def sender_ok(**kwargs):
+    return None
+
+
+def sender_in_error(**kwargs):
+    return "Unable to send"
+
+
+def sender_mail(**kwargs):
+    mail.send_mail("Subject", "Body", "sender@test.com", ["receiver@test.com"])
+
+
+class TestEnqueue(TestCase):
+    @mock.patch("base.utils.outbox.transaction.on_commit")
+    def test_should_record_sender_and_kwargs(self, mock_on_commit):
+        outbox_message = outbox.enqueue(sender_ok, receiver_ids=[1, 2])
+
+        self.assertEqual(outbox_message.sender, "base.tests.utils.test_outbox.sender_ok")
+        self.assertEqual(outbox_message.sender_kwargs, {'receiver_ids': [1, 2]})
+        self.assertEqual(outbox_message.status, OutboxMessageStatus.PENDING.name)
+        self.assertTrue(mock_on_commit.called)
+
+
+class TestDeliverPendingMessages(TestCase):
+    def test_should_mark_message_as_sent(self):
+        outbox_message = OutboxMessage.objects.create(sender="base.tests.utils.test_outbox.sender_ok")
+
+        result = outbox.deliver_pending_messages()
+
+        outbox_message.refresh_from_db()
+        self.assertEqual(outbox_message.status, OutboxMessageStatus.SENT.name)
+        self.assertIsNotNone(outbox_message.sent_at)
+        self.assertEqual(result[OutboxMessageStatus.SENT.name], 1)
+
+    def test_should_postpone_next_attempt_when_sender_returns_an_error(self):
+        outbox_message = OutboxMessage.objects.create(sender="base.tests.utils.test_outbox.sender_in_error")
+
+        outbox.deliver_pending_messages()
+
+        outbox_message.refresh_from_db()
+        self.assertEqual(outbox_message.status, OutboxMessageStatus.PENDING.name)
+        self.assertEqual(outbox_message.attempts, 1)
+        self.assertEqual(outbox_message.last_error, "Unable to send")
+        self.assertGreater(outbox_message.next_attempt_at, timezone.now())
+
+    def test_should_move_message_to_dead_letter_after_max_attempts(self):
+        outbox_message = OutboxMessage.objects.create(
+            sender="base.tests.utils.test_outbox.sender_in_error",
+            attempts=outbox.MAX_ATTEMPTS - 1,
+        )
+
+        outbox.deliver_pending_messages()
+
+        outbox_message.refresh_from_db()
+        self.assertEqual(outbox_message.status, OutboxMessageStatus.DEAD_LETTER.name)
+
+    def test_should_not_deliver_message_before_next_attempt(self):
+        OutboxMessage.objects.create(
+            sender="base.tests.utils.test_outbox.sender_ok",
+            next_attempt_at=timezone.now() + datetime.timedelta(hours=1),
+        )
+
+        result = outbox.deliver_pending_messages()
+
+        self.assertEqual(result[OutboxMessageStatus.SENT.name], 0)
+
+    def test_should_not_claim_a_message_twice(self):
+        OutboxMessage.objects.create(sender="base.tests.utils.test_outbox.sender_ok")
+
+        self.assertEqual(len(outbox.claim_pending_messages()), 1)
+        self.assertEqual(outbox.claim_pending_messages(), [])
+
+    @override_settings(
+        EMAIL_BACKEND='base.utils.mail_connection.SharedConnectionEmailBackend',
+        EMAIL_DELIVERY_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    )
+    def test_should_send_messages_over_a_single_connection(self):
+        OutboxMessage.objects.create(sender="base.tests.utils.test_outbox.sender_mail")
+        OutboxMessage.objects.create(sender="base.tests.utils.test_outbox.sender_mail")
+
+        with mock.patch(
+                "base.utils.mail_connection._get_delivery_connection",
+                wraps=mail_connection._get_delivery_connection
+        ) as mock_get_delivery_connection:
+            result = outbox.deliver_pending_messages()
+
+        self.assertEqual(result[OutboxMessageStatus.SENT.name], 2)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mock_get_delivery_connection.call_count, 1)
@@ -0,0 +1,105 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib.auth.models import Group
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase, RequestFactory, override_settings
+from django.urls import ResolverMatch
+from django.views import View
+
+from base.middlewares.query_profiling_middleware import QueryProfilingMiddleware
+from base.tests.mixin.query_budget import QueryBudgetMixin
+from base.utils import query_profiling
+
+
+class TestFingerprint(SimpleTestCase):
+    def test_should_ignore_parameters_values(self):
+        self.assertEqual(
+            query_profiling.fingerprint("SELECT * FROM base_person WHERE id = 12 AND last_name = 'Smith'"),
+            query_profiling.fingerprint("SELECT * FROM base_person WHERE id = 3 AND last_name = 'O''Neil'"),
+        )
+
+    def test_should_ignore_size_of_in_clause(self):
+        self.assertEqual(
+            query_profiling.fingerprint("SELECT * FROM base_person WHERE id IN (%s, %s, %s)"),
+            query_profiling.fingerprint("SELECT * FROM base_person WHERE id IN (%s)"),
+        )
+
+
+class TestQueryBudget(QueryBudgetMixin, TestCase):
+    def test_should_count_queries_and_duplicates(self):
+        with query_profiling.profile() as report:
+            for name in ("a", "b", "c"):
+                list(Group.objects.filter(name=name))
+
+        self.assertEqual(report.query_count, 3)
+        self.assertEqual(report.duplicate_count, 2)
+
+    def test_should_raise_when_budget_is_exceeded(self):
+        with query_profiling.profile() as report:
+            list(Group.objects.all())
+            list(Group.objects.all())
+
+        with self.assertRaises(query_profiling.QueryBudgetExceeded):
+            query_profiling.QueryBudget(max_queries=2, max_duplicates=0).check(report, "view")
+
+    def test_assert_query_budget(self):
+        with self.assertQueryBudget(max_queries=1):
+            list(Group.objects.all())
+
+
+@query_profiling.query_budget(max_queries=1)
+def _view_within_budget(request):
+    list(Group.objects.all())
+    return HttpResponse()
+
+
+@query_profiling.query_budget(max_queries=1)
+class _ViewExceedingBudget(View):
+    def get(self, request):
+        list(Group.objects.all())
+        list(Group.objects.all())
+        return HttpResponse()
+
+
+class TestQueryProfilingMiddleware(TestCase):
+    def _get(self, view):
+        request = RequestFactory().get("/")
+        request.resolver_match = ResolverMatch(view, (), {}, url_name="profiled_view")
+        return QueryProfilingMiddleware(lambda req: view(req))(request)
+
+    def test_should_add_query_count_to_response(self):
+        response = self._get(_view_within_budget)
+        self.assertEqual(response['X-Query-Count'], '1')
+
+    @override_settings(QUERY_PROFILING_STRICT=True)
+    def test_should_raise_when_view_exceeds_budget_in_strict_mode(self):
+        with self.assertRaises(query_profiling.QueryBudgetExceeded):
+            self._get(_ViewExceedingBudget.as_view())
+
+    @override_settings(QUERY_PROFILING_STRICT=False)
+    def test_should_only_log_when_view_exceeds_budget(self):
+        response = self._get(_ViewExceedingBudget.as_view())
+        self.assertEqual(response['X-Query-Count'], '2')
@@ -0,0 +1,181 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import time
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.contrib.sessions.backends.base import SessionBase
+from django.db import connections, DEFAULT_DB_ALIAS
+from django.http import HttpResponse
+from django.test import SimpleTestCase, RequestFactory, override_settings, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from base.middlewares.read_replica_middleware import ReadReplicaMiddleware
+from base.utils import read_replica
+
+
+@override_settings(DATABASE_REPLICA_ALIAS='replica')
+class TestReadReplicaRouter(SimpleTestCase):
+    def test_should_read_from_primary_outside_replica_scope(self):
+        self.assertEqual(Group.objects.all().db, DEFAULT_DB_ALIAS)
+
+    def test_should_read_from_replica_inside_replica_scope(self):
+        with read_replica.read_replica():
+            self.assertEqual(Group.objects.all().db, 'replica')
+        self.assertEqual(Group.objects.all().db, DEFAULT_DB_ALIAS)
+
+    def test_should_write_on_primary_inside_replica_scope(self):
+        with read_replica.read_replica():
+            self.assertEqual(read_replica.ReadReplicaRouter().db_for_write(Group), DEFAULT_DB_ALIAS)
+
+    def test_should_read_from_primary_inside_transaction_of_primary(self):
+        with read_replica.read_replica(), mock.patch.object(connections[DEFAULT_DB_ALIAS], 'in_atomic_block', True):
+            self.assertEqual(Group.objects.all().db, DEFAULT_DB_ALIAS)
+
+    def test_should_support_nested_scopes(self):
+        with read_replica.read_replica():
+            with read_replica.read_replica():
+                pass
+            self.assertEqual(Group.objects.all().db, 'replica')
+
+    def test_should_read_from_primary_inside_primary_scope(self):
+        with read_replica.read_replica():
+            with read_replica.read_primary():
+                self.assertEqual(Group.objects.all().db, DEFAULT_DB_ALIAS)
+            self.assertEqual(Group.objects.all().db, 'replica')
+
+    @override_settings(DATABASE_REPLICA_ALIAS=None)
+    def test_should_read_from_primary_when_no_replica_is_configured(self):
+        with read_replica.read_replica():
+            self.assertEqual(Group.objects.all().db, DEFAULT_DB_ALIAS)
+
+
+@skipUnless('replica' in settings.DATABASES, "No replica database configured (see DATABASE_REPLICA_HOST)")
+@override_settings(DATABASE_REPLICA_ALIAS='replica')
+class TestReadReplicaQueries(TransactionTestCase):
+    # Not a TestCase : inside its transaction of the primary, the reads are kept on the primary
+    databases = {DEFAULT_DB_ALIAS, 'replica'}
+
+    def test_should_execute_reads_of_replica_scope_on_replica_connection(self):
+        with CaptureQueriesContext(connections['replica']) as replica_queries, \
+                CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary_queries:
+            with read_replica.read_replica():
+                list(Group.objects.all())
+
+        self.assertEqual(len(replica_queries), 1)
+        self.assertIn('auth_group', replica_queries[0]['sql'])
+        self.assertEqual(len(primary_queries), 0)
+
+    def test_should_execute_writes_of_replica_scope_on_primary_connection(self):
+        with CaptureQueriesContext(connections['replica']) as replica_queries, \
+                CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary_queries:
+            with read_replica.read_replica():
+                Group.objects.create(name="replica_scope")
+
+        self.assertEqual(len(replica_queries), 0)
+        self.assertTrue(any('INSERT' in query['sql'] for query in primary_queries.captured_queries))
+
+
+@override_settings(DATABASE_REPLICA_ALIAS='replica', REPLICA_READ_YOUR_WRITES_DELAY=10)
+class TestReadReplicaMiddleware(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.reads_from = None
+
+    def _build_request(self, method='get', authenticated=True, with_session=True):
+        request = getattr(self.factory, method)('/')
+        request.session = SessionBase()
+        if with_session:
+            request.session['_auth_user_id'] = '1'
+        request.user = mock.Mock(is_authenticated=authenticated)
+        return request
+
+    def _call(self, request, view, status=200):
+        def get_response(req):
+            middleware.process_view(req, view, (), {})
+            self.reads_from = Group.objects.all().db
+            return HttpResponse(status=status)
+
+        middleware = ReadReplicaMiddleware(get_response)
+        return middleware(request)
+
+    def test_read_only_view_should_read_from_replica(self):
+        self._call(self._build_request(), read_replica.read_only_view(lambda request: None))
+
+        self.assertEqual(self.reads_from, 'replica')
+        self.assertEqual(Group.objects.all().db, DEFAULT_DB_ALIAS)
+
+    def test_other_views_should_read_from_primary(self):
+        self._call(self._build_request(), lambda request: None)
+
+        self.assertEqual(self.reads_from, DEFAULT_DB_ALIAS)
+
+    def test_read_only_view_should_read_from_primary_when_session_is_pinned(self):
+        request = self._build_request()
+        request.session[read_replica.PRIMARY_PINNED_UNTIL_SESSION_KEY] = time.time() + 5
+
+        self._call(request, read_replica.read_only_view(lambda request: None))
+
+        self.assertEqual(self.reads_from, DEFAULT_DB_ALIAS)
+
+    def test_should_pin_session_after_successful_write(self):
+        request = self._build_request(method='post')
+
+        self._call(request, lambda request: None)
+
+        self.assertTrue(read_replica.is_pinned_to_primary(request))
+
+    def test_should_not_pin_session_after_read_failed_write_or_write_without_session(self):
+        requests_and_status = [
+            (self._build_request(method='get'), 200),
+            (self._build_request(method='post'), 400),
+            (self._build_request(method='post', authenticated=False), 200),
+            (self._build_request(method='post', with_session=False), 200),
+        ]
+        for request, status in requests_and_status:
+            with self.subTest(method=request.method, status=status):
+                self._call(request, lambda request: None, status=status)
+                self.assertFalse(read_replica.is_pinned_to_primary(request))
+
+    def test_should_leave_replica_scope_when_view_raises(self):
+        def get_response(req):
+            middleware.process_view(req, read_replica.read_only_view(lambda request: None), (), {})
+            raise ValueError
+
+        middleware = ReadReplicaMiddleware(get_response)
+        with self.assertRaises(ValueError):
+            middleware(self._build_request())
+
+        self.assertEqual(Group.objects.all().db, DEFAULT_DB_ALIAS)
+
+
+class TestReadOnlyView(SimpleTestCase):
+    def test_should_mark_view_as_non_atomic(self):
+        view = read_replica.read_only_view(lambda request: None)
+
+        self.assertTrue(read_replica.is_read_only_view(view))
+        self.assertIn(DEFAULT_DB_ALIAS, view._non_atomic_requests)
@@ -0,0 +1,81 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.test import SimpleTestCase, TestCase
+
+from base.forms.utils.filter_field import filter_field_by_search_text
+from base.models.learning_unit_year import LearningUnitYear
+from base.tests.factories.learning_container_year import LearningContainerYearFactory
+from base.tests.factories.learning_unit_year import LearningUnitYearFactory
+from base.utils import search_text
+
+
+class TestNormalize(SimpleTestCase):
+    def test_should_remove_accents_and_lowercase(self):
+        self.assertEqual(search_text.normalize("Économie ÉLÉMENTAIRE"), "economie elementaire")
+
+    def test_should_join_values_and_ignore_empty_ones(self):
+        self.assertEqual(search_text.normalize("Droit", None, "", "Pénal"), "droit penal")
+
+
+class TestFilterFieldBySearchText(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.learning_unit_year = LearningUnitYearFactory(
+            learning_container_year__common_title="Chimie générale",
+            specific_title="Travaux pratiques",
+        )
+        cls.other_learning_unit_year = LearningUnitYearFactory(
+            learning_container_year__common_title="Physique",
+            specific_title="Électricité",
+        )
+
+    def test_search_title_should_be_synchronized_on_save(self):
+        self.learning_unit_year.refresh_from_db()
+        self.assertEqual(self.learning_unit_year.search_title, "chimie generale - travaux pratiques")
+
+    def test_search_title_should_follow_container_title(self):
+        container = self.learning_unit_year.learning_container_year
+        container.common_title = "Biologie"
+        container.save()
+
+        self.learning_unit_year.refresh_from_db()
+        self.assertEqual(self.learning_unit_year.search_title, "biologie - travaux pratiques")
+
+    def test_should_match_every_word_regardless_of_accents_and_case(self):
+        qs = filter_field_by_search_text(LearningUnitYear.objects.all(), 'title', "GENERALE chimie")
+        self.assertCountEqual(qs, [self.learning_unit_year])
+
+    def test_should_not_filter_when_value_is_blank(self):
+        qs = filter_field_by_search_text(LearningUnitYear.objects.all(), 'title', " ")
+        self.assertCountEqual(qs, [self.learning_unit_year, self.other_learning_unit_year])
+
+    def test_should_order_by_relevance(self):
+        best_match = LearningUnitYearFactory(
+            learning_container_year=LearningContainerYearFactory(common_title="Electricite"),
+            specific_title="",
+        )
+        qs = filter_field_by_search_text(LearningUnitYear.objects.all(), 'title', "electricite")
+        self.assertEqual(list(qs), [best_match, self.other_learning_unit_year])
@@ -29,6 +29,7 @@ from django.test import TestCase
 
 from base.models.education_group_year import EducationGroupYear
 from base.models.learning_unit_year import LearningUnitYear
+from base.models.person import Person
 from base.tests.factories.education_group_year import EducationGroupYearFactory
 from base.tests.factories.learning_unit_year import LearningUnitYearFactory
 from base.tests.factories.person import PersonWithPermissionsFactory
@@ -153,9 +154,10 @@ class TestSendMessage(TestCase):
     @patch("osis_common.messaging.send_message.send_messages")
     @patch("osis_common.messaging.message_config.create_table")
     def test_with_one_enrollment(self, mock_create_table, mock_send_messages):
-        send_mail.send_message_after_all_encoded_by_manager(
-            [self.person_1, self.person_without_language],
-            [self.exam_enrollment_1],
+        mock_send_messages.return_value = None
+        send_mail.deliver_message_after_all_encoded_by_manager(
+            [self.person_1.id, self.person_without_language.id],
+            [self.exam_enrollment_1.id],
             self.learning_unit_year.acronym,
             self.educ_group_year.acronym,
             [self.exam_enrollment_1.id],
@@ -189,6 +191,39 @@ class TestSendMessage(TestCase):
         self.assertEqual(args.get('txt_template_ref'),
                          "{}_txt".format(send_mail.ASSESSMENTS_ALL_SCORES_BY_PGM_MANAGER))
 
+    @patch("base.utils.send_mail.outbox.enqueue")
+    def test_message_after_all_encoded_by_manager_is_recorded_in_outbox(self, mock_enqueue):
+        send_mail.send_message_after_all_encoded_by_manager(
+            [self.person_1],
+            [self.exam_enrollment_1],
+            self.learning_unit_year.acronym,
+            self.educ_group_year.acronym,
+            [self.exam_enrollment_1.id],
+            False,
+            cc=[self.person_2, Person(email="address@test.com")]
+        )
+        args, kwargs = mock_enqueue.call_args
+        self.assertEqual(args[0], send_mail.deliver_message_after_all_encoded_by_manager)
+        self.assertEqual(kwargs['receiver_ids'], [self.person_1.id])
+        self.assertEqual(kwargs['enrollment_ids'], [self.exam_enrollment_1.id])
+        self.assertEqual(kwargs['cc_person_ids'], [self.person_2.id])
+        self.assertEqual(kwargs['cc_emails'], ["address@test.com"])
+
+    @patch("base.utils.send_mail.outbox.enqueue")
+    def test_message_after_all_encoded_by_manager_is_recorded_once_by_language(self, mock_enqueue):
+        send_mail.send_message_after_all_encoded_by_manager(
+            [self.person_1, self.person_2, self.person_without_language],
+            [self.exam_enrollment_1],
+            self.learning_unit_year.acronym,
+            self.educ_group_year.acronym,
+            [self.exam_enrollment_1.id],
+            False,
+        )
+        self.assertCountEqual(
+            [call_kwargs['receiver_ids'] for _args, call_kwargs in mock_enqueue.call_args_list],
+            [[self.person_2.id], [self.person_1.id, self.person_without_language.id]]
+        )
+
     @patch("osis_common.messaging.send_message.send_messages")
     def test_send_mail_for_educational_information_update(self, mock_send_messages):
         add_message_template_html_education_update()
@@ -201,11 +236,12 @@ class TestSendMessage(TestCase):
     @patch("osis_common.messaging.send_message.send_messages")
     @patch("osis_common.messaging.message_config.create_table")
     def test_send_mail_after_scores_submission(self, mock_create_table, mock_send_messages):
+        mock_send_messages.return_value = None
         for person in self.persons:
-            send_mail.send_mail_after_scores_submission(
-                [person],
+            send_mail.deliver_mail_after_scores_submission(
+                person.id,
                 self.learning_unit_year.acronym,
-                [self.exam_enrollment_1],
+                [self.exam_enrollment_1.id],
                 True
             )
             args = mock_create_table.call_args[0]
@@ -232,6 +268,21 @@ class TestSendMessage(TestCase):
                              "{}_txt".format(send_mail.ASSESSMENTS_SCORES_SUBMISSION_MESSAGE_TEMPLATE))
             self.assertEqual(self.learning_unit_year.acronym, args.get('template_base_data').get('learning_unit_name'))
 
+    @patch("base.utils.send_mail.outbox.enqueue")
+    def test_mail_after_scores_submission_is_recorded_in_outbox_by_teacher(self, mock_enqueue):
+        send_mail.send_mail_after_scores_submission(
+            self.persons,
+            self.learning_unit_year.acronym,
+            [self.exam_enrollment_1],
+            False
+        )
+        self.assertEqual(mock_enqueue.call_count, 2)
+        args, kwargs = mock_enqueue.call_args
+        self.assertEqual(args[0], send_mail.deliver_mail_after_scores_submission)
+        self.assertEqual(kwargs['receiver_id'], self.person_2.id)
+        self.assertEqual(kwargs['submitted_enrollment_ids'], [self.exam_enrollment_1.id])
+        self.assertFalse(kwargs['all_encoded'])
+
     def test_get_encoding_status_not_all_encoded(self):
         self.assertEqual(send_mail._get_encoding_status(LANGUAGE_CODE_EN, False), 'It remains notes to encode.')
         self.assertEqual(send_mail._get_encoding_status(LANGUAGE_CODE_FR, False),
@@ -28,7 +28,7 @@ from django.test import TestCase
 from django.urls import reverse
 
 from base.models.entity_version import EntityVersion
-from base.models.enums.education_group_types import TrainingType
+from base.models.enums.education_group_types import TrainingType, GroupType
 from base.models.group_element_year import GroupElementYear
 from base.tests.factories.academic_year import AcademicYearFactory
 from base.tests.factories.business.entities import EntitiesHierarchyFactory
@@ -146,6 +146,43 @@ class TestFilter(TestCase):
             [],
         )
 
+    def test_should_return_learning_unit_borrowed_by_specific_faculty(self):
+        gey = self.generate_group_element_year(
+            self.entities_hierarchy.school_2_1_1.entity,
+            self.entities_hierarchy.school_1_1_1.entity
+        )
+        response = self.client.get(
+            self.url,
+            self.generate_get_data(borrowing_faculty=self.entities_hierarchy.faculty_2_1)
+        )
+        self.assertQuerysetEqual(
+            response.context["page_obj"].object_list,
+            [gey.child_element.learning_unit_year],
+            transform=lambda obj: obj
+        )
+
+    def test_should_only_consider_management_entity_of_root_trainings(self):
+        common_core_link = GroupElementYearChildLeafFactory(
+            parent_element__group_year__education_group_type__name=GroupType.COMMON_CORE.name,
+            parent_element__group_year__academic_year=self.academic_year,
+            parent_element__group_year__management_entity=self.entities_hierarchy.faculty_1_1.entity,
+            child_element__learning_unit_year__academic_year=self.academic_year,
+            child_element__learning_unit_year__learning_container_year__requirement_entity=
+            self.entities_hierarchy.school_2_1_1.entity
+        )
+        GroupElementYearFactory(
+            parent_element__group_year__education_group_type__name=TrainingType.BACHELOR.name,
+            parent_element__group_year__academic_year=self.academic_year,
+            parent_element__group_year__management_entity=self.entities_hierarchy.faculty_2_1.entity,
+            child_element=common_core_link.parent_element,
+        )
+
+        response = self.client.get(self.url, self.generate_get_data())
+        self.assertQuerysetEqual(
+            response.context["page_obj"].object_list,
+            [],
+        )
+
     def generate_get_data(self, borrowing_faculty: EntityVersion = None):
         data = {"academic_year": self.academic_year.id}
         if borrowing_faculty:
@@ -30,6 +30,7 @@ from django.http import HttpResponseForbidden
 from django.test import TestCase, Client
 from django.urls import reverse
 
+from base.business.revision_history import LEARNING_UNIT_YEAR
 from base.models.enums import learning_unit_year_subtypes, learning_container_year_types
 from base.models.enums.groups import UE_FACULTY_MANAGER_GROUP, FACULTY_MANAGER_GROUP
 from base.tests.business.test_perms import create_person_with_permission_and_group
@@ -76,21 +77,21 @@ class TestLearningUnitDetailView(TestCase):
             academic_year=self.current_academic_year,
         )
         LearningComponentYearFactory(learning_unit_year=learning_unit_year)
+        history_url = reverse('revision_history', args=[LEARNING_UNIT_YEAR, learning_unit_year.pk])
 
         response = self.client.get(reverse('learning_unit', args=[learning_unit_year.pk]))
-        self.assertEqual(len(response.context['versions']), 0)
+        self.assertEqual(response.context['history_url'], history_url)
+        self.assertEqual(len(self.client.get(history_url).context['history']), 0)
 
         with reversion.create_revision():
             learning_unit_year.learning_container_year.save()
 
-        response = self.client.get(reverse('learning_unit', args=[learning_unit_year.pk]))
-        self.assertEqual(len(response.context['versions']), 1)
+        self.assertEqual(len(self.client.get(history_url).context['history']), 1)
 
         with reversion.create_revision():
             learning_unit_year.learningcomponentyear_set.first().save()
 
-        response = self.client.get(reverse('learning_unit', args=[learning_unit_year.pk]))
-        self.assertEqual(len(response.context['versions']), 2)
+        self.assertEqual(len(self.client.get(history_url).context['history']), 2)
 
     def test_external_learning_unit_read(self):
         external_learning_unit_year = ExternalLearningUnitYearFactory(
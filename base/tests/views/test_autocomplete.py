@@ -140,6 +140,18 @@ class TestCountryAutocomplete(TestCase):
 
         self.assertListEqual(results, expected_results)
 
+    def test_should_rank_results_by_relevance(self):
+        country_containing_query = CountryFactory(name="Kingdom of Narnia and beyond")
+        self.client.force_login(user=self.super_user)
+        response = self.client.get(self.url, data={'q': 'narnia'})
+
+        results = _get_results_from_autocomplete_response(response)
+
+        self.assertListEqual(
+            [result['id'] for result in results],
+            [str(self.country.pk), str(country_containing_query.pk)]
+        )
+
 
 class TestCampusAutocomplete(TestCase):
     @classmethod
@@ -499,6 +499,21 @@ class TestGroupActionsOnProposals(TestCase):
         self.assertEqual(author, self.person)
         self.assertFalse(research_criteria)
 
+    @mock.patch("base.business.learning_unit_proposal.ASYNC_CONSOLIDATION_THRESHOLD", 0)
+    @mock.patch("base.business.learning_unit_proposal.consolidate_proposals_and_send_report")
+    @mock.patch("base.business.learning_unit_proposal.consolidate_proposals_async",
+                side_effect=lambda proposals, author, research_criteria: {})
+    def test_when_action_is_consolidate_with_many_proposals(self, mock_consolidate_async, mock_consolidate):
+        post_data = {
+            "action": ACTION_CONSOLIDATE,
+            "selected_action": [self.proposals[0].learning_unit_year.acronym]
+        }
+        self.client.post(self.url, data=post_data, follow=True)
+
+        proposals, author, research_criteria = mock_consolidate_async.call_args[0]
+        self.assertEqual(list(proposals), [self.proposals[0]])
+        self.assertFalse(mock_consolidate.called)
+
     @mock.patch("base.business.learning_unit_proposal.force_state_of_proposals",
                 side_effect=lambda proposals, author, research_criteria: {})
     def test_when_action_is_force_state_but_no_new_state(self, mock_force_state):
@@ -0,0 +1,69 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import reversion
+from django.http import HttpResponse
+from django.test import TestCase
+from django.urls import reverse
+
+from base.business.revision_history import LEARNING_UNIT_YEAR
+from base.tests.factories.learning_unit_year import LearningUnitYearFullFactory
+from base.tests.factories.person import PersonFactory
+from base.tests.factories.user import SuperUserFactory
+from base.views.revision_history import RevisionHistoryView
+
+
+class RevisionHistoryViewTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.learning_unit_year = LearningUnitYearFullFactory()
+        cls.url = reverse('revision_history', args=[LEARNING_UNIT_YEAR, cls.learning_unit_year.pk])
+        cls.superuser = SuperUserFactory()
+
+    def setUp(self):
+        self.client.force_login(self.superuser)
+
+    def test_forbidden_without_permission(self):
+        self.client.force_login(PersonFactory().user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
+
+    def test_unknown_aggregate_type(self):
+        response = self.client.get(reverse('revision_history', args=['UNKNOWN', self.learning_unit_year.pk]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_history_is_paginated(self):
+        for _ in range(RevisionHistoryView.paginate_by + 1):
+            with reversion.create_revision():
+                self.learning_unit_year.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HttpResponse.status_code)
+        self.assertTemplateUsed(response, "blocks/panel/revision_history_rows.html")
+        self.assertEqual(len(response.context['history']), RevisionHistoryView.paginate_by)
+        self.assertTrue(response.context['page_obj'].has_next())
+
+        response = self.client.get(self.url, data={'page': 2})
+        self.assertEqual(len(response.context['history']), 1)
@@ -49,6 +49,8 @@ from base.views import learning_achievement, search, user_list
 from base.views import learning_unit, offer, common, institution, organization, academic_calendar, \
     my_osis, student
 from base.views import teaching_material
+from base.utils.read_replica import read_only_view
+from base.views.revision_history import RevisionHistoryView
 from base.views.learning_units.detail import DetailLearningUnitYearView, DetailLearningUnitYearViewBySlug
 from base.views.learning_units.external import create as create_external
 from base.views.learning_units.pedagogy.publish import publish_and_access_publication
@@ -120,6 +122,12 @@ urlpatterns = [
 
     url(r'^catalog/$', common.catalog, name='catalog'),
 
+    path(
+        'revision_history/<str:aggregate_type>/<int:aggregate_id>/',
+        RevisionHistoryView.as_view(),
+        name='revision_history'
+    ),
+
     url(r'^entities/', include([
         url(r'^$', institution.entities_search, name='entities'),
         url(r'^(?P<entity_version_id>[0-9]+)/', include([
@@ -136,21 +144,26 @@ urlpatterns = [
     ])),
 
     url(r'^learning_units/', include([
-        url(r'^by_activity/', base.views.learning_units.search.simple.LearningUnitSearch.as_view(),
+        url(r'^by_activity/',
+            read_only_view(base.views.learning_units.search.simple.LearningUnitSearch.as_view()),
             name='learning_units'),
-        url(r'^by_service_course/', base.views.learning_units.search.service_course.ServiceCourseSearch.as_view(),
+        url(r'^by_service_course/',
+            read_only_view(base.views.learning_units.search.service_course.ServiceCourseSearch.as_view()),
             name='learning_units_service_course'),
         url(r'^by_proposal/', base.views.learning_units.search.proposal.SearchLearningUnitProposal.as_view(),
             name='learning_units_proposal'),
-        url(r'^by_borrowed_course/', base.views.learning_units.search.borrowed.BorrowedLearningUnitSearch.as_view(),
+        url(r'^by_borrowed_course/',
+            read_only_view(base.views.learning_units.search.borrowed.BorrowedLearningUnitSearch.as_view()),
             name='learning_units_borrowed_course'),
         url(r'^by_summary/',
-            base.views.learning_units.search.educational_information.LearningUnitDescriptionFicheSearch.as_view(),
+            read_only_view(
+                base.views.learning_units.search.educational_information.LearningUnitDescriptionFicheSearch.as_view()
+            ),
             name='learning_units_summary'),
         url(r'^by_external/', include([
             url(
                 r'^$',
-                base.views.learning_units.search.external.ExternalLearningUnitSearch.as_view(),
+                read_only_view(base.views.learning_units.search.external.ExternalLearningUnitSearch.as_view()),
                 name='learning_units_external'
             ),
             url(
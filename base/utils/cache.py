@@ -144,6 +144,60 @@ class SearchParametersCache(OsisCache):
         return "_".join([self.PREFIX_KEY, str(self.user.id), self.objects_class])
 
 
+class NavigationSnapshotCache(OsisCache):
+    """
+    Ordered results of the last search of the user, so that the previous/next navigation on detail pages
+    does not have to run the search again.
+    Each row is a tuple (id, code, year, title, version_label).
+    """
+    PREFIX_KEY = "navigation_"
+    EXCLUDED_PARAMETERS = ('page', 'xls_status')
+
+    def __init__(self, user, objects_class):
+        self.user = user
+        self.objects_class = objects_class
+
+    @property
+    def key(self):
+        return "_".join([self.PREFIX_KEY, str(self.user.id), self.objects_class])
+
+    def is_up_to_date(self, search_parameters) -> bool:
+        cached_data = self.cached_data
+        return bool(cached_data) and cached_data['search_parameters'] == self._normalize(search_parameters)
+
+    def save_snapshot(self, search_parameters, rows):
+        rows = [tuple(row) for row in rows]
+        self.set_cached_data({
+            'search_parameters': self._normalize(search_parameters),
+            'positions': {row[0]: index for index, row in enumerate(rows)},
+            'rows': rows,
+        })
+
+    def get_neighbours(self, search_parameters, obj_id: int):
+        """
+        :return: The tuple (previous row, next row) of the object or None when the snapshot does not match the
+        search parameters or does not contain the object.
+        """
+        if not self.is_up_to_date(search_parameters):
+            return None
+        cached_data = self.cached_data
+        position = cached_data['positions'].get(obj_id)
+        if position is None:
+            return None
+        rows = cached_data['rows']
+        previous_row = rows[position - 1] if position > 0 else None
+        next_row = rows[position + 1] if position + 1 < len(rows) else None
+        return previous_row, next_row
+
+    @classmethod
+    def _normalize(cls, search_parameters) -> dict:
+        if hasattr(search_parameters, 'lists'):
+            items = search_parameters.lists()
+        else:
+            items = ((key, value if isinstance(value, list) else [value]) for key, value in search_parameters.items())
+        return {key: [str(v) for v in value] for key, value in items if key not in cls.EXCLUDED_PARAMETERS}
+
+
 class ElementCache(OsisCache):
     PREFIX_KEY = 'select_element_{user}'
 
@@ -0,0 +1,108 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import logging
+import time
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Stop calling a remote service after 'failure_threshold' consecutive failures. The circuit stays open during
+    'recovery_timeout' seconds, then calls are let through again: a success closes the circuit and a failure
+    reopens it. The state is kept in the cache, shared by the processes using the same cache backend.
+    'is_failure' tells which exceptions mean that the service is unavailable (all of them by default) : the others
+    are raised without being counted.
+    """
+    PREFIX_KEY = 'circuit_breaker_{name}'
+
+    def __init__(
+            self,
+            name: str,
+            failure_threshold: int = 5,
+            recovery_timeout: int = 60,
+            is_failure: Callable[[Exception], bool] = None
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.is_failure = is_failure
+
+    @property
+    def key(self) -> str:
+        return self.PREFIX_KEY.format(name=self.name)
+
+    @property
+    def failures_key(self) -> str:
+        return "{}_failures".format(self.key)
+
+    @property
+    def opened_until_key(self) -> str:
+        return "{}_opened_until".format(self.key)
+
+    @property
+    def is_open(self) -> bool:
+        opened_until = cache.get(self.opened_until_key)
+        return opened_until is not None and opened_until > time.time()
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        if self.is_open:
+            raise CircuitOpenError("Circuit '{}' is open".format(self.name))
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if self.is_failure is None or self.is_failure(e):
+                self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    def record_failure(self) -> None:
+        # Atomic increment : the failures can be recorded by concurrent processes
+        cache.add(self.failures_key, 0, timeout=None)
+        try:
+            failures = cache.incr(self.failures_key)
+        except ValueError:
+            # Key evicted between add() and incr()
+            failures = 1
+            cache.set(self.failures_key, failures, timeout=None)
+        if failures >= self.failure_threshold:
+            logger.warning("[Circuit breaker] Circuit '{}' opened after {} failures".format(self.name, failures))
+            cache.set(self.opened_until_key, time.time() + self.recovery_timeout, timeout=None)
+
+    def record_success(self) -> None:
+        cache.delete_many([self.failures_key, self.opened_until_key])
+
+    def reset(self) -> None:
+        self.record_success()
@@ -0,0 +1,81 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import contextlib
+import threading
+from typing import Any, Callable, Hashable
+
+_local = threading.local()
+
+
+@contextlib.contextmanager
+def scope():
+    """
+    Inside this scope, an entity loaded through get_or_load() is loaded only once : the same instance is returned
+    to every caller. Nested scopes share the outermost one.
+    """
+    if getattr(_local, 'entities', None) is not None:
+        yield
+        return
+    _local.entities = {}
+    try:
+        yield
+    finally:
+        _local.entities = None
+
+
+@contextlib.contextmanager
+def discard_on_error():
+    """
+    Clear the current scope when the block fails : its entities may have been modified in memory only and must not be
+    reused by the next commands.
+    """
+    try:
+        yield
+    except Exception:
+        clear()
+        raise
+
+
+def get_or_load(repository: Any, entity_id: Hashable, loader: Callable[[Hashable], Any]) -> Any:
+    entities = getattr(_local, 'entities', None)
+    if entities is None:
+        return loader(entity_id)
+    key = (repository, entity_id)
+    if key not in entities:
+        entities[key] = loader(entity_id)
+    return entities[key]
+
+
+def discard(repository: Any, entity_id: Hashable) -> None:
+    entities = getattr(_local, 'entities', None)
+    if entities:
+        entities.pop((repository, entity_id), None)
+
+
+def clear() -> None:
+    entities = getattr(_local, 'entities', None)
+    if entities:
+        entities.clear()
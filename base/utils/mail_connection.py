@@ -0,0 +1,69 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+
+_state = threading.local()
+
+
+def _get_delivery_connection(**kwargs) -> BaseEmailBackend:
+    return mail.get_connection(backend=settings.EMAIL_DELIVERY_BACKEND, **kwargs)
+
+
+@contextmanager
+def shared_connection():
+    """
+    Send all the emails of the block over a single connection of EMAIL_DELIVERY_BACKEND (e.g. one SMTP session
+    for a batch of messages instead of one session by message).
+    """
+    connection = _get_delivery_connection()
+    connection.open()
+    _state.connection = connection
+    try:
+        yield connection
+    finally:
+        _state.connection = None
+        connection.close()
+
+
+class SharedConnectionEmailBackend(BaseEmailBackend):
+    """
+    Email backend (EMAIL_BACKEND) which sends over the connection opened by shared_connection() when there is one,
+    else over a new connection of EMAIL_DELIVERY_BACKEND.
+    """
+    def __init__(self, fail_silently=False, **kwargs):
+        super().__init__(fail_silently=fail_silently)
+        self.kwargs = kwargs
+
+    def send_messages(self, email_messages):
+        connection = getattr(_state, 'connection', None)
+        if connection is None:
+            connection = _get_delivery_connection(fail_silently=self.fail_silently, **self.kwargs)
+        return connection.send_messages(email_messages)
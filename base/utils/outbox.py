@@ -0,0 +1,129 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+"""
+DB-backed outbox for outbound mails recorded with enqueue() (for now, the mails of the scores encoding): messages
+are written in the transaction of the request and delivered by the 'base.tasks.deliver_outbox_messages' worker,
+with retries and dead-letter. A sender must send a single message, so that a retry never sends again what was
+already delivered.
+The pending messages are claimed in a short transaction and sent out of it, over a single mail connection.
+"""
+import datetime
+import logging
+from typing import Callable, Dict, List
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from base.models.enums.outbox_message_status import OutboxMessageStatus
+from base.models.outbox_message import OutboxMessage
+from base.utils import mail_connection
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+BATCH_SIZE = 50
+MAX_ATTEMPTS = 5
+RETRY_DELAY = datetime.timedelta(minutes=1)
+# A claimed message which is neither sent nor failed after this delay (e.g. the worker was killed) is delivered again
+CLAIM_TIMEOUT = datetime.timedelta(minutes=15)
+
+
+class OutboxDeliveryError(Exception):
+    pass
+
+
+def enqueue(sender: Callable, **sender_kwargs) -> OutboxMessage:
+    """
+    :param sender: Function which builds and sends the message. Its return value is considered as an error message.
+    :param sender_kwargs: JSON serializable arguments of the sender (ids rather than model instances)
+    """
+    outbox_message = OutboxMessage.objects.create(
+        sender="{}.{}".format(sender.__module__, sender.__name__),
+        sender_kwargs=sender_kwargs,
+    )
+    transaction.on_commit(_schedule_delivery)
+    return outbox_message
+
+
+def _schedule_delivery():
+    from base.tasks import deliver_outbox_messages
+    deliver_outbox_messages.run.delay()
+
+
+def deliver_pending_messages(batch_size: int = BATCH_SIZE) -> Dict[str, int]:
+    result = {OutboxMessageStatus.SENT.name: 0, OutboxMessageStatus.PENDING.name: 0,
+              OutboxMessageStatus.DEAD_LETTER.name: 0}
+    outbox_messages = claim_pending_messages(batch_size)
+    if not outbox_messages:
+        return result
+    with mail_connection.shared_connection():
+        for outbox_message in outbox_messages:
+            deliver(outbox_message)
+            result[outbox_message.status] += 1
+    return result
+
+
+def claim_pending_messages(batch_size: int = BATCH_SIZE) -> List[OutboxMessage]:
+    """
+    The next attempt of the claimed messages is postponed, so that the other workers skip them while they are sent
+    """
+    with transaction.atomic():
+        outbox_messages = list(
+            OutboxMessage.objects.select_for_update(skip_locked=True).filter(
+                status=OutboxMessageStatus.PENDING.name,
+                next_attempt_at__lte=timezone.now(),
+            ).order_by('created_at')[:batch_size]
+        )
+        OutboxMessage.objects.filter(
+            pk__in=[outbox_message.pk for outbox_message in outbox_messages]
+        ).update(next_attempt_at=timezone.now() + CLAIM_TIMEOUT)
+    return outbox_messages
+
+
+def deliver(outbox_message: OutboxMessage) -> None:
+    try:
+        with transaction.atomic():
+            error_message = import_string(outbox_message.sender)(**outbox_message.sender_kwargs)
+            if error_message:
+                raise OutboxDeliveryError(error_message)
+    # General catch to be sure to not stop the delivery of the other messages
+    except Exception as err:
+        logger.exception("Delivery of outbox message %s failed", outbox_message.pk)
+        _mark_as_failed(outbox_message, str(err))
+    else:
+        outbox_message.status = OutboxMessageStatus.SENT.name
+        outbox_message.sent_at = timezone.now()
+    outbox_message.save()
+
+
+def _mark_as_failed(outbox_message: OutboxMessage, error: str) -> None:
+    outbox_message.attempts += 1
+    outbox_message.last_error = error
+    if outbox_message.attempts >= MAX_ATTEMPTS:
+        outbox_message.status = OutboxMessageStatus.DEAD_LETTER.name
+    else:
+        outbox_message.next_attempt_at = timezone.now() + RETRY_DELAY * 2 ** (outbox_message.attempts - 1)
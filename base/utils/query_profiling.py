@@ -0,0 +1,155 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import collections
+import contextlib
+import json
+import re
+import time
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import connection
+
+_STRING_LITERAL_REGEX = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_REGEX = re.compile(r"\b\d+(\.\d+)?\b")
+_VALUES_LIST_REGEX = re.compile(r"\((?:\s*\?\s*,)*\s*\?\s*\)")
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class QueryBudget:
+    def __init__(self, max_queries: int, max_duplicates: Optional[int] = None):
+        self.max_queries = max_queries
+        self.max_duplicates = max_duplicates
+
+    def check(self, report: 'ProfilingReport', label: str) -> None:
+        errors = []
+        if report.query_count > self.max_queries:
+            errors.append("{} queries (budget: {})".format(report.query_count, self.max_queries))
+        if self.max_duplicates is not None and report.duplicate_count > self.max_duplicates:
+            errors.append("{} duplicated queries (budget: {})".format(report.duplicate_count, self.max_duplicates))
+        if errors:
+            raise QueryBudgetExceeded("{} exceeds its query budget: {}\n{}".format(
+                label,
+                ", ".join(errors),
+                "\n".join(
+                    "{} x {}".format(count, fingerprint) for fingerprint, count in report.get_duplicates()
+                ),
+            ))
+
+
+def query_budget(max_queries: int, max_duplicates: Optional[int] = None):
+    """
+    Declare the maximum number of SQL queries executed by a view (function or class based).
+    The budget is checked by QueryProfilingMiddleware.
+    """
+    def decorator(view):
+        view.query_budget = QueryBudget(max_queries, max_duplicates)
+        return view
+    return decorator
+
+
+def get_view_query_budget(view_func) -> Optional[QueryBudget]:
+    budget = getattr(view_func, 'query_budget', None)
+    if budget is None and hasattr(view_func, 'view_class'):
+        budget = getattr(view_func.view_class, 'query_budget', None)
+    return budget
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Normalize the parameters of a SQL query so that the same query executed with different values
+    has the same fingerprint (N+1 queries detection).
+    """
+    sql = _STRING_LITERAL_REGEX.sub("?", sql)
+    sql = _NUMBER_REGEX.sub("?", sql).replace("%s", "?")
+    sql = _VALUES_LIST_REGEX.sub("(...)", sql)
+    return " ".join(sql.split())
+
+
+class ProfilingReport:
+    def __init__(self):
+        self.fingerprints = collections.Counter()  # type: Dict[str, int]
+        self.db_time = 0.0
+        self.total_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.monotonic()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.monotonic() - start
+            self.fingerprints[fingerprint(sql)] += 1
+
+    @property
+    def query_count(self) -> int:
+        return sum(self.fingerprints.values())
+
+    @property
+    def duplicate_count(self) -> int:
+        return sum(count - 1 for count in self.fingerprints.values())
+
+    @property
+    def python_time(self) -> float:
+        return max(self.total_time - self.db_time, 0.0)
+
+    def get_duplicates(self) -> List[tuple]:
+        return [(sql, count) for sql, count in self.fingerprints.most_common() if count > 1]
+
+    def as_dict(self) -> dict:
+        return {
+            'query_count': self.query_count,
+            'duplicate_count': self.duplicate_count,
+            'db_time': round(self.db_time * 1000, 1),
+            'python_time': round(self.python_time * 1000, 1),
+            'duplicates': self.get_duplicates()[:10],
+        }
+
+
+@contextlib.contextmanager
+def profile():
+    report = ProfilingReport()
+    start = time.monotonic()
+    try:
+        with connection.execute_wrapper(report):
+            yield report
+    finally:
+        report.total_time = time.monotonic() - start
+
+
+def write_report(view_name: str, report: ProfilingReport) -> None:
+    report_file = getattr(settings, 'QUERY_PROFILING_REPORT_FILE', None)
+    if not report_file:
+        return
+    with open(report_file, 'a') as file:
+        file.write(json.dumps(dict(view=view_name, **report.as_dict())) + "\n")
+
+
+def read_reports(report_file: str) -> List[dict]:
+    with open(report_file) as file:
+        return [json.loads(line) for line in file if line.strip()]
@@ -0,0 +1,130 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+PRIMARY_PINNED_UNTIL_SESSION_KEY = '_db_primary_pinned_until'
+
+_state = threading.local()
+
+
+def get_replica_alias() -> Optional[str]:
+    return getattr(settings, 'DATABASE_REPLICA_ALIAS', None)
+
+
+def _get_depth() -> int:
+    return getattr(_state, 'depth', 0)
+
+
+def enter_replica_scope() -> None:
+    _state.depth = _get_depth() + 1
+
+
+def leave_replica_scope() -> None:
+    _state.depth = max(_get_depth() - 1, 0)
+
+
+@contextmanager
+def read_replica():
+    """
+    Send the reads executed in the block to the replica database (background exports, read-only views).
+    Writes always go to the primary database.
+    """
+    enter_replica_scope()
+    try:
+        yield
+    finally:
+        leave_replica_scope()
+
+
+@contextmanager
+def read_primary():
+    """
+    Send the reads executed in the block to the primary database, even inside a read_replica() scope
+    (e.g. when the replica did not catch up with data already seen on the primary).
+    """
+    depth = _get_depth()
+    _state.depth = 0
+    try:
+        yield
+    finally:
+        _state.depth = depth
+
+
+def is_reading_from_replica() -> bool:
+    # Inside a transaction of the primary, the reads must see the uncommitted writes of this transaction
+    return bool(get_replica_alias()) and _get_depth() > 0 and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+
+
+def read_only_view(view):
+    """
+    Mark a view (function or result of as_view()) as read-only: its queries are sent to the replica by
+    ReadReplicaMiddleware and the view is not wrapped in a transaction when ATOMIC_REQUESTS is enabled.
+    Must be the outermost decorator.
+    """
+    view.read_replica = True
+    return transaction.non_atomic_requests(view)
+
+
+def is_read_only_view(view_func) -> bool:
+    return getattr(view_func, 'read_replica', False)
+
+
+def pin_to_primary(request) -> None:
+    """
+    Read-your-writes: the next requests of the session read from the primary until the replica caught up.
+    """
+    request.session[PRIMARY_PINNED_UNTIL_SESSION_KEY] = time.time() + settings.REPLICA_READ_YOUR_WRITES_DELAY
+
+
+def is_pinned_to_primary(request) -> bool:
+    session = getattr(request, 'session', None)
+    return session is not None and session.get(PRIMARY_PINNED_UNTIL_SESSION_KEY, 0) > time.time()
+
+
+class ReadReplicaRouter:
+    """
+    Route the reads to the replica alias inside a read_replica() scope, everything else to the primary.
+    """
+    def db_for_read(self, model, **hints):
+        if is_reading_from_replica():
+            return get_replica_alias()
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
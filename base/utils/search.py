@@ -25,11 +25,12 @@
 ##############################################################################
 import urllib
 
+from django.db.models import CharField, Value
 from django.http import JsonResponse, QueryDict
 from django_filters.views import FilterView
 
 from base.templatetags import pagination
-from base.utils.cache import SearchParametersCache
+from base.utils.cache import SearchParametersCache, NavigationSnapshotCache
 
 
 class SearchMixin:
@@ -39,9 +40,12 @@ class SearchMixin:
         Add possibility to cache search parameters
 
         serializer_class: class used to serialize the resulting queryset
+        navigation_fields: fields (code, year, title, version label) of the results kept for the previous/next
+                           navigation on detail pages. No snapshot is kept when it is not set.
     """
     serializer_class = None
     cache_search = True
+    navigation_fields = None
 
     def render_to_response(self, context, **response_kwargs):
         if "application/json" in self.request.headers.get("Accept", ""):
@@ -62,9 +66,22 @@ class SearchMixin:
         context = super().get_context_data(**kwargs)
         if self.cache_search:
             SearchParametersCache(self.request.user, self.model.__name__).set_cached_data(self.request.GET)
+            if self.navigation_fields:
+                self._save_navigation_snapshot()
 
         return context
 
+    def _save_navigation_snapshot(self):
+        snapshot_cache = NavigationSnapshotCache(self.request.user, self.model.__name__)
+        # Only the page changed: the results are the same
+        if 'page' in self.request.GET and snapshot_cache.is_up_to_date(self.request.GET):
+            return
+        code_field, year_field, title_field, version_label_field = self.navigation_fields
+        rows = self.object_list.values_list(
+            'id', code_field, year_field, title_field, version_label_field or Value(None, output_field=CharField())
+        )
+        snapshot_cache.save_snapshot(self.request.GET, rows)
+
     def get_paginate_by(self, queryset):
         pagination.store_paginator_size(self.request)
         return pagination.get_paginator_size(self.request)
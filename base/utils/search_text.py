@@ -0,0 +1,55 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import unicodedata
+
+from django.contrib.postgres.indexes import GinIndex
+
+SEARCH_TEXT_FIELD = 'search_title'
+
+
+def normalize(*values) -> str:
+    """
+    Unaccented and lowercased text used by the trigram indexed search columns.
+    """
+    text = " ".join(value for value in values if value)
+    text = unicodedata.normalize('NFKD', text)
+    return "".join(character for character in text if not unicodedata.combining(character)).lower()
+
+
+def filter_queryset(queryset, value: str):
+    """
+    Keep the objects whose search column contains each word of the value.
+    """
+    for word in normalize(value).split():
+        queryset = queryset.filter(**{"{}__contains".format(SEARCH_TEXT_FIELD): word})
+    return queryset
+
+
+def trigram_index(field_name: str, name: str) -> GinIndex:
+    """
+    Index usable by 'contains', 'icontains' and 'iregex' lookups on the field (requires pg_trgm extension).
+    """
+    return GinIndex(fields=[field_name], name=name, opclasses=['gin_trgm_ops'])
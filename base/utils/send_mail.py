@@ -29,6 +29,7 @@ Utility files for mail sending
 """
 from typing import List
 import datetime
+import io
 import itertools
 
 from django.conf import settings
@@ -36,17 +37,16 @@ from django.contrib.auth.models import Permission
 from django.contrib.messages import ERROR
 from django.db.models import Q
 from django.utils import translation
-from django.utils.translation import gettext as _
+from django.utils.translation import gettext as _, gettext_lazy
 from openpyxl import Workbook
-from openpyxl.writer.excel import save_virtual_workbook
 
 from assessments.business import score_encoding_sheet
 from base.models.enums import proposal_type
 from base.models.enums.exam_enrollment_justification_type import JUSTIFICATION_TYPES
 from base.models.exam_enrollment import ExamEnrollment
 from base.models.person import Person
-from osis_common.document import paper_sheet, xls_build
-from osis_common.document.xls_build import _adjust_column_width
+from base.utils import outbox
+from osis_common.document import paper_sheet
 from osis_common.messaging import message_config, send_message as message_service
 
 EDUCATIONAL_INFORMATION_UPDATE_TXT = 'educational_information_update_txt'
@@ -56,6 +56,17 @@ EDUCATIONAL_INFORMATION_UPDATE_HTML = 'educational_information_update_html'
 ASSESSMENTS_SCORES_SUBMISSION_MESSAGE_TEMPLATE = "assessments_scores_submission"
 ASSESSMENTS_ALL_SCORES_BY_PGM_MANAGER = "assessments_all_scores_by_pgm_manager"
 
+CONSOLIDATION_OPERATION = "consolidation"
+CANCELLATION_OPERATION = "cancellation"
+PROPOSAL_REPORT_TEMPLATES_BY_OPERATION = {
+    CONSOLIDATION_OPERATION: ('learning_unit_proposal_consolidated_html', 'learning_unit_proposal_consolidated_txt'),
+    CANCELLATION_OPERATION: ('learning_unit_proposal_canceled_html', 'learning_unit_proposal_canceled_txt'),
+}
+PROPOSAL_REPORT_HEADER_TITLES = [
+    gettext_lazy('Ac yr.'), gettext_lazy('Code'), gettext_lazy('Title'), gettext_lazy('Type'),
+    gettext_lazy("Proposal status"), gettext_lazy('Status'), gettext_lazy('Reason for failure'),
+]
+
 
 def send_mail_after_scores_submission(persons: List[Person], learning_unit_name: str,
                                       submitted_enrollments: List[ExamEnrollment], all_encoded: bool):
@@ -65,9 +76,33 @@ def send_mail_after_scores_submission(persons: List[Person], learning_unit_name:
     :param learning_unit_name: The name of the learning unit for which scores were submitted
     :param submitted_enrollments : The list of newly submitted enrollments
     :param all_encoded : Tell if all the scores are encoded and submitted
-    :return An error message if the template is not in the database
+    :return None
+
+    The messages are only recorded in the outbox and sent by the worker.
+    One outbox message by teacher, so that a retry never sends again the messages already delivered.
     """
+    for person in persons:
+        outbox.enqueue(
+            deliver_mail_after_scores_submission,
+            receiver_id=person.id,
+            learning_unit_name=learning_unit_name,
+            submitted_enrollment_ids=[enrollment.id for enrollment in submitted_enrollments],
+            all_encoded=all_encoded,
+        )
+    return None
+
+
+def deliver_mail_after_scores_submission(receiver_id, learning_unit_name, submitted_enrollment_ids, all_encoded):
+    return _send_mail_after_scores_submission(
+        Person.objects.get(pk=receiver_id),
+        learning_unit_name,
+        _find_enrollments_for_message(submitted_enrollment_ids),
+        all_encoded
+    )
+
 
+def _send_mail_after_scores_submission(person: Person, learning_unit_name: str,
+                                       submitted_enrollments: List[ExamEnrollment], all_encoded: bool):
     html_template_ref = "{}_html".format(ASSESSMENTS_SCORES_SUBMISSION_MESSAGE_TEMPLATE)
     txt_template_ref = "{}_txt".format(ASSESSMENTS_SCORES_SUBMISSION_MESSAGE_TEMPLATE)
     subject_data = {'learning_unit_name': learning_unit_name}
@@ -88,25 +123,18 @@ def send_mail_after_scores_submission(persons: List[Person], learning_unit_name:
             justifications[enrollment.justification_final] if enrollment.justification_final else '',
         ) for enrollment in submitted_enrollments]
 
-    receivers = [
-        message_config.create_receiver(
-            person.id, person.email, person.language if person.language else settings.LANGUAGE_CODE
-        ) for person in persons
-    ]
-
-    for receiver in receivers:
-        table = message_config.create_table('submitted_enrollments',
-                                            get_enrollment_headers(receiver['receiver_lang']),
-                                            submitted_enrollments_data,
-                                            data_translatable=['Justification'])
-        template_base_data.update(
-            {'encoding_status': _get_encoding_status(receiver['receiver_lang'], all_encoded)
-             }
-        )
-        message_content = message_config.create_message_content(html_template_ref, txt_template_ref, [table],
-                                                                [receiver], template_base_data, subject_data)
-        message_service.send_messages(message_content)
-    return None
+    receiver = message_config.create_receiver(person.id, person.email, __get_person_lang(person))
+    table = message_config.create_table('submitted_enrollments',
+                                        get_enrollment_headers(receiver['receiver_lang']),
+                                        submitted_enrollments_data,
+                                        data_translatable=['Justification'])
+    template_base_data.update(
+        {'encoding_status': _get_encoding_status(receiver['receiver_lang'], all_encoded)
+         }
+    )
+    message_content = message_config.create_message_content(html_template_ref, txt_template_ref, [table],
+                                                            [receiver], template_base_data, subject_data)
+    return message_service.send_messages(message_content)
 
 
 def send_mail_after_the_learning_unit_year_deletion(managers, acronym: str, academic_year, msg_list):
@@ -176,21 +204,25 @@ def send_mail_after_annual_procedure_of_automatic_postponement_of_luy(
 
 
 def send_mail_cancellation_learning_unit_proposals(manager, tuple_proposals_results, research_criteria):
-    html_template_ref = 'learning_unit_proposal_canceled_html'
-    txt_template_ref = 'learning_unit_proposal_canceled_txt'
-    return _send_mail_action_learning_unit_proposal(manager, tuple_proposals_results, html_template_ref,
-                                                    txt_template_ref, "cancellation", research_criteria)
+    return send_mail_proposals_report(
+        manager,
+        _build_table_proposal_data(tuple_proposals_results),
+        CANCELLATION_OPERATION,
+        research_criteria
+    )
 
 
 def send_mail_consolidation_learning_unit_proposal(manager, tuple_proposals_results, research_criteria):
-    html_template_ref = 'learning_unit_proposal_consolidated_html'
-    txt_template_ref = 'learning_unit_proposal_consolidated_txt'
-    return _send_mail_action_learning_unit_proposal(manager, tuple_proposals_results, html_template_ref,
-                                                    txt_template_ref, "consolidation", research_criteria)
+    return send_mail_proposals_report(
+        manager,
+        _build_table_proposal_data(tuple_proposals_results),
+        CONSOLIDATION_OPERATION,
+        research_criteria
+    )
 
 
-def _send_mail_action_learning_unit_proposal(manager, tuple_proposals_results, html_template_ref, txt_template_ref,
-                                             operation, research_criteria):
+def send_mail_proposals_report(manager, report_rows, operation, research_criteria):
+    html_template_ref, txt_template_ref = PROPOSAL_REPORT_TEMPLATES_BY_OPERATION[operation]
     receivers = [message_config.create_receiver(manager.id, manager.email, manager.language)]
     suject_data = {}
     template_base_data = {
@@ -198,34 +230,28 @@ def _send_mail_action_learning_unit_proposal(manager, tuple_proposals_results, h
         "last_name": manager.last_name
     }
     attachment = ("report.xlsx",
-                  build_proposal_report_attachment(manager, tuple_proposals_results, operation, research_criteria),
+                  build_proposal_report_attachment(manager, report_rows, operation, research_criteria),
                   "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
     message_content = message_config.create_message_content(html_template_ref, txt_template_ref, None, receivers,
                                                             template_base_data, suject_data, attachment=attachment)
     return message_service.send_messages(message_content)
 
 
-# FIXME should be moved to osis_common
-def build_proposal_report_attachment(manager, proposals_with_results, operation, research_criteria):
-    table_data = _build_table_proposal_data(proposals_with_results)
-
-    xls_parameters = {
-        xls_build.LIST_DESCRIPTION_KEY: "Liste d'activités",
-        xls_build.FILENAME_KEY: 'Learning_units',
-        xls_build.USER_KEY: str(manager),
-        xls_build.WORKSHEETS_DATA: [
-            {
-                xls_build.CONTENT_KEY: table_data,
-                xls_build.HEADER_TITLES_KEY: [_('Ac yr.'), _('Code'), _('Title'), _('Type'),
-                                              _("Proposal status"), _('Status'), _('Reason for failure')],
-                xls_build.WORKSHEET_TITLE_KEY: 'Report'
-            }
-        ],
-        "operation": operation,
-        "research_criteria": research_criteria
-    }
+def build_proposal_report_attachment(manager, report_rows, operation, research_criteria):
+    """ Rows are streamed to a write-only workbook, so the whole report is never held as cells in memory """
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title='Report')
+    worksheet.append([str(title) for title in PROPOSAL_REPORT_HEADER_TITLES])
+    for row in report_rows:
+        worksheet.append([str(value) for value in row])
 
-    return _create_xls(xls_parameters)
+    worksheet_parameters = workbook.create_sheet(title=str(_('parameters')))
+    for row in _get_worksheet_parameters_rows(manager, operation, research_criteria):
+        worksheet_parameters.append([str(value) for value in row])
+
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
 
 
 def _build_table_proposal_data(proposals_with_results):
@@ -245,32 +271,15 @@ def _build_table_proposal_data(proposals_with_results):
 
 
 # FIXME should be moved to osis_common
-def _create_xls(parameters_dict):
-    workbook = Workbook(encoding='utf-8')
-    sheet_number = 0
-    for worksheet_data in parameters_dict.get(xls_build.WORKSHEETS_DATA):
-        xls_build._build_worksheet(worksheet_data, workbook, sheet_number)
-        sheet_number = sheet_number + 1
-
-    _build_worksheet_parameters(workbook, parameters_dict.get(xls_build.USER_KEY),
-                                parameters_dict.get("operation", ""), parameters_dict.get("research_criteria"))
-    return save_virtual_workbook(workbook)
-
-
-# FIXME should be moved to osis_common
-def _build_worksheet_parameters(workbook, a_user, operation, research_criteria):
-    worksheet_parameters = workbook.create_sheet(title=str(_('parameters')))
+def _get_worksheet_parameters_rows(a_user, operation, research_criteria):
     now = datetime.datetime.now()
-    worksheet_parameters.append([str(_('author')), str(a_user)])
-    worksheet_parameters.append([str(_('Date')), now.strftime('%d-%m-%Y %H:%M')])
-    worksheet_parameters.append([_('Operation'), _(operation)])
+    yield [str(_('author')), str(a_user)]
+    yield [str(_('Date')), now.strftime('%d-%m-%Y %H:%M')]
+    yield [_('Operation'), _(operation)]
     if research_criteria:
-        worksheet_parameters.append([_('Research criteria')])
+        yield [_('Research criteria')]
         for research_key, research_value in research_criteria:
-            worksheet_parameters.append(["", research_key, str(research_value)])
-
-    _adjust_column_width(worksheet_parameters)
-    return worksheet_parameters
+            yield ["", research_key, str(research_value)]
 
 
 def send_message_after_all_encoded_by_manager(
@@ -292,8 +301,73 @@ def send_message_after_all_encoded_by_manager(
     :param encoding_already_completed_before_update: Before update encoding was already complete.
     :param cc: Persons (list) need to be in copy (cc) of the emails sent
     :return: A message if an error occurred, None if it's ok
+
+    The message is only recorded in the outbox: the score sheet is built and the message is sent by the worker.
+    One outbox message by language, so that a retry never sends again the languages already delivered.
     """
+    cc = cc or []
+    receivers_by_lang = itertools.groupby(sorted(receivers, key=__get_person_lang), __get_person_lang)
+    for _lang, lang_receivers in receivers_by_lang:
+        outbox.enqueue(
+            deliver_message_after_all_encoded_by_manager,
+            receiver_ids=[person.id for person in lang_receivers],
+            enrollment_ids=[enrollment.id for enrollment in enrollments],
+            learning_unit_acronym=learning_unit_acronym,
+            offer_acronym=offer_acronym,
+            updated_enrollments_ids=list(updated_enrollments_ids),
+            encoding_already_completed_before_update=encoding_already_completed_before_update,
+            cc_person_ids=[person.id for person in cc if person.pk],
+            cc_emails=[person.email for person in cc if not person.pk],
+        )
+    return None
+
+
+def __get_person_lang(person):
+    return person.language or settings.LANGUAGE_CODE
+
 
+def deliver_message_after_all_encoded_by_manager(
+        receiver_ids,
+        enrollment_ids,
+        learning_unit_acronym,
+        offer_acronym,
+        updated_enrollments_ids,
+        encoding_already_completed_before_update,
+        cc_person_ids=None,
+        cc_emails=None
+):
+    receivers = Person.objects.filter(pk__in=receiver_ids)
+    enrollments = _find_enrollments_for_message(enrollment_ids)
+    cc = list(Person.objects.filter(pk__in=cc_person_ids or [])) + [Person(email=email) for email in cc_emails or []]
+    return _send_message_after_all_encoded_by_manager(
+        receivers,
+        enrollments,
+        learning_unit_acronym,
+        offer_acronym,
+        updated_enrollments_ids,
+        encoding_already_completed_before_update,
+        cc=cc or None
+    )
+
+
+def _find_enrollments_for_message(enrollment_ids: List[int]) -> List[ExamEnrollment]:
+    enrollments_by_id = ExamEnrollment.objects.select_related(
+        'session_exam',
+        'learning_unit_enrollment__offer_enrollment__education_group_year',
+        'learning_unit_enrollment__offer_enrollment__student__person',
+    ).in_bulk(enrollment_ids)
+    return [enrollments_by_id[enrollment_id] for enrollment_id in enrollment_ids]
+
+
+def _send_message_after_all_encoded_by_manager(
+        receivers,
+        enrollments,
+        learning_unit_acronym,
+        offer_acronym,
+        updated_enrollments_ids,
+        encoding_already_completed_before_update,
+        cc=None
+):
     html_template_ref = '{}_html'.format(ASSESSMENTS_ALL_SCORES_BY_PGM_MANAGER)
     txt_template_ref = '{}_txt'.format(ASSESSMENTS_ALL_SCORES_BY_PGM_MANAGER)
     receivers = [message_config.create_receiver(person.id, person.email, person.language) for person in receivers]
@@ -329,6 +403,7 @@ def send_message_after_all_encoded_by_manager(
         encoding_already_completed_before_update
     )
 
+    attachment = build_scores_sheet_attachment(enrollments)
     for receiver_lang, receivers in receivers_by_lang:
         receivers = list(receivers)
         table = message_config.create_table(
@@ -345,7 +420,6 @@ def send_message_after_all_encoded_by_manager(
             data_translatable=['Justification'],
         )
 
-        attachment = build_scores_sheet_attachment(enrollments)
         message_content = message_config.create_message_content(
             html_template_ref,
             txt_template_ref,
@@ -356,7 +430,10 @@ def send_message_after_all_encoded_by_manager(
             attachment,
             cc=cc,
         )
-        message_service.send_messages(message_content)
+        error_message = message_service.send_messages(message_content)
+        if error_message:
+            return error_message
+    return None
 
 
 def __order_by_lang(receiver):
@@ -33,6 +33,7 @@ from django.http import JsonResponse
 from django.utils.html import format_html
 
 from base.forms.learning_unit.entity_form import find_additional_requirement_entities_choices
+from base.forms.utils.filter_field import order_by_similarity
 from base.models.campus import Campus
 from base.models.entity_version import find_pedagogical_entities_version
 from base.models.enums.academic_calendar_type import AcademicCalendarTypes
@@ -56,10 +57,10 @@ class OrganizationAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetV
                 entity__entityversion__entityversionaddress__country=country,
             )
 
+        qs = qs.distinct().order_by('name')
         if self.q:
-            qs = qs.filter(name__icontains=self.q)
-
-        return qs.distinct().order_by('name')
+            qs = order_by_similarity(qs.filter(name__icontains=self.q), self.q, 'name')
+        return qs
 
     def get_result_label(self, result):
         return result.name
@@ -67,10 +68,10 @@ class OrganizationAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetV
 
 class CountryAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetView):
     def get_queryset(self):
-        qs = Country.objects.all()
+        qs = Country.objects.order_by('name')
         if self.q:
-            qs = qs.filter(name__icontains=self.q)
-        return qs.order_by('name')
+            qs = order_by_similarity(qs.filter(name__icontains=self.q), self.q, 'name')
+        return qs
 
 
 class CampusAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetView):
@@ -93,10 +94,14 @@ class CampusAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetView):
                 organization__entity__entityversion__entityversionaddress__country=country,
             )
 
+        qs = qs.select_related('organization').order_by('organization__name').distinct()
         if self.q:
-            qs = qs.filter(Q(organization__name__icontains=self.q) | Q(name__icontains=self.q))
-
-        return qs.select_related('organization').order_by('organization__name').distinct()
+            qs = order_by_similarity(
+                qs.filter(Q(organization__name__icontains=self.q) | Q(name__icontains=self.q)),
+                self.q,
+                'organization__name', 'name'
+            )
+        return qs
 
     def get_result_label(self, result):
         return result.organization.name
@@ -115,7 +120,11 @@ class EntityAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetView):
         else:
             qs = find_pedagogical_entities_version().order_by('acronym')
         if self.q:
-            qs = qs.filter(Q(title__icontains=self.q) | Q(acronym__icontains=self.q))
+            qs = order_by_similarity(
+                qs.filter(Q(title__icontains=self.q) | Q(acronym__icontains=self.q)),
+                self.q,
+                'acronym', 'title'
+            )
         return qs
 
     def get_result_label(self, result):
@@ -150,7 +159,11 @@ class EntityRequirementAutocomplete(LoginRequiredMixin, EntityRoleChoiceFieldMix
     def get_queryset(self):
         qs = super().get_queryset().pedagogical_entities().order_by('acronym')
         if self.q:
-            qs = qs.filter(Q(acronym__icontains=self.q) | Q(title__icontains=self.q))
+            qs = order_by_similarity(
+                qs.filter(Q(acronym__icontains=self.q) | Q(title__icontains=self.q)),
+                self.q,
+                'acronym', 'title'
+            )
         return qs
 
     def get_result_label(self, result):
@@ -163,16 +176,21 @@ class EmployeeAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetView)
             fullname=Concat('last_name', Value(' '), 'first_name'),
             fullname_inverted=Concat('first_name', Value(' '), 'last_name'),
         )
+        qs = qs.order_by("last_name", "first_name")
         if self.q:
-            qs = qs.filter(
-                Q(last_name__icontains=self.q) |
-                Q(first_name__icontains=self.q) |
-                Q(middle_name__icontains=self.q) |
-                Q(global_id__icontains=self.q) |
-                Q(fullname__icontains=self.q) |
-                Q(fullname_inverted__icontains=self.q)
+            qs = order_by_similarity(
+                qs.filter(
+                    Q(last_name__icontains=self.q) |
+                    Q(first_name__icontains=self.q) |
+                    Q(middle_name__icontains=self.q) |
+                    Q(global_id__icontains=self.q) |
+                    Q(fullname__icontains=self.q) |
+                    Q(fullname_inverted__icontains=self.q)
+                ),
+                self.q,
+                'fullname', 'fullname_inverted', 'global_id'
             )
-        return qs.order_by("last_name", "first_name")
+        return qs
 
     def get_result_label(self, result):
         return "{last_name} {first_name}".format(last_name=result.last_name.upper(), first_name=result.first_name)
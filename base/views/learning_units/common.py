@@ -27,19 +27,17 @@ import re
 from typing import Optional
 
 from django.contrib.auth.decorators import login_required, permission_required
-from django.db.models import Prefetch
 from django.http import JsonResponse, HttpResponseNotFound
 from django.shortcuts import get_object_or_404
 
 from base import models as mdl
-from base.business.learning_unit import get_organization_from_learning_unit_year, get_all_attributions, \
-    get_components_identification
+from base.business.learning_unit import get_organization_from_learning_unit_year
 from base.business.learning_unit_proposal import get_difference_of_proposal
 from base.business.learning_units.edition import create_learning_unit_year_creation_message
-from base.models import proposal_learning_unit
 from base.models.learning_unit import REGEX_BY_SUBTYPE
 from base.models.learning_unit_year import LearningUnitYear
 from base.views.common import display_success_messages
+from learning_unit.ddd.repository import load_learning_unit_year_detail
 from osis_common.decorators.ajax import ajax_required
 
 
@@ -85,22 +83,22 @@ def get_learning_unit_identification_context(learning_unit_year_id, person):
     context = get_common_context_learning_unit_year(person, learning_unit_year_id)
 
     learning_unit_year = context['learning_unit_year']
+    detail = load_learning_unit_year_detail.load_from_instance(learning_unit_year)
     context['warnings'] = learning_unit_year.warnings
-    proposal = proposal_learning_unit.find_by_learning_unit(learning_unit_year.learning_unit)
+    proposal = detail.proposal
 
     context["can_create_partim"] = person.user.has_perm('base.can_create_partim', learning_unit_year)
-    context['learning_container_year_partims'] = learning_unit_year.get_partims_related()
+    context['learning_container_year_partims'] = detail.partims
     context['organization'] = get_organization_from_learning_unit_year(learning_unit_year)
     context['campus'] = learning_unit_year.campus
-    context.update(get_all_attributions(learning_unit_year))
-    components = get_components_identification(learning_unit_year)
+    context.update(detail.attributions)
+    components = detail.components_identification
     context['components'] = components.get('components')
     context['REQUIREMENT_ENTITY'] = components.get('REQUIREMENT_ENTITY')
     context['ADDITIONAL_REQUIREMENT_ENTITY_1'] = components.get('ADDITIONAL_REQUIREMENT_ENTITY_1')
     context['ADDITIONAL_REQUIREMENT_ENTITY_2'] = components.get('ADDITIONAL_REQUIREMENT_ENTITY_2')
     context['proposal'] = proposal
-    context['proposal_folder_entity_version'] = mdl.entity_version.get_by_entity_and_date(
-        proposal.entity, None) if proposal else None
+    context['proposal_folder_entity_version'] = detail.proposal_folder_entity_version
     context['differences'] = get_difference_of_proposal(proposal, learning_unit_year) \
         if proposal and proposal.learning_unit_year == learning_unit_year \
         else {}
@@ -126,15 +124,7 @@ def get_common_context_learning_unit_year(person,
                                           learning_unit_year_id: Optional[int] = None,
                                           code: Optional[str] = None,
                                           year: Optional[int] = None):
-    query_set = LearningUnitYear.objects.all().select_related(
-        'learning_unit',
-        'learning_container_year'
-    ).prefetch_related(
-        Prefetch(
-            'learning_unit__learningunityear_set',
-            queryset=LearningUnitYear.objects.select_related('academic_year')
-        )
-    )
+    query_set = load_learning_unit_year_detail.get_queryset()
     if learning_unit_year_id:
         learning_unit_year = get_object_or_404(query_set, pk=learning_unit_year_id)
     else:
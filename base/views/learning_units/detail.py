@@ -25,24 +25,19 @@
 ############################################################################
 
 from django.contrib.auth.mixins import PermissionRequiredMixin
-from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import DetailView
-from reversion.models import Version
 
-from base.business.learning_unit import get_all_attributions, get_components_identification
 from base.business.learning_unit_proposal import get_difference_of_proposal
-from base.models import proposal_learning_unit
 from base.models.academic_year import current_academic_year
-from base.models.entity_version import get_by_entity_and_date
-from base.models.learning_component_year import LearningComponentYear
+from base.models.enums.revision_aggregate_types import RevisionAggregateTypes
 from base.models.learning_unit_year import LearningUnitYear
 from base.models.person import Person
-from base.models.proposal_learning_unit import ProposalLearningUnit
 from base.views.common import display_warning_messages, add_to_session
-from osis_common.utils.models import get_object_or_none
+from learning_unit.ddd.repository import load_learning_unit_year_detail
 
 SEARCH_URL_PART = 'learning_units/by_'
 
@@ -75,8 +70,8 @@ class DetailLearningUnitYearView(PermissionRequiredMixin, DetailView):
         # Get does not need to fetch self.object again
         context = self.get_context_data(object=self.object)
 
-        if proposal_learning_unit.is_learning_unit_year_in_proposal(self.object) and \
-                self.object.get_partims_related().exists():
+        proposal = self.detail.proposal
+        if proposal and proposal.learning_unit_year_id == self.object.pk and self.detail.partims:
             display_warning_messages(request, _("The learning unit have partim"))
         return self.render_to_response(context)
 
@@ -88,21 +83,12 @@ class DetailLearningUnitYearView(PermissionRequiredMixin, DetailView):
     def current_academic_year(self):
         return current_academic_year()
 
+    @cached_property
+    def detail(self):
+        return load_learning_unit_year_detail.load_from_instance(self.object)
+
     def get_queryset(self):
-        return super().get_queryset().select_related(
-            'learning_container_year__academic_year',
-            'academic_year', 'learning_unit',
-            'campus__organization', 'externallearningunityear',
-        ).prefetch_related(
-            Prefetch(
-                'learningcomponentyear_set',
-                queryset=LearningComponentYear.objects.order_by('type', 'acronym')
-            ),
-            Prefetch(
-                'learning_unit__learningunityear_set',
-                queryset=LearningUnitYear.objects.select_related('academic_year')
-            )
-        )
+        return load_learning_unit_year_detail.get_queryset()
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -113,26 +99,28 @@ class DetailLearningUnitYearView(PermissionRequiredMixin, DetailView):
 
         context['warnings'] = self.object.warnings
 
-        context['learning_container_year_partims'] = self.object.get_partims_related()
-        context.update(get_all_attributions(self.object))
-        components = get_components_identification(self.object)
+        context['learning_container_year_partims'] = self.detail.partims
+        context.update(self.detail.attributions)
+        components = self.detail.components_identification
 
         context['components'] = components.get('components')
         context['REQUIREMENT_ENTITY'] = components.get('REQUIREMENT_ENTITY')
         context['ADDITIONAL_REQUIREMENT_ENTITY_1'] = components.get('ADDITIONAL_REQUIREMENT_ENTITY_1')
         context['ADDITIONAL_REQUIREMENT_ENTITY_2'] = components.get('ADDITIONAL_REQUIREMENT_ENTITY_2')
 
-        proposal = get_object_or_none(ProposalLearningUnit, learning_unit_year__learning_unit=self.object.learning_unit)
+        proposal = self.detail.proposal
         context['proposal'] = proposal
 
-        context['proposal_folder_entity_version'] = get_by_entity_and_date(
-            proposal.entity, None) if proposal else None
+        context['proposal_folder_entity_version'] = self.detail.proposal_folder_entity_version
         context['differences'] = get_difference_of_proposal(proposal, self.object) \
             if proposal and proposal.learning_unit_year == self.object else {}
 
         context.update(self.get_context_permission(proposal))
-        context["versions"] = self.get_versions()
-        context["list_partims"] = self.object.get_partims_related().values_list('acronym', flat=True)
+        context["history_url"] = reverse(
+            'revision_history',
+            args=[RevisionAggregateTypes.LEARNING_UNIT_YEAR.name, self.object.pk]
+        )
+        context["list_partims"] = [partim.acronym for partim in self.detail.partims]
         context["tab_active"] = "learning_unit"  # Corresponds to url_name
 
         return context
@@ -154,24 +142,9 @@ class DetailLearningUnitYearView(PermissionRequiredMixin, DetailView):
 
         return context
 
-    def get_versions(self):
-        """ Fetch all versions related to the learning unit year """
-        versions = Version.objects.get_for_object(self.object)
-        versions |= Version.objects.get_for_object(self.object.learning_container_year)
-        versions |= Version.objects.get_for_object(self.object.learning_unit)
-
-        if self.object.is_external():
-            versions |= Version.objects.get_for_object(self.object.externallearningunityear)
-
-        for component in self.object.learningcomponentyear_set.all():
-            versions |= Version.objects.get_for_object(component)
-
-        return versions.order_by('-revision__date_created').distinct('revision__date_created'
-                                                                     ).select_related('revision__user__person')
-
 
 class DetailLearningUnitYearViewBySlug(DetailLearningUnitYearView):
     def get_object(self, queryset=None):
         acronym = self.kwargs['acronym'].upper()
         year = int(self.kwargs['year'])
-        return get_object_or_404(LearningUnitYear, acronym=acronym, academic_year__year=year)
+        return get_object_or_404(self.get_queryset(), acronym=acronym, academic_year__year=year)
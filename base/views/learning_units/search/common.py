@@ -32,7 +32,6 @@ from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.utils.translation import gettext_lazy as _
 from django_filters.views import FilterView
 
-from base.business import learning_unit_year_with_context
 from base.business.learning_unit_xls import create_xls, create_xls_with_parameters, WITH_GRP, WITH_ATTRIBUTIONS, \
     create_xls_attributions
 from base.business.learning_units.xls_comparison import create_xls_comparison, create_xls_proposal_comparison
@@ -68,6 +67,7 @@ class BaseLearningUnitSearch(PermissionRequiredMixin, CacheFilterMixin, SearchMi
     cache_exclude_params = ['xls_status']
 
     serializer_class = None
+    navigation_fields = ('acronym', 'academic_year__year', 'acronym', None)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -150,8 +150,6 @@ def _create_xls_proposal(view_obj, context, **response_kwargs):
 def _create_xls_proposal_comparison(view_obj, context, **response_kwargs):
     user = view_obj.request.user
     luys = context["filter"].qs
-    for luy in luys:
-        learning_unit_year_with_context.append_latest_entities(luy)
     filters = _get_filter(context["form"], view_obj.search_type)
     return create_xls_proposal_comparison(user, luys, filters)
 
@@ -0,0 +1,54 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
+from django.http import Http404
+from django.views.generic import ListView
+
+from base.business import revision_history
+from base.models.enums.revision_aggregate_types import RevisionAggregateTypes
+
+PERMISSION_BY_AGGREGATE_TYPE = {
+    RevisionAggregateTypes.LEARNING_UNIT_YEAR.name: 'base.can_access_learningunit',
+    RevisionAggregateTypes.EDUCATION_GROUP_YEAR.name: 'base.view_educationgroup',
+    RevisionAggregateTypes.GROUP_YEAR.name: 'base.view_educationgroup',
+}
+
+
+class RevisionHistoryView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
+    """ Page of the history of an aggregate, lazily loaded in the "Last modifications" panel """
+    template_name = "blocks/panel/revision_history_rows.html"
+    context_object_name = "history"
+    paginate_by = 20
+    raise_exception = True
+
+    def get_permission_required(self):
+        try:
+            return [PERMISSION_BY_AGGREGATE_TYPE[self.kwargs['aggregate_type']]]
+        except KeyError:
+            raise Http404
+
+    def get_queryset(self):
+        return revision_history.get_history(self.kwargs['aggregate_type'], self.kwargs['aggregate_id'])
@@ -0,0 +1,77 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import uuid
+from typing import Dict, Iterable, Tuple
+
+from django.core.cache import cache
+
+from base.utils.cache import OsisCache
+
+TRANSLATED_TEXTS_CACHE_TIMEOUT = 60 * 60 * 24
+
+Reference = Tuple[str, int]  # (entity, reference) of a TranslatedText
+
+
+class TranslatedTextsCache(OsisCache):
+    """
+    All the texts of an (entity, reference). The key contains a version token which is renewed each time a text of
+    this reference is saved or deleted (see 'invalidate'), so that outdated texts are never served.
+    """
+    PREFIX_KEY = 'cms_translated_texts'
+    VERSION_PREFIX_KEY = 'cms_translated_texts_version'
+
+    def __init__(self, entity: str, reference: int, version: str):
+        self.entity = entity
+        self.reference = reference
+        self.version = version
+
+    @property
+    def key(self):
+        return "_".join([self.PREFIX_KEY, self.entity, str(self.reference), self.version])
+
+    def set_cached_data(self, data, timeout=TRANSLATED_TEXTS_CACHE_TIMEOUT):
+        super().set_cached_data(data, timeout=timeout)
+
+    @classmethod
+    def get_version_key(cls, entity: str, reference: int) -> str:
+        return "_".join([cls.VERSION_PREFIX_KEY, entity, str(reference)])
+
+    @classmethod
+    def get_many(cls, references: Iterable[Reference]) -> Dict[Reference, 'TranslatedTextsCache']:
+        version_keys = {cls.get_version_key(entity, reference): (entity, reference) for entity, reference in references}
+        versions = cache.get_many(version_keys.keys())
+        new_versions = {key: uuid.uuid4().hex for key in version_keys if key not in versions}
+        if new_versions:
+            cache.set_many(new_versions, timeout=None)
+            versions.update(new_versions)
+        return {
+            (entity, reference): cls(entity, reference, versions[key])
+            for key, (entity, reference) in version_keys.items()
+        }
+
+    @classmethod
+    def invalidate(cls, entity: str, reference: int):
+        cache.delete(cls.get_version_key(entity, reference))
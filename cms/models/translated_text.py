@@ -23,13 +23,18 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from typing import List
+import functools
+import itertools
+import operator
+from typing import List, Iterable, Dict, Optional
 
 from ckeditor.fields import RichTextField
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
-from django.db import models
-from django.db.models.signals import post_delete
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.shortcuts import get_object_or_404
 from reversion.admin import VersionAdmin
@@ -37,6 +42,7 @@ from reversion.models import Version
 
 from base.models.education_group_year import EducationGroupYear
 from base.models.enums.education_group_types import GroupType
+from cms.cache import TranslatedTextsCache, Reference, TRANSLATED_TEXTS_CACHE_TIMEOUT
 from cms.enums.entity_name import ENTITY_NAME, OFFER_YEAR
 from education_group.ddd.domain.group import Group
 from education_group.models.group_year import GroupYear
@@ -83,6 +89,63 @@ def search(entity, reference: int, text_labels_name: List[str] = None, language:
     return queryset.select_related('text_label')
 
 
+class CmsTexts:
+    """
+    Texts of several (entity, reference) loaded at once by bulk_search().
+    """
+    def __init__(self, texts_by_reference: Dict[Reference, Dict[tuple, Optional[str]]]):
+        self.texts_by_reference = texts_by_reference
+
+    def get_text(self, entity: str, reference: int, text_label_name: str, language: str) -> Optional[str]:
+        return self.texts_by_reference.get((entity, int(reference)), {}).get((text_label_name, language))
+
+    def get_texts(self, entity: str, reference: int, language: str) -> Dict[str, Optional[str]]:
+        texts = self.texts_by_reference.get((entity, int(reference)), {})
+        return {
+            text_label_name: text
+            for (text_label_name, text_language), text in texts.items() if text_language == language
+        }
+
+
+def bulk_search(references: Iterable[Reference]) -> CmsTexts:
+    """
+    Texts of all labels and languages of the given (entity, reference), read from the cache or loaded in one query.
+    Unlike get_or_create(), missing texts are never created.
+    """
+    references = {(entity, int(reference)) for entity, reference in references}
+    caches = TranslatedTextsCache.get_many(references)
+    cached_texts = cache.get_many([translated_texts_cache.key for translated_texts_cache in caches.values()])
+    texts_by_reference = {
+        reference: cached_texts[translated_texts_cache.key]
+        for reference, translated_texts_cache in caches.items() if translated_texts_cache.key in cached_texts
+    }
+
+    missing_references = references - set(texts_by_reference)
+    if missing_references:
+        loaded_texts = _load_texts(missing_references)
+        cache.set_many(
+            {caches[reference].key: loaded_texts[reference] for reference in missing_references},
+            timeout=TRANSLATED_TEXTS_CACHE_TIMEOUT
+        )
+        texts_by_reference.update(loaded_texts)
+    return CmsTexts(texts_by_reference)
+
+
+def _load_texts(references: Iterable[Reference]) -> Dict[Reference, Dict[tuple, Optional[str]]]:
+    references = sorted(references)
+    filter_clause = functools.reduce(operator.or_, (
+        Q(entity=entity, reference__in=[reference for _, reference in entity_references])
+        for entity, entity_references in itertools.groupby(references, key=operator.itemgetter(0))
+    ))
+    texts_by_reference = {reference: {} for reference in references}
+    rows = TranslatedText.objects.filter(filter_clause).values_list(
+        'entity', 'reference', 'text_label__label', 'language', 'text'
+    )
+    for entity, reference, text_label_name, language, text in rows:
+        texts_by_reference[(entity, reference)][(text_label_name, language)] = text
+    return texts_by_reference
+
+
 def get_or_create(entity, reference, text_label, language):
     translated_text, _ = TranslatedText.objects.get_or_create(
         entity=entity,
@@ -114,6 +177,15 @@ def get_groups_or_offers_cms_reference_object(group: Group):
     )
 
 
+@receiver(post_save, sender=TranslatedText)
+@receiver(post_delete, sender=TranslatedText)
+def _translated_text_changed(sender, instance, **kwargs):
+    invalidate = functools.partial(TranslatedTextsCache.invalidate, instance.entity, instance.reference)
+    invalidate()
+    # Texts read by another request before the commit must not stay in cache
+    transaction.on_commit(invalidate)
+
+
 @receiver(post_delete, sender=EducationGroupYear)
 def _educationgroupyear_delete(sender, instance, **kwargs):
     TranslatedText.objects.filter(entity=OFFER_YEAR, reference=instance.id).delete()
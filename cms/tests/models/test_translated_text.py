@@ -23,8 +23,12 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
 
+from cms.enums.entity_name import LEARNING_UNIT_YEAR, OFFER_YEAR
+from cms.models import translated_text
 from cms.models.translated_text import TranslatedText
 from cms.tests.factories.text_label import OfferTextLabelFactory, GroupTextLabelFactory, \
     LearningUnitYearTextLabelFactory
@@ -62,3 +66,61 @@ class TranslatedTextTest(TestCase):
             list(tt),
             [text_label_oy_1.label, text_label_oy_2.label, text_label_oy_3.label]
         )
+
+
+class TestBulkSearch(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.text_label = LearningUnitYearTextLabelFactory(label='resume')
+        cls.text_fr = LearningUnitYearTranslatedTextFactory(
+            text_label=cls.text_label,
+            reference=REFERENCE,
+            language=settings.LANGUAGE_CODE_FR,
+            text="Résumé",
+        )
+        cls.other_reference_text = LearningUnitYearTranslatedTextFactory(
+            text_label=cls.text_label,
+            reference=REFERENCE + 1,
+            language=settings.LANGUAGE_CODE_FR,
+            text="Autre résumé",
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_should_load_texts_of_all_references_in_one_query(self):
+        with self.assertNumQueries(1):
+            texts = translated_text.bulk_search([
+                (LEARNING_UNIT_YEAR, REFERENCE), (LEARNING_UNIT_YEAR, REFERENCE + 1), (OFFER_YEAR, REFERENCE)
+            ])
+
+        self.assertEqual(texts.get_text(LEARNING_UNIT_YEAR, REFERENCE, 'resume', settings.LANGUAGE_CODE_FR), "Résumé")
+        self.assertEqual(
+            texts.get_text(LEARNING_UNIT_YEAR, REFERENCE + 1, 'resume', settings.LANGUAGE_CODE_FR),
+            "Autre résumé"
+        )
+        self.assertIsNone(texts.get_text(OFFER_YEAR, REFERENCE, 'resume', settings.LANGUAGE_CODE_FR))
+
+    def test_should_not_create_missing_texts(self):
+        texts = translated_text.bulk_search([(LEARNING_UNIT_YEAR, REFERENCE)])
+
+        self.assertIsNone(texts.get_text(LEARNING_UNIT_YEAR, REFERENCE, 'resume', settings.LANGUAGE_CODE_EN))
+        self.assertFalse(TranslatedText.objects.filter(language=settings.LANGUAGE_CODE_EN).exists())
+
+    def test_should_read_texts_from_cache(self):
+        translated_text.bulk_search([(LEARNING_UNIT_YEAR, REFERENCE)])
+
+        with self.assertNumQueries(0):
+            texts = translated_text.bulk_search([(LEARNING_UNIT_YEAR, REFERENCE)])
+        self.assertEqual(texts.get_text(LEARNING_UNIT_YEAR, REFERENCE, 'resume', settings.LANGUAGE_CODE_FR), "Résumé")
+
+    def test_should_invalidate_cache_when_text_is_saved(self):
+        translated_text.bulk_search([(LEARNING_UNIT_YEAR, REFERENCE)])
+        self.text_fr.text = "Nouveau résumé"
+        self.text_fr.save()
+
+        texts = translated_text.bulk_search([(LEARNING_UNIT_YEAR, REFERENCE)])
+        self.assertEqual(
+            texts.get_text(LEARNING_UNIT_YEAR, REFERENCE, 'resume', settings.LANGUAGE_CODE_FR),
+            "Nouveau résumé"
+        )
@@ -25,6 +25,7 @@
 ##############################################################################
 from django.conf.urls import url, include
 
+from base.utils.read_replica import read_only_view
 from education_group.api.views.group import GroupDetail, GroupTitle
 from education_group.api.views.group_element_year import TrainingTreeView, MiniTrainingTreeView, GroupTreeView
 from education_group.api.views.hops import HopsList
@@ -37,9 +38,9 @@ app_name = "education_group"
 
 urlpatterns = [
     url(r'^hops/(?P<year>[\d]{4})$', HopsList.as_view(), name=HopsList.name),
-    url(r'^trainings$', TrainingList.as_view(), name=TrainingList.name),
+    url(r'^trainings$', read_only_view(TrainingList.as_view()), name=TrainingList.name),
     url(r'^trainings/(?P<year>[\d]{4})/(?P<acronym>[\w]+(?:[/ ]?[\w]{1,2}){0,2})/', include([
-        url(r'^tree$', TrainingTreeView.as_view(), name=TrainingTreeView.name),
+        url(r'^tree$', read_only_view(TrainingTreeView.as_view()), name=TrainingTreeView.name),
         url(r'^title$', TrainingTitle.as_view(), name=TrainingTitle.name),
         url(r'^offer_roots$', TrainingOfferRoots.as_view(), name=TrainingOfferRoots.name),
         url(r'^prerequisites$', TrainingPrerequisites.as_view(), {'transition': False},
@@ -53,7 +54,7 @@ urlpatterns = [
     url(
         r'^trainings/(?P<year>[\d]{4})/(?P<acronym>[\w]+(?:[/ ]?[a-zA-Z]{1,2}){0,2})/versions/(?P<version_name>[\w]+)/',
         include([
-            url(r'^tree$', TrainingTreeView.as_view(), name=TrainingTreeView.name),
+            url(r'^tree$', read_only_view(TrainingTreeView.as_view()), name=TrainingTreeView.name),
             url(r'^title$', TrainingTitle.as_view(), name=TrainingTitle.name),
             url(r'^offer_roots$', TrainingOfferRoots.as_view(), name=TrainingOfferRoots.name),
         ])
@@ -71,15 +72,15 @@ urlpatterns = [
     url(
         r'^mini_trainings/(?P<year>[\d]{4})/(?P<acronym>[a-zA-Z0-9/\-_]+)/versions/(?P<version_name>[\w]+)/',
         include([
-            url(r'^tree$', MiniTrainingTreeView.as_view(), name=MiniTrainingTreeView.name),
+            url(r'^tree$', read_only_view(MiniTrainingTreeView.as_view()), name=MiniTrainingTreeView.name),
             url(r'^title$', MiniTrainingTitle.as_view(), name=MiniTrainingTitle.name),
             url(r'^offer_roots$', MiniTrainingOfferRoots.as_view(), name=MiniTrainingOfferRoots.name),
         ])
     ),
-    url(r'^mini_trainings$', MiniTrainingList.as_view(), name=MiniTrainingList.name),
+    url(r'^mini_trainings$', read_only_view(MiniTrainingList.as_view()), name=MiniTrainingList.name),
     # TODO: Limit special characters authorized in mini trainings urls (in 4831)
     url(r'^mini_trainings/(?P<year>[\d]{4})/(?P<acronym>[a-zA-Z0-9/\-_]+)/', include([
-        url(r'^tree$', MiniTrainingTreeView.as_view(), name=MiniTrainingTreeView.name),
+        url(r'^tree$', read_only_view(MiniTrainingTreeView.as_view()), name=MiniTrainingTreeView.name),
         url(r'^title$', MiniTrainingTitle.as_view(), name=MiniTrainingTitle.name),
         url(r'^offer_roots$', MiniTrainingOfferRoots.as_view(), name=MiniTrainingOfferRoots.name),
         url(r'^prerequisites$', MiniTrainingPrerequisites.as_view(), {'transition': False},
@@ -96,7 +97,7 @@ urlpatterns = [
         name=GroupDetail.name
     ),
     url(r'^groups/(?P<year>[\d]{4})/(?P<partial_acronym>[\w]+)/', include([
-        url(r'^tree$', GroupTreeView.as_view(), name=GroupTreeView.name),
+        url(r'^tree$', read_only_view(GroupTreeView.as_view()), name=GroupTreeView.name),
         url(r'^title$', GroupTitle.as_view(), name=GroupTitle.name),
     ])),
 ]
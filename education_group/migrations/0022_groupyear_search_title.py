@@ -0,0 +1,61 @@
+# Generated by Django 2.2.13 on 2021-04-23 10:12
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from base.models.enums.education_group_categories import Categories
+from base.utils import search_text
+
+BATCH_SIZE = 1000
+
+
+def fill_search_titles(apps, schema_editor):
+    GroupYear = apps.get_model('education_group', 'GroupYear')
+
+    group_years = []
+    qs = GroupYear.objects.select_related('education_group_type', 'educationgroupversion__offer')
+    for group_year in qs.iterator(chunk_size=BATCH_SIZE):
+        version = getattr(group_year, 'educationgroupversion', None)
+        if version and version.offer and \
+                group_year.education_group_type.category in Categories.training_categories():
+            group_year.search_title = search_text.normalize(version.offer.title, version.title_fr)
+        else:
+            group_year.search_title = search_text.normalize(group_year.title_fr)
+        group_years.append(group_year)
+    GroupYear.objects.bulk_update(group_years, ['search_title'], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0587_search_title'),
+        ('program_management', '0010_auto_20210208_0948'),
+        ('education_group', '0021_default_titles_bis'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupyear',
+            name='search_title',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(fill_search_titles, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='groupyear',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['acronym'], name='groupyear_acronym_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='groupyear',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['partial_acronym'], name='groupyear_code_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='groupyear',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['search_title'], name='groupyear_search_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+    ]
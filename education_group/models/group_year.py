@@ -37,13 +37,14 @@ from base.models.campus import Campus
 from base.models.entity import Entity
 from base.models.enums.education_group_categories import Categories
 from base.models.enums.education_group_types import GroupType, MiniTrainingType
+from base.utils import search_text
 from education_group.models.enums.constraint_type import ConstraintTypes
 from osis_common.models.osis_model_admin import OsisModelAdmin
 
 
 def fill_from_past_year(modeladmin, request, queryset):
     from program_management.ddd.command import FillProgramTreeContentFromLastYearCommand
-    from program_management.ddd.service.write import bulk_fill_program_tree_content_service_from_past_year
+    from infrastructure.messages_bus import message_bus_instance
     cmds = []
     qs = queryset.select_related("academic_year")
     for obj in qs:
@@ -52,8 +53,8 @@ def fill_from_past_year(modeladmin, request, queryset):
             to_code=obj.partial_acronym
         )
         cmds.append(cmd)
-    result = bulk_fill_program_tree_content_service_from_past_year.bulk_fill_program_tree_content_from_last_year(cmds)
-    modeladmin.message_user(request, "{} programs have been filled".format(len(result)))
+    message_bus_instance.invoke_async(cmds)
+    modeladmin.message_user(request, "{} programs have been queued for filling".format(len(cmds)))
 
 
 fill_from_past_year.short_description = _("Fill program tree content from last year")
@@ -223,6 +224,8 @@ class GroupYear(models.Model):
         on_delete=models.PROTECT
     )
 
+    search_title = models.TextField(blank=True, default='', editable=False)
+
     objects = GroupYearManager.from_queryset(GroupYearQuerySet)()
     objects_version = GroupYearVersionManager.from_queryset(GroupYearQuerySet)()
 
@@ -231,6 +234,11 @@ class GroupYear(models.Model):
         index_together = [
             ("partial_acronym", "academic_year"),
         ]
+        indexes = [
+            search_text.trigram_index('acronym', name='groupyear_acronym_trgm'),
+            search_text.trigram_index('partial_acronym', name='groupyear_code_trgm'),
+            search_text.trigram_index('search_title', name='groupyear_search_trgm'),
+        ]
 
     def __str__(self):
         return "{} ({})".format(self.acronym,
@@ -241,8 +249,31 @@ class GroupYear(models.Model):
             raise AttributeError(
                 _('Please enter an academic year greater or equal to group start year.')
             )
+        self.search_title = self.get_search_title()
         super().save(*args, **kwargs)
 
+    def get_search_title(self) -> str:
+        version = getattr(self, 'educationgroupversion', None)
+        if version and version.offer and self.education_group_type.category in Categories.training_categories():
+            return search_text.normalize(version.offer.title, version.title_fr)
+        return search_text.normalize(self.title_fr)
+
+    @classmethod
+    def update_search_titles(cls, queryset):
+        from base.business import change_log
+        from base.models.enums.change_log_types import ChangeLogActions
+        group_years = queryset.select_related(
+            'education_group_type', 'educationgroupversion__offer', 'academic_year'
+        )
+        updated_group_years = []
+        for group_year in group_years:
+            search_title = group_year.get_search_title()
+            if group_year.search_title != search_title:
+                group_year.search_title = search_title
+                updated_group_years.append(group_year)
+        cls.objects.bulk_update(updated_group_years, ['search_title'])
+        change_log.record_many(updated_group_years, ChangeLogActions.UPDATE)
+
     def delete(self, using=None, keep_parents=False):
         result = super().delete(using, keep_parents)
 
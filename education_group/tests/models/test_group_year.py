@@ -27,6 +27,8 @@
 from django.test import TestCase
 from django.utils.translation import gettext as _
 
+from base.models.change_log_entry import ChangeLogEntry
+from base.models.enums.change_log_types import ChangeLogActions, ChangeLogObjectTypes
 from base.models.enums.education_group_categories import Categories
 from base.tests.factories.academic_year import AcademicYearFactory
 from education_group.models.group_year import GroupYear
@@ -141,3 +143,37 @@ class GroupYearFieldForTrigger(TestCase):
                         file_name='update_group_years_unversioned_fields.sql'
                     )
                 self.assertIn(field, model_fields, error_msg)
+
+
+class TestGroupYearSearchTitle(TestCase):
+    def test_search_title_case_group_type(self):
+        group_year = GroupYearFactory(education_group_type__category=Categories.GROUP, title_fr="Option Été")
+        self.assertEqual(group_year.search_title, "option ete")
+
+    def test_search_title_should_follow_offer_title(self):
+        standard_version = StandardEducationGroupVersionFactory(offer__title="Bachelier en Économie")
+        offer = standard_version.offer
+        offer.title = "Master en Économie"
+        offer.save()
+
+        standard_version.root_group.refresh_from_db()
+        self.assertEqual(
+            standard_version.root_group.search_title,
+            GroupYear.objects.get(pk=standard_version.root_group.pk).get_search_title()
+        )
+        self.assertIn("master en economie", standard_version.root_group.search_title)
+
+    def test_search_title_update_should_be_logged(self):
+        standard_version = StandardEducationGroupVersionFactory(offer__title="Bachelier en Économie")
+        group_year_entries = ChangeLogEntry.objects.filter(
+            object_type=ChangeLogObjectTypes.GROUP_YEAR.name,
+            object_id=standard_version.root_group.pk,
+            action=ChangeLogActions.UPDATE.name,
+        )
+        number_of_entries = group_year_entries.count()
+
+        offer = standard_version.offer
+        offer.title = "Master en Économie"
+        offer.save()
+
+        self.assertEqual(group_year_entries.count(), number_of_entries + 1)
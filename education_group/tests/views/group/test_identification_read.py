@@ -23,7 +23,6 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from django.db.models import QuerySet
 from django.http import HttpResponseForbidden, HttpResponse, HttpResponseNotFound
 from django.test import TestCase
 from django.urls import reverse
@@ -92,7 +91,7 @@ class TestGroupReadIdentification(TestCase):
         self.assertEqual(response.context['tree_json_url'], expected_tree_json_url)
         self.assertIsInstance(response.context['tree_root_id'], int)
         self.assertIsInstance(response.context['group'], Group)
-        self.assertIsInstance(response.context['history'], QuerySet)
+        self.assertIsInstance(response.context['history_url'], str)
 
     def test_assert_active_tabs_is_identification_and_others_are_not_active(self):
         response = self.client.get(self.url)
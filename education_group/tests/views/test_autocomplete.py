@@ -108,6 +108,21 @@ class TestCertificateAimAutocomplete(TestCase):
         response = self.client.get(self.url, data={'q': 'descr'})
         self._assert_result_is_correct(response)
 
+    def test_should_rank_descriptions_by_relevance(self):
+        certificate_aim_containing_query = CertificateAimFactory(
+            code=5678,
+            section=5,
+            description="another long description of a certificate aim",
+        )
+        self.client.force_login(user=self.super_user)
+        response = self.client.get(self.url, data={'q': 'description'})
+
+        results = json.loads(str(response.content, encoding='utf8'))['results']
+        self.assertEqual(
+            [result['id'] for result in results],
+            [self.certificate_aim.code, certificate_aim_containing_query.code]
+        )
+
     def test_with_filter_by_section(self):
         self.client.force_login(user=self.super_user)
         response = self.client.get(self.url, data={'forward': '{"section": "5"}'})
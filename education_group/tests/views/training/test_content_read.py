@@ -30,6 +30,7 @@ from django.test import TestCase
 from django.urls import reverse
 
 from base.models.enums.education_group_types import TrainingType
+from base.tests.factories.group_element_year import GroupElementYearChildLeafFactory
 from base.tests.factories.person import PersonWithPermissionsFactory
 from base.tests.factories.user import UserFactory
 from base.utils.urls import reverse_with_get
@@ -53,7 +54,7 @@ class TestTrainingReadContent(TestCase):
             root_group__academic_year__year=2019,
             root_group__education_group_type__name=TrainingType.PGRM_MASTER_120.name,
         )
-        ElementGroupYearFactory(group_year=cls.training_version.root_group)
+        cls.root_element = ElementGroupYearFactory(group_year=cls.training_version.root_group)
         cls.url = reverse('training_content', kwargs={'year': 2019, 'code': 'LDROI200M'})
 
     def setUp(self) -> None:
@@ -116,3 +117,19 @@ class TestTrainingReadContent(TestCase):
         self.assertFalse(response.context['tab_urls'][Tab.GENERAL_INFO]['active'])
         self.assertFalse(response.context['tab_urls'][Tab.SKILLS_ACHIEVEMENTS]['active'])
         self.assertFalse(response.context['tab_urls'][Tab.ACCESS_REQUIREMENTS]['active'])
+
+    def test_assert_context_contains_aggregates_of_displayed_node(self):
+        GroupElementYearChildLeafFactory(
+            parent_element=self.root_element,
+            child_element__learning_unit_year__academic_year__year=2019,
+            relative_credits=5,
+            block=12,
+            is_mandatory=True,
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.context['aggregates'].total_credits, 5)
+        self.assertEqual(response.context['aggregates'].mandatory_credits, 5)
+        self.assertEqual(response.context['credits_by_block'], "1: 5 ; 2: 5")
+        self.assertContains(response, 'id="content_aggregates"')
@@ -25,7 +25,6 @@
 ##############################################################################
 from unittest import mock
 
-from django.db.models import QuerySet
 from django.http import HttpResponseForbidden, HttpResponse, HttpResponseNotFound
 from django.test import TestCase
 from django.urls import reverse
@@ -153,7 +152,7 @@ class TestTrainingReadIdentification(TestCase):
         self.assertIsInstance(response.context['tree_json_url'], str)
         self.assertIsInstance(response.context['tree_root_id'], int)
         self.assertIsInstance(response.context['group'], Group)
-        self.assertIsInstance(response.context['history'], QuerySet)
+        self.assertIsInstance(response.context['history_url'], str)
         self.assertIn('current_version', response.context)
         self.assertIn('academic_year_choices', response.context)
         self.assertIn('versions_choices', response.context)
@@ -27,6 +27,7 @@ from dal import autocomplete
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.utils.html import format_html
 
+from base.forms.utils.filter_field import order_by_similarity
 from base.models.certificate_aim import CertificateAim
 from base.models.education_group_type import EducationGroupType
 
@@ -64,7 +65,7 @@ class CertificateAimAutocomplete(autocomplete.Select2QuerySetView):
             if self.q.isdigit():
                 qs = qs.filter(code=self.q)
             else:
-                qs = qs.filter(description__icontains=self.q)
+                qs = order_by_similarity(qs.filter(description__icontains=self.q), self.q, 'description')
 
         section = self.forwarded.get('section', None)
         if section:
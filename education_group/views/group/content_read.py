@@ -29,6 +29,7 @@ from typing import List
 from base.utils.urls import reverse_with_get
 from education_group.views.group.common_read import Tab, GroupRead
 from program_management.ddd.domain.service.get_program_tree_version_for_tree import get_program_tree_version_for_tree
+from program_management import formatter
 from program_management.ddd.repositories import load_tree
 
 
@@ -40,6 +41,7 @@ class GroupReadContent(GroupRead):
         return {
             **super().get_context_data(**kwargs),
             "children": self.get_children(),
+            **self.get_aggregates_context(),
             "tree_different_versions": get_program_tree_version_for_tree(self.get_tree().get_all_nodes())
         }
 
@@ -57,6 +59,15 @@ class GroupReadContent(GroupRead):
     def get_tree(self):
         return load_tree.load(self.get_root_id())
 
-    def get_children(self) -> List['Node']:
-        parent_node = self.get_tree().get_node(self.get_path())
-        return parent_node.children
+    def get_node(self) -> 'Node':
+        return self.get_tree().get_node(self.get_path())
+
+    def get_children(self) -> List['Link']:
+        return self.get_node().children
+
+    def get_aggregates_context(self) -> dict:
+        aggregates = self.get_tree().get_aggregates().get_node_aggregates(self.get_node())
+        return {
+            "aggregates": aggregates,
+            "credits_by_block": formatter.format_credits_by_block(aggregates.credits_by_block),
+        }
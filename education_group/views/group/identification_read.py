@@ -23,9 +23,9 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from reversion.models import Version
+from django.urls import reverse
 
-from education_group.models.group_year import GroupYear
+from base.models.enums.revision_aggregate_types import RevisionAggregateTypes
 from education_group.views.group.common_read import Tab, GroupRead
 
 
@@ -36,25 +36,8 @@ class GroupReadIdentification(GroupRead):
     def get_context_data(self, **kwargs):
         return {
             **super().get_context_data(**kwargs),
-            "history": self.get_related_history(),
+            "history_url": reverse(
+                'revision_history',
+                args=[RevisionAggregateTypes.GROUP_YEAR.name, self.get_group_year().pk]
+            ),
         }
-
-    def get_related_history(self):
-        group_year = self.get_group_year()
-        versions = Version.objects.get_for_object(
-            group_year
-        ).select_related('revision__user__person')
-
-        related_models = [
-            GroupYear,
-        ]
-
-        subversion = Version.objects.none()
-        for model in related_models:
-            subversion |= Version.objects.get_for_model(model).select_related('revision__user__person')
-
-        versions |= subversion.filter(
-            serialized_data__contains="\"group_year\": {}".format(group_year.pk)
-        )
-
-        return versions.order_by('-revision__date_created').distinct('revision__date_created')
@@ -23,16 +23,10 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from reversion.models import Version
+from django.urls import reverse
 
-from base.models.education_group_achievement import EducationGroupAchievement
-from base.models.education_group_certificate_aim import EducationGroupCertificateAim
-from base.models.education_group_detailed_achievement import EducationGroupDetailedAchievement
-from base.models.education_group_organization import EducationGroupOrganization
-from base.models.education_group_year_domain import EducationGroupYearDomain
-from education_group.models.group_year import GroupYear
+from base.models.enums.revision_aggregate_types import RevisionAggregateTypes
 from education_group.views.mini_training.common_read import MiniTrainingRead, Tab
-from program_management.models.education_group_version import EducationGroupVersion
 
 
 class MiniTrainingReadIdentification(MiniTrainingRead):
@@ -42,32 +36,9 @@ class MiniTrainingReadIdentification(MiniTrainingRead):
     def get_context_data(self, **kwargs):
         return {
             **super().get_context_data(**kwargs),
-            "history": self.get_related_history(),
+            "history_url": reverse(
+                'revision_history',
+                args=[RevisionAggregateTypes.EDUCATION_GROUP_YEAR.name, self.get_education_group_version().offer_id]
+            ),
             "permission_object": self.get_permission_object()
         }
-
-    def get_related_history(self):
-        education_group_year = self.get_education_group_version().offer
-        versions = Version.objects.get_for_object(
-            education_group_year
-        ).select_related('revision__user__person')
-
-        related_models = [
-            EducationGroupOrganization,
-            EducationGroupAchievement,
-            EducationGroupDetailedAchievement,
-            EducationGroupYearDomain,
-            EducationGroupCertificateAim,
-            EducationGroupVersion,
-            GroupYear,
-        ]
-
-        subversion = Version.objects.none()
-        for model in related_models:
-            subversion |= Version.objects.get_for_model(model).select_related('revision__user__person')
-
-        versions |= subversion.filter(
-            serialized_data__contains="\"education_group_year\": {}".format(education_group_year.pk)
-        )
-
-        return versions.order_by('-revision__date_created').distinct('revision__date_created')
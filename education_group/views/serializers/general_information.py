@@ -36,7 +36,6 @@ from base.models.enums.education_group_types import TrainingType
 from cms.enums import entity_name
 from cms.models import translated_text
 from cms.models.text_label import TextLabel
-from cms.models.translated_text import TranslatedText
 from cms.models.translated_text_label import TranslatedTextLabel
 from education_group.ddd.domain.group import Group
 
@@ -114,14 +113,7 @@ def __get_common_labels(group: Group) -> List[str]:
 
 def __get_translated_labels(reference_pk: int, labels: List[str], language_code: str, group: Group):
     entity = entity_name.get_offers_or_groups_entity_from_group(group)
-    subqstranslated_fr = TranslatedText.objects.filter(
-        reference=reference_pk, text_label=OuterRef('pk'),
-        language=settings.LANGUAGE_CODE_FR, entity=entity
-    ).values('text')[:1]
-    subqstranslated_en = TranslatedText.objects.filter(
-        reference=reference_pk, text_label=OuterRef('pk'),
-        language=settings.LANGUAGE_CODE_EN, entity=entity
-    ).values('text')[:1]
+    texts = translated_text.bulk_search([(entity, reference_pk)])
     subqslabel = TranslatedTextLabel.objects.filter(
         text_label=OuterRef('pk'),
         language=language_code
@@ -133,11 +125,15 @@ def __get_translated_labels(reference_pk: int, labels: List[str], language_code:
     ).annotate(
         label_id=F('label'),
         label_translated=Subquery(subqslabel, output_field=fields.CharField()),
-        text_fr=Subquery(subqstranslated_fr, output_field=fields.CharField()),
-        text_en=Subquery(subqstranslated_en, output_field=fields.CharField())
-    ).values('label_id', 'label_translated', 'text_fr', 'text_en')
+    ).values('label_id', 'label_translated')
 
-    return {label['label_id']: label for label in qs}
+    return {
+        label['label_id']: {
+            **label,
+            'text_fr': texts.get_text(entity, reference_pk, label['label_id'], settings.LANGUAGE_CODE_FR),
+            'text_en': texts.get_text(entity, reference_pk, label['label_id'], settings.LANGUAGE_CODE_EN),
+        } for label in qs
+    }
 
 
 def get_contacts(group: Group):
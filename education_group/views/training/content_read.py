@@ -28,6 +28,7 @@ from typing import List
 
 from base.utils.urls import reverse_with_get
 from education_group.views.training.common_read import TrainingRead, Tab
+from program_management import formatter
 from program_management.ddd.repositories import load_tree
 
 
@@ -38,7 +39,8 @@ class TrainingReadContent(TrainingRead):
     def get_context_data(self, **kwargs):
         return {
             **super().get_context_data(**kwargs),
-            "children": self.get_children()
+            "children": self.get_children(),
+            **self.get_aggregates_context(),
         }
 
     def get_update_training_url(self):
@@ -55,6 +57,15 @@ class TrainingReadContent(TrainingRead):
     def get_tree(self):
         return load_tree.load(self.get_root_id())
 
-    def get_children(self) -> List['Node']:
-        parent_node = self.get_tree().get_node(self.path)
-        return parent_node.children
+    def get_node(self) -> 'Node':
+        return self.get_tree().get_node(self.path)
+
+    def get_children(self) -> List['Link']:
+        return self.get_node().children
+
+    def get_aggregates_context(self) -> dict:
+        aggregates = self.get_tree().get_aggregates().get_node_aggregates(self.get_node())
+        return {
+            "aggregates": aggregates,
+            "credits_by_block": formatter.format_credits_by_block(aggregates.credits_by_block),
+        }
@@ -53,6 +53,7 @@ from education_group.forms.training import CreateTrainingForm
 from education_group.models.group_year import GroupYear
 from education_group.templatetags.academic_year_display import display_as_academic_year
 from education_group.views.proxy.read import Tab
+from infrastructure.messages_bus import message_bus_instance
 from osis_common.ddd.interface import BusinessExceptions
 from osis_role.contrib.views import PermissionRequiredMixin
 from program_management.ddd import command as command_pgrm
@@ -60,7 +61,6 @@ from program_management.ddd.domain.program_tree import Path
 from program_management.ddd.domain.service.element_id_search import ElementIdSearch
 from program_management.ddd.domain.service.identity_search import NodeIdentitySearch
 from program_management.ddd.service.read import node_identity_service
-from program_management.ddd.service.write import create_and_attach_training_service
 from program_management.ddd.service.write.create_training_with_program_tree import \
     create_and_report_training_with_program_tree
 
@@ -205,7 +205,7 @@ class TrainingCreateView(LoginRequiredMixin, PermissionRequiredMixin, View):
                 **create_training_data,
                 path_to_paste=self.get_attach_path(),
             )
-            training_ids = create_and_attach_training_service.create_and_attach_training(cmd)
+            training_ids = message_bus_instance.invoke(cmd)
         else:
             training_ids = create_and_report_training_with_program_tree(
                 command.CreateAndPostponeTrainingAndProgramTreeCommand(**create_training_data)
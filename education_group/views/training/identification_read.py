@@ -25,20 +25,14 @@
 ##############################################################################
 from typing import List
 
-from reversion.models import Version
+from django.urls import reverse
 
-from base.models.education_group_achievement import EducationGroupAchievement
-from base.models.education_group_certificate_aim import EducationGroupCertificateAim
-from base.models.education_group_detailed_achievement import EducationGroupDetailedAchievement
-from base.models.education_group_organization import EducationGroupOrganization
-from base.models.education_group_year_domain import EducationGroupYearDomain
+from base.models.enums.revision_aggregate_types import RevisionAggregateTypes
 from education_group.ddd.command import GetTrainingEmptyFieldsOnWarningCommand
 from education_group.ddd.domain import exception
 from education_group.ddd.service.read.check_training_empty_fields_on_warning_service import \
     check_training_empty_fields_on_warning
-from education_group.models.group_year import GroupYear
 from education_group.views.training.common_read import TrainingRead, Tab
-from program_management.models.education_group_version import EducationGroupVersion
 
 
 class TrainingReadIdentification(TrainingRead):
@@ -49,7 +43,10 @@ class TrainingReadIdentification(TrainingRead):
         return {
             **super().get_context_data(**kwargs),
             "permission_object": self.get_permission_object(),
-            "history": self.get_related_history(),
+            "history_url": reverse(
+                'revision_history',
+                args=[RevisionAggregateTypes.EDUCATION_GROUP_YEAR.name, self.education_group_version.offer_id]
+            ),
             "fields_warnings": self.get_fields_in_warning()
         }
 
@@ -61,29 +58,3 @@ class TrainingReadIdentification(TrainingRead):
             except exception.TrainingEmptyFieldException as e:
                 return e.fields
         return []
-
-    def get_related_history(self):
-        group_year = self.education_group_version.root_group
-        versions = Version.objects.get_for_object(
-            self.education_group_version
-        ).select_related('revision__user__person')
-
-        related_models = [
-            EducationGroupOrganization,
-            EducationGroupAchievement,
-            EducationGroupDetailedAchievement,
-            EducationGroupYearDomain,
-            EducationGroupCertificateAim,
-            EducationGroupVersion,
-            GroupYear,
-        ]
-
-        subversion = Version.objects.none()
-        for model in related_models:
-            subversion |= Version.objects.get_for_model(model).select_related('revision__user__person')
-
-        versions |= subversion.filter(
-            serialized_data__contains="\"pk\": {}".format(group_year.pk)
-        )
-
-        return versions.order_by('-revision__date_created').distinct('revision__date_created')
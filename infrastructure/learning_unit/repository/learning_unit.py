@@ -34,6 +34,7 @@ from base.models.learning_container import LearningContainer as LearningContaine
 from base.models.learning_container_year import LearningContainerYear as LearningContainerYearDatabase
 from base.models.learning_unit import LearningUnit as LearningUnitDatabase
 from base.models.learning_unit_year import LearningUnitYear as LearningUnitYearDatabase
+from base.utils import search_text
 from ddd.logic.learning_unit.builder.learning_unit_builder import LearningUnitBuilder
 from ddd.logic.learning_unit.domain.model.learning_unit import LearningUnit, LearningUnitIdentity
 from ddd.logic.learning_unit.dtos import LearningUnitFromRepositoryDTO, LearningUnitSearchDTO
@@ -73,10 +74,7 @@ class LearningUnitRepository(ILearningUnitRepository):
                 requirement_entity__entityversion__acronym__icontains=responsible_entity_code,
             )
         if full_title is not None:
-            qs = qs.filter(
-                Q(learning_container_year__common_title__icontains=full_title)
-                | Q(specific_title__icontains=full_title),
-            )
+            qs = search_text.filter_queryset(qs, full_title)
 
         qs = qs.annotate(
             code=F('acronym'),
@@ -23,8 +23,12 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import functools
+import itertools
 from typing import Dict, Callable, List
 
+import attr
+
 from ddd.logic.learning_unit.commands import CreateLearningUnitCommand
 from ddd.logic.learning_unit.use_case.write.create_learning_unit_service import create_learning_unit
 from ddd.logic.shared_kernel.academic_year.commands import SearchAcademicYearCommand
@@ -33,9 +37,18 @@ from ddd.logic.shared_kernel.language.commands import SearchLanguagesCommand
 from ddd.logic.shared_kernel.language.use_case.read.search_languages_service import search_languages
 from infrastructure.learning_unit.repository.entity_repository import UclEntityRepository
 from infrastructure.learning_unit.repository.learning_unit import LearningUnitRepository
+from infrastructure.messages_bus_middlewares import MessageBusMiddleware, IdentityMapMiddleware, \
+    InstrumentationMiddleware, TransactionMiddleware
 from infrastructure.shared_kernel.academic_year.repository.academic_year import AcademicYearRepository
 from infrastructure.shared_kernel.language.repository.language import LanguageRepository
 from osis_common.ddd.interface import CommandRequest, ApplicationServiceResult
+from program_management.ddd import command as program_management_command
+from program_management.ddd.service.write import paste_element_service, \
+    create_and_postpone_tree_specific_version_service, create_and_postpone_tree_transition_version_service, \
+    create_and_attach_training_service, fill_program_tree_content_from_last_year_service, \
+    bulk_fill_program_tree_content_service_from_past_year, \
+    fill_program_tree_version_content_from_program_tree_version_service, \
+    bulk_fill_program_tree_version_content_service_from_past_year
 
 
 class MessageBus:
@@ -45,13 +58,83 @@ class MessageBus:
         ),
         SearchLanguagesCommand: lambda cmd: search_languages(cmd, LanguageRepository()),
         SearchAcademicYearCommand: lambda cmd: search_academic_years(cmd, AcademicYearRepository()),
+        program_management_command.PasteElementCommand: lambda cmd: paste_element_service.paste_element(cmd),
+        program_management_command.CreateProgramTreeSpecificVersionCommand: lambda cmd: (
+            create_and_postpone_tree_specific_version_service.create_and_postpone_program_tree_specific_version(cmd)
+        ),
+        program_management_command.CreateProgramTreeTransitionVersionCommand: lambda cmd: (
+            create_and_postpone_tree_transition_version_service.create_and_postpone_program_tree_transition_version(
+                cmd
+            )
+        ),
+        program_management_command.CreateAndAttachTrainingCommand: lambda cmd: (
+            create_and_attach_training_service.create_and_attach_training(cmd)
+        ),
+        program_management_command.FillProgramTreeContentFromLastYearCommand: lambda cmd: (
+            fill_program_tree_content_from_last_year_service.fill_program_tree_content_from_last_year(cmd)
+        ),
+        program_management_command.FillProgramTreeVersionContentFromProgramTreeVersionCommand: lambda cmd: (
+            fill_program_tree_version_content_from_program_tree_version_service.
+            fill_program_tree_version_content_from_program_tree_version(cmd)
+        ),
     }  # type: Dict[CommandRequest, Callable[[CommandRequest], ApplicationServiceResult]]
 
+    # Handlers receiving all the commands of a same type dispatched together (see invoke_batch)
+    batch_command_handlers = {
+        program_management_command.FillProgramTreeContentFromLastYearCommand: lambda cmds: (
+            bulk_fill_program_tree_content_service_from_past_year.bulk_fill_program_tree_content_from_last_year(cmds)
+        ),
+        program_management_command.FillProgramTreeVersionContentFromProgramTreeVersionCommand: lambda cmds: (
+            bulk_fill_program_tree_version_content_service_from_past_year.
+            bulk_fill_program_tree_version_content_from_last_year(cmds)
+        ),
+    }  # type: Dict[CommandRequest, Callable[[List[CommandRequest]], List[ApplicationServiceResult]]]
+
+    # Applied in this order around each handler
+    middlewares = [
+        InstrumentationMiddleware(),
+        TransactionMiddleware(),
+        IdentityMapMiddleware(),
+    ]  # type: List[MessageBusMiddleware]
+
     def invoke(self, command: CommandRequest) -> ApplicationServiceResult:
-        return self.command_handlers[command.__class__](command)
+        return self._handle(command, self.command_handlers[command.__class__])
 
     def invoke_multiple(self, commands: List['CommandRequest']) -> List[ApplicationServiceResult]:
         return [self.invoke(command) for command in commands]
 
+    def invoke_batch(self, commands: List['CommandRequest']) -> List[ApplicationServiceResult]:
+        """
+        Consecutive commands of a same type are given at once to the batch handler of this type.
+        Commands without batch handler are invoked one by one.
+        """
+        results = []
+        for command_class, grouped_commands in itertools.groupby(commands, key=lambda cmd: cmd.__class__):
+            grouped_commands = list(grouped_commands)
+            batch_handler = self.batch_command_handlers.get(command_class)
+            if batch_handler:
+                results += self._handle(grouped_commands, batch_handler)
+            else:
+                results += self.invoke_multiple(grouped_commands)
+        return results
+
+    def invoke_async(self, commands: List['CommandRequest']) -> None:
+        """
+        Dispatch the commands to a Celery worker, where they are handled by invoke_batch.
+        Commands attributes must be serializable. Only the attributes given to the constructor are sent.
+        """
+        from base.tasks import invoke_commands
+        invoke_commands.run.delay([
+            {
+                'command': "{}.{}".format(command.__class__.__module__, command.__class__.__name__),
+                'attributes': attr.asdict(command, filter=lambda attribute, value: attribute.init),
+            } for command in commands
+        ])
+
+    def _handle(self, command, handler):
+        for middleware in reversed(self.middlewares):
+            handler = functools.partial(middleware, next_handler=handler)
+        return handler(command)
+
 
 message_bus_instance = MessageBus()
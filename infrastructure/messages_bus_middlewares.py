@@ -0,0 +1,97 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import logging
+import time
+from typing import Callable, Union, List
+
+from django.conf import settings
+from django.db import transaction, connection
+
+from base.utils import identity_map
+from osis_common.ddd.interface import CommandRequest, ApplicationServiceResult
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+Commands = Union[CommandRequest, List[CommandRequest]]
+Handler = Callable[[Commands], ApplicationServiceResult]
+
+
+class MessageBusMiddleware:
+    """
+    Wraps the execution of a command (or of a batch of commands of the same type) by its handler.
+    """
+    def __call__(self, command: Commands, next_handler: Handler) -> ApplicationServiceResult:
+        raise NotImplementedError()
+
+
+class TransactionMiddleware(MessageBusMiddleware):
+    def __call__(self, command: Commands, next_handler: Handler) -> ApplicationServiceResult:
+        with transaction.atomic():
+            return next_handler(command)
+
+
+class InstrumentationMiddleware(MessageBusMiddleware):
+    """
+    Log the duration and the number of SQL queries of each command.
+    """
+    def __call__(self, command: Commands, next_handler: Handler) -> ApplicationServiceResult:
+        query_counter = _QueryCounter()
+        start = time.monotonic()
+        try:
+            with connection.execute_wrapper(query_counter):
+                return next_handler(command)
+        finally:
+            logger.info(
+                "Command %s handled in %.1f ms with %s queries",
+                _get_command_name(command),
+                (time.monotonic() - start) * 1000,
+                query_counter.count,
+            )
+
+
+class IdentityMapMiddleware(MessageBusMiddleware):
+    """
+    Entities loaded by the repositories are shared by the commands handled in the same scope.
+    The scope is discarded when a command fails, as its entities may have been modified in memory only.
+    """
+    def __call__(self, command: Commands, next_handler: Handler) -> ApplicationServiceResult:
+        with identity_map.scope(), identity_map.discard_on_error():
+            return next_handler(command)
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _get_command_name(command: Commands) -> str:
+    if isinstance(command, list):
+        return "{}[{}]".format(command[0].__class__.__name__ if command else "", len(command))
+    return command.__class__.__name__
@@ -27,6 +27,7 @@ from django.conf import settings
 from django.conf.urls import url
 from django.urls import include
 
+from base.utils.read_replica import read_only_view
 from learning_unit.api.views.attribution import LearningUnitAttribution
 from learning_unit.api.views.learning_achievement import LearningAchievementList
 from learning_unit.api.views.learning_unit import LearningUnitDetailed, LearningUnitList, LearningUnitTitle
@@ -36,10 +37,10 @@ from learning_unit.api.views.teaching_materials import LearningUnitTeachingMater
 app_name = "learning_unit"
 
 urlpatterns = [
-    url(r'^learning_units$', LearningUnitList.as_view(), name=LearningUnitList.name),
+    url(r'^learning_units$', read_only_view(LearningUnitList.as_view()), name=LearningUnitList.name),
     url(
         r'^learning_units/(?P<year>[0-9]{4})/(?P<acronym>[a-zA-Z0-9]+)$',
-        LearningUnitDetailed.as_view(),
+        read_only_view(LearningUnitDetailed.as_view()),
         name=LearningUnitDetailed.name
     ),
     url(r'^learning_units/(?P<year>[0-9]{4})/(?P<acronym>[a-zA-Z0-9]+)/', include([
@@ -25,6 +25,7 @@
 ##############################################################################
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
 from django_filters import rest_framework as filters
 from rest_framework import generics
 
@@ -32,6 +33,7 @@ from backoffice.settings.rest_framework.common_views import LanguageContextSeria
 from base.models.learning_unit_year import LearningUnitYear, LearningUnitYearQuerySet
 from learning_unit.api.serializers.learning_unit import LearningUnitDetailedSerializer, LearningUnitSerializer, \
     LearningUnitTitleSerializer, ExternalLearningUnitDetailedSerializer
+from learning_unit.ddd.repository import load_learning_unit_year_detail
 
 
 class LearningUnitFilter(filters.FilterSet):
@@ -74,25 +76,21 @@ class LearningUnitDetailed(LanguageContextSerializerMixin, generics.RetrieveAPIV
     """
     name = 'learningunits_read'
 
-    def get_object(self):
-        acronym = self.kwargs['acronym']
-        year = self.kwargs['year']
-        queryset = LearningUnitYear.objects.filter(learning_container_year__isnull=False).select_related(
-            'language',
-            'campus',
-            'academic_year',
-            'learning_container_year',
-            'externallearningunityear'
+    @cached_property
+    def learning_unit_year(self):
+        queryset = load_learning_unit_year_detail.get_queryset().filter(
+            learning_container_year__isnull=False
         ).prefetch_related(
             'learning_container_year__requirement_entity__entityversion_set',
-            'learningcomponentyear_set',
         ).annotate_full_title()
-        luy = get_object_or_404(
+        return get_object_or_404(
             LearningUnitYearQuerySet.annotate_entities_allocation_and_requirement_acronym(queryset),
-            acronym__iexact=acronym,
-            academic_year__year=year
+            acronym__iexact=self.kwargs['acronym'],
+            academic_year__year=self.kwargs['year']
         )
-        return luy
+
+    def get_object(self):
+        return self.learning_unit_year
 
     def get_serializer_class(self):
         if self.get_object().is_external():
@@ -24,15 +24,15 @@
 #
 ##############################################################################
 from django.conf import settings
-from django.db.models import F, Q
 from rest_framework import generics
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 
-from base.business.learning_unit import CMS_LABEL_PEDAGOGY, CMS_LABEL_SPECIFICATIONS, CMS_LABEL_PEDAGOGY_FR_AND_EN, \
-    CMS_LABEL_PEDAGOGY_FR_ONLY, CMS_LABEL_PEDAGOGY_FORCE_MAJEURE
+from base.business.learning_unit import CMS_LABEL_PEDAGOGY, CMS_LABEL_SPECIFICATIONS, CMS_LABEL_PEDAGOGY_FR_ONLY, \
+    CMS_LABEL_PEDAGOGY_FORCE_MAJEURE
 from base.models.learning_unit_year import LearningUnitYear
-from cms.models.translated_text import TranslatedText
+from cms.enums.entity_name import LEARNING_UNIT_YEAR
+from cms.models import translated_text
 from learning_unit.api.serializers.summary_specification import LearningUnitSummarySpecificationSerializer
 
 
@@ -52,40 +52,23 @@ class LearningUnitSummarySpecification(generics.GenericAPIView):
             academic_year__year=self.kwargs['year']
         )
         parent = learning_unit_year.parent
-        qs_parent = self._get_translated_texts(parent) if parent else None
-        qs = self._get_translated_texts(learning_unit_year).values('label', 'text')
-
-        summary_specification_grouped = dict.fromkeys(
-            CMS_LABEL_PEDAGOGY +
-            CMS_LABEL_SPECIFICATIONS +
-            CMS_LABEL_PEDAGOGY_FORCE_MAJEURE,
-            None
+        texts = translated_text.bulk_search(
+            (LEARNING_UNIT_YEAR, luy.pk) for luy in filter(None, [learning_unit_year, parent])
         )
-        for key in summary_specification_grouped.keys():
-            partim_text = qs.filter(label=key).values_list('text', flat=True).first()
-            parent_text = qs_parent.filter(label=key).values_list('text', flat=True).first() if qs_parent else None
+
+        summary_specification_grouped = {}
+        for key in CMS_LABEL_PEDAGOGY + CMS_LABEL_SPECIFICATIONS + CMS_LABEL_PEDAGOGY_FORCE_MAJEURE:
+            language = self._get_text_language(key)
+            partim_text = texts.get_text(LEARNING_UNIT_YEAR, learning_unit_year.pk, key, language)
+            parent_text = texts.get_text(LEARNING_UNIT_YEAR, parent.pk, key, language) if parent else None
             summary_specification_grouped[key] = partim_text if partim_text else parent_text
 
         serializer = self.get_serializer(summary_specification_grouped)
 
         return Response(serializer.data)
 
-    def _get_translated_texts(self, luy):
+    def _get_text_language(self, label: str) -> str:
+        if label in CMS_LABEL_PEDAGOGY_FR_ONLY:
+            return settings.LANGUAGE_CODE_FR
         language = self.request.LANGUAGE_CODE
-        qs = TranslatedText.objects.filter(
-            reference=luy.pk,
-            text_label__label__in=CMS_LABEL_PEDAGOGY + CMS_LABEL_SPECIFICATIONS + CMS_LABEL_PEDAGOGY_FORCE_MAJEURE
-        ).annotate(
-            label=F('text_label__label')
-        ).filter(
-            Q(
-                language=settings.LANGUAGE_CODE_FR if language == settings.LANGUAGE_CODE_FR[:2] else language,
-                label__in=CMS_LABEL_PEDAGOGY_FR_AND_EN + CMS_LABEL_SPECIFICATIONS + CMS_LABEL_PEDAGOGY_FORCE_MAJEURE
-            )
-            |
-            Q(
-                language=settings.LANGUAGE_CODE_FR,
-                label__in=CMS_LABEL_PEDAGOGY_FR_ONLY
-            )
-        )
-        return qs
+        return settings.LANGUAGE_CODE_FR if language == settings.LANGUAGE_CODE_FR[:2] else language
@@ -0,0 +1,183 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import itertools
+from typing import Dict, List, Optional
+
+import attr
+from django.db.models import Prefetch, QuerySet
+from django.utils import timezone
+
+from base.business.learning_unit_year_with_context import volume_learning_component_year
+from base.models.entity_version import EntityVersion
+from base.models.enums import learning_unit_year_subtypes
+from base.models.enums.entity_container_year_link_type import REQUIREMENT_ENTITY, ALLOCATION_ENTITY, \
+    ADDITIONAL_REQUIREMENT_ENTITY_1, ADDITIONAL_REQUIREMENT_ENTITY_2, REQUIREMENT_ENTITIES
+from base.models.learning_component_year import LearningComponentYear
+from base.models.learning_unit_year import LearningUnitYear
+from base.models.proposal_learning_unit import ProposalLearningUnit
+
+LinkType = str
+
+
+@attr.s(slots=True)
+class LearningUnitYearDetail:
+    """
+    Read model shared by the learning unit tabs and the API detail: every row is loaded up-front,
+    so reading it in views and templates does not trigger any query.
+    """
+    learning_unit_year = attr.ib(type=LearningUnitYear)
+    partims = attr.ib(type=List[LearningUnitYear], factory=list)
+    components = attr.ib(type=List[LearningComponentYear], factory=list)
+    entity_versions = attr.ib(type=Dict[LinkType, EntityVersion], factory=dict)  # Most recent version by link type
+    proposal = attr.ib(type=Optional[ProposalLearningUnit], default=None)
+    proposal_folder_entity_version = attr.ib(type=Optional[EntityVersion], default=None)
+
+    @property
+    def attributions(self) -> Dict[str, EntityVersion]:
+        # Same keys as base.business.learning_unit.get_all_attributions
+        return {
+            'requirement_entity': self.entity_versions.get(REQUIREMENT_ENTITY),
+            'allocation_entity': self.entity_versions.get(ALLOCATION_ENTITY),
+            'additional_requirement_entity_1': self.entity_versions.get(ADDITIONAL_REQUIREMENT_ENTITY_1),
+            'additional_requirement_entity_2': self.entity_versions.get(ADDITIONAL_REQUIREMENT_ENTITY_2),
+        }
+
+    @property
+    def components_identification(self) -> dict:
+        # Same structure as base.business.learning_unit.get_components_identification
+        components = {
+            'components': [
+                {
+                    'learning_component_year': component,
+                    'volumes': volume_learning_component_year(component)
+                }
+                for component in self.components
+            ]
+        }
+        components.update({
+            link_type: entity_version.acronym if entity_version else None
+            for link_type, entity_version in self.entity_versions.items()
+            if link_type in REQUIREMENT_ENTITIES
+        })
+        return components
+
+
+def get_queryset() -> QuerySet:
+    """ Learning unit years with the rows displayed by every learning unit tab """
+    return LearningUnitYear.objects.select_related(
+        'academic_year',
+        'learning_unit',
+        'language',
+        'campus__organization',
+        'externallearningunityear',
+        'learning_container_year__academic_year',
+        'learning_container_year__requirement_entity',
+        'learning_container_year__allocation_entity',
+        'learning_container_year__additional_entity_1',
+        'learning_container_year__additional_entity_2',
+    ).prefetch_related(
+        'learningcomponentyear_set',
+        Prefetch(
+            'learning_unit__learningunityear_set',
+            queryset=LearningUnitYear.objects.select_related('academic_year')
+        ),
+    )
+
+
+def load(learning_unit_year_id: int) -> LearningUnitYearDetail:
+    return load_from_instance(get_queryset().get(pk=learning_unit_year_id))
+
+
+def load_from_instance(learning_unit_year: LearningUnitYear) -> LearningUnitYearDetail:
+    """
+    Complete a learning unit year fetched through get_queryset() with its partims, proposal and entity versions.
+    Costs at most three queries, whatever the number of components, partims or entities.
+    """
+    container_year = learning_unit_year.learning_container_year
+    proposal = ProposalLearningUnit.objects.filter(
+        learning_unit_year__learning_unit_id=learning_unit_year.learning_unit_id
+    ).select_related('learning_unit_year__academic_year').first()
+
+    entities_by_type = container_year.get_map_entity_by_type() if container_year else {}
+    entity_ids = {entity.pk for entity in entities_by_type.values() if entity}
+    if proposal:
+        entity_ids.add(proposal.entity_id)
+    versions_by_entity = _load_entity_versions(entity_ids)
+    for entity in filter(None, entities_by_type.values()):
+        # Used by Entity.get_latest_entity_version()
+        entity.entity_versions = versions_by_entity.get(entity.pk, [])
+
+    return LearningUnitYearDetail(
+        learning_unit_year=learning_unit_year,
+        partims=_load_partims(learning_unit_year),
+        components=sorted(
+            learning_unit_year.learningcomponentyear_set.all(),
+            key=lambda component: (component.type or '', component.acronym or '')
+        ),
+        entity_versions={
+            link_type: versions_by_entity[entity.pk][-1]
+            for link_type, entity in entities_by_type.items()
+            if entity and versions_by_entity.get(entity.pk)
+        },
+        proposal=proposal,
+        proposal_folder_entity_version=_get_current_version(
+            versions_by_entity.get(proposal.entity_id, [])
+        ) if proposal else None,
+    )
+
+
+def _load_partims(learning_unit_year: LearningUnitYear) -> List[LearningUnitYear]:
+    if not learning_unit_year.is_full() or not learning_unit_year.learning_container_year_id:
+        return []
+    return list(
+        LearningUnitYear.objects.filter(
+            learning_container_year_id=learning_unit_year.learning_container_year_id,
+            subtype=learning_unit_year_subtypes.PARTIM,
+        ).select_related('academic_year').order_by('acronym')
+    )
+
+
+def _load_entity_versions(entity_ids) -> Dict[int, List[EntityVersion]]:
+    if not entity_ids:
+        return {}
+    versions = EntityVersion.objects.filter(
+        entity_id__in=entity_ids
+    ).select_related('entity__organization').order_by('entity_id', 'start_date')
+    return {
+        entity_id: list(entity_versions)
+        for entity_id, entity_versions in itertools.groupby(versions, key=lambda version: version.entity_id)
+    }
+
+
+def _get_current_version(entity_versions: List[EntityVersion]) -> Optional[EntityVersion]:
+    today = timezone.now().date()
+    return next(
+        (
+            version for version in entity_versions
+            if version.start_date <= today and (version.end_date is None or version.end_date >= today)
+        ),
+        None
+    )
@@ -34,6 +34,7 @@ from base.models.enums import learning_unit_year_subtypes
 from base.tests.factories.academic_year import AcademicYearFactory
 from base.tests.factories.learning_unit_year import LearningUnitYearFactory
 from base.tests.factories.person import PersonFactory
+from cms.enums.entity_name import LEARNING_UNIT_YEAR
 from cms.models.translated_text import TranslatedText
 from cms.tests.factories.translated_text import TranslatedTextFactory, TranslatedTextRandomFactory
 from learning_unit.api.views.summary_specification import LearningUnitSummarySpecification
@@ -50,6 +51,7 @@ class LearningUnitSummarySpecificationTestCase(APITestCase):
         )
         for label in CMS_LABEL_PEDAGOGY:
             TranslatedTextRandomFactory(
+                entity=LEARNING_UNIT_YEAR,
                 reference=cls.learning_unit_year.pk,
                 text_label__label=label,
                 language=settings.LANGUAGE_CODE_FR
@@ -106,6 +108,7 @@ class LearningUnitSummarySpecificationTestCase(APITestCase):
         partims_labels.remove('resume')
         for label in partims_labels:
             TranslatedTextFactory(
+                entity=LEARNING_UNIT_YEAR,
                 reference=partim.pk,
                 text_label__label=label,
                 language=settings.LANGUAGE_CODE_FR
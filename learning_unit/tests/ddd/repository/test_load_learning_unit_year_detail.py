@@ -0,0 +1,127 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+
+from django.test import TestCase
+
+from base.models.enums import learning_component_year_type
+from base.models.enums.entity_container_year_link_type import REQUIREMENT_ENTITY, ALLOCATION_ENTITY
+from base.tests.factories.entity_version import EntityVersionFactory
+from base.tests.factories.learning_component_year import LearningComponentYearFactory
+from base.tests.factories.learning_unit_year import LearningUnitYearFullFactory, LearningUnitYearPartimFactory
+from base.tests.factories.proposal_learning_unit import ProposalLearningUnitFactory
+from learning_unit.ddd.repository import load_learning_unit_year_detail
+
+# Learning unit year, its components, the years of its learning unit, its proposal, its partims and entity versions
+QUERY_BUDGET = 6
+
+
+class TestLoadLearningUnitYearDetail(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.learning_unit_year = LearningUnitYearFullFactory()
+        cls.requirement_entity = cls.learning_unit_year.learning_container_year.requirement_entity
+        cls.old_entity_version = EntityVersionFactory(
+            entity=cls.requirement_entity,
+            start_date=datetime.date(2000, 1, 1),
+            end_date=datetime.date(2009, 12, 31),
+        )
+        cls.entity_version = EntityVersionFactory(
+            entity=cls.requirement_entity,
+            start_date=datetime.date(2010, 1, 1),
+            end_date=None,
+        )
+        cls.practical = LearningComponentYearFactory(
+            learning_unit_year=cls.learning_unit_year,
+            type=learning_component_year_type.PRACTICAL_EXERCISES,
+        )
+        cls.lecturing = LearningComponentYearFactory(
+            learning_unit_year=cls.learning_unit_year,
+            type=learning_component_year_type.LECTURING,
+        )
+
+    def test_should_load_detail(self):
+        detail = load_learning_unit_year_detail.load(self.learning_unit_year.pk)
+
+        self.assertEqual(detail.learning_unit_year, self.learning_unit_year)
+        self.assertListEqual(detail.components, [self.lecturing, self.practical])
+        self.assertListEqual(detail.partims, [])
+        self.assertIsNone(detail.proposal)
+        self.assertEqual(detail.entity_versions[REQUIREMENT_ENTITY], self.entity_version)
+        self.assertEqual(detail.attributions['allocation_entity'], self.entity_version)
+        self.assertEqual(
+            detail.components_identification[REQUIREMENT_ENTITY],
+            self.entity_version.acronym
+        )
+
+    def test_should_load_partims_and_proposal(self):
+        partims = [
+            LearningUnitYearPartimFactory(
+                academic_year=self.learning_unit_year.academic_year,
+                learning_container_year=self.learning_unit_year.learning_container_year,
+                acronym="{}{}".format(self.learning_unit_year.acronym, letter),
+            ) for letter in "BA"
+        ]
+        proposal = ProposalLearningUnitFactory(
+            learning_unit_year=self.learning_unit_year,
+            entity=self.requirement_entity,
+        )
+
+        detail = load_learning_unit_year_detail.load(self.learning_unit_year.pk)
+
+        self.assertListEqual(detail.partims, sorted(partims, key=lambda partim: partim.acronym))
+        self.assertEqual(detail.proposal, proposal)
+        self.assertEqual(detail.proposal_folder_entity_version, self.entity_version)
+
+    def test_should_load_within_query_budget_whatever_the_number_of_rows(self):
+        for letter in "ABC":
+            LearningUnitYearPartimFactory(
+                academic_year=self.learning_unit_year.academic_year,
+                learning_container_year=self.learning_unit_year.learning_container_year,
+                acronym="{}{}".format(self.learning_unit_year.acronym, letter),
+            )
+        LearningComponentYearFactory.create_batch(3, learning_unit_year=self.learning_unit_year)
+        ProposalLearningUnitFactory(learning_unit_year=self.learning_unit_year, entity=self.requirement_entity)
+
+        with self.assertNumQueries(QUERY_BUDGET):
+            detail = load_learning_unit_year_detail.load(self.learning_unit_year.pk)
+            detail.attributions
+            detail.components_identification
+            [component.learning_unit_year_id for component in detail.components]
+            [partim.academic_year.year for partim in detail.partims]
+            detail.learning_unit_year.learning_container_year.requirement_entity.get_latest_entity_version()
+            [luy.academic_year.year for luy in detail.learning_unit_year.learning_unit.learningunityear_set.all()]
+
+    def test_partim_has_no_partims(self):
+        partim = LearningUnitYearPartimFactory(
+            academic_year=self.learning_unit_year.academic_year,
+            learning_container_year=self.learning_unit_year.learning_container_year,
+        )
+        self.assertListEqual(load_learning_unit_year_detail.load(partim.pk).partims, [])
+
+    def test_allocation_entity_is_requirement_entity(self):
+        detail = load_learning_unit_year_detail.load(self.learning_unit_year.pk)
+        self.assertEqual(detail.entity_versions[ALLOCATION_ENTITY], detail.entity_versions[REQUIREMENT_ENTITY])
@@ -64,6 +64,7 @@ FONT_HYPERLINK = Font(underline='single', color='0563C1')
 HeaderLine = namedtuple('HeaderLine', ['egy_acronym', 'egy_title', 'code_header', 'title_header', 'credits_header',
                                        'block_header', 'mandatory_header'])
 OfficialTextLine = namedtuple('OfficialTextLine', ['text'])
+ContentAggregatesLine = namedtuple('ContentAggregatesLine', ['text'])
 LearningUnitYearLine = namedtuple('LearningUnitYearLine', ['luy_acronym', 'luy_title'])
 PrerequisiteItemLine = namedtuple(
     'PrerequisiteItemLine',
@@ -123,6 +124,7 @@ def _build_excel_lines(tree: 'ProgramTree') -> List:
         )
     )
 
+    aggregates = tree.get_aggregates()
     for node in tree.get_nodes_that_have_prerequisites():
         content.append(
             LearningUnitYearLine(luy_acronym=node.code, luy_title=complete_title(node))
@@ -130,8 +132,8 @@ def _build_excel_lines(tree: 'ProgramTree') -> List:
 
         for group_number, group in enumerate(tree.get_prerequisite(node).prerequisite_item_groups, start=1):
             for position, prerequisite_item in enumerate(group.prerequisite_items, start=1):
-                prerequisite_item_links = tree.search_links_using_node(
-                    tree.get_node_by_code_and_year(code=prerequisite_item.code, year=prerequisite_item.year)
+                prerequisite_item_links = aggregates.search_links_using_node(
+                    aggregates.get_node_by_code_and_year(code=prerequisite_item.code, year=prerequisite_item.year)
                 )
                 prerequisite_line = _prerequisite_item_line(tree,
                                                             prerequisite_item, prerequisite_item_links,
@@ -139,6 +141,7 @@ def _build_excel_lines(tree: 'ProgramTree') -> List:
                                                             len(group.prerequisite_items))
                 content.append(prerequisite_line)
 
+    content.append(_content_aggregates_line(tree))
     return content
 
 
@@ -153,6 +156,11 @@ def _first_line_content(header_line) -> List:
     return content
 
 
+def _content_aggregates_line(tree: 'ProgramTree') -> ContentAggregatesLine:
+    aggregates = tree.get_aggregates().get_node_aggregates(tree.root_node)
+    return ContentAggregatesLine(text=formatter.format_node_aggregates(aggregates))
+
+
 def _get_operator(prerequisite: Prerequisite, group_number: int, position: int):
     if group_number == 1 and position == 1:
         return None
@@ -332,6 +340,7 @@ def _build_excel_lines_prerequisited(tree: 'ProgramTree') -> List:
                     )
                     first = False
                     content.append(prerequisite_line)
+    content.append(_content_aggregates_line(tree))
     return content
 
 
@@ -345,7 +354,7 @@ def _get_group_or_offer_title(language, tree):
 def _build_is_prerequisite_for_line(prerequisite_node: 'NodeLearningUnitYear', first, tree: 'ProgramTree') \
         -> PrerequisiteOfItemLine:
     text = (_("is a prerequisite of") + " :") if first else None
-    first_link = tree.get_first_link_occurence_using_node(prerequisite_node)
+    first_link = tree.get_aggregates().search_links_using_node(prerequisite_node)[0]
     return PrerequisiteOfItemLine(
         text=text,
         luy_acronym=prerequisite_node.code,
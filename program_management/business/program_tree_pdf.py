@@ -0,0 +1,272 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+import hashlib
+from collections import namedtuple
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.http import HttpRequest, HttpResponse
+from django.utils import translation
+
+from backoffice.settings.base import LANGUAGE_CODE_EN
+from base.models.enums.education_group_types import GroupType, TrainingType, MiniTrainingType
+from base.models.group_element_year import GroupElementYear
+from base.models.prerequisite import Prerequisite
+from base.models.prerequisite_item import PrerequisiteItem
+from base.utils.cache import OsisCache
+from base.utils.read_replica import read_primary
+from osis_common.document.pdf_build import render_pdf
+from program_management.ddd.domain import exception
+from program_management.ddd.domain.node import NodeIdentity
+from program_management.ddd.domain.program_tree_version import version_label
+from program_management.ddd.domain.service.identity_search import ProgramTreeVersionIdentitySearch, \
+    ProgramTreeIdentitySearch
+from program_management.ddd.repositories.program_tree import ProgramTreeRepository
+from program_management.ddd.repositories.program_tree_version import ProgramTreeVersionRepository
+from program_management.models.education_group_version import EducationGroupVersion
+from program_management.models.element import Element
+
+CURRENT_SIZE_FOR_ANNUAL_COLUMN = 15
+MAIN_PART_INIT_SIZE = 650
+PADDING = 10
+USUAL_NUMBER_OF_BLOCKS = 3
+
+PDF_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+PDF_GENERATION_LOCK_TIMEOUT = 60 * 10
+# Above this number of links, the PDF is generated by a worker instead of during the request
+ASYNC_GENERATION_THRESHOLD = 300
+
+PUBLISHED_ROOT_TYPES = TrainingType.get_names() + MiniTrainingType.get_names()
+
+
+TreeStamp = namedtuple('TreeStamp', 'value, number_of_links')
+
+
+class ProgramTreePdfCache(OsisCache):
+    """
+    Rendered PDF of a program tree. The key contains a stamp of the tree content (see 'get_tree_stamp'), so that
+    a document is never served once a node or a link of the tree has changed.
+    """
+    PREFIX_KEY = 'program_tree_pdf'
+
+    def __init__(self, code: str, year: int, language: str, tree_stamp: str):
+        self.code = code
+        self.year = year
+        self.language = language
+        self.tree_stamp = tree_stamp
+
+    @property
+    def key(self):
+        return "_".join([self.PREFIX_KEY, self.code, str(self.year), self.language, self.tree_stamp])
+
+    def set_cached_data(self, data, timeout=PDF_CACHE_TIMEOUT):
+        super().set_cached_data(data, timeout=timeout)
+
+    def get_response(self) -> Optional[HttpResponse]:
+        cached_data = self.cached_data
+        if not cached_data:
+            return None
+        response = HttpResponse(cached_data['content'], content_type=cached_data['content_type'])
+        if cached_data['content_disposition']:
+            response['Content-Disposition'] = cached_data['content_disposition']
+        return response
+
+    def save_response(self, response: HttpResponse):
+        self.set_cached_data({
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'content_disposition': response.get('Content-Disposition'),
+        })
+
+
+def acquire_generation_lock(code: str, year: int, language: str) -> bool:
+    """
+    :return: False if the PDF is already being generated by a worker
+    """
+    return cache.add(_get_generation_lock_key(code, year, language), True, timeout=PDF_GENERATION_LOCK_TIMEOUT)
+
+
+def release_generation_lock(code: str, year: int, language: str):
+    cache.delete(_get_generation_lock_key(code, year, language))
+
+
+def _get_generation_lock_key(code: str, year: int, language: str) -> str:
+    return "_".join([ProgramTreePdfCache.PREFIX_KEY, 'generation', code, str(year), language])
+
+
+def get_tree_stamp(code: str, year: int) -> Optional[TreeStamp]:
+    """
+    Fingerprint of the content of the tree: links (added, removed or modified), nodes (with the titles of their offer
+    and the volumes of their learning components), versions and prerequisites.
+    :return: None if the root node does not exist
+    """
+    root_element_id = Element.objects.filter(
+        group_year__partial_acronym=code,
+        group_year__academic_year__year=year,
+    ).values_list('pk', flat=True).first()
+    if root_element_id is None:
+        return None
+    tree_structure = GroupElementYear.objects.get_adjacency_list([root_element_id])
+    link_ids = sorted(link['id'] for link in tree_structure)
+    element_ids = [root_element_id] + [link['child_id'] for link in tree_structure]
+
+    links_changed = GroupElementYear.objects.filter(pk__in=link_ids).aggregate(changed=Max('changed'))
+    elements_changed = Element.objects.filter(pk__in=element_ids).aggregate(
+        elements=Max('changed'),
+        group_years=Max('group_year__changed'),
+        offers=Max('group_year__educationgroupversion__offer__changed'),
+        learning_unit_years=Max('learning_unit_year__changed'),
+        learning_container_years=Max('learning_unit_year__learning_container_year__changed'),
+        learning_component_years=Max('learning_unit_year__learningcomponentyear__changed'),
+    )
+    versions_changed = EducationGroupVersion.objects.filter(
+        root_group__element__pk=root_element_id
+    ).aggregate(changed=Max('changed'))
+    # Ids and not only the last changed dates, so that a deletion changes the stamp
+    prerequisites = Prerequisite.objects.filter(
+        education_group_version__root_group__element__pk=root_element_id,
+        learning_unit_year__element__pk__in=element_ids,
+    )
+    prerequisites_stamp = list(prerequisites.order_by('pk').values_list('pk', 'changed'))
+    prerequisite_items_stamp = list(
+        PrerequisiteItem.objects.filter(prerequisite__in=prerequisites).order_by('pk').values_list('pk', 'changed')
+    )
+
+    fingerprint = repr((
+        link_ids,
+        links_changed['changed'],
+        sorted(elements_changed.items()),
+        sorted(versions_changed.items()),
+        prerequisites_stamp,
+        prerequisite_items_stamp,
+    ))
+    return TreeStamp(value=hashlib.sha1(fingerprint.encode()).hexdigest(), number_of_links=len(link_ids))
+
+
+def render_program_tree_pdf(request: HttpRequest, code: str, year: int, language: str) -> HttpResponse:
+    node_id = NodeIdentity(code=code, year=year)
+
+    program_tree_id = ProgramTreeVersionIdentitySearch().get_from_node_identity(node_id)
+    try:
+        program_tree_version = ProgramTreeVersionRepository.get(program_tree_id)
+    except exception.ProgramTreeVersionNotFoundException:
+        program_tree_version = None
+    if program_tree_version:
+        tree = program_tree_version.get_tree()
+    else:
+        tree = ProgramTreeRepository.get(
+            ProgramTreeIdentitySearch().get_from_node_identity(node_id)
+        )
+    tree = tree.prune(ignore_children_from={GroupType.MINOR_LIST_CHOICE})
+    if tree.root_node.is_finality():
+        title = tree.root_node.offer_partial_title_en \
+            if language == LANGUAGE_CODE_EN and tree.root_node.offer_partial_title_en \
+            else tree.root_node.offer_partial_title_fr
+    else:
+        title = tree.root_node.group_title_en if language == LANGUAGE_CODE_EN and tree.root_node.group_title_en \
+            else tree.root_node.group_title_fr
+
+    version_str = version_label(program_tree_version.entity_identity) if program_tree_version else ''
+    if version_str:
+        version_title = program_tree_version.title_en \
+            if language == LANGUAGE_CODE_EN and program_tree_version.title_en else program_tree_version.title_fr
+        title = "{} - {}{}".format(title, version_title, version_str)
+
+    context = {
+        'root': tree.root_node,
+        'tree': tree,
+        'language': language,
+        'created': datetime.datetime.now(),
+        'max_block': tree.get_greater_block_value(),
+        'main_part_col_length': get_main_part_col_length(tree.get_greater_block_value()),
+        'title': title.strip()
+    }
+
+    with translation.override(language):
+        return render_pdf(
+            request,
+            context=context,
+            filename="{}{}".format(
+                tree.root_node.title,
+                version_str if version_str else ''
+            ),
+            template='pdf_content.html',
+        )
+
+
+def generate_program_tree_pdf(
+        code: str,
+        year: int,
+        language: str,
+        request: HttpRequest = None,
+        expected_tree_stamp: str = None
+) -> HttpResponse:
+    """
+    Return the cached PDF of the tree or render it and put it in cache.
+    :param expected_tree_stamp: Stamp of the tree seen by the caller on the primary database. When the tree read here
+    (e.g. from a lagging replica) has another stamp, the PDF is generated from the primary database, so that it is
+    cached under the stamp the views look for.
+    :raise ProgramTreeNotFoundException: if the root node does not exist
+    """
+    tree_stamp = get_tree_stamp(code, year)
+    if expected_tree_stamp is not None and (tree_stamp is None or tree_stamp.value != expected_tree_stamp):
+        with read_primary():
+            return generate_program_tree_pdf(code, year, language, request)
+    if tree_stamp is None:
+        raise exception.ProgramTreeNotFoundException(code=code, year=year)
+    pdf_cache = ProgramTreePdfCache(code, year, language, tree_stamp.value)
+    response = pdf_cache.get_response()
+    if response is None:
+        response = render_program_tree_pdf(request or build_rendering_request(), code, year, language)
+        pdf_cache.save_response(response)
+    return response
+
+
+def build_rendering_request() -> HttpRequest:
+    """
+    Request used to render documents out of an HTTP request (by a worker), so that static files urls are absolute.
+    """
+    request = HttpRequest()
+    request.META['HTTP_HOST'] = settings.PDF_RENDERING_HOST
+    return request
+
+
+def get_published_roots_codes(year: int):
+    return Element.objects.filter(
+        group_year__academic_year__year=year,
+        group_year__education_group_type__name__in=PUBLISHED_ROOT_TYPES,
+        group_year__educationgroupversion__isnull=False,
+    ).values_list('group_year__partial_acronym', flat=True).distinct()
+
+
+def get_main_part_col_length(max_block):
+    if max_block <= USUAL_NUMBER_OF_BLOCKS:
+        return MAIN_PART_INIT_SIZE
+    else:
+        return MAIN_PART_INIT_SIZE - ((max_block-USUAL_NUMBER_OF_BLOCKS) * (CURRENT_SIZE_FOR_ANNUAL_COLUMN + PADDING))
@@ -23,12 +23,13 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from typing import List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from django.utils.translation import gettext_lazy as _, pgettext_lazy
 from openpyxl.styles import Font
 
 from base.business.education_group import ordering_data
+from base.business.learning_unit_xls import get_significant_volume
 from base.business.xls import get_name_or_username
 from base.models.enums.publication_contact_type import PublicationContactType
 from base.utils.excel import get_html_to_text
@@ -40,9 +41,13 @@ from education_group.ddd.service.read import get_group_service, get_training_ser
 from education_group.models.group_year import GroupYear
 from education_group.views import serializers
 from osis_common.document import xls_build
+from program_management import formatter
 from program_management.ddd.domain import exception
 from program_management.ddd.domain.node import NodeIdentity
+from program_management.ddd.domain.program_tree import ProgramTreeIdentity
 from program_management.ddd.domain.service.identity_search import ProgramTreeVersionIdentitySearch
+from program_management.ddd.domain.tree_aggregates import NodeAggregates
+from program_management.ddd.repositories.program_tree import ProgramTreeRepository
 from program_management.ddd.repositories.program_tree_version import ProgramTreeVersionRepository
 
 ARES_ONLY = [str(_('ARES study code')), str(_('ARES-GRACA')), str(_('ARES ability'))]
@@ -70,6 +75,7 @@ WITH_FUNDING = "with_funding"
 WITH_OTHER_LEGAL_INFORMATION = "with_other_legal_information"
 WITH_ADDITIONAL_INFO = "with_additional_info"
 WITH_KEYWORDS = "with_keywords"
+WITH_CONTENT_AGGREGATES = "with_content_aggregates"
 
 TRAINING_LIST_CUSTOMIZABLE_PARAMETERS = [
     WITH_VALIDITY,
@@ -85,7 +91,8 @@ TRAINING_LIST_CUSTOMIZABLE_PARAMETERS = [
     WITH_ARES_CODE,
     WITH_OTHER_LEGAL_INFORMATION,
     WITH_ADDITIONAL_INFO,
-    WITH_KEYWORDS
+    WITH_KEYWORDS,
+    WITH_CONTENT_AGGREGATES,
 ]
 DEFAULT_EDUCATION_GROUP_TITLES = [
     str(_('Ac yr.')),
@@ -122,7 +129,10 @@ PARAMETER_HEADERS = {
     WITH_ADDITIONAL_INFO: [str(_('Type of constraint')), str(_('minimum constraint').capitalize()),
                            str(_('maximum constraint').capitalize()), str(_('comment (internal)').capitalize()),
                            str(_('Remark')), str(_('Remark in English'))],
-    WITH_KEYWORDS: [str(_('Keywords'))]
+    WITH_KEYWORDS: [str(_('Keywords'))],
+    WITH_CONTENT_AGGREGATES: [str(_('Credits of the content')), str(_('Mandatory credits of the content')),
+                              str(_('Learning units of the content')), str(_('Lecturing vol.')),
+                              str(_('Practical vol.'))],
 }
 
 BOLD_FONT = Font(bold=True)
@@ -145,10 +155,43 @@ def create_customized_xls(user, found_education_groups_param, filters, order_dat
 def prepare_xls_content_with_parameters(found_education_groups: List[GroupYear], other_params: List['str']) -> List:
     if WITH_ORGANIZATION in other_params and WITH_ACTIVITIES in other_params:
         other_params.remove(WITH_ACTIVITIES)
-    return [extract_xls_data_from_education_group_with_parameters(eg, other_params) for eg in found_education_groups]
+    aggregates_by_code_and_year = {}
+    if WITH_CONTENT_AGGREGATES in other_params:
+        aggregates_by_code_and_year = _get_content_aggregates_by_code_and_year(found_education_groups)
+    return [
+        extract_xls_data_from_education_group_with_parameters(
+            eg,
+            other_params,
+            aggregates_by_code_and_year.get((eg.partial_acronym, eg.academic_year.year))
+        ) for eg in found_education_groups
+    ]
+
+
+def _get_content_aggregates_by_code_and_year(
+        group_years: List[GroupYear]
+) -> Dict[Tuple[str, int], 'NodeAggregates']:
+    """
+    Aggregates of the content of each group year, read from their program trees loaded at once.
+    """
+    if not group_years:
+        return {}
+    trees = ProgramTreeRepository.search(
+        entity_ids=[
+            ProgramTreeIdentity(code=group_year.partial_acronym, year=group_year.academic_year.year)
+            for group_year in group_years
+        ]
+    )
+    return {
+        (tree.root_node.code, tree.root_node.year): tree.get_aggregates().get_node_aggregates(tree.root_node)
+        for tree in trees
+    }
 
 
-def extract_xls_data_from_education_group_with_parameters(group_year: GroupYear, other_params: List['str']) -> List:
+def extract_xls_data_from_education_group_with_parameters(
+        group_year: GroupYear,
+        other_params: List['str'],
+        content_aggregates: Optional['NodeAggregates'] = None
+) -> List:
     offer = None
     training = None
     mini_training = None
@@ -246,9 +289,24 @@ def extract_xls_data_from_education_group_with_parameters(group_year: GroupYear,
     if WITH_KEYWORDS in other_params:
         data.append(_build_keywords_data(offer))
 
+    if WITH_CONTENT_AGGREGATES in other_params:
+        data.extend(_build_content_aggregates_data(content_aggregates))
+
     return data
 
 
+def _build_content_aggregates_data(content_aggregates: Optional['NodeAggregates']) -> List:
+    if not content_aggregates:
+        return _add_empty_characters(len(PARAMETER_HEADERS[WITH_CONTENT_AGGREGATES]))
+    return [
+        formatter.format_credits(content_aggregates.total_credits),
+        formatter.format_credits(content_aggregates.mandatory_credits),
+        content_aggregates.learning_units_count,
+        get_significant_volume(content_aggregates.volume_total_lecturing),
+        get_significant_volume(content_aggregates.volume_total_practical),
+    ]
+
+
 def _build_keywords_data(offer: Union['Training', 'Mini-Training']) -> str:
     if offer:
         return offer.keywords
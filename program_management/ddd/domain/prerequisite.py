@@ -24,8 +24,9 @@
 #
 ##############################################################################
 import contextlib
+import functools
 import re
-from typing import List, Dict
+from typing import List, Dict, Optional, Set, Tuple
 
 import attr
 from django.utils.translation import gettext as _
@@ -68,6 +69,131 @@ PREREQUISITE_SYNTAX_REGEX = r'^(?i)({no_element_regex}|' \
 
 PrerequisiteExpression = str  # Example : "(Prerequisite1 OR Prerequisite2) AND (prerequisite3)"
 
+TOKEN_REGEX = re.compile(
+    r'(?P<open>\()|(?P<close>\))|(?P<operator> (?:{and_operator}|{or_operator}) )|(?P<acronym>{acronym_regex})'.format(
+        and_operator=AND_OPERATOR,
+        or_operator=OR_OPERATOR,
+        acronym_regex=ACRONYM_REGEX,
+    ),
+    re.IGNORECASE
+)
+OPERATOR_BY_KEYWORD = {AND_OPERATOR: AND, OR_OPERATOR: OR}
+KEYWORD_BY_OPERATOR = {AND: AND_OPERATOR, OR: OR_OPERATOR}
+
+
+@attr.s(frozen=True, slots=True)
+class CompiledPrerequisite:
+    """
+    Parsed form of a prerequisite expression : groups of codes joined by the main operator.
+    The items of a group are joined by the secondary operator.
+    """
+    main_operator = attr.ib(type=str)
+    groups = attr.ib(type=Tuple[Tuple[str, ...], ...])
+
+    @property
+    def secondary_operator(self) -> str:
+        return OR if self.main_operator == AND else AND
+
+    @property
+    def codes(self) -> Set[str]:
+        return {code for group in self.groups for code in group}
+
+    @property
+    def expression(self) -> PrerequisiteExpression:
+        def _format_group(group: Tuple[str, ...]):
+            return "({})" if len(group) > 1 and len(self.groups) > 1 else "{}"
+
+        secondary_operator = " {} ".format(KEYWORD_BY_OPERATOR[self.secondary_operator])
+        return " {} ".format(KEYWORD_BY_OPERATOR[self.main_operator]).join(
+            _format_group(group).format(secondary_operator.join(group)) for group in self.groups
+        )
+
+    def is_satisfied_by(self, available_codes: Set[str]) -> bool:
+        if self.main_operator == AND:
+            return all(any(code in available_codes for code in group) for group in self.groups)
+        return any(all(code in available_codes for code in group) for group in self.groups)
+
+
+@functools.lru_cache(maxsize=2048)
+def compile_expression(prerequisite_expression: PrerequisiteExpression) -> Optional[CompiledPrerequisite]:
+    """
+    Parse the expression in a single pass.
+    Return None when the expression does not respect the syntax (see PREREQUISITE_SYNTAX_REGEX).
+    """
+    tokens = _tokenize(prerequisite_expression)
+    if tokens is None:
+        return None
+    if not tokens:
+        return CompiledPrerequisite(main_operator=AND, groups=())
+
+    groups = []
+    group_operators = []
+    main_operators = set()
+    position = 0
+    while True:
+        kind, value = tokens[position]
+        if kind == 'acronym':
+            groups.append((value,))
+            group_operators.append(None)
+            position += 1
+        elif kind == 'open':
+            group, group_operator, position = _parse_group(tokens, position + 1)
+            if group is None:
+                return None
+            groups.append(group)
+            group_operators.append(group_operator)
+        else:
+            return None
+
+        if position == len(tokens):
+            break
+        kind, value = tokens[position]
+        if kind != 'operator' or position + 1 == len(tokens):
+            return None
+        main_operators.add(value)
+        position += 1
+
+    if len(main_operators) > 1 or (len(groups) == 1 and group_operators[0]):
+        return None
+    main_operator = main_operators.pop() if main_operators else AND
+    if main_operator in group_operators:
+        return None
+    return CompiledPrerequisite(main_operator=main_operator, groups=tuple(groups))
+
+
+def _tokenize(prerequisite_expression: PrerequisiteExpression) -> Optional[List[Tuple[str, str]]]:
+    tokens = []
+    position = 0
+    while position < len(prerequisite_expression):
+        match = TOKEN_REGEX.match(prerequisite_expression, position)
+        if not match:
+            return None
+        value = match.group()
+        if match.lastgroup == 'operator':
+            value = OPERATOR_BY_KEYWORD[value.strip().upper()]
+        tokens.append((match.lastgroup, value))
+        position = match.end()
+    return tokens
+
+
+def _parse_group(tokens: List[Tuple[str, str]], position: int) -> Tuple[Optional[Tuple[str, ...]], Optional[str], int]:
+    codes = []
+    operators = set()
+    while position < len(tokens):
+        kind, value = tokens[position]
+        if kind != 'acronym':
+            break
+        codes.append(value)
+        position += 1
+        if position < len(tokens) and tokens[position][0] == 'operator':
+            operators.add(tokens[position][1])
+            position += 1
+            continue
+        if position < len(tokens) and tokens[position][0] == 'close' and len(codes) > 1 and len(operators) == 1:
+            return tuple(codes), operators.pop(), position + 1
+        break
+    return None, None, position
+
 
 class PrerequisiteItem:
     def __init__(self, code: str, year: int):
@@ -157,6 +283,15 @@ class Prerequisite(interface.Entity):
     def secondary_operator(self):
         return OR if self.main_operator == AND else AND
 
+    def compile(self) -> CompiledPrerequisite:
+        return CompiledPrerequisite(
+            main_operator=self.main_operator,
+            groups=tuple(
+                tuple(item.code for item in group.prerequisite_items)
+                for group in self.prerequisite_item_groups if group.prerequisite_items
+            )
+        )
+
 
 class NullPrerequisite(Prerequisite):
     def __init__(self, context_tree: 'ProgramTreeIdentity', node_having_prerequisites: 'NodeIdentity'):
@@ -183,56 +318,38 @@ class PrerequisiteFactory:
     ) -> Prerequisite:
         if not prerequisite_expression:
             return NullPrerequisite(context_tree, node_having_prerequisites)
-
-        main_operator = self._detect_main_operator_in_string(prerequisite_expression)
-        secondary_operator = AND if main_operator == OR else OR
-        prerequisite_item_groups = self._get_grouped_items_from_string(
-            prerequisite_expression,
-            main_operator,
-            secondary_operator,
-            node_having_prerequisites.year
+        compiled_prerequisite = compile_expression(prerequisite_expression)
+        assert compiled_prerequisite, "Invalid prerequisite expression : {}".format(prerequisite_expression)
+        return self.from_compiled(
+            compiled_prerequisite,
+            node_having_prerequisites,
+            context_tree
         )
 
-        result = Prerequisite(main_operator, context_tree, node_having_prerequisites, prerequisite_item_groups)
-        result.has_changed = True
-        return result
-
     @classmethod
-    def _get_grouped_items_from_string(
+    def from_compiled(
             cls,
-            prerequisite_string: PrerequisiteExpression,
-            main_operator: str,
-            secondary_operator: str,
-            year: int
-    ) -> List[PrerequisiteItemGroup]:
-        main_operator_splitter = ' ET ' if main_operator == AND else ' OU '
-        secondary_operator_splitter = ' OU ' if main_operator == AND else ' ET '
-
-        groups = prerequisite_string.split(main_operator_splitter)
+            compiled_prerequisite: 'CompiledPrerequisite',
+            node_having_prerequisites: 'NodeIdentity',
+            context_tree: 'ProgramTreeIdentity'
+    ) -> Prerequisite:
+        if not compiled_prerequisite.groups:
+            return NullPrerequisite(context_tree, node_having_prerequisites)
 
-        return [
+        prerequisite_item_groups = [
             PrerequisiteItemGroup(
-                secondary_operator,
-                cls._split_group_into_items(group, secondary_operator_splitter, year)
-            ) for group in groups
+                compiled_prerequisite.secondary_operator,
+                [PrerequisiteItem(code, node_having_prerequisites.year) for code in group]
+            ) for group in compiled_prerequisite.groups
         ]
-
-    @classmethod
-    def _split_group_into_items(cls, group: str, operator: str, year: int) -> List[PrerequisiteItem]:
-        group = cls._remove_parenthesis(group)
-        group = group.split(operator)
-        group_of_learning_units = [PrerequisiteItem(item, year) for item in group]
-        return group_of_learning_units
-
-    @classmethod
-    def _remove_parenthesis(cls, string: str):
-        return re.sub('[()]', "", string)
-
-    @classmethod
-    def _detect_main_operator_in_string(cls, prerequisite_string: PrerequisiteExpression) -> str:
-        if re.match(MULTIPLE_PREREQUISITES_REGEX_OR, prerequisite_string):
-            return OR
-        return AND
+        result = Prerequisite(
+            compiled_prerequisite.main_operator,
+            context_tree,
+            node_having_prerequisites,
+            prerequisite_item_groups
+        )
+        result.has_changed = True
+        return result
 
     @classmethod
     def copy_to_tree(cls, to_copy: 'Prerequisite', to_tree: 'ProgramTree') -> 'Prerequisite':
@@ -267,16 +384,7 @@ class PrerequisiteFactory:
                 )
             raise CannotCopyPrerequisiteException()
 
-        return cls().from_expression(
-            cls._normalize_expression(to_copy.get_prerequisite_expression(translate=False)),
-            node_having_prerequisite_identity,
-            to_tree.entity_id
-        )
-
-    # FIX: Because the expression varies with translation
-    @classmethod
-    def _normalize_expression(cls, prerequisite_expression: str) -> str:
-        return prerequisite_expression.replace(' AND ', ' ET ').replace(' OR ', ' OU ')
+        return cls.from_compiled(to_copy.compile(), node_having_prerequisite_identity, to_tree.entity_id)
 
 
 factory = PrerequisiteFactory()
@@ -310,6 +418,16 @@ class Prerequisites(interface.RootEntity):
     def get_prerequisite(self, node: 'NodeLearningUnitYear') -> 'Prerequisite':
         return self._map_node_identity_prerequisite().get(node.entity_id)
 
+    def search_affected_by_removal(self, removed_codes: Set[str]) -> List['NodeIdentity']:
+        """
+        Nodes whose prerequisite refers to one of the removed codes, ordered by code.
+        """
+        nodes_having_prerequisites_by_code = self._map_code_nodes_having_prerequisites()
+        affected_nodes = set()
+        for code in removed_codes:
+            affected_nodes.update(nodes_having_prerequisites_by_code.get(code, ()))
+        return sorted(affected_nodes, key=lambda node_identity: node_identity.code)
+
     def set_prerequisite(
             self,
             node_having_prerequisites: 'NodeLearningUnitYear',
@@ -331,8 +449,13 @@ class Prerequisites(interface.RootEntity):
             if new_prerequisite in self.prerequisites:
                 self.prerequisites.remove(new_prerequisite)
             self.prerequisites.append(new_prerequisite)
+            self._clear_cached_results()
         return messages
 
+    def _clear_cached_results(self):
+        for attribute_name in [name for name in vars(self) if name.startswith('__cached_')]:
+            delattr(self, attribute_name)
+
     @staticmethod
     def __clean_set_prerequisite(
             prerequisite_expression: 'PrerequisiteExpression',
@@ -365,6 +488,14 @@ class Prerequisites(interface.RootEntity):
     def _map_node_identity_prerequisite(self) -> Dict['NodeIdentity', 'Prerequisite']:
         return {p.node_having_prerequisites: p for p in self.prerequisites}
 
+    @cached_result
+    def _map_code_nodes_having_prerequisites(self) -> Dict[str, Set['NodeIdentity']]:
+        result = {}
+        for prerequisite in self.prerequisites:
+            for code in prerequisite.compile().codes:
+                result.setdefault(code, set()).add(prerequisite.node_having_prerequisites)
+        return result
+
 
 @attr.s(slots=True)
 class NullPrerequisites(Prerequisites):
@@ -49,6 +49,7 @@ from program_management.ddd.domain.prerequisite import Prerequisites, \
     PrerequisitesBuilder
 from program_management.ddd.domain.report import Report
 from program_management.ddd.domain.service.generate_node_code import GenerateNodeCode
+from program_management.ddd.domain.tree_aggregates import TreeAggregates
 from program_management.ddd.repositories import load_authorized_relationship
 from program_management.ddd.validators import validators_by_business_action
 from program_management.ddd.validators._path_validator import PathValidator
@@ -139,13 +140,82 @@ class ProgramTreeBuilder:
             program_tree_next_year = repository.get(identity_next_year)
         except exception.ProgramTreeNotFoundException:
             # Case create program tree to next year
-            root_next_year = node_factory.copy_to_next_year(copy_from.root_node)
-            program_tree_next_year = ProgramTree(
-                entity_id=identity_next_year,
-                root_node=root_next_year,
-                authorized_relationships=load_authorized_relationship.load()
+            program_tree_next_year = self._build_program_tree_next_year(
+                copy_from,
+                identity_next_year,
+                load_authorized_relationship.load()
             )
+        self._copy_mandatory_children_to_next_year(copy_from, program_tree_next_year)
+        return program_tree_next_year
+
+    def copy_to_next_years(
+            self,
+            copy_from: 'ProgramTree',
+            end_year: int,
+            repository: 'ProgramTreeRepository',
+            report: Optional[Report] = None
+    ) -> List['ProgramTree']:
+        """
+        Computes in memory the program trees from 'copy_from' year + 1 to 'end_year' (included).
+        Each year is copied from the year before, existing trees of all target years are loaded at once.
+        :return: The program trees of the next years, ordered by year.
+        """
+        identities_next_years = [
+            attr.evolve(copy_from.entity_id, year=year) for year in range(copy_from.entity_id.year + 1, end_year + 1)
+        ]
+        if not identities_next_years:
+            return []
+        existing_trees = {tree.entity_id: tree for tree in repository.search(entity_ids=identities_next_years)}
+        authorized_relationships = None
+
+        program_trees_next_years = []
+        for identity_next_year in identities_next_years:
+            try:
+                validators_by_business_action.CopyProgramTreeValidatorList(copy_from).validate()
+            except exception.CannotCopyTreeDueToEndDate:
+                if report:
+                    report.add_warning(
+                        report_events.CopyProgramTreeStoppedDueToEndDateEvent(
+                            node=copy_from.root_node,
+                            copy_year=identity_next_year.year
+                        )
+                    )
+                break
+
+            program_tree_next_year = existing_trees.get(identity_next_year)
+            if not program_tree_next_year:
+                if authorized_relationships is None:
+                    authorized_relationships = load_authorized_relationship.load()
+                program_tree_next_year = self._build_program_tree_next_year(
+                    copy_from,
+                    identity_next_year,
+                    authorized_relationships
+                )
+            program_tree_next_year.report = report
+            self._copy_mandatory_children_to_next_year(copy_from, program_tree_next_year)
 
+            program_trees_next_years.append(program_tree_next_year)
+            copy_from = program_tree_next_year
+        return program_trees_next_years
+
+    def _build_program_tree_next_year(
+            self,
+            copy_from: 'ProgramTree',
+            identity_next_year: 'ProgramTreeIdentity',
+            authorized_relationships: 'AuthorizedRelationshipList'
+    ) -> 'ProgramTree':
+        root_next_year = node_factory.copy_to_next_year(copy_from.root_node)
+        return ProgramTree(
+            entity_id=identity_next_year,
+            root_node=root_next_year,
+            authorized_relationships=authorized_relationships
+        )
+
+    def _copy_mandatory_children_to_next_year(
+            self,
+            copy_from: 'ProgramTree',
+            program_tree_next_year: 'ProgramTree'
+    ) -> None:
         root_next_year = program_tree_next_year.root_node
         mandatory_types = copy_from.get_ordered_mandatory_children_types(
             parent_node=root_next_year
@@ -155,7 +225,6 @@ class ProgramTreeBuilder:
             if child_current_year.node_type in mandatory_types:
                 child_next_year = node_factory.copy_to_next_year(child_current_year)
                 root_next_year.add_child(child_next_year, is_mandatory=True)
-        return program_tree_next_year
 
     def copy_prerequisites_from_program_tree(self, from_tree: 'ProgramTree', to_tree: 'ProgramTree') -> 'ProgramTree':
         to_tree.prerequisites = PrerequisitesBuilder().copy_to_tree(from_tree.prerequisites, to_tree)
@@ -170,6 +239,7 @@ class ProgramTreeBuilder:
         validators_by_business_action.FillProgramTreeValidatorList(to_tree).validate()
 
         self._fill_node_from_last_year_node(last_year_tree.root_node, to_tree.root_node, existing_nodes, to_tree)
+        to_tree._invalidate_aggregates()
 
         return to_tree
 
@@ -266,6 +336,7 @@ class ProgramTreeBuilder:
             node_code_generator,
             to_tree
         )
+        to_tree._invalidate_aggregates()
 
         return to_tree
 
@@ -460,6 +531,8 @@ class ProgramTree(interface.RootEntity):
     entity_id = attr.ib(type=ProgramTreeIdentity)  # FIXME :: pass entity_id as mandatory param !
     prerequisites = attr.ib(type='Prerequisites')
     report = attr.ib(type=Optional[Report], default=None)
+    # Memoized read model, reset by the changes of links made through the tree
+    _aggregates = attr.ib(type=Optional[TreeAggregates], default=None, init=False, repr=False)
 
     @prerequisites.default
     def _default_prerequisite(self) -> 'Prerequisites':
@@ -550,7 +623,7 @@ class ProgramTree(interface.RootEntity):
         ]
 
     def search_links_using_node(self, child_node: 'Node') -> List['Link']:
-        return [link_obj for link_obj in self.get_all_links() if link_obj.child == child_node]
+        return self.get_aggregates().search_links_using_node(child_node)
 
     def get_first_link_occurence_using_node(self, child_node: 'Node') -> 'Link':
         links = self.search_links_using_node(child_node)
@@ -603,13 +676,7 @@ class ProgramTree(interface.RootEntity):
         :param year: int
         :return: Node
         """
-        return next(
-            (
-                node for node in self.get_all_nodes()
-                if node.code == code and node.academic_year.year == year
-            ),
-            None
-        )
+        return self.get_aggregates().get_node_by_code_and_year(code, year)
 
     def get_all_nodes(self, types: Set[EducationGroupTypesEnum] = None) -> Set['Node']:
         """
@@ -632,6 +699,10 @@ class ProgramTree(interface.RootEntity):
             nodes_permitted.add(node)
         return list(sorted(nodes_permitted, key=lambda n: n.code))
 
+    @cached_result
+    def get_codes_permitted_as_prerequisite(self) -> Set[str]:
+        return {node.code for node in self.get_nodes_permitted_as_prerequisite()}
+
     def get_nodes_that_have_prerequisites(self) -> List['NodeLearningUnitYear']:
         return list(
             sorted(
@@ -663,10 +734,18 @@ class ProgramTree(interface.RootEntity):
         return self.get_all_nodes(types=finality_types)
 
     def get_greater_block_value(self) -> int:
-        all_links = self.get_all_links()
-        if not all_links:
-            return 0
-        return max(link_obj.block_max_value for link_obj in all_links)
+        return self.get_aggregates().greater_block_value
+
+    def get_aggregates(self) -> TreeAggregates:
+        if self._aggregates is None:
+            self._aggregates = TreeAggregates(self.root_node)
+        return self._aggregates
+
+    def _invalidate_aggregates(self) -> None:
+        self._aggregates = None
+        # Results memoized with 'cached_result' (e.g. permitted codes, paths) depend on the links as well
+        for attribute_name in [name for name in vars(self) if name.startswith('__cached_')]:
+            delattr(self, attribute_name)
 
     def get_all_links(self) -> List['Link']:
         return _links_from_root(self.root_node)
@@ -730,6 +809,7 @@ class ProgramTree(interface.RootEntity):
         )
         validator.validate()
 
+        self._invalidate_aggregates()
         return node_to_paste_to.add_child(
             node_to_paste,
             access_condition=paste_command.access_condition,
@@ -784,6 +864,7 @@ class ProgramTree(interface.RootEntity):
             prerequisite_repository
         ).validate()
 
+        self._invalidate_aggregates()
         return parent.detach_child(node_to_detach)
 
     def __copy__(self) -> 'ProgramTree':
@@ -801,9 +882,10 @@ class ProgramTree(interface.RootEntity):
 
     def get_relative_credits_values(self, child_node: 'NodeIdentity'):
         distinct_credits_repr = []
-        node = self.get_node_by_code_and_year(child_node.code, child_node.year)
+        aggregates = self.get_aggregates()
+        node = aggregates.get_node_by_code_and_year(child_node.code, child_node.year)
 
-        for link_obj in self.search_links_using_node(node):
+        for link_obj in aggregates.search_links_using_node(node):
             if link_obj.relative_credits_repr not in distinct_credits_repr:
                 distinct_credits_repr.append(link_obj.relative_credits_repr)
         return " ; ".join(
@@ -811,9 +893,10 @@ class ProgramTree(interface.RootEntity):
         )
 
     def get_blocks_values(self, child_node: 'NodeIdentity'):
-        node = self.get_node_by_code_and_year(child_node.code, child_node.year)
+        aggregates = self.get_aggregates()
+        node = aggregates.get_node_by_code_and_year(child_node.code, child_node.year)
         return " ; ".join(
-            [str(grp.block) for grp in self.search_links_using_node(node) if grp.block]
+            [str(grp.block) for grp in aggregates.search_links_using_node(node) if grp.block]
         )
 
     def is_empty(self):
@@ -869,6 +952,7 @@ class ProgramTree(interface.RootEntity):
             comment_english=comment_english
         )
 
+        self._invalidate_aggregates()
         validators_by_business_action.UpdateLinkValidatorList(
             self,
             child_node,
@@ -912,14 +996,32 @@ class ProgramTree(interface.RootEntity):
         return self.prerequisites.is_prerequisite(node)
 
     def search_is_prerequisite_of(self, search_from_node: 'NodeLearningUnitYear') -> List['NodeLearningUnitYear']:
+        aggregates = self.get_aggregates()
         return [
-            self.get_node_by_code_and_year(node_identity.code, node_identity.year)
+            aggregates.get_node_by_code_and_year(node_identity.code, node_identity.year)
             for node_identity in self.prerequisites.search_is_prerequisite_of(search_from_node)
         ]
 
     def get_prerequisite(self, node: 'NodeLearningUnitYear') -> 'Prerequisite':
         return self.prerequisites.get_prerequisite(node)
 
+    def search_units_affected_by_removal(self, node_to_remove: 'Node') -> List['NodeLearningUnitYear']:
+        """
+        Learning units of the tree (out of the removed node) whose prerequisite refers to a learning unit of the
+        removed node.
+        """
+        removed_nodes = node_to_remove.get_all_children_as_learning_unit_nodes()
+        if node_to_remove.is_learning_unit():
+            removed_nodes.append(node_to_remove)
+        removed_identities = {node_obj.entity_id for node_obj in removed_nodes}
+        aggregates = self.get_aggregates()
+        affected_nodes = (
+            aggregates.get_node_by_code_and_year(node_identity.code, node_identity.year)
+            for node_identity in self.prerequisites.search_affected_by_removal({node.code for node in removed_nodes})
+            if node_identity not in removed_identities
+        )
+        return [node_obj for node_obj in affected_nodes if node_obj]
+
 
 def is_empty(parent_node: 'Node', relationships: 'AuthorizedRelationshipList'):
     for child_node in parent_node.children_as_nodes:
@@ -144,3 +144,18 @@ class CannotCopyPrerequisiteAsLearningUnitNotPresent(ReportEvent):
             "copy_year": self.copy_year,
             "training_title": self.training_root_node.full_code_acronym_representation()
         }
+
+
+@attr.s(frozen=True, slots=True)
+class CopyProgramTreeStoppedDueToEndDateEvent(ReportEvent):
+    node = attr.ib(type='NodeGroupYear')
+    copy_year = attr.ib(type=int)
+
+    def __str__(self):
+        return _(
+            "%(title)s ends in %(end_year)s. It is not postponed from %(copy_year)s."
+        ) % {
+            "title": self.node.full_code_acronym_representation(),
+            "end_year": self.node.end_year,
+            "copy_year": self.copy_year,
+        }
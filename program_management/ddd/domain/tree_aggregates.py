@@ -0,0 +1,113 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+"""
+Read model of a program tree : indexes of its nodes and links, and aggregates of the subtree of each node (credits,
+credits per block, learning units, volumes), computed in a single post-order pass instead of re-walking the subtrees
+for each displayed or exported row.
+"""
+import collections
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+import attr
+
+from program_management.ddd.business_types import *
+
+Code = str
+Year = int
+Block = int
+
+
+@attr.s(slots=True)
+class NodeAggregates:
+    # Credits of the learning units of the subtree : relative credits of their link, or their own credits
+    total_credits = attr.ib(type=Decimal, default=Decimal(0))
+    # Credits of the learning units reached through mandatory links only
+    mandatory_credits = attr.ib(type=Decimal, default=Decimal(0))
+    credits_by_block = attr.ib(type=Dict[Block, Decimal], factory=dict)
+    # Number of links to a learning unit in the subtree
+    learning_units_count = attr.ib(type=int, default=0)
+    volume_total_lecturing = attr.ib(type=Decimal, default=Decimal(0))
+    volume_total_practical = attr.ib(type=Decimal, default=Decimal(0))
+
+    def add(self, other: 'NodeAggregates', is_mandatory: bool) -> None:
+        self.total_credits += other.total_credits
+        if is_mandatory:
+            self.mandatory_credits += other.mandatory_credits
+        for block, credits in other.credits_by_block.items():
+            self.credits_by_block[block] = self.credits_by_block.get(block, Decimal(0)) + credits
+        self.learning_units_count += other.learning_units_count
+        self.volume_total_lecturing += other.volume_total_lecturing
+        self.volume_total_practical += other.volume_total_practical
+
+
+class TreeAggregates:
+    def __init__(self, root_node: 'Node'):
+        self.greater_block_value = 0
+        self._aggregates_by_node: Dict['Node', NodeAggregates] = {}
+        self._nodes_by_code_and_year: Dict[Tuple[Code, Year], 'Node'] = {}
+        self._links_by_child: Dict['Node', List['Link']] = collections.defaultdict(list)
+        self._visit(root_node)
+
+    def _visit(self, node: 'Node') -> NodeAggregates:
+        # A node used several times in the tree (e.g. a common core) is aggregated once
+        if node in self._aggregates_by_node:
+            return self._aggregates_by_node[node]
+
+        self._nodes_by_code_and_year[(node.code, node.year)] = node
+        aggregates = NodeAggregates()
+        for link in node.children:
+            self._links_by_child[link.child].append(link)
+            self.greater_block_value = max(self.greater_block_value, link.block_max_value)
+            child_aggregates = self._visit(link.child)
+            if link.child.is_learning_unit():
+                child_aggregates = _get_learning_unit_aggregates(link)
+            aggregates.add(child_aggregates, link.is_mandatory)
+        self._aggregates_by_node[node] = aggregates
+        return aggregates
+
+    def get_node_aggregates(self, node: 'Node') -> NodeAggregates:
+        return self._aggregates_by_node[node]
+
+    def get_node_by_code_and_year(self, code: str, year: int) -> Optional['Node']:
+        return self._nodes_by_code_and_year.get((code, year))
+
+    def search_links_using_node(self, node: 'Node') -> List['Link']:
+        """ Distinct links of the tree whose child is the node, in the order of the tree """
+        return self._links_by_child.get(node) or []
+
+
+def _get_learning_unit_aggregates(link: 'Link') -> NodeAggregates:
+    learning_unit = link.child
+    credits = Decimal(link.relative_credits or learning_unit.credits or 0)
+    return NodeAggregates(
+        total_credits=credits,
+        mandatory_credits=credits,
+        credits_by_block={int(block): credits for block in str(link.block or '')},
+        learning_units_count=1,
+        volume_total_lecturing=learning_unit.volume_total_lecturing or Decimal(0),
+        volume_total_practical=learning_unit.volume_total_practical or Decimal(0),
+    )
@@ -21,72 +21,148 @@
 #  at the root of the source code of this program.  If not,
 #  see http://www.gnu.org/licenses/.
 # ############################################################################
-from base.models import learning_unit_year, prerequisite_item, learning_unit
+from typing import List, Dict, Tuple
+
+from django.db import IntegrityError
+from django.utils import timezone
+
+from base.business import change_log
+from base.models import learning_unit_year, prerequisite_item
 from base.models import prerequisite as prerequisite_model
+from base.models.enums.change_log_types import ChangeLogActions
 from program_management.ddd.business_types import *
-from program_management.ddd.domain.node import NodeLearningUnitYear, NodeGroupYear
 from program_management.models.education_group_version import EducationGroupVersion
-from program_management.models.enums.node_type import NodeType
+
+BULK_BATCH_SIZE = 1000
+
+Code = str
+Year = int
+LearningUnitYearId = int
+LearningUnitId = int
 
 
 def persist(tree: 'ProgramTree'):
     prerequisites_changed = [prerequisite for prerequisite in tree.get_all_prerequisites() if prerequisite.has_changed]
-    for prerequisite in prerequisites_changed:
-        _persist(tree.root_node, prerequisite)
+    if prerequisites_changed:
+        _persist_many(tree.root_node, prerequisites_changed)
 
 
 def _persist(
         node_group_year: 'NodeGroupYear',
         prerequisite: 'Prerequisite',
 ) -> None:
+    _persist_many(node_group_year, [prerequisite])
+
+
+def _persist_many(
+        node_group_year: 'NodeGroupYear',
+        prerequisites: List['Prerequisite'],
+) -> None:
+    if not prerequisites:
+        return
     try:
         education_group_version_obj = EducationGroupVersion.objects.get(root_group__element__pk=node_group_year.node_id)
     except EducationGroupVersion.DoesNotExist:
         return
 
-    learning_unit_year_obj = learning_unit_year.LearningUnitYear.objects.get(
-        acronym=prerequisite.node_having_prerequisites.code,
-        academic_year__year=prerequisite.node_having_prerequisites.year,
+    learning_unit_years = _get_learning_unit_years(
+        [(p.node_having_prerequisites.code, p.node_having_prerequisites.year) for p in prerequisites] +
+        [(item.code, item.year) for p in prerequisites for item in p.get_all_prerequisite_items()]
     )
+    existing_prerequisites = {
+        obj.learning_unit_year_id: obj
+        for obj in prerequisite_model.Prerequisite.objects.filter(
+            education_group_version=education_group_version_obj,
+            learning_unit_year_id__in=[
+                learning_unit_years[(p.node_having_prerequisites.code, p.node_having_prerequisites.year)]['id']
+                for p in prerequisites
+            ]
+        )
+    }
 
-    prerequisite_model_obj, created = prerequisite_model.Prerequisite.objects.update_or_create(
-        education_group_version=education_group_version_obj,
-        learning_unit_year=learning_unit_year_obj,
-        defaults={"main_operator": prerequisite.main_operator}
+    to_create, to_update, to_delete = [], [], []
+    prerequisite_model_obj_by_domain_obj = []
+    for prerequisite in prerequisites:
+        learning_unit_year_obj = learning_unit_years[
+            (prerequisite.node_having_prerequisites.code, prerequisite.node_having_prerequisites.year)
+        ]
+        prerequisite_model_obj = existing_prerequisites.get(learning_unit_year_obj['id'])
+        if not prerequisite.prerequisite_item_groups:
+            if prerequisite_model_obj:
+                to_delete.append(prerequisite_model_obj.pk)
+            continue
+
+        if prerequisite_model_obj:
+            prerequisite_model_obj.main_operator = prerequisite.main_operator
+            prerequisite_model_obj.changed = timezone.now()
+            to_update.append(prerequisite_model_obj)
+        else:
+            prerequisite_model_obj = prerequisite_model.Prerequisite(
+                education_group_version=education_group_version_obj,
+                education_group_year_id=education_group_version_obj.offer_id,
+                learning_unit_year_id=learning_unit_year_obj['id'],
+                main_operator=prerequisite.main_operator,
+            )
+            to_create.append(prerequisite_model_obj)
+        prerequisite_model_obj_by_domain_obj.append((prerequisite_model_obj, prerequisite))
+
+    prerequisite_item.PrerequisiteItem.objects.filter(prerequisite_id__in=[obj.pk for obj in to_update]).delete()
+    prerequisite_model.Prerequisite.objects.filter(pk__in=to_delete).delete()
+    prerequisite_model.Prerequisite.objects.bulk_update(
+        to_update,
+        ['main_operator', 'changed'],
+        batch_size=BULK_BATCH_SIZE
     )
+    prerequisite_model.Prerequisite.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE)
+    # Bulk operations bypass the signals : the changes are logged here, items included in their prerequisite
+    change_log.record_many(to_update, ChangeLogActions.UPDATE)
+    change_log.record_many(to_create, ChangeLogActions.CREATE)
 
-    if prerequisite.prerequisite_item_groups:
-        _persist_prerequisite_items(prerequisite_model_obj, prerequisite)
-    else:
-        prerequisite_model_obj.delete()
+    prerequisite_item.PrerequisiteItem.objects.bulk_create(
+        [
+            item_obj
+            for prerequisite_model_obj, prerequisite in prerequisite_model_obj_by_domain_obj
+            for item_obj in _build_prerequisite_items(prerequisite_model_obj, prerequisite, learning_unit_years)
+        ],
+        batch_size=BULK_BATCH_SIZE
+    )
 
 
-def _persist_prerequisite_items(
+def _build_prerequisite_items(
         prerequisite_model_obj: prerequisite_model.Prerequisite,
-        prerequisite_domain_obj: 'Prerequisite'
-):
-    _delete_prerequisite_items(prerequisite_model_obj)
+        prerequisite_domain_obj: 'Prerequisite',
+        learning_unit_years: Dict[Tuple[Code, Year], Dict]
+) -> List[prerequisite_item.PrerequisiteItem]:
+    learning_unit_having_prerequisites_id = learning_unit_years[
+        (prerequisite_domain_obj.node_having_prerequisites.code, prerequisite_domain_obj.node_having_prerequisites.year)
+    ]['learning_unit_id']
+
+    items = []
     for group_number, group in enumerate(prerequisite_domain_obj.prerequisite_item_groups, 1):
         for position, item in enumerate(group.prerequisite_items, 1):
-
-            learning_unit_obj = _get_learning_unit_of_prerequisite_item(item)
-
-            prerequisite_item.PrerequisiteItem.objects.create(
-                prerequisite=prerequisite_model_obj,
-                learning_unit=learning_unit_obj,
-                group_number=group_number,
-                position=position,
+            learning_unit_id = learning_unit_years.get((item.code, item.year), {}).get('learning_unit_id')
+            # bulk_create() bypasses PrerequisiteItem.save(), so its integrity check is done here
+            if learning_unit_id == learning_unit_having_prerequisites_id:
+                raise IntegrityError("A learning unit cannot be prerequisite to itself")
+            items.append(
+                prerequisite_item.PrerequisiteItem(
+                    prerequisite_id=prerequisite_model_obj.pk,
+                    learning_unit_id=learning_unit_id,
+                    group_number=group_number,
+                    position=position,
+                )
             )
+    return items
 
 
-def _delete_prerequisite_items(prerequisite_model_obj: prerequisite_model.Prerequisite):
-    items = prerequisite_model_obj.prerequisiteitem_set.all()
-    for item in items:
-        item.delete()
-
-
-def _get_learning_unit_of_prerequisite_item(prerequisite_item_domain_obj: 'PrerequisiteItem'):
-    return learning_unit.LearningUnit.objects.filter(
-        learningunityear__acronym=prerequisite_item_domain_obj.code,
-        learningunityear__academic_year__year=prerequisite_item_domain_obj.year
-    ).first()
+def _get_learning_unit_years(identities: List[Tuple[Code, Year]]) -> Dict[Tuple[Code, Year], Dict]:
+    identities = set(identities)
+    qs = learning_unit_year.LearningUnitYear.objects.filter(
+        acronym__in={code for code, _ in identities},
+        academic_year__year__in={year for _, year in identities},
+    ).values('id', 'learning_unit_id', 'acronym', 'academic_year__year')
+    return {
+        (row['acronym'], row['academic_year__year']): row
+        for row in qs
+        if (row['acronym'], row['academic_year__year']) in identities
+    }
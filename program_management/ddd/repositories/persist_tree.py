@@ -23,11 +23,14 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from typing import List, Set, Dict
+from typing import List, Set, Dict, Tuple
 
 from django.db import transaction
-from django.db.models import F
+from django.db.models import F, Max
+from django.utils import timezone
 
+from base.business import change_log
+from base.models.enums.change_log_types import ChangeLogActions
 from base.models.enums.link_type import LinkTypes
 from base.models.group_element_year import GroupElementYear
 from osis_common.decorators.deprecated import deprecated
@@ -36,13 +39,31 @@ from program_management.ddd.repositories import _persist_prerequisite
 from program_management.models.element import Element
 
 ElementId = int
+GroupElementYearId = int
+
+BULK_BATCH_SIZE = 1000
+GROUP_ELEMENT_YEAR_FIELDS = [
+    'relative_credits',
+    'min_credits',
+    'max_credits',
+    'is_mandatory',
+    'block',
+    'access_condition',
+    'comment',
+    'comment_english',
+    'own_comment',
+    'quadrimester_derogation',
+    'link_type',
+    'order',
+    'changed',
+]
 
 
 @deprecated  # use ProgramTreeRepository.create() or .update() instead
 @transaction.atomic
 def persist(tree: 'ProgramTree') -> None:
     __update_or_create_links(tree)
-    __delete_links(tree, tree.root_node)
+    __delete_links(tree)
     _persist_prerequisite.persist(tree)
 
 
@@ -50,9 +71,10 @@ def __update_or_create_links(tree: 'ProgramTree'):
     links_has_changed = [
         link for link in tree.get_all_links() if link.has_changed
     ]
+    if not links_has_changed:
+        return
     elements_by_identity = __get_elements_by_node_identity(links_has_changed)
-    for link in links_has_changed:
-        __persist_group_element_year(link, elements_by_identity)
+    __persist_group_element_years(links_has_changed, elements_by_identity)
 
 
 def __get_elements_by_node_identity(links_has_changed: List['Link']) -> Dict['NodeIdentity', ElementId]:
@@ -95,48 +117,104 @@ def __get_elements_as_learning_unit(nodes: Set['Node']):
     ).values('pk', 'code', 'year')
 
 
-def __persist_group_element_year(link: 'Link', elements_by_identity: Dict['NodeIdentity', ElementId]):
-    group_element_year, _ = GroupElementYear.objects.update_or_create(
+def __persist_group_element_years(links: List['Link'], elements_by_identity: Dict['NodeIdentity', ElementId]):
+    group_element_years = [__build_group_element_year(link, elements_by_identity) for link in links]
+    existing_ids = __get_existing_group_element_year_ids(group_element_years)
+    __set_default_order(group_element_years)
+
+    to_create, to_update = [], []
+    for group_element_year in group_element_years:
+        key = (group_element_year.parent_element_id, group_element_year.child_element_id)
+        group_element_year.pk = existing_ids.get(key)
+        if group_element_year.pk:
+            to_update.append(group_element_year)
+        else:
+            to_create.append(group_element_year)
+
+    if to_update:
+        GroupElementYear.objects.bulk_update(to_update, GROUP_ELEMENT_YEAR_FIELDS, batch_size=BULK_BATCH_SIZE)
+        change_log.record_many(to_update, ChangeLogActions.UPDATE)
+    if to_create:
+        GroupElementYear.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE)
+        change_log.record_many(to_create, ChangeLogActions.CREATE)
+
+
+def __build_group_element_year(link: 'Link', elements_by_identity: Dict['NodeIdentity', ElementId]):
+    return GroupElementYear(
         parent_element_id=elements_by_identity[link.parent.entity_id],
         child_element_id=elements_by_identity[link.child.entity_id],
-        defaults={
-            'relative_credits': link.relative_credits,
-            'min_credits': link.min_credits,
-            'max_credits': link.max_credits,
-            'is_mandatory': link.is_mandatory,
-            'block': link.block,
-            'access_condition': link.access_condition,
-            'comment': link.comment,
-            'comment_english': link.comment_english,
-            'own_comment': link.own_comment,
-            'quadrimester_derogation': link.quadrimester_derogation.name if link.quadrimester_derogation else None,
-            # FIXME : Find a rules for enum in order to be consistant
-            'link_type': link.link_type.name if isinstance(link.link_type, LinkTypes) else link.link_type,
-            'order': link.order,
-
-        }
+        relative_credits=link.relative_credits,
+        min_credits=link.min_credits,
+        max_credits=link.max_credits,
+        is_mandatory=link.is_mandatory,
+        block=link.block,
+        access_condition=link.access_condition,
+        comment=link.comment,
+        comment_english=link.comment_english,
+        own_comment=link.own_comment,
+        quadrimester_derogation=link.quadrimester_derogation.name if link.quadrimester_derogation else None,
+        # FIXME : Find a rules for enum in order to be consistant
+        link_type=link.link_type.name if isinstance(link.link_type, LinkTypes) else link.link_type,
+        order=link.order,
+        changed=timezone.now(),
     )
 
 
-def __delete_links(tree: 'ProgramTree', node: 'Node'):
-    for link in node._deleted_children:
-        __persist_deleted_prerequisites(tree, link.child)
-        __delete_group_element_year(link)
+def __get_existing_group_element_year_ids(
+        group_element_years: List[GroupElementYear]
+) -> Dict[Tuple[ElementId, ElementId], GroupElementYearId]:
+    qs = GroupElementYear.objects.filter(
+        parent_element_id__in={gey.parent_element_id for gey in group_element_years},
+        child_element_id__in={gey.child_element_id for gey in group_element_years},
+    ).values_list('parent_element_id', 'child_element_id', 'pk')
+    return {(parent_id, child_id): pk for parent_id, child_id, pk in qs}
+
+
+def __set_default_order(group_element_years: List[GroupElementYear]):
+    """
+    Bulk operations bypass OrderedModel.save(), so links without order are appended
+    after the last existing child of their parent, as save() would have done.
+    """
+    without_order = [gey for gey in group_element_years if gey.order is None]
+    if not without_order:
+        return
+    max_order_by_parent = dict(
+        GroupElementYear.objects.filter(
+            parent_element_id__in={gey.parent_element_id for gey in without_order}
+        ).values('parent_element_id').annotate(max_order=Max('order')).values_list('parent_element_id', 'max_order')
+    )
+    for gey in without_order:
+        max_order = max_order_by_parent.get(gey.parent_element_id)
+        gey.order = 0 if max_order is None else max_order + 1
+        max_order_by_parent[gey.parent_element_id] = gey.order
+
+
+def __delete_links(tree: 'ProgramTree'):
+    links_to_delete = __get_deleted_links(tree.root_node)
+    if not links_to_delete:
+        return
+    __persist_deleted_prerequisites(tree, links_to_delete)
+    __delete_group_element_years(links_to_delete)
+
+
+def __get_deleted_links(node: 'Node') -> List['Link']:
+    deleted_links = list(node._deleted_children)
     for link in node.children:
-        __delete_links(tree, link.child)
+        deleted_links.extend(__get_deleted_links(link.child))
+    return deleted_links
 
 
-def __persist_deleted_prerequisites(tree: 'ProgramTree', node: 'Node'):
-    if node.is_learning_unit():
-        prerequisite = tree.get_prerequisite(node)
-        if prerequisite:
-            _persist_prerequisite._persist(tree.root_node, prerequisite)
-    else:
-        for child_node in node.get_all_children_as_learning_unit_nodes():
-            prerequisite = tree.get_prerequisite(child_node)
+def __persist_deleted_prerequisites(tree: 'ProgramTree', deleted_links: List['Link']):
+    prerequisites = []
+    for link in deleted_links:
+        node = link.child
+        learning_unit_nodes = [node] if node.is_learning_unit() else node.get_all_children_as_learning_unit_nodes()
+        for learning_unit_node in learning_unit_nodes:
+            prerequisite = tree.get_prerequisite(learning_unit_node)
             if prerequisite:
-                _persist_prerequisite._persist(tree.root_node, prerequisite)
+                prerequisites.append(prerequisite)
+    _persist_prerequisite._persist_many(tree.root_node, prerequisites)
 
 
-def __delete_group_element_year(link):
-    GroupElementYear.objects.filter(pk=link.pk).delete()
+def __delete_group_element_years(links: List['Link']):
+    GroupElementYear.objects.filter(pk__in=[link.pk for link in links]).delete()
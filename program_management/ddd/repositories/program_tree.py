@@ -29,6 +29,7 @@ from typing import Optional, List, Set, Union
 from django.db.models import Q
 
 from base.models.group_element_year import GroupElementYear
+from base.utils import identity_map
 from education_group.ddd.command import CreateOrphanGroupCommand, CopyGroupCommand
 from education_group.models.group_year import GroupYear
 from osis_common.ddd import interface
@@ -71,6 +72,7 @@ class ProgramTreeRepository(interface.AbstractRepository):
             delete_node_service: interface.ApplicationService = None,
     ) -> None:
         program_tree = cls.get(entity_id)
+        identity_map.discard(cls, entity_id)
 
         _delete_node_content(program_tree.root_node, delete_node_service)
         cmd = command.DeleteNodeCommand(
@@ -122,16 +124,22 @@ class ProgramTreeRepository(interface.AbstractRepository):
                 )
 
         persist_tree.persist(program_tree)
+        identity_map.discard(cls, program_tree.entity_id)
         return program_tree.entity_id
 
     @classmethod
     def update(cls, program_tree: 'ProgramTree', **_) -> 'ProgramTreeIdentity':
         warnings.warn("DEPRECATED : use .save() function instead", DeprecationWarning, stacklevel=2)
         persist_tree.persist(program_tree)
+        identity_map.discard(cls, program_tree.entity_id)
         return program_tree.entity_id
 
     @classmethod
     def get(cls, entity_id: 'ProgramTreeIdentity') -> 'ProgramTree':
+        return identity_map.get_or_load(cls, entity_id, cls._load)
+
+    @classmethod
+    def _load(cls, entity_id: 'ProgramTreeIdentity') -> 'ProgramTree':
         try:
             tree_root_id = Element.objects.get(
                 group_year__partial_acronym=entity_id.code,
@@ -23,11 +23,14 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from typing import List
 
 import program_management.ddd.command
+from base.ddd.utils.business_validator import MultipleBusinessExceptions
 from program_management.ddd.domain import node
 from program_management.ddd.repositories import load_tree, node as node_repository, program_tree, program_tree_version
 from program_management.ddd.validators import validators_by_business_action
+from program_management.ddd.validators.validation_context import ValidationContext
 
 
 def check_paste(check_command: program_management.ddd.command.CheckPasteNodeCommand) -> None:
@@ -43,3 +46,35 @@ def check_paste(check_command: program_management.ddd.command.CheckPasteNodeComm
         program_tree.ProgramTreeRepository(),
         program_tree_version.ProgramTreeVersionRepository()
     ).validate()
+
+
+def check_paste_nodes(check_commands: List[program_management.ddd.command.CheckPasteNodeCommand]) -> None:
+    """
+    Check the paste of several nodes at once : the trees are loaded once for all the nodes and the validation
+    of a node stops at its first error.
+    """
+    validation_context = ValidationContext(program_tree.ProgramTreeRepository())
+    tree_version_repository = program_tree_version.ProgramTreeVersionRepository()
+    trees_by_root_id = {}
+    exceptions = set()
+    for check_command in check_commands:
+        node_to_paste = node_repository.NodeRepository.get(
+            node.NodeIdentity(code=check_command.node_to_paste_code, year=check_command.node_to_paste_year)
+        )
+        if check_command.root_id not in trees_by_root_id:
+            trees_by_root_id[check_command.root_id] = load_tree.load(check_command.root_id)
+
+        try:
+            validators_by_business_action.CheckPasteNodeValidatorList(
+                trees_by_root_id[check_command.root_id],
+                node_to_paste,
+                check_command,
+                validation_context,
+                tree_version_repository,
+                fail_fast=True
+            ).validate()
+        except MultipleBusinessExceptions as e:
+            exceptions |= e.exceptions
+
+    if exceptions:
+        raise MultipleBusinessExceptions(exceptions=exceptions)
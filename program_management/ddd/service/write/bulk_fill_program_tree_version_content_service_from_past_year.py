@@ -25,7 +25,10 @@
 import contextlib
 from typing import List
 
+from django.db import transaction
+
 from base.ddd.utils.business_validator import MultipleBusinessExceptions
+from base.utils import identity_map
 from osis_common.ddd.interface import BusinessException
 from program_management.ddd.business_types import *
 from program_management.ddd.command import FillProgramTreeVersionContentFromProgramTreeVersionCommand
@@ -38,7 +41,9 @@ def bulk_fill_program_tree_version_content_from_last_year(
 ) -> List['ProgramTreeVersionIdentity']:
     result = []
     for cmd in cmds:
-        with contextlib.suppress(BusinessException, MultipleBusinessExceptions, ProgramTreeVersionNotFoundException):
+        # The entities of a failed command are discarded, so that the next commands do not reuse them
+        with contextlib.suppress(BusinessException, MultipleBusinessExceptions, ProgramTreeVersionNotFoundException), \
+                transaction.atomic(), identity_map.discard_on_error():
             result.append(
                 fill_program_tree_version_content_from_program_tree_version_service.
                 fill_program_tree_version_content_from_program_tree_version(
@@ -27,42 +27,51 @@ from typing import List
 
 from django.db import transaction
 
-from program_management.ddd.command import PostponeProgramTreeCommand, CopyProgramTreeToNextYearCommand
-from program_management.ddd.domain import exception
-from program_management.ddd.domain.program_tree import ProgramTreeIdentity
+from education_group.ddd.domain import exception
+from education_group.ddd.service.write import copy_group_service
+from program_management.ddd.command import PostponeProgramTreeCommand
+from program_management.ddd.domain.program_tree import ProgramTreeIdentity, ProgramTreeBuilder
+from program_management.ddd.domain.report import Report, ReportIdentity
 from program_management.ddd.domain.service.calculate_end_postponement import CalculateEndPostponement
+from program_management.ddd.repositories import program_tree as program_tree_repository
 from program_management.ddd.repositories import program_tree_version as program_tree_version_repository
-from program_management.ddd.service.write import copy_program_tree_service
+from program_management.ddd.repositories import report as report_repository
 
 
 @transaction.atomic()
 def postpone_program_tree(
         postpone_cmd: 'PostponeProgramTreeCommand'
 ) -> List['ProgramTreeIdentity']:
-
     identities_created = []
 
     # GIVEN
-    from_year = postpone_cmd.from_year
+    repository = program_tree_repository.ProgramTreeRepository()
     end_postponement_year = CalculateEndPostponement.calculate_end_postponement_year_program_tree(
         identity=ProgramTreeIdentity(code=postpone_cmd.from_code, year=postpone_cmd.from_year),
         repository=program_tree_version_repository.ProgramTreeVersionRepository()
     )
+    existing_program_tree = repository.get(
+        entity_id=ProgramTreeIdentity(code=postpone_cmd.from_code, year=postpone_cmd.from_year)
+    )
+    report = Report(entity_id=ReportIdentity(transaction_id=postpone_cmd.transaction_id))
 
     # WHEN
-    while from_year < end_postponement_year:
-        try:
-            identity_next_year = copy_program_tree_service.copy_program_tree_to_next_year(
-                copy_cmd=CopyProgramTreeToNextYearCommand(
-                    code=postpone_cmd.from_code,
-                    year=from_year,
-                )
-            )
+    program_trees_next_years = ProgramTreeBuilder().copy_to_next_years(
+        existing_program_tree,
+        end_postponement_year,
+        repository,
+        report=report
+    )
 
-            # THEN
-            identities_created.append(identity_next_year)
-            from_year += 1
-        except exception.CannotCopyTreeDueToEndDate:
-            break
+    # THEN
+    for program_tree_next_year in program_trees_next_years:
+        # TODO :: remove this try except and add Repository.upsert() function
+        try:
+            with transaction.atomic():
+                identity = repository.create(program_tree_next_year, copy_group_service=copy_group_service.copy_group)
+        except exception.CodeAlreadyExistException:
+            identity = repository.update(program_tree_next_year)
+        identities_created.append(identity)
 
+    report_repository.ReportRepository().create(report)
     return identities_created
@@ -25,41 +25,12 @@
 ##############################################################################
 from typing import List
 
-from django.db import transaction
-
-from program_management.ddd.command import PostponeProgramTreeCommand, CopyProgramTreeToNextYearCommand
+from program_management.ddd.command import PostponeProgramTreeCommand
 from program_management.ddd.domain.program_tree import ProgramTreeIdentity
-from program_management.ddd.domain.service.calculate_end_postponement import CalculateEndPostponement
-from program_management.ddd.repositories.program_tree_version import ProgramTreeVersionRepository
-from program_management.ddd.service.write import copy_program_tree_service
+from program_management.ddd.service.write import postpone_program_tree_service
 
 
-@transaction.atomic()
 def postpone_program_tree(
         postpone_cmd: 'PostponeProgramTreeCommand'
 ) -> List['ProgramTreeIdentity']:
-
-    identities_created = []
-
-    # GIVEN
-    from_year = postpone_cmd.from_year
-    end_postponement_year = CalculateEndPostponement.calculate_end_postponement_year_program_tree(
-        identity=ProgramTreeIdentity(code=postpone_cmd.from_code, year=postpone_cmd.from_year),
-        repository=ProgramTreeVersionRepository()
-    )
-
-    # WHEN
-    while from_year < end_postponement_year:
-
-        identity_next_year = copy_program_tree_service.copy_program_tree_to_next_year(
-            copy_cmd=CopyProgramTreeToNextYearCommand(
-                code=postpone_cmd.from_code,
-                year=from_year,
-            )
-        )
-
-        # THEN
-        identities_created.append(identity_next_year)
-        from_year += 1
-
-    return identities_created
+    return postpone_program_tree_service.postpone_program_tree(postpone_cmd)
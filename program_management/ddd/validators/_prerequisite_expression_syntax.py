@@ -21,8 +21,6 @@
 #  at the root of the source code of this program.  If not,
 #  see http://www.gnu.org/licenses/.
 # ############################################################################
-import re
-
 from django.utils.translation import gettext_lazy as _
 
 from base.ddd.utils.business_validator import BusinessValidator
@@ -37,5 +35,5 @@ class PrerequisiteExpressionSyntaxValidator(BusinessValidator):
         self.prerequisite_string = prerequisite_string
 
     def validate(self, *args, **kwargs):
-        if not re.match(prerequisite.PREREQUISITE_SYNTAX_REGEX, self.prerequisite_string):
+        if prerequisite.compile_expression(self.prerequisite_string) is None:
             self.add_error_message(_("Prerequisites are invalid"))
@@ -41,7 +41,7 @@ class PrerequisiteItemsValidator(BusinessValidator):
         self.prerequisite_string = prerequisite_string
         self.node = node
         self.program_tree = program_tree
-        self.codes_permitted = {n.code for n in self.program_tree.get_nodes_permitted_as_prerequisite()}
+        self.codes_permitted = self.program_tree.get_codes_permitted_as_prerequisite()
 
     def validate(self, *args, **kwargs):
         node_not_in_codes_permitted = self.node.code not in self.codes_permitted
@@ -80,4 +80,7 @@ class PrerequisiteItemsValidator(BusinessValidator):
             )
 
     def _extract_acronyms(self):
+        compiled_prerequisite = prerequisite.compile_expression(self.prerequisite_string)
+        if compiled_prerequisite:
+            return compiled_prerequisite.codes
         return re.findall(prerequisite.ACRONYM_REGEX, self.prerequisite_string)
@@ -0,0 +1,60 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import Dict, List, Tuple
+
+from program_management.ddd.business_types import *
+
+
+class ValidationContext:
+    """
+    Shared state of the validators of a business action.
+
+    It exposes the same read interface as the ProgramTreeRepository : the trees are loaded once and the same
+    instances are given to every validator, so the facts they cache (paths, parents,...) are computed once too.
+    """
+
+    def __init__(self, tree_repository: 'ProgramTreeRepository'):
+        self.tree_repository = tree_repository
+        self._trees_by_identity = {}  # type: Dict['ProgramTreeIdentity', 'ProgramTree']
+        self._trees_by_children = {}  # type: Dict[Tuple, List['ProgramTree']]
+
+    def get(self, entity_id: 'ProgramTreeIdentity') -> 'ProgramTree':
+        if entity_id not in self._trees_by_identity:
+            self._trees_by_identity[entity_id] = self.tree_repository.get(entity_id)
+        return self._trees_by_identity[entity_id]
+
+    def search_from_children(self, node_ids: List['NodeIdentity'], **kwargs) -> List['ProgramTree']:
+        key = (tuple(node_ids), tuple(sorted(kwargs.items())))
+        if key not in self._trees_by_children:
+            trees = [self._share_tree(tree) for tree in self.tree_repository.search_from_children(node_ids, **kwargs)]
+            self._trees_by_children[key] = trees
+        return list(self._trees_by_children[key])
+
+    def _share_tree(self, tree: 'ProgramTree') -> 'ProgramTree':
+        return self._trees_by_identity.setdefault(tree.entity_id, tree)
+
+    def __getattr__(self, name):
+        return getattr(self.tree_repository, name)
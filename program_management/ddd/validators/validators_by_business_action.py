@@ -70,6 +70,7 @@ from program_management.ddd.validators._version_name_existed import VersionNameE
 from program_management.ddd.validators._version_name_exists import VersionNameExistsValidator
 from program_management.ddd.validators._version_name_pattern import VersionNamePatternValidator
 from program_management.ddd.validators.link import CreateLinkValidatorList
+from program_management.ddd.validators.validation_context import ValidationContext
 
 
 class PasteNodeValidatorList(MultipleExceptionBusinessListValidator):
@@ -80,24 +81,28 @@ class PasteNodeValidatorList(MultipleExceptionBusinessListValidator):
             paste_command: command.PasteElementCommand,
             link_type: Optional[LinkTypes],
             tree_repository: 'ProgramTreeRepository',
-            version_repository: 'ProgramTreeVersionRepository'
+            version_repository: 'ProgramTreeVersionRepository',
+            fail_fast: bool = False
     ):
         path = paste_command.path_where_to_paste
         parent_node = tree.get_node(path)
         block = paste_command.block
         relative_credits = paste_command.relative_credits
+        context = _get_validation_context(tree_repository)
+        self.fail_fast = fail_fast
 
+        # Validators which do not load other trees come first (see fail_fast)
         if node_to_paste.is_group_or_mini_or_training():
             self.validators = [
                 CreateLinkValidatorList(parent_node, node_to_paste),
                 MinimumEditableYearValidator(tree),
-                InfiniteRecursivityTreeValidator(tree, node_to_paste, path, tree_repository),
                 AuthorizedLinkTypeValidator(tree, node_to_paste, link_type),
                 BlockValidator(block),
-                ValidateFinalitiesEndDateAndOptions(parent_node, node_to_paste, tree_repository),
-                ValidateAuthorizedRelationshipForAllTrees(tree, node_to_paste, path, tree_repository, link_type),
-                MatchVersionValidator(parent_node, node_to_paste, tree_repository, version_repository),
                 RelativeCreditsValidator(relative_credits),
+                InfiniteRecursivityTreeValidator(tree, node_to_paste, path, context),
+                ValidateFinalitiesEndDateAndOptions(parent_node, node_to_paste, context),
+                ValidateAuthorizedRelationshipForAllTrees(tree, node_to_paste, path, context, link_type),
+                MatchVersionValidator(parent_node, node_to_paste, context, version_repository),
             ]
 
         elif node_to_paste.is_learning_unit():
@@ -105,10 +110,10 @@ class PasteNodeValidatorList(MultipleExceptionBusinessListValidator):
                 CreateLinkValidatorList(parent_node, node_to_paste),
                 AuthorizedRelationshipLearningUnitValidator(tree, node_to_paste, parent_node),
                 MinimumEditableYearValidator(tree),
-                InfiniteRecursivityTreeValidator(tree, node_to_paste, path, tree_repository),
                 AuthorizedLinkTypeValidator(tree, node_to_paste, link_type),
                 BlockValidator(block),
                 RelativeCreditsValidator(relative_credits),
+                InfiniteRecursivityTreeValidator(tree, node_to_paste, path, context),
             ]
 
         else:
@@ -139,30 +144,29 @@ class CheckPasteNodeValidatorList(MultipleExceptionBusinessListValidator):
             node_to_paste: 'Node',
             check_paste_command: command.CheckPasteNodeCommand,
             tree_repository: 'ProgramTreeRepository',
-            tree_version_repository: 'ProgramTreeVersionRepository'
+            tree_version_repository: 'ProgramTreeVersionRepository',
+            fail_fast: bool = False
     ):
         path = check_paste_command.path_to_paste
+        parent_node = tree.get_node(path)
+        context = _get_validation_context(tree_repository)
+        self.fail_fast = fail_fast
 
         if node_to_paste.is_group_or_mini_or_training():
             self.validators = [
-                CreateLinkValidatorList(tree.get_node(path), node_to_paste),
+                CreateLinkValidatorList(parent_node, node_to_paste),
                 MinimumEditableYearValidator(tree),
-                InfiniteRecursivityTreeValidator(tree, node_to_paste, path, tree_repository),
-                ValidateFinalitiesEndDateAndOptions(tree.get_node(path), node_to_paste, tree_repository),
-                MatchVersionValidator(
-                    tree.get_node(path),
-                    node_to_paste,
-                    tree_repository,
-                    tree_version_repository
-                ),
+                InfiniteRecursivityTreeValidator(tree, node_to_paste, path, context),
+                ValidateFinalitiesEndDateAndOptions(parent_node, node_to_paste, context),
+                MatchVersionValidator(parent_node, node_to_paste, context, tree_version_repository),
             ]
 
         elif node_to_paste.is_learning_unit():
             self.validators = [
-                CreateLinkValidatorList(tree.get_node(path), node_to_paste),
-                AuthorizedRelationshipLearningUnitValidator(tree, node_to_paste, tree.get_node(path)),
+                CreateLinkValidatorList(parent_node, node_to_paste),
+                AuthorizedRelationshipLearningUnitValidator(tree, node_to_paste, parent_node),
                 MinimumEditableYearValidator(tree),
-                InfiniteRecursivityTreeValidator(tree, node_to_paste, path, tree_repository),
+                InfiniteRecursivityTreeValidator(tree, node_to_paste, path, context),
             ]
 
         else:
@@ -181,11 +185,12 @@ class DetachNodeValidatorList(MultipleExceptionBusinessListValidator):
             prerequisite_repository: 'TreePrerequisitesRepository'
     ) -> None:
         detach_from = tree.get_node(path_to_parent)
+        context = _get_validation_context(tree_repository)
 
         prerequisites_validator = IsHasPrerequisiteForAllTreesValidator(
             detach_from,
             node_to_detach,
-            tree_repository,
+            context,
             prerequisite_repository
         )
 
@@ -196,7 +201,7 @@ class DetachNodeValidatorList(MultipleExceptionBusinessListValidator):
                 MinimumEditableYearValidator(tree),
                 DetachAuthorizedRelationshipValidator(tree, node_to_detach, detach_from),
                 prerequisites_validator,
-                DetachOptionValidator(tree, path_to_node_to_detach, tree_repository),
+                DetachOptionValidator(tree, path_to_node_to_detach, context),
             ]
 
         elif node_to_detach.is_learning_unit():
@@ -363,3 +368,9 @@ class CheckTransitionNameValidatorList(MultipleExceptionBusinessListValidator):
             TransitionNameExistedValidator(from_specific_version, new_transition_name, all_versions)
         ]
         super().__init__()
+
+
+def _get_validation_context(tree_repository: 'ProgramTreeRepository') -> 'ValidationContext':
+    if isinstance(tree_repository, ValidationContext):
+        return tree_repository
+    return ValidationContext(tree_repository)
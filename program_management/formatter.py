@@ -21,12 +21,17 @@
 #  at the root of the source code of this program.  If not,
 #  see http://www.gnu.org/licenses/.
 # ############################################################################
+from decimal import Decimal
+from typing import Dict
+
 from django.http import Http404
+from django.utils.translation import gettext as _
 
 from backoffice.settings.base import LANGUAGE_CODE_EN
 from program_management.ddd.business_types import *
 from program_management.ddd.domain.exception import ProgramTreeNotFoundException
 from program_management.ddd.domain.node import build_title
+from program_management.ddd.domain.tree_aggregates import NodeAggregates
 
 
 def format_version_title(node: 'NodeGroupYear', language: str) -> str:
@@ -69,3 +74,24 @@ def format_program_tree_complete_title(program_tree_version: 'ProgramTreeVersion
         }
     except ProgramTreeNotFoundException:
         raise Http404
+
+
+def format_credits(credits: Decimal) -> str:
+    return "{:f}".format(credits.normalize())
+
+
+def format_credits_by_block(credits_by_block: Dict[int, Decimal]) -> str:
+    return " ; ".join(
+        "{}: {}".format(block, format_credits(credits)) for block, credits in sorted(credits_by_block.items())
+    )
+
+
+def format_node_aggregates(aggregates: 'NodeAggregates') -> str:
+    return _(
+        "%(total_credits)s credits, of which %(mandatory_credits)s mandatory, in %(learning_units_count)s "
+        "learning units"
+    ) % {
+        'total_credits': format_credits(aggregates.total_credits),
+        'mandatory_credits': format_credits(aggregates.mandatory_credits),
+        'learning_units_count': aggregates.learning_units_count,
+    }
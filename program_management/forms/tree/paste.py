@@ -28,10 +28,11 @@ from django.forms import BaseFormSet
 
 from base.ddd.utils.business_validator import MultipleBusinessExceptions
 from base.forms.exceptions import InvalidFormException
+from base.utils import identity_map
+from infrastructure.messages_bus import message_bus_instance
 from program_management.ddd import command
 from program_management.ddd.business_types import *
 from program_management.ddd.domain import exception
-from program_management.ddd.service.write import paste_element_service
 from program_management.forms.content import LinkForm
 
 
@@ -64,7 +65,7 @@ class PasteNodeForm(LinkForm):
     def save(self):
         if self.is_valid():
             try:
-                return paste_element_service.paste_element(self.generate_paste_command())
+                return message_bus_instance.invoke(self.generate_paste_command())
             except MultipleBusinessExceptions as e:
                 self.handle_save_exception(e)
         raise InvalidFormException()
@@ -101,11 +102,12 @@ class BasePasteNodesFormset(BaseFormSet):
     def save(self) -> List[Optional['LinkIdentity']]:
         results = []
         is_a_form_invalid = False
-        for form in self.forms:
-            try:
-                results.append(form.save())
-            except InvalidFormException:
-                is_a_form_invalid = True
+        with identity_map.scope():
+            for form in self.forms:
+                try:
+                    results.append(form.save())
+                except InvalidFormException:
+                    is_a_form_invalid = True
 
         if is_a_form_invalid:
             raise InvalidFormException()
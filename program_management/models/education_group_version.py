@@ -34,7 +34,7 @@ from osis_common.models.osis_model_admin import OsisModelAdmin
 
 def fill_from_past_year(modeladmin, request, queryset):
     from program_management.ddd.command import FillProgramTreeVersionContentFromProgramTreeVersionCommand
-    from program_management.ddd.service.write import bulk_fill_program_tree_version_content_service_from_past_year
+    from infrastructure.messages_bus import message_bus_instance
     cmds = []
     qs = queryset.select_related("offer", "root_group", "offer__academic_year")
     for obj in qs:
@@ -49,9 +49,8 @@ def fill_from_past_year(modeladmin, request, queryset):
             to_transition_name=obj.transition_name
         )
         cmds.append(cmd)
-    result = bulk_fill_program_tree_version_content_service_from_past_year.\
-        bulk_fill_program_tree_version_content_from_last_year(cmds)
-    modeladmin.message_user(request, "{} programs have been filled".format(len(result)))
+    message_bus_instance.invoke_async(cmds)
+    modeladmin.message_user(request, "{} programs have been queued for filling".format(len(cmds)))
 
 
 fill_from_past_year.short_description = _("Fill program tree content from last year")
@@ -166,6 +165,11 @@ class EducationGroupVersion(models.Model):
         unique_together = ('version_name', 'offer', 'transition_name')
         default_manager_name = 'objects'
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        from education_group.models.group_year import GroupYear
+        GroupYear.update_search_titles(GroupYear.objects.filter(pk=self.root_group_id))
+
     def version_label(self):
         if self.version_name and self.transition_name:
             return '[{}-{}]'.format(self.version_name, self.transition_name)
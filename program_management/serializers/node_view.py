@@ -33,6 +33,7 @@ from django.utils.translation import gettext_lazy as _
 from base.models.enums import link_type
 from base.models.enums.proposal_type import ProposalType
 from base.utils.urls import reverse_with_get
+from program_management import formatter
 from program_management.ddd.business_types import *
 from program_management.ddd.domain.node import NodeIdentity
 from program_management.ddd.domain.program_tree import PATH_SEPARATOR
@@ -156,10 +157,18 @@ def _get_node_view_serializer(
             tree=tree,
             context=context,
         ),
-        'a_attr': _get_node_view_attribute_serializer(link, tree, context),
+        'a_attr': {
+            **_get_node_view_attribute_serializer(link, tree, context),
+            'title': __get_group_title(tree, link),
+        },
     }
 
 
+def __get_group_title(tree: 'ProgramTree', link: 'Link') -> str:
+    aggregates = tree.get_aggregates().get_node_aggregates(link.child)
+    return "%s\n%s" % (link.child.code, formatter.format_node_aggregates(aggregates))
+
+
 def _get_group_node_icon(obj: 'Link'):
     if obj.link_type == link_type.LinkTypes.REFERENCE:
         return static('img/reference.jpg')
@@ -27,6 +27,7 @@
 from django.urls import reverse
 
 from base.utils.urls import reverse_with_get
+from program_management import formatter
 from program_management.ddd.business_types import *
 from program_management.serializers.node_view import serialize_children, _format_node_group_text
 
@@ -48,6 +49,10 @@ def program_tree_view_serializer(tree: 'ProgramTree', context: 'NodeViewContext'
             'element_type': tree.root_node.type.name,
             'element_code': tree.root_node.code,
             'element_year': tree.root_node.year,
+            'title': "%s\n%s" % (
+                tree.root_node.code,
+                formatter.format_node_aggregates(tree.get_aggregates().get_node_aggregates(tree.root_node))
+            ),
             'paste_url': reverse_with_get('tree_paste_node', get=querystring_params),
             'search_url': reverse_with_get(
                 'quick_search_education_group',
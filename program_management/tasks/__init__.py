@@ -0,0 +1,10 @@
+from . import generate_program_tree_pdf
+
+from celery.schedules import crontab
+from backoffice.celery import app as celery_app
+celery_app.conf.beat_schedule.update({
+    '|Program management| Generate PDF of published programs': {
+        'task': 'program_management.tasks.generate_program_tree_pdf.run_for_published_programs',
+        'schedule': crontab(minute=0, hour=2)
+    },
+})
@@ -0,0 +1,37 @@
+import logging
+
+from django.conf import settings
+
+from backoffice.celery import app as celery_app
+from base.models.academic_year import starting_academic_year
+from base.utils.read_replica import read_replica
+from program_management.business import program_tree_pdf
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+
+@celery_app.task
+def run(code: str, year: int, language: str, tree_stamp: str = None) -> dict:
+    try:
+        with read_replica():
+            program_tree_pdf.generate_program_tree_pdf(code, year, language, expected_tree_stamp=tree_stamp)
+    finally:
+        program_tree_pdf.release_generation_lock(code, year, language)
+    return {'code': code, 'year': year, 'language': language}
+
+
+@celery_app.task
+def run_for_published_programs() -> dict:
+    academic_year = starting_academic_year()
+    generated = 0
+    for year in [academic_year.year, academic_year.year + 1]:
+        for code in program_tree_pdf.get_published_roots_codes(year):
+            for language, _ in settings.LANGUAGES:
+                try:
+                    with read_replica():
+                        program_tree_pdf.generate_program_tree_pdf(code, year, language)
+                    generated += 1
+                # General catch to be sure to not stop the generation of the other documents
+                except Exception:
+                    logger.exception("PDF generation of program %s in %s failed", code, year)
+    return {'generated': generated}
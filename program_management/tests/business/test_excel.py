@@ -30,7 +30,9 @@ from django.test.utils import override_settings
 from django.utils.translation import gettext_lazy as _
 
 from base.models.enums.prerequisite_operator import OR
-from program_management.business.excel import HeaderLine, OfficialTextLine, LearningUnitYearLine, PrerequisiteItemLine
+from program_management import formatter
+from program_management.business.excel import HeaderLine, OfficialTextLine, LearningUnitYearLine, PrerequisiteItemLine, \
+    ContentAggregatesLine
 from program_management.business.excel import _build_excel_lines
 from program_management.tests.ddd.factories.domain.prerequisite.prerequisite import PrerequisitesFactory
 from program_management.tests.ddd.factories.domain.program_tree.LDROI200M_DROI2M import ProgramTreeDROI2MFactory
@@ -73,6 +75,13 @@ class TestGeneratePrerequisitesWorkbook(SimpleTestCase):
         headers = _build_excel_lines(group_as_program_tree)
         self.assertEqual(expected_first_line, headers[0])
 
+    def test_last_line_contains_aggregates_of_program(self):
+        aggregates = self.tree_droi2m.get_aggregates().get_node_aggregates(self.tree_droi2m.root_node)
+
+        content = _build_excel_lines(self.tree_droi2m)
+
+        self.assertEqual(content[-1], ContentAggregatesLine(text=formatter.format_node_aggregates(aggregates)))
+
     @override_settings(LANGUAGES=[('en', 'English'), ], LANGUAGE_CODE='en')
     def test_when_learning_unit_year_has_one_prerequisite(self):
         tree = copy.deepcopy(self.tree_droi2m)
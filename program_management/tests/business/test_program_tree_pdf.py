@@ -0,0 +1,191 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import TestCase
+
+from base.tests.factories.academic_year import AcademicYearFactory
+from base.tests.factories.group_element_year import GroupElementYearFactory
+from base.tests.factories.learning_component_year import LecturingLearningComponentYearFactory
+from base.tests.factories.prerequisite import PrerequisiteFactory
+from base.utils.read_replica import read_primary
+from program_management.business import program_tree_pdf
+from program_management.ddd.domain import exception
+from program_management.tests.factories.education_group_version import EducationGroupVersionFactory
+from program_management.tests.factories.element import ElementGroupYearFactory, ElementLearningUnitYearFactory
+
+
+class TestGetTreeStamp(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = AcademicYearFactory()
+        cls.root_element = ElementGroupYearFactory(group_year__academic_year=cls.academic_year)
+        cls.link = GroupElementYearFactory(
+            parent_element=cls.root_element,
+            child_element__group_year__academic_year=cls.academic_year
+        )
+        cls.code = cls.root_element.group_year.partial_acronym
+        cls.year = cls.academic_year.year
+
+    def test_should_return_none_when_root_does_not_exist(self):
+        self.assertIsNone(program_tree_pdf.get_tree_stamp("UNKNOWN", self.year))
+
+    def test_should_count_links(self):
+        self.assertEqual(program_tree_pdf.get_tree_stamp(self.code, self.year).number_of_links, 1)
+
+    def test_should_change_when_link_is_added(self):
+        stamp = program_tree_pdf.get_tree_stamp(self.code, self.year)
+        GroupElementYearFactory(
+            parent_element=self.link.child_element,
+            child_element__group_year__academic_year=self.academic_year
+        )
+        self.assertNotEqual(stamp, program_tree_pdf.get_tree_stamp(self.code, self.year))
+
+    def test_should_change_when_node_is_updated(self):
+        stamp = program_tree_pdf.get_tree_stamp(self.code, self.year)
+        self.link.child_element.group_year.save()
+        self.assertNotEqual(stamp, program_tree_pdf.get_tree_stamp(self.code, self.year))
+
+    def test_should_change_when_offer_title_is_updated(self):
+        version = EducationGroupVersionFactory(
+            root_group=self.link.child_element.group_year,
+            offer__academic_year=self.academic_year,
+        )
+        stamp = program_tree_pdf.get_tree_stamp(self.code, self.year)
+
+        version.offer.title = "Updated title"
+        version.offer.save()
+
+        self.assertNotEqual(stamp, program_tree_pdf.get_tree_stamp(self.code, self.year))
+
+    def test_should_change_when_learning_component_volume_is_updated(self):
+        learning_unit_link = GroupElementYearFactory(
+            parent_element=self.link.child_element,
+            child_element=ElementLearningUnitYearFactory(learning_unit_year__academic_year=self.academic_year)
+        )
+        component = LecturingLearningComponentYearFactory(
+            learning_unit_year=learning_unit_link.child_element.learning_unit_year
+        )
+        stamp = program_tree_pdf.get_tree_stamp(self.code, self.year)
+
+        component.hourly_volume_total_annual += 15
+        component.save()
+
+        self.assertNotEqual(stamp, program_tree_pdf.get_tree_stamp(self.code, self.year))
+
+    def test_should_change_when_prerequisite_is_deleted(self):
+        learning_unit_link = GroupElementYearFactory(
+            parent_element=self.link.child_element,
+            child_element=ElementLearningUnitYearFactory(learning_unit_year__academic_year=self.academic_year)
+        )
+        prerequisite = PrerequisiteFactory(
+            learning_unit_year=learning_unit_link.child_element.learning_unit_year,
+            education_group_version=EducationGroupVersionFactory(root_group=self.root_element.group_year),
+        )
+        stamp = program_tree_pdf.get_tree_stamp(self.code, self.year)
+
+        prerequisite.delete()
+
+        self.assertNotEqual(stamp, program_tree_pdf.get_tree_stamp(self.code, self.year))
+
+    def test_should_ignore_prerequisites_of_other_versions(self):
+        learning_unit_link = GroupElementYearFactory(
+            parent_element=self.link.child_element,
+            child_element=ElementLearningUnitYearFactory(learning_unit_year__academic_year=self.academic_year)
+        )
+        stamp = program_tree_pdf.get_tree_stamp(self.code, self.year)
+
+        PrerequisiteFactory(learning_unit_year=learning_unit_link.child_element.learning_unit_year)
+
+        self.assertEqual(stamp, program_tree_pdf.get_tree_stamp(self.code, self.year))
+
+    def test_should_be_stable_when_tree_does_not_change(self):
+        self.assertEqual(
+            program_tree_pdf.get_tree_stamp(self.code, self.year),
+            program_tree_pdf.get_tree_stamp(self.code, self.year)
+        )
+
+
+class TestGenerateProgramTreePdf(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.root_element = ElementGroupYearFactory()
+        cls.code = cls.root_element.group_year.partial_acronym
+        cls.year = cls.root_element.group_year.academic_year.year
+
+    def setUp(self):
+        self.addCleanup(cache.clear)
+        patcher = mock.patch(
+            "program_management.business.program_tree_pdf.render_program_tree_pdf",
+            return_value=HttpResponse(b"pdf", content_type="application/pdf")
+        )
+        self.mock_render = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_should_render_document_once(self):
+        program_tree_pdf.generate_program_tree_pdf(self.code, self.year, 'fr-be')
+        response = program_tree_pdf.generate_program_tree_pdf(self.code, self.year, 'fr-be')
+
+        self.assertEqual(self.mock_render.call_count, 1)
+        self.assertEqual(response.content, b"pdf")
+
+    def test_should_render_document_by_language(self):
+        program_tree_pdf.generate_program_tree_pdf(self.code, self.year, 'fr-be')
+        program_tree_pdf.generate_program_tree_pdf(self.code, self.year, 'en')
+
+        self.assertEqual(self.mock_render.call_count, 2)
+
+    def test_should_raise_when_root_does_not_exist(self):
+        with self.assertRaises(exception.ProgramTreeNotFoundException):
+            program_tree_pdf.generate_program_tree_pdf("UNKNOWN", self.year, 'fr-be')
+        self.assertFalse(self.mock_render.called)
+
+    @mock.patch("program_management.business.program_tree_pdf.read_primary", wraps=read_primary)
+    def test_should_read_tree_from_primary_when_stamp_differs_from_expected_one(self, mock_read_primary):
+        program_tree_pdf.generate_program_tree_pdf(self.code, self.year, 'fr-be', expected_tree_stamp="outdated")
+
+        self.assertTrue(mock_read_primary.called)
+        self.assertEqual(self.mock_render.call_count, 1)
+        tree_stamp = program_tree_pdf.get_tree_stamp(self.code, self.year)
+        pdf_cache = program_tree_pdf.ProgramTreePdfCache(self.code, self.year, 'fr-be', tree_stamp.value)
+        self.assertIsNotNone(pdf_cache.get_response())
+
+    @mock.patch("program_management.business.program_tree_pdf.read_primary", wraps=read_primary)
+    def test_should_keep_reading_from_current_database_when_stamp_is_expected_one(self, mock_read_primary):
+        tree_stamp = program_tree_pdf.get_tree_stamp(self.code, self.year)
+
+        program_tree_pdf.generate_program_tree_pdf(self.code, self.year, 'fr-be', expected_tree_stamp=tree_stamp.value)
+
+        self.assertFalse(mock_read_primary.called)
+        self.assertEqual(self.mock_render.call_count, 1)
+
+    def test_generation_lock(self):
+        self.assertTrue(program_tree_pdf.acquire_generation_lock(self.code, self.year, 'en'))
+        self.assertFalse(program_tree_pdf.acquire_generation_lock(self.code, self.year, 'en'))
+        program_tree_pdf.release_generation_lock(self.code, self.year, 'en')
+        self.assertTrue(program_tree_pdf.acquire_generation_lock(self.code, self.year, 'en'))
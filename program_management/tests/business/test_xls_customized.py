@@ -34,6 +34,7 @@ from base.models.enums.publication_contact_type import PublicationContactType
 from base.tests.factories.academic_year import get_current_year
 from base.tests.factories.education_group_publication_contact import EducationGroupPublicationContactFactory
 from base.tests.factories.education_group_type import MiniTrainingEducationGroupTypeFactory
+from base.tests.factories.group_element_year import GroupElementYearChildLeafFactory
 from education_group.ddd.domain.group import GroupIdentity
 from education_group.ddd.domain.mini_training import MiniTrainingIdentity
 from education_group.tests.ddd.factories.academic_partner import AcademicPartnerFactory
@@ -54,7 +55,8 @@ from program_management.business.xls_customized import _build_headers, TRAINING_
     _build_organization_data, _get_responsibles_and_contacts, _build_aims_data, _build_keywords_data, \
     _get_co_organizations, _build_duration_data, _build_common_ares_code_data, _title_yes_no_empty, \
     _build_funding_data, _build_diploma_certificat_data, _build_enrollment_data, \
-    _build_other_legal_information_data, _build_title_fr, _build_secondary_domains
+    _build_other_legal_information_data, _build_title_fr, _build_secondary_domains, \
+    _get_content_aggregates_by_code_and_year, _build_content_aggregates_data
 from program_management.tests.ddd.factories.node import NodeGroupYearFactory
 from program_management.tests.ddd.factories.program_tree import ProgramTreeFactory
 from program_management.tests.ddd.factories.program_tree_version import ProgramTreeVersionFactory
@@ -110,6 +112,9 @@ ADDITIONAL_INFO_HEADERS = [
     "Type de contrainte", "Contrainte minimum", "Contrainte maximum", "Commentaire (interne)", "Remarque",
     "Remarque en anglais"
 ]
+CONTENT_AGGREGATES_HEADERS = [
+    "Crédits du contenu", "Crédits obligatoires du contenu", "Unités d'enseignement du contenu", "Vol. PM", "Vol. PP"
+]
 
 
 @override_settings(LANGUAGES=[('fr-be', 'Français'), ], LANGUAGE_CODE='fr-be')
@@ -135,6 +140,7 @@ class XlsCustomizedHeadersTestCase(SimpleTestCase):
         self.assertListEqual(headers[48:51], OTHER_LEGAL_INFORMATION_HEADERS)
         self.assertListEqual(headers[51:57], ADDITIONAL_INFO_HEADERS)
         self.assertListEqual(headers[57:58], ["Mots clés"])
+        self.assertListEqual(headers[58:63], CONTENT_AGGREGATES_HEADERS)
 
     def test_no_duplicate_headers_when_organization_and_activities(self):
         headers = _build_headers([WITH_ORGANIZATION, WITH_ACTIVITIES])
@@ -247,6 +253,25 @@ class XlsCustomizedContentTestCase(TestCase):
             remark=remark
         )
 
+    def test_get_content_aggregates_by_code_and_year(self):
+        GroupElementYearChildLeafFactory(
+            parent_element=self.root_group_element,
+            child_element__learning_unit_year__academic_year__year=self.current_year,
+            relative_credits=6,
+            is_mandatory=False,
+        )
+
+        aggregates_by_code_and_year = _get_content_aggregates_by_code_and_year([self.training_version.root_group])
+
+        aggregates = aggregates_by_code_and_year[("LDROI200M", self.current_year)]
+        self.assertEqual(aggregates.total_credits, 6)
+        self.assertEqual(aggregates.mandatory_credits, 0)
+        self.assertEqual(aggregates.learning_units_count, 1)
+        self.assertEqual(_build_content_aggregates_data(aggregates)[:3], ["6", "0", 1])
+
+    def test_build_content_aggregates_data_when_content_not_found(self):
+        self.assertEqual(_build_content_aggregates_data(None), ['', '', '', '', ''])
+
     def test_build_validity_for_training(self):
         expected = [
             'Actif',
@@ -250,3 +250,62 @@ class TestConstructPrerequisiteFromExpression(SimpleTestCase):
             prerequisite_expression,
             str(prerequisite_obj)
         )
+
+
+class TestCompileExpression(SimpleTestCase):
+    def test_should_return_none_when_syntax_is_invalid(self):
+        self.assertIsNone(prerequisite.compile_expression("LSINF1111 OU (LINGI1526 OU LINGI2356)"))
+
+    def test_should_return_groups_of_codes(self):
+        compiled = prerequisite.compile_expression("LSINF1111 ou (LINGI1526 et LINGI2356)")
+        self.assertEqual(compiled.main_operator, prerequisite_operator.OR)
+        self.assertEqual(compiled.groups, (("LSINF1111",), ("LINGI1526", "LINGI2356")))
+        self.assertEqual(compiled.codes, {"LSINF1111", "LINGI1526", "LINGI2356"})
+
+    def test_expression_should_be_normalized(self):
+        compiled = prerequisite.compile_expression("LSINF1111 et (LINGI1526 ou LINGI2356)")
+        self.assertEqual(compiled.expression, "LSINF1111 ET (LINGI1526 OU LINGI2356)")
+
+    def test_is_satisfied_by_when_main_operator_is_and(self):
+        compiled = prerequisite.compile_expression("LSINF1111 ET (LINGI1526 OU LINGI2356)")
+        self.assertTrue(compiled.is_satisfied_by({"LSINF1111", "LINGI2356"}))
+        self.assertFalse(compiled.is_satisfied_by({"LINGI1526", "LINGI2356"}))
+
+    def test_is_satisfied_by_when_main_operator_is_or(self):
+        compiled = prerequisite.compile_expression("LSINF1111 OU (LINGI1526 ET LINGI2356)")
+        self.assertTrue(compiled.is_satisfied_by({"LINGI1526", "LINGI2356"}))
+        self.assertFalse(compiled.is_satisfied_by({"LINGI1526"}))
+
+    def test_compile_prerequisite_should_give_back_its_expression(self):
+        expression = "LOSIS4525 OU (LMARC5823 ET BRABD6985)"
+        prerequisite_obj = prerequisite.factory.from_expression(
+            prerequisite_expression=expression,
+            node_having_prerequisites=NodeLearningUnitYearFactory(),
+            context_tree=ProgramTreeFactory().entity_id
+        )
+        self.assertEqual(prerequisite_obj.compile(), prerequisite.compile_expression(expression))
+
+
+class TestSearchAffectedByRemoval(SimpleTestCase):
+    def setUp(self):
+        self.tree = ProgramTreeFactory()
+        self.node_having_prerequisites = NodeLearningUnitYearFactory(code='LDROI1001')
+        self.prerequisites = prerequisite.Prerequisites(
+            self.tree.entity_id,
+            [
+                prerequisite.factory.from_expression(
+                    prerequisite_expression="LOSIS4525 OU (LMARC5823 ET BRABD6985)",
+                    node_having_prerequisites=self.node_having_prerequisites.entity_id,
+                    context_tree=self.tree.entity_id
+                )
+            ]
+        )
+
+    def test_should_return_nodes_whose_prerequisite_refers_to_a_removed_code(self):
+        self.assertListEqual(
+            self.prerequisites.search_affected_by_removal({'LMARC5823', 'LSINF1111'}),
+            [self.node_having_prerequisites.entity_id]
+        )
+
+    def test_should_return_empty_list_when_no_prerequisite_refers_to_removed_codes(self):
+        self.assertListEqual(self.prerequisites.search_affected_by_removal({'LSINF1111'}), [])
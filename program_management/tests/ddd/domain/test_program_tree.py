@@ -25,6 +25,7 @@
 ##############################################################################
 import copy
 import inspect
+import uuid
 from unittest import mock
 from unittest.mock import patch
 
@@ -43,6 +44,7 @@ from program_management.ddd.domain.link import Link
 from program_management.ddd.domain.prerequisite import PrerequisiteItem
 from program_management.ddd.domain.program_tree import ProgramTree
 from program_management.ddd.domain.program_tree import build_path
+from program_management.ddd.domain.report import Report, ReportIdentity
 from program_management.ddd.domain.service.generate_node_abbreviated_title import GenerateNodeAbbreviatedTitle
 from program_management.ddd.domain.service.generate_node_code import GenerateNodeCode
 from program_management.ddd.domain.service.validation_rule import FieldValidationRule
@@ -154,6 +156,64 @@ class TestProgramTreeBuilderCopyToNextYear(SimpleTestCase):
         self._assert_mandatory_children_are_created(resulted_tree)
 
 
+class TestProgramTreeBuilderCopyToNextYears(SimpleTestCase):
+    def setUp(self) -> None:
+        self.authorized_relation = MandatoryRelationshipObjectFactory()
+        self.authorized_relations_list = AuthorizedRelationshipListFactory(
+            authorized_relationships=[self.authorized_relation]
+        )
+        self.copy_from_program_tree = ProgramTreeFactory(
+            authorized_relationships=self.authorized_relations_list,
+            root_node__node_type=self.authorized_relation.parent_type,
+            root_node__end_year=None,
+        )
+        self.copy_from_program_tree.root_node.add_child(
+            NodeGroupYearFactory(node_type=self.authorized_relation.child_type)
+        )
+        self.mock_repository = mock.create_autospec(ProgramTreeRepository)
+        self.mock_repository.search.return_value = []
+        self.report = Report(entity_id=ReportIdentity(transaction_id=uuid.uuid4()))
+
+    @mock.patch.object(GenerateNodeCode, 'generate_from_parent_node')
+    @mock.patch.object(GenerateNodeAbbreviatedTitle, 'generate')
+    @mock.patch.object(FieldValidationRule, 'get')
+    @mock.patch('program_management.ddd.repositories.load_authorized_relationship.load')
+    def test_should_copy_tree_for_each_year_until_end_year(self, mock_relationships, *mocks):
+        mock_relationships.return_value = self.authorized_relations_list
+        from_year = self.copy_from_program_tree.entity_id.year
+
+        resulted_trees = program_tree.ProgramTreeBuilder().copy_to_next_years(
+            self.copy_from_program_tree,
+            from_year + 3,
+            self.mock_repository,
+            report=self.report
+        )
+
+        self.assertEqual([from_year + 1, from_year + 2, from_year + 3], [tree.entity_id.year for tree in resulted_trees])
+        self.assertEqual(self.mock_repository.search.call_count, 1)
+        self.assertEqual(mock_relationships.call_count, 1)
+        self.assertFalse(self.report.get_warnings())
+
+    @mock.patch.object(GenerateNodeCode, 'generate_from_parent_node')
+    @mock.patch.object(GenerateNodeAbbreviatedTitle, 'generate')
+    @mock.patch.object(FieldValidationRule, 'get')
+    @mock.patch('program_management.ddd.repositories.load_authorized_relationship.load')
+    def test_should_stop_copy_and_report_warning_when_tree_ends(self, mock_relationships, *mocks):
+        mock_relationships.return_value = self.authorized_relations_list
+        from_year = self.copy_from_program_tree.entity_id.year
+        self.copy_from_program_tree.root_node.end_year = from_year + 1
+
+        resulted_trees = program_tree.ProgramTreeBuilder().copy_to_next_years(
+            self.copy_from_program_tree,
+            from_year + 3,
+            self.mock_repository,
+            report=self.report
+        )
+
+        self.assertEqual([from_year + 1], [tree.entity_id.year for tree in resulted_trees])
+        self.assertEqual(len(self.report.get_warnings()), 1)
+
+
 class TestGetNodeProgramTree(SimpleTestCase):
     def setUp(self):
         link = LinkFactory()
@@ -603,6 +663,64 @@ class TestGetCodesPermittedAsPrerequisite(SimpleTestCase):
         expected_result = [ue]
         self.assertListEqual(result, expected_result)
 
+    @patch.object(DetachNodeValidatorList, 'validate')
+    def test_codes_should_be_reset_when_node_is_detached(self, mock_validate):
+        link = LinkFactory(parent=self.tree.root_node, child=NodeLearningUnitYearFactory())
+        self.assertSetEqual(self.tree.get_codes_permitted_as_prerequisite(), {link.child.code})
+
+        self.tree.detach_node(build_path(link.parent, link.child), mock.Mock(), mock.Mock())
+
+        self.assertSetEqual(self.tree.get_codes_permitted_as_prerequisite(), set())
+
+    @patch.object(PasteNodeValidatorList, 'validate')
+    def test_codes_should_be_reset_when_node_is_pasted(self, mock_validate):
+        self.assertSetEqual(self.tree.get_codes_permitted_as_prerequisite(), set())
+        node_to_paste = NodeLearningUnitYearFactory()
+        paste_command = PasteElementCommandFactory(
+            node_to_paste_code=node_to_paste.code,
+            node_to_paste_year=node_to_paste.year,
+            path_where_to_paste=str(self.tree.root_node.node_id)
+        )
+
+        self.tree.paste_node(node_to_paste, paste_command, mock.Mock(), mock.Mock())
+
+        self.assertSetEqual(self.tree.get_codes_permitted_as_prerequisite(), {node_to_paste.code})
+
+
+class TestSearchUnitsAffectedByRemoval(SimpleTestCase):
+    def setUp(self):
+        self.tree = ProgramTreeFactory()
+        self.group_to_remove = NodeGroupYearFactory()
+        LinkFactory(parent=self.tree.root_node, child=self.group_to_remove)
+        self.removed_unit = LinkFactory(parent=self.group_to_remove, child=NodeLearningUnitYearFactory()).child
+        self.removed_unit_having_prerequisite = LinkFactory(
+            parent=self.group_to_remove,
+            child=NodeLearningUnitYearFactory()
+        ).child
+        self.unit_having_prerequisite = LinkFactory(
+            parent=self.tree.root_node,
+            child=NodeLearningUnitYearFactory()
+        ).child
+        self.unit_without_prerequisite = LinkFactory(
+            parent=self.tree.root_node,
+            child=NodeLearningUnitYearFactory()
+        ).child
+        for node_having_prerequisite in [self.unit_having_prerequisite, self.removed_unit_having_prerequisite]:
+            PrerequisitesFactory.produce_inside_tree(
+                context_tree=self.tree,
+                node_having_prerequisite=node_having_prerequisite.entity_id,
+                nodes_that_are_prequisites=[self.removed_unit]
+            )
+
+    def test_should_return_units_out_of_removed_node_which_have_a_removed_unit_as_prerequisite(self):
+        self.assertListEqual(
+            self.tree.search_units_affected_by_removal(self.group_to_remove),
+            [self.unit_having_prerequisite]
+        )
+
+    def test_should_return_empty_list_when_removed_unit_is_not_a_prerequisite(self):
+        self.assertListEqual(self.tree.search_units_affected_by_removal(self.unit_without_prerequisite), [])
+
 
 class TestGetAllFinalities(SimpleTestCase):
 
@@ -0,0 +1,126 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from program_management.ddd.domain.tree_aggregates import NodeAggregates
+from program_management.tests.ddd.factories.link import LinkFactory
+from program_management.tests.ddd.factories.node import NodeGroupYearFactory, NodeLearningUnitYearFactory
+from program_management.tests.ddd.factories.program_tree import ProgramTreeFactory
+
+
+class TestTreeAggregates(SimpleTestCase):
+    def setUp(self):
+        """
+        root
+        |--(block 1, mandatory, 4 rel. credits) LU1
+        |--(block 12, optional) LU2
+        |--(mandatory) common_core
+           |--(block 2, mandatory) LU3
+        |--(optional) subgroup
+           |--(mandatory) common_core
+        """
+        self.tree = ProgramTreeFactory()
+        self.lu1 = NodeLearningUnitYearFactory(credits=Decimal(5), volume_total_lecturing=Decimal(30),
+                                               volume_total_practical=Decimal(15))
+        self.lu2 = NodeLearningUnitYearFactory(credits=Decimal(3), volume_total_lecturing=Decimal(10),
+                                               volume_total_practical=None)
+        self.lu3 = NodeLearningUnitYearFactory(credits=Decimal(6), volume_total_lecturing=None,
+                                               volume_total_practical=Decimal(20))
+        self.common_core = NodeGroupYearFactory()
+        self.subgroup = NodeGroupYearFactory()
+
+        self.link_lu1 = LinkFactory(parent=self.tree.root_node, child=self.lu1, block=1, is_mandatory=True,
+                                    relative_credits=4)
+        LinkFactory(parent=self.tree.root_node, child=self.lu2, block=12, is_mandatory=False, relative_credits=None)
+        LinkFactory(parent=self.tree.root_node, child=self.common_core, block=None, is_mandatory=True)
+        self.link_lu3 = LinkFactory(parent=self.common_core, child=self.lu3, block=2, is_mandatory=True,
+                                    relative_credits=None)
+        LinkFactory(parent=self.tree.root_node, child=self.subgroup, block=None, is_mandatory=False)
+        LinkFactory(parent=self.subgroup, child=self.common_core, block=None, is_mandatory=True)
+
+    def test_should_aggregate_subtree_of_each_node(self):
+        aggregates = self.tree.get_aggregates()
+
+        self.assertEqual(
+            aggregates.get_node_aggregates(self.common_core),
+            NodeAggregates(
+                total_credits=Decimal(6),
+                mandatory_credits=Decimal(6),
+                credits_by_block={2: Decimal(6)},
+                learning_units_count=1,
+                volume_total_lecturing=Decimal(0),
+                volume_total_practical=Decimal(20),
+            )
+        )
+        self.assertEqual(
+            aggregates.get_node_aggregates(self.tree.root_node),
+            NodeAggregates(
+                total_credits=Decimal(4 + 3 + 6 + 6),
+                mandatory_credits=Decimal(4 + 6),
+                credits_by_block={1: Decimal(4 + 3), 2: Decimal(3 + 6 + 6)},
+                learning_units_count=4,
+                volume_total_lecturing=Decimal(40),
+                volume_total_practical=Decimal(15 + 20 + 20),
+            )
+        )
+
+    def test_should_index_nodes_and_links(self):
+        aggregates = self.tree.get_aggregates()
+
+        self.assertEqual(aggregates.get_node_by_code_and_year(self.lu3.code, self.lu3.year), self.lu3)
+        self.assertIsNone(aggregates.get_node_by_code_and_year("UNKNOWN", self.lu3.year))
+        self.assertEqual(aggregates.search_links_using_node(self.lu3), [self.link_lu3])
+        self.assertEqual(len(aggregates.search_links_using_node(self.common_core)), 2)
+        self.assertEqual(aggregates.greater_block_value, 2)
+
+    def test_tree_lookups_should_use_indexes(self):
+        self.assertEqual(self.tree.get_node_by_code_and_year(self.lu3.code, self.lu3.year), self.lu3)
+        self.assertEqual(self.tree.search_links_using_node(self.lu3), [self.link_lu3])
+        self.assertEqual(self.tree.count_usages_distinct(self.common_core), 2)
+
+    def test_should_be_memoized_with_the_tree(self):
+        self.assertIs(self.tree.get_aggregates(), self.tree.get_aggregates())
+
+    @mock.patch('program_management.ddd.domain.program_tree.validators_by_business_action.UpdateLinkValidatorList')
+    def test_should_be_invalidated_when_link_updated_through_the_tree(self, mock_update_link_validator_list):
+        self.assertEqual(self.tree.get_aggregates().greater_block_value, 2)
+
+        self.tree.update_link(
+            str(self.tree.root_node.pk),
+            child_id=self.lu1.entity_id,
+            relative_credits=4,
+            access_condition=False,
+            is_mandatory=True,
+            block=123,
+            link_type=None,
+            comment="",
+            comment_english=""
+        )
+
+        self.assertEqual(self.tree.get_aggregates().greater_block_value, 3)
@@ -50,7 +50,7 @@ from program_management.tests.factories.element import ElementGroupYearFactory,
 
 
 class TestPersist(TestCase):
-    @mock.patch("program_management.ddd.repositories._persist_prerequisite._persist")
+    @mock.patch("program_management.ddd.repositories._persist_prerequisite._persist_many")
     def test_call_persist_prerequisite_on_changed_node(self, mock_persist_prerequisite):
         year = 2020
         tree = ProgramTreeFactory(root_node__year=year, root_node__node_type=TrainingType.BACHELOR)
@@ -61,7 +61,7 @@ class TestPersist(TestCase):
 
         _persist_prerequisite.persist(tree)
 
-        mock_persist_prerequisite.assert_called_once_with(tree.root_node, tree.get_all_prerequisites()[0])
+        mock_persist_prerequisite.assert_called_once_with(tree.root_node, [tree.get_all_prerequisites()[0]])
 
 
 class TestPersistPrerequisite(TestCase):
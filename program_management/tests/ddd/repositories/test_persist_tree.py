@@ -26,8 +26,12 @@
 from unittest.mock import patch
 from unittest import mock
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
+from base.models.change_log_entry import ChangeLogEntry
+from base.models.enums.change_log_types import ChangeLogObjectTypes, ChangeLogActions
 from base.models.group_element_year import GroupElementYear
 from base.models.prerequisite import Prerequisite
 from base.models.prerequisite_item import PrerequisiteItem
@@ -49,6 +53,7 @@ from program_management.tests.factories.element import ElementGroupYearFactory,
 class TestPersistTree(TestCase):
     def setUp(self):
         academic_year = AcademicYearFactory(current=True)
+        self.academic_year = academic_year
 
         self.training_version = EducationGroupVersionFactory()
 
@@ -93,6 +98,24 @@ class TestPersistTree(TestCase):
         )
         self.assertTrue(link_common_core_with_learn_unit.exists())
 
+    def test_should_log_created_links_in_change_log(self):
+        tree = load_tree.load(self.root_node.node_id)
+        tree.root_node.add_child(self.common_core_node)
+
+        persist_tree.persist(tree)
+
+        link = GroupElementYear.objects.get(
+            parent_element_id=self.root_node.node_id,
+            child_element_id=self.common_core_node.node_id,
+        )
+        self.assertTrue(
+            ChangeLogEntry.objects.filter(
+                object_type=ChangeLogObjectTypes.LINK.name,
+                object_id=link.pk,
+                action=ChangeLogActions.CREATE.name,
+            ).exists()
+        )
+
     def test_save_when_first_link_exists_and_second_one_does_not(self):
         GroupElementYearFactory(parent_element=self.root_group, child_element=self.common_core_element)
         tree = load_tree.load(self.root_node.node_id)
@@ -109,7 +132,7 @@ class TestPersistTree(TestCase):
             ).exists()
         )
 
-    @patch("program_management.ddd.repositories.persist_tree.__persist_group_element_year")
+    @patch("program_management.ddd.repositories.persist_tree.__persist_group_element_years")
     def test_save_when_link_has_not_changed(self, mock):
         GroupElementYearFactory(parent_element=self.root_group, child_element=self.common_core_element)
         tree = load_tree.load(self.root_node.node_id)
@@ -117,7 +140,7 @@ class TestPersistTree(TestCase):
         assertion_msg = "No changes made, so function GroupelementYear.save() should not have been called"
         self.assertFalse(mock.called, assertion_msg)
 
-    @patch("program_management.ddd.repositories.persist_tree.__persist_group_element_year")
+    @patch("program_management.ddd.repositories.persist_tree.__persist_group_element_years")
     def test_save_when_link_has_changed(self, mock):
         GroupElementYearFactory(parent_element=self.root_group, child_element=self.common_core_element)
         tree = load_tree.load(self.root_node.node_id)
@@ -128,6 +151,28 @@ class TestPersistTree(TestCase):
         """
         self.assertTrue(mock.called, assertion_msg)
 
+    def test_number_of_queries_should_not_depend_on_number_of_links_created(self):
+        with CaptureQueriesContext(connection) as context_with_one_link:
+            persist_tree.persist(self._get_tree_with_new_learning_unit_links(number_of_links=1))
+        with CaptureQueriesContext(connection) as context_with_many_links:
+            persist_tree.persist(self._get_tree_with_new_learning_unit_links(number_of_links=10))
+
+        self.assertEqual(len(context_with_one_link), len(context_with_many_links))
+
+    def _get_tree_with_new_learning_unit_links(self, number_of_links: int):
+        root_element = ElementGroupYearFactory(group_year__academic_year=self.academic_year)
+        tree = load_tree.load(root_element.pk)
+        for _ in range(number_of_links):
+            element = ElementLearningUnitYearFactory(learning_unit_year__academic_year=self.academic_year)
+            tree.root_node.add_child(
+                NodeLearningUnitYearFactory(
+                    node_id=element.pk,
+                    code=element.learning_unit_year.acronym,
+                    year=element.learning_unit_year.academic_year.year
+                )
+            )
+        return tree
+
     @patch.object(DetachNodeValidatorList, 'validate')
     def test_delete_when_1_link_has_been_deleted(self, mock_detach):
         mock_detach.return_value = None
@@ -143,7 +188,7 @@ class TestPersistTree(TestCase):
         persist_tree.persist(tree)
         self.assertEqual(qs_link_will_be_detached.count(), 0)
 
-    @patch("program_management.ddd.repositories.persist_tree.__delete_group_element_year")
+    @patch("program_management.ddd.repositories.persist_tree.__delete_group_element_years")
     def test_delete_when_nothing_has_been_deleted(self, mock):
         GroupElementYearFactory(parent_element=self.root_group, child_element=self.common_core_element)
         tree = load_tree.load(self.root_node.node_id)
@@ -162,8 +207,8 @@ class TestPersistPrerequisites(TestCase):
 
         mock_persist_prerequisite.assert_called_once_with(tree)
 
-    @patch("program_management.ddd.repositories._persist_prerequisite._persist")
-    @patch("program_management.ddd.repositories.persist_tree.__delete_group_element_year")
+    @patch("program_management.ddd.repositories._persist_prerequisite._persist_many")
+    @patch("program_management.ddd.repositories.persist_tree.__delete_group_element_years")
     def test_should_call_persist_prerequisites_on_all_children_when_link_deleted(
             self,
             mock_delete_group_element_year,
@@ -202,13 +247,10 @@ class TestPersistPrerequisites(TestCase):
         tree.root_node.detach_child(root_node_child)
 
         persist_tree.persist(tree)
-        number_learning_unit_removed = 2
-        self.assertNotEqual(
-            mock_persist_prerequisite.call_count,
-            number_learning_unit_removed
-        )
+        mock_persist_prerequisite.assert_called_once()
+        _, prerequisites_persisted = mock_persist_prerequisite.call_args[0]
         number_learning_unit_with_prerequisite_removed = 1
         self.assertEqual(
-            mock_persist_prerequisite.call_count,
+            len(prerequisites_persisted),
             number_learning_unit_with_prerequisite_removed
         )
@@ -0,0 +1,92 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from base.ddd.utils.business_validator import MultipleExceptionBusinessListValidator, BusinessValidator, \
+    MultipleBusinessExceptions
+from osis_common.ddd.interface import BusinessException
+from program_management.ddd.domain.program_tree import ProgramTreeIdentity
+from program_management.ddd.validators.validation_context import ValidationContext
+from program_management.tests.ddd.factories.node import NodeGroupYearFactory
+from program_management.tests.ddd.factories.program_tree import ProgramTreeFactory
+
+
+class TestValidationContext(SimpleTestCase):
+    def setUp(self):
+        self.tree = ProgramTreeFactory()
+        self.repository = mock.Mock()
+        self.repository.get.return_value = self.tree
+        self.repository.search_from_children.return_value = [self.tree]
+        self.context = ValidationContext(self.repository)
+
+    def test_should_load_tree_once(self):
+        identity = ProgramTreeIdentity(code="LDROI100B", year=2020)
+        self.assertIs(self.context.get(identity), self.context.get(identity))
+        self.repository.get.assert_called_once_with(identity)
+
+    def test_should_search_trees_using_node_once(self):
+        node_identity = NodeGroupYearFactory().entity_id
+        trees = self.context.search_from_children([node_identity])
+        trees.append(ProgramTreeFactory())
+
+        self.assertEqual(self.context.search_from_children([node_identity]), [self.tree])
+        self.repository.search_from_children.assert_called_once_with([node_identity])
+
+    def test_should_share_tree_instances_between_searches(self):
+        self.repository.search_from_children.return_value = [self.tree]
+        self.repository.get.return_value = ProgramTreeFactory(root_node=self.tree.root_node)
+        tree_found = self.context.search_from_children([NodeGroupYearFactory().entity_id])[0]
+
+        self.assertIs(self.context.get(self.tree.entity_id), tree_found)
+        self.assertFalse(self.repository.get.called)
+
+    def test_should_delegate_other_methods_to_repository(self):
+        self.context.search(entity_ids=[])
+        self.repository.search.assert_called_once_with(entity_ids=[])
+
+
+class TestFailFast(SimpleTestCase):
+    class _RaiseValidator(BusinessValidator):
+        def validate(self, *args, **kwargs):
+            raise BusinessException("Error")
+
+    def setUp(self):
+        self.last_validator = mock.Mock()
+        self.validator_list = MultipleExceptionBusinessListValidator()
+        self.validator_list.validators = [self._RaiseValidator(), self.last_validator]
+
+    def test_should_run_all_validators_by_default(self):
+        with self.assertRaises(MultipleBusinessExceptions):
+            self.validator_list.validate()
+        self.assertTrue(self.last_validator.validate.called)
+
+    def test_should_stop_at_first_exception_when_fail_fast(self):
+        self.validator_list.fail_fast = True
+        with self.assertRaises(MultipleBusinessExceptions):
+            self.validator_list.validate()
+        self.assertFalse(self.last_validator.validate.called)
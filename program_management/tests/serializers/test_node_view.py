@@ -35,6 +35,7 @@ from base.models.enums import link_type
 from base.models.enums.education_group_types import TrainingType
 from base.models.enums.proposal_type import ProposalType
 from base.utils.urls import reverse_with_get
+from program_management import formatter
 from program_management.models.enums.node_type import NodeType
 from program_management.serializers.node_view import _get_node_view_attribute_serializer, \
     _get_leaf_view_attribute_serializer, \
@@ -50,7 +51,9 @@ class TestNodeViewSerializer(SimpleTestCase):
         self.root_node = NodeGroupYearFactory(node_id=1, code="LBIR100A", title="BIR1BA", year=2018)
         node_parent = NodeGroupYearFactory(node_id=2, code="LTROC250T", title="Tronc commun 2", year=2018)
         node_child = NodeGroupYearFactory(node_id=6, code="LSUBGR150G", title="Sous-groupe 2", year=2018)
+        LinkFactory(parent=self.root_node, child=node_parent)
         self.link = LinkFactory(parent=node_parent, child=node_child, link_type=link_type.LinkTypes.REFERENCE)
+        LinkFactory(parent=node_child, child=NodeLearningUnitYearFactory(credits=5, year=2018), relative_credits=4)
 
         self.context = NodeViewContext(current_path='1|2|6', root_node=self.root_node, view_path='1|2')
         self.tree = ProgramTreeFactory(root_node=self.root_node)
@@ -71,6 +74,15 @@ class TestNodeViewSerializer(SimpleTestCase):
         expected_icon_path = 'img/reference.jpg'
         self.assertIn(expected_icon_path, serialized_data['icon'])
 
+    def test_serialize_node_ensure_title_with_subtree_aggregates(self):
+        serialized_data = _get_node_view_serializer(self.link, self.tree, self.context)
+        expected_title = "{}\n{}".format(
+            self.link.child.code,
+            formatter.format_node_aggregates(self.tree.get_aggregates().get_node_aggregates(self.link.child))
+        )
+        self.assertEqual(serialized_data['a_attr']['title'], expected_title)
+        self.assertEqual(self.tree.get_aggregates().get_node_aggregates(self.link.child).total_credits, 4)
+
 
 class TestNodeViewAttributeSerializer(SimpleTestCase):
     def setUp(self):
@@ -27,6 +27,7 @@ from django.test import TestCase
 
 from program_management.ddd.domain.program_tree import ProgramTree
 from program_management.serializers.node_view import NodeViewContext
+from program_management import formatter
 from program_management.serializers.program_tree_view import program_tree_view_serializer
 from program_management.tests.ddd.factories.link import LinkFactory
 from program_management.tests.ddd.factories.node import NodeGroupYearFactory, NodeLearningUnitYearFactory
@@ -74,7 +75,7 @@ class TestProgramTreeViewSerializer(TestCase):
     def test_serialize_program_tree_assert_keys_of_root_element_a_attr(self):
         serialized_data = program_tree_view_serializer(self.tree, self.context)
         expected_keys = [
-            'element_id', 'element_type', 'element_code', 'element_year', 'href', 'paste_url',
+            'element_id', 'element_type', 'element_code', 'element_year', 'title', 'href', 'paste_url',
             'search_url'
         ]
 
@@ -108,6 +109,27 @@ class TestProgramTreeViewSerializer(TestCase):
         self.assertIsInstance(a_attr, dict)
         self.assertSetEqual(set(a_attr.keys()), set(expected_keys))
 
+    def test_serialize_program_tree_titles_with_subtree_aggregates(self):
+        aggregates = self.tree.get_aggregates()
+
+        serialized_data = program_tree_view_serializer(self.tree, self.context)
+
+        self.assertEqual(
+            serialized_data['a_attr']['title'],
+            "{}\n{}".format(
+                self.root_node.code,
+                formatter.format_node_aggregates(aggregates.get_node_aggregates(self.root_node))
+            )
+        )
+        self.assertEqual(
+            serialized_data['children'][1]['a_attr']['title'],
+            "{}\n{}".format(
+                self.subgroup1.code,
+                formatter.format_node_aggregates(aggregates.get_node_aggregates(self.subgroup1))
+            )
+        )
+        self.assertEqual(aggregates.get_node_aggregates(self.subgroup1).learning_units_count, 2)
+
     def test_serialize_program_tree_text(self):
         serialized_data = program_tree_view_serializer(self.tree, self.context)
         self.assertEqual(serialized_data['text'],
@@ -121,7 +121,7 @@ class TestPasteNodeView(TestCase):
         self.assertTrue(self.permission_mock.called)
 
     @mock.patch('program_management.ddd.service.read.element_selected_service.retrieve_element_selected')
-    @mock.patch('program_management.ddd.service.read.check_paste_node_service.check_paste')
+    @mock.patch('program_management.ddd.service.read.check_paste_node_service.check_paste_nodes')
     @mock.patch(
         'program_management.ddd.domain.service.identity_search.ProgramTreeVersionIdentitySearch.get_from_node_identity'
     )
@@ -156,7 +156,7 @@ class TestPasteNodeView(TestCase):
 
     @mock.patch('program_management.ddd.service.read.element_selected_service.retrieve_element_selected')
     @mock.patch('program_management.forms.tree.paste.BasePasteNodesFormset.is_valid')
-    @mock.patch('program_management.ddd.service.read.check_paste_node_service.check_paste')
+    @mock.patch('program_management.ddd.service.read.check_paste_node_service.check_paste_nodes')
     @mock.patch(
         'program_management.ddd.domain.service.identity_search.ProgramTreeVersionIdentitySearch.get_from_node_identity'
     )
@@ -301,7 +301,7 @@ class TestCheckPasteView(TestCase):
     def setUp(self):
         self.client.force_login(self.person.user)
 
-        patcher_check_paste = mock.patch("program_management.ddd.service.read.check_paste_node_service.check_paste")
+        patcher_check_paste = mock.patch("program_management.ddd.service.read.check_paste_node_service.check_paste_nodes")
         self.mock_check_paste = patcher_check_paste.start()
         self.mock_check_paste.return_value = None
         self.addCleanup(patcher_check_paste.stop)
@@ -316,22 +316,22 @@ class TestCheckPasteView(TestCase):
             },
             HTTP_ACCEPT="application/json"
         )
-        self.mock_check_paste.assert_has_calls(
+        self.mock_check_paste.assert_called_once_with(
             [
-                mock.call(command.CheckPasteNodeCommand(
+                command.CheckPasteNodeCommand(
                     12,
                     node_to_paste_code="LSINF1254",
                     node_to_paste_year=2021,
                     path_to_paste=self.path,
                     path_to_detach=None
-                )),
-                mock.call(command.CheckPasteNodeCommand(
+                ),
+                command.CheckPasteNodeCommand(
                     12,
                     node_to_paste_code="LECGE2589",
                     node_to_paste_year=2021,
                     path_to_paste=self.path,
                     path_to_detach=None
-                ))
+                )
             ]
         )
 
@@ -354,7 +354,7 @@ class TestCheckPasteView(TestCase):
 
         self.assertEqual(
             response.json(),
-            {"error_messages": ["Not valid", "Not valid"]}
+            {"error_messages": ["Not valid"]}
         )
 
     def test_should_not_return_error_messages_when_check_paste_service_do_not_raises_excpetion(self):
@@ -75,8 +75,9 @@ class LearningUnitPrerequisiteTrainingandMiniTraining(PermissionRequiredMixin, L
         return super().render_to_response(context, **response_kwargs)
 
     def add_warning_messages(self, context):
+        prerequisite = self.program_tree.get_prerequisite(self.node)
         validator = PrerequisiteItemsValidator(
-            str(self.program_tree.get_prerequisite(self.node)),
+            prerequisite.compile().expression if prerequisite else "",
             self.node,
             self.program_tree
         )
@@ -57,8 +57,9 @@ class LearningUnitPrerequisite(PermissionRequiredMixin, SuccessMessageMixin, Lea
         node = self._get_learning_unit_year_node()
         form_kwargs["program_tree"] = self.program_tree
         form_kwargs["node"] = node
+        prerequisite = self.program_tree.get_prerequisite(node)
         form_kwargs["initial"] = {
-            "prerequisite_string": str(self.program_tree.get_prerequisite(node) or '')
+            "prerequisite_string": prerequisite.compile().expression if prerequisite else ''
         }
         return form_kwargs
 
@@ -29,6 +29,7 @@ from django_filters import FilterSet, filters, OrderingFilter
 from django_filters.views import FilterView
 
 from base.forms.learning_unit.search.quick_search import QuickLearningUnitYearFilter
+from base.forms.utils.filter_field import filter_field_by_search_text
 from base.models.academic_year import AcademicYear
 from base.models.learning_unit_year import LearningUnitYear
 from base.utils.cache import CacheFilterMixin
@@ -66,7 +67,7 @@ class QuickGroupYearFilter(FilterSet):
     )
     title = filters.CharFilter(
         field_name="title_fr",
-        lookup_expr='icontains',
+        method=filter_field_by_search_text,
         max_length=255,
         required=False,
         label=_('Title')
@@ -24,7 +24,6 @@
 #
 ##############################################################################
 import functools
-import itertools
 from typing import List
 
 from django import shortcuts
@@ -87,17 +86,17 @@ class PasteNodesView(AjaxPermissionRequiredMixin, AjaxTemplateMixin, SuccessMess
         if not self.nodes_to_paste:
             display_warning_messages(self.request, _("Please cut or copy an item before paste"))
 
-        error_messages = list(itertools.chain.from_iterable(
-            check_paste(
-                self.request,
+        error_messages = check_paste(
+            self.request,
+            [
                 {
                     "element_code": node_to_paste.code,
                     "element_year": node_to_paste.year,
                     "path_to_detach": self.path_to_detach_from
                 }
-            )
-            for node_to_paste in self.nodes_to_paste
-        ))
+                for node_to_paste in self.nodes_to_paste
+            ]
+        )
         if error_messages:
             display_error_messages(self.request, error_messages)
 
@@ -199,36 +198,40 @@ class CheckPasteView(LoginRequiredMixin, View):
         if not elements_to_paste:
             return JsonResponse({"error_messages": [_("Please cut or copy an item before paste")]})
 
-        error_messages = list(itertools.chain.from_iterable(
-            check_paste(request, element) for element in elements_to_paste
-        ))
+        error_messages = check_paste(request, elements_to_paste)
         if error_messages:
             return JsonResponse({"error_messages": error_messages})
 
         return JsonResponse({"error_messages": []})
 
 
-def check_paste(request, node_to_paste) -> List[str]:
+def check_paste(request, nodes_to_paste: List[dict]) -> List[str]:
     root_id = int(request.GET["path"].split("|")[0])
-    check_command = program_management.ddd.command.CheckPasteNodeCommand(
-        root_id=root_id,
-        node_to_paste_code=node_to_paste["element_code"],
-        node_to_paste_year=node_to_paste["element_year"],
-        path_to_detach=node_to_paste["path_to_detach"],
-        path_to_paste=request.GET["path"],
-    )
-    check_key = '{}|{}'.format(request.GET['path'], node_to_paste['element_code'])
+    check_commands = []
+    check_keys = []
+    for node_to_paste in nodes_to_paste:
+        check_key = '{}|{}'.format(request.GET['path'], node_to_paste['element_code'])
+        # result cached to avoid double check
+        if request.session.get(check_key):
+            del request.session[check_key]
+            continue
+        check_commands.append(
+            program_management.ddd.command.CheckPasteNodeCommand(
+                root_id=root_id,
+                node_to_paste_code=node_to_paste["element_code"],
+                node_to_paste_year=node_to_paste["element_year"],
+                path_to_detach=node_to_paste["path_to_detach"],
+                path_to_paste=request.GET["path"],
+            )
+        )
+        check_keys.append(check_key)
 
     try:
-        if not request.session.get(check_key):
-            check_paste_node_service.check_paste(check_command)
+        if check_commands:
+            check_paste_node_service.check_paste_nodes(check_commands)
     except MultipleBusinessExceptions as exceptions:
         return [business_exception.message for business_exception in exceptions.exceptions]
 
-    # cache result to avoid double check
-    if request.session.get(check_key):
-        del request.session[check_key]
-    else:
+    for check_key in check_keys:
         request.session[check_key] = True
-
     return []
@@ -2,12 +2,14 @@ from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse, HttpResponseBadRequest
 from django.views.decorators.http import require_GET
 
+from base.utils.read_replica import read_only_view
 from program_management.ddd import command
 from program_management.ddd.service.read import node_identity_service, get_program_tree_service
 from program_management.serializers.program_tree_view import program_tree_view_serializer
 from program_management.serializers.node_view import NodeViewContext
 
 
+@read_only_view
 @login_required
 @require_GET
 def tree_json_view(request, root_id: int):
@@ -42,6 +42,7 @@ from education_group.ddd.domain import exception
 from education_group.ddd.domain.training import TrainingIdentity
 from education_group.models.group_year import GroupYear
 from education_group.templatetags.academic_year_display import display_as_academic_year
+from infrastructure.messages_bus import message_bus_instance
 from osis_role.contrib.views import AjaxPermissionRequiredMixin
 from program_management.ddd.business_types import *
 from program_management.ddd.command import CreateProgramTreeSpecificVersionCommand, \
@@ -55,8 +56,7 @@ from program_management.ddd.domain.service.identity_search import NodeIdentitySe
 from program_management.ddd.repositories.program_tree_version import ProgramTreeVersionRepository
 from program_management.ddd.service.read import get_last_existing_version_service, \
     get_last_existing_transition_version_service
-from program_management.ddd.service.write import create_and_postpone_tree_specific_version_service, \
-    prolong_existing_tree_version_service, create_and_postpone_tree_transition_version_service
+from program_management.ddd.service.write import prolong_existing_tree_version_service
 from program_management.forms.transition import TransitionVersionForm
 from program_management.forms.version import SpecificVersionForm
 
@@ -116,8 +116,7 @@ class CreateProgramTreeSpecificVersion(AjaxPermissionRequiredMixin, AjaxTemplate
             if not last_existing_version:
                 command = _convert_form_to_create_specific_version_command(form)
                 try:
-                    identities = create_and_postpone_tree_specific_version_service. \
-                        create_and_postpone_program_tree_specific_version(command=command)
+                    identities = message_bus_instance.invoke(command)
                 except (program_exception.VersionNameExistsCurrentYearAndInFuture,
                         exception.MultipleEntitiesFoundException) as e:
                     form.add_error('version_name', e.message)
@@ -238,8 +237,7 @@ class CreateProgramTreeTransitionVersion(AjaxPermissionRequiredMixin, AjaxTempla
             try:
                 if not last_existing_version:
                     command = _convert_form_to_create_transition_version_command(form)
-                    identities = create_and_postpone_tree_transition_version_service. \
-                        create_and_postpone_program_tree_transition_version(command=command)
+                    identities = message_bus_instance.invoke(command)
                 else:
                     identities = prolong_existing_tree_version_service.prolong_existing_tree_version(
                         _convert_form_to_prolong_command(form, last_existing_version)
@@ -23,10 +23,9 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from typing import List, Tuple
 
 from django.conf import settings
-from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Value, CharField
 from rest_framework import serializers
 
 from base.business.education_groups import general_information_sections
@@ -35,7 +34,7 @@ from base.business.education_groups.general_information_sections import \
 from base.models.enums.education_group_types import GroupType
 from cms.enums import entity_name
 from cms.models import translated_text
-from cms.models.translated_text import TranslatedText, get_groups_or_offers_cms_reference_object
+from cms.models.translated_text import get_groups_or_offers_cms_reference_object
 from cms.models.translated_text_label import TranslatedTextLabel
 from education_group.ddd import command
 from education_group.ddd.service.read import get_group_service
@@ -67,7 +66,7 @@ class GeneralInformationSerializer(serializers.Serializer):
 
     def get_sections(self, obj):
         datas = []
-        sections = []
+        cms_sections = []
         language = settings.LANGUAGE_CODE_FR \
             if self.instance.language == settings.LANGUAGE_CODE_FR[:2] else self.instance.language
         pertinent_sections = general_information_sections.SECTIONS_PER_OFFER_TYPE[obj.node_type.name]
@@ -89,45 +88,41 @@ class GeneralInformationSerializer(serializers.Serializer):
                 })
                 datas.append(serializer.data)
             elif specific_section not in WS_SECTIONS_TO_SKIP:
-                sections.append(self._get_section_cms(obj, specific_section, language, reference))
+                cms_sections.append((obj, specific_section, *self._get_cms_reference(obj, reference)))
 
         for offer in extra_intro_offers:
-            sections.append(self._get_section_cms(offer, 'intro', language))
+            cms_sections.append((offer, 'intro', *self._get_cms_reference(offer)))
 
-        datas += SectionSerializer(sections, many=True).data
+        datas += SectionSerializer(self._get_sections_cms(cms_sections, language), many=True).data
         return datas
 
-    def _get_section_cms(self, node, section, language, reference: int = None):
+    @staticmethod
+    def _get_cms_reference(node, reference: int = None) -> Tuple[str, int]:
         if reference is None:
             get_group_cmd = command.GetGroupCommand(code=node.code, year=node.year)
             group = get_group_service.get_group(get_group_cmd)
             reference = get_groups_or_offers_cms_reference_object(group).pk
-            entity = entity_name.get_offers_or_groups_entity_from_group(group)
-        else:
-            entity = entity_name.get_offers_or_groups_entity_from_group(node)
-        translated_text_label = TranslatedTextLabel.objects.get(
-            text_label__label=section,
-            language=language,
-            text_label__entity=entity
-        )
-        translated_text = TranslatedText.objects.filter(
-            text_label__label=section,
-            language=language,
-            entity=entity,
-            reference=reference
-        ).annotate(
-            label=Value(self._get_correct_label_name(node, section), output_field=CharField()),
-            translated_label=Value(translated_text_label.label, output_field=CharField())
-        )
+            return entity_name.get_offers_or_groups_entity_from_group(group), reference
+        return entity_name.get_offers_or_groups_entity_from_group(node), reference
 
-        try:
-            return translated_text.values('label', 'translated_label', 'text').get()
-        except ObjectDoesNotExist:
-            return {
+    def _get_sections_cms(self, cms_sections: List[tuple], language: str) -> List[dict]:
+        texts = translated_text.bulk_search((entity, reference) for _, _, entity, reference in cms_sections)
+        translated_text_labels = TranslatedTextLabel.objects.filter(
+            text_label__label__in={section for _, section, _, _ in cms_sections},
+            language=language,
+        ).select_related('text_label')
+        translated_labels = {
+            (translated_text_label.text_label.entity, translated_text_label.text_label.label):
+                translated_text_label.label
+            for translated_text_label in translated_text_labels
+        }
+        return [
+            {
                 'label': self._get_correct_label_name(node, section),
-                'translated_label': translated_text_label.label,
-                'text': None,
-            }
+                'translated_label': translated_labels.get((entity, section)),
+                'text': texts.get_text(entity, reference, section, language),
+            } for node, section, entity, reference in cms_sections
+        ]
 
     @staticmethod
     def _get_correct_label_name(node, section):
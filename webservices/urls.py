@@ -29,6 +29,7 @@ import logging
 from django.conf import settings
 from django.conf.urls import url, include
 
+from base.utils.read_replica import read_only_view
 from webservices.api.views.auth_token import AuthToken
 from webservices.api.views.common_access_requirements import CommonAccessRequirements
 from webservices.api.views.common_text import CommonText
@@ -70,13 +71,13 @@ for appname in webservice_apps:
 
 urlpatterns = [
     url('^v0.3/catalog/offer/(?P<year>[0-9]{4})/(?P<language>[a-zA-Z]{2})/common$',
-        CommonText.as_view(),
+        read_only_view(CommonText.as_view()),
         name=CommonText.name),
     url('^v0.3/catalog/offer/(?P<year>[0-9]{4})/(?P<language>[a-zA-Z]{2})/common/admission_condition$',
-        CommonAccessRequirements.as_view(),
+        read_only_view(CommonAccessRequirements.as_view()),
         name=CommonAccessRequirements.name),
     url('^v0.3/catalog/offer/(?P<year>[0-9]{4})/(?P<language>[a-zA-Z]{2})/(?P<acronym>[a-zA-Z0-9]+)$',
-        GeneralInformation.as_view(),
+        read_only_view(GeneralInformation.as_view()),
         name=GeneralInformation.name),
     url(r'^v1/', include(url_api_v1)),
 ]